@@ -128,6 +128,28 @@ DATABASES = {
 }
 
 
+# Cache
+# Context halaman indikator di-cache per versi dataset (apps/services/view_cache.py).
+# Default locmem (per proses); set REDIS_CACHE_URL agar cache dan lock-nya dipakai bersama antar proses/node.
+REDIS_CACHE_URL = os.getenv('REDIS_CACHE_URL')
+
+if REDIS_CACHE_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_CACHE_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'aastabaya',
+            'OPTIONS': {'MAX_ENTRIES': 1000},
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -1,6 +1,8 @@
+from collections import Counter
+
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from .models import User,News,Infographic,Publication,Data, HumanDevelopmentIndex, HotelOccupancyCombined, HotelOccupancyYearly, GiniRatio, IPM_UHH_SP, IPM_HLS, IPM_RLS, IPM_PengeluaranPerKapita, IPM_IndeksKesehatan, IPM_IndeksHidupLayak, IPM_IndeksPendidikan, KetenagakerjaanTPT, KetenagakerjaanTPAK, KemiskinanSurabaya, KemiskinanJawaTimur, Kependudukan, PDRBPengeluaranADHB, PDRBPengeluaranADHK, PDRBPengeluaranDistribusi, PDRBPengeluaranLajuPDRB, PDRBPengeluaranADHBTriwulanan, PDRBPengeluaranADHKTriwulanan, PDRBPengeluaranDistribusiTriwulanan, PDRBPengeluaranLajuQtoQ, PDRBPengeluaranLajuYtoY, PDRBPengeluaranLajuCtoC, PDRBLapanganUsahaADHB, PDRBLapanganUsahaADHK, PDRBLapanganUsahaDistribusi, PDRBLapanganUsahaLajuPDRB, PDRBLapanganUsahaLajuImplisit, PDRBLapanganUsahaADHBTriwulanan, PDRBLapanganUsahaADHKTriwulanan, PDRBLapanganUsahaDistribusiTriwulanan, PDRBLapanganUsahaLajuQtoQ, PDRBLapanganUsahaLajuYtoY, PDRBLapanganUsahaLajuCtoC, Inflasi, InflasiPerKomoditas, Bookmark
+from .models import User,News,Infographic,Publication,Data, HumanDevelopmentIndex, HotelOccupancyCombined, HotelOccupancyYearly, GiniRatio, IPM_UHH_SP, IPM_HLS, IPM_RLS, IPM_PengeluaranPerKapita, IPM_IndeksKesehatan, IPM_IndeksHidupLayak, IPM_IndeksPendidikan, KetenagakerjaanTPT, KetenagakerjaanTPAK, KemiskinanSurabaya, KemiskinanJawaTimur, Kependudukan, PDRBPengeluaranADHB, PDRBPengeluaranADHK, PDRBPengeluaranDistribusi, PDRBPengeluaranLajuPDRB, PDRBPengeluaranADHBTriwulanan, PDRBPengeluaranADHKTriwulanan, PDRBPengeluaranDistribusiTriwulanan, PDRBPengeluaranLajuQtoQ, PDRBPengeluaranLajuYtoY, PDRBPengeluaranLajuCtoC, PDRBLapanganUsahaADHB, PDRBLapanganUsahaADHK, PDRBLapanganUsahaDistribusi, PDRBLapanganUsahaLajuPDRB, PDRBLapanganUsahaLajuImplisit, PDRBLapanganUsahaADHBTriwulanan, PDRBLapanganUsahaADHKTriwulanan, PDRBLapanganUsahaDistribusiTriwulanan, PDRBLapanganUsahaLajuQtoQ, PDRBLapanganUsahaLajuYtoY, PDRBLapanganUsahaLajuCtoC, Inflasi, InflasiPerKomoditas, Bookmark, SyncState, SyncJob, SchedulerLease, DatasetSchedule, SyncRun, SyncStep, IndicatorSnapshot, DatasetVersion, Region
 
 # Register your models here.
 
@@ -54,4 +56,102 @@ admin.site.register(PDRBLapanganUsahaLajuQtoQ)
 admin.site.register(PDRBLapanganUsahaLajuYtoY)
 admin.site.register(PDRBLapanganUsahaLajuCtoC)
 admin.site.register(Inflasi)
-admin.site.register(InflasiPerKomoditas)
\ No newline at end of file
+admin.site.register(InflasiPerKomoditas)
+admin.site.register(SyncState)
+admin.site.register(SchedulerLease)
+admin.site.register(DatasetVersion)
+
+
+@admin.register(SyncJob)
+class SyncJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'sync_type', 'status', 'created_at', 'started_at', 'finished_at', 'worker')
+    list_filter = ('status', 'sync_type')
+    readonly_fields = ('created_at', 'started_at', 'finished_at', 'heartbeat_at')
+
+
+@admin.register(DatasetSchedule)
+class DatasetScheduleAdmin(admin.ModelAdmin):
+    list_display = ('task_name', 'cadence', 'interval_hours', 'next_run_at', 'last_run_at', 'last_changed_at', 'unchanged_runs')
+    list_filter = ('cadence',)
+
+
+class SyncStepInline(admin.TabularInline):
+    model = SyncStep
+    extra = 0
+    can_delete = False
+    fields = (
+        'task', 'key', 'status', 'duration_seconds', 'fetch_seconds', 'parse_seconds', 'save_seconds',
+        'state_seconds', 'bytes_read', 'cells_read', 'created', 'updated', 'unchanged', 'skipped', 'queries', 'error',
+    )
+    readonly_fields = fields
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(SyncRun)
+class SyncRunAdmin(admin.ModelAdmin):
+    list_display = ('id', 'sync_type', 'trigger', 'status', 'started_at', 'duration_seconds', 'created', 'updated', 'unchanged', 'queries')
+    list_filter = ('status', 'trigger', 'sync_type')
+    readonly_fields = ('started_at', 'finished_at')
+    inlines = [SyncStepInline]
+
+    # Jumlah run terakhir dan task terlama yang ditampilkan di grafik tren
+    TREND_RUNS = 30
+    TREND_TASKS = 8
+
+    def trend_data(self):
+        """Data grafik tren changelist: durasi per task dan per tahap untuk TREND_RUNS run terakhir."""
+        runs = list(SyncRun.objects.exclude(status=SyncRun.Status.RUNNING)[:self.TREND_RUNS])[::-1]
+        steps = SyncStep.objects.filter(run__in=runs, key='').values(
+            'run_id', 'task', 'duration_seconds', 'fetch_seconds', 'parse_seconds', 'save_seconds',
+            'state_seconds', 'bytes_read',
+        )
+        by_run = {run.pk: [] for run in runs}
+        slowest = Counter()
+        for step in steps:
+            by_run[step['run_id']].append(step)
+            slowest[step['task']] += step['duration_seconds']
+        tasks = [task for task, _ in slowest.most_common(self.TREND_TASKS)]
+
+        def per_run(field, task=None):
+            return [
+                round(sum(s[field] for s in by_run[run.pk] if task is None or s['task'] == task), 2)
+                for run in runs
+            ]
+
+        return {
+            'labels': [f"#{run.pk} {run.started_at:%d/%m %H:%M}" for run in runs],
+            'duration': [round(run.duration_seconds, 2) for run in runs],
+            'rows': [run.created + run.updated for run in runs],
+            'queries': [run.queries for run in runs],
+            'megabytes': [round(value / 1_000_000, 2) for value in per_run('bytes_read')],
+            'stages': {stage: per_run(f'{stage}_seconds') for stage in ('fetch', 'parse', 'save', 'state')},
+            'tasks': {task: [value if value else None for value in per_run('duration_seconds', task)] for task in tasks},
+        }
+
+    def changelist_view(self, request, extra_context=None):
+        extra_context = extra_context or {}
+        extra_context['trend_data'] = self.trend_data()
+        return super().changelist_view(request, extra_context=extra_context)
+
+
+@admin.register(SyncStep)
+class SyncStepAdmin(admin.ModelAdmin):
+    list_display = ('run', 'task', 'key', 'status', 'duration_seconds', 'fetch_seconds', 'parse_seconds', 'save_seconds', 'bytes_read', 'cells_read', 'created', 'updated', 'unchanged', 'queries')
+    list_filter = ('status', 'task', 'skipped')
+    search_fields = ('task', 'key', 'error')
+
+
+@admin.register(IndicatorSnapshot)
+class IndicatorSnapshotAdmin(admin.ModelAdmin):
+    list_display = ('position', 'name', 'value', 'period', 'previous_value', 'previous_period', 'change', 'change_percent', 'change_type', 'computed_at')
+    search_fields = ('key', 'name')
+    readonly_fields = ('computed_at',)
+
+
+@admin.register(Region)
+class RegionAdmin(admin.ModelAdmin):
+    list_display = ('code', 'name', 'region_type', 'aliases')
+    list_filter = ('region_type',)
+    search_fields = ('code', 'name')
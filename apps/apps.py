@@ -9,9 +9,13 @@ class AppsConfig(AppConfig):
     
     def ready(self):
         """
-        Memulai scheduler saat Django app siap.
-        Hanya berjalan di production atau saat tidak dalam mode test.
+        Menghubungkan signal versi dataset, lalu memulai scheduler saat Django app siap.
+        Scheduler hanya berjalan di production atau saat tidak dalam mode test.
         """
+        # Edit di luar sync (admin, API) juga menaikkan versi dataset cache halaman dan ETag API
+        from .services.view_cache import track_model_changes
+        track_model_changes(self)
+
         # Jangan jalankan scheduler saat running migrations atau dalam mode test
         if os.environ.get('RUN_MAIN') != 'true':
             return
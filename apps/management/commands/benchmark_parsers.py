@@ -0,0 +1,292 @@
+import contextlib
+import io
+import random
+import math
+import time
+
+import numpy as np
+import pandas as pd
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.services import number_parser
+from apps.services.legacy_number_parsers import SCALAR_PARSERS
+from apps.services.sheet_specs import (
+    IPM_SPEC, IPM_PENGELUARAN_PER_KAPITA_SPEC, parse_wide_year_sheet, wide_sheet_records,
+)
+
+
+def legacy_parse_wide_sheet(data):
+    """Salinan parser per-service lama (IPMService.fetch_ipm_data) sebagai pembanding."""
+    if not data or len(data) < 2:
+        return pd.DataFrame()
+
+    headers = data[0]
+    data_rows = data[1:]
+    df = pd.DataFrame(data_rows, columns=headers)
+
+    if 'Kabupaten/Kota\nRegency/Municipality' in df.columns:
+        df = df.rename(columns={'Kabupaten/Kota\nRegency/Municipality': 'Kabupaten/Kota'})
+    elif 'Kabupaten/Kot' in df.columns:
+        df = df.rename(columns={'Kabupaten/Kot': 'Kabupaten/Kota'})
+    elif 'Provinsi' in df.columns:
+        df = df.rename(columns={'Provinsi': 'Kabupaten/Kota'})
+    elif 'Kabupaten/Kota' not in df.columns:
+        location_col_found = False
+        for col in df.columns:
+            col_lower = str(col).lower()
+            if 'kabupaten' in col_lower or 'kota' in col_lower or 'kot' in col_lower or 'provinsi' in col_lower:
+                df = df.rename(columns={col: 'Kabupaten/Kota'})
+                location_col_found = True
+                break
+        if not location_col_found:
+            return pd.DataFrame()
+
+    empty_columns = [col for col in df.columns if col == '']
+    if empty_columns:
+        df = df.drop(columns=empty_columns)
+
+    year_columns = [col for col in df.columns if col.isdigit() and len(col) == 4]
+    if not year_columns:
+        for col in df.columns:
+            if col != 'Kabupaten/Kota' and str(col).strip().isdigit():
+                year_columns.append(col)
+    if not year_columns:
+        return pd.DataFrame()
+
+    df_melted = pd.melt(df, id_vars=['Kabupaten/Kota'], value_vars=year_columns,
+                        var_name='Tahun', value_name='Value')
+    df_melted['Tahun'] = pd.to_numeric(df_melted['Tahun'], errors='coerce')
+    df_melted['Value'] = df_melted['Value'].astype(str)
+    df_melted['Value'] = df_melted['Value'].str.replace(',', '.', regex=False)
+    df_melted['Value'] = pd.to_numeric(df_melted['Value'], errors='coerce')
+    df_melted.dropna(subset=['Value'], inplace=True)
+    df_melted.dropna(subset=['Tahun'], inplace=True)
+    return df_melted
+
+
+def legacy_wide_sheet_records(df, spec):
+    """
+    Salinan loop iterrows() save_*_to_db lama, tanpa bagian penulisan ke database dan
+    tanpa location_type (sekarang diturunkan dari Region, tidak disimpan per baris).
+    """
+    records = []
+    for index, row in df.iterrows():
+        location_name = str(row['Kabupaten/Kota']).strip()
+        if not location_name or "Sumber/Source" in location_name:
+            continue
+
+        value = row['Value']
+        if spec.round_digits is not None:
+            value = round(float(value), spec.round_digits) if pd.notna(value) else None
+
+        records.append({
+            'location_name': location_name,
+            'year': int(row['Tahun']),
+            spec.value_field: value,
+        })
+    return records
+
+
+def synthetic_wide_grid(rows, years, seed=0):
+    """Grid worksheet lebar sintetis: format angka campuran, sel kosong/'-', kolom kosong dan baris sumber."""
+    rng = random.Random(seed)
+    header = ['Kabupaten/Kota\nRegency/Municipality'] + [str(2000 + i) for i in range(years)] + ['']
+    grid = [header]
+    for r in range(rows):
+        name = f"KOTA {r}" if r % 3 == 0 else f"Kabupaten {r}"
+        row = [name]
+        for _ in range(years):
+            roll = rng.random()
+            if roll < 0.05:
+                row.append('')
+            elif roll < 0.08:
+                row.append('-')
+            elif roll < 0.5:
+                row.append(f"{rng.uniform(0, 100):.2f}".replace('.', ','))
+            else:
+                row.append(f"{rng.uniform(0, 100):.3f}")
+        row.append('')
+        grid.append(row)
+    grid.append(['Sumber/Source: BPS'] + [''] * (years + 1))
+    return grid
+
+
+NUMBER_EDGE_CASES = [
+    '', ' ', '-', '—', ' - ', 'error', 'ERROR', 'nan', 'NaN', 'None', 'null', 'inf', '-inf', '1e400',
+    '0', '-0', '12', ' 12 ', '12,5', '12.5', '1.234', '1.2345', '.5', '5.', ',5', '1.234.567',
+    '1.234.567,89', '1,234,567', '1,2', '-1.234,5', '+7', '1e3', '1_000', '12a', 'a12', '1 000',
+    '٣٤', '12..3', '1,2.3', '..', ',', '.', '--5', '(3,5)', '3,5%', None, float('nan'),
+]
+
+
+def random_number_string(rng):
+    """String angka acak dengan campuran format Indonesia/Inggris dan sampah."""
+    roll = rng.random()
+    if roll < 0.15:
+        return rng.choice(NUMBER_EDGE_CASES)
+    if roll < 0.35:
+        return ''.join(rng.choice('0123456789.,- e') for _ in range(rng.randint(1, 8)))
+    number = rng.uniform(-1e7, 1e7) if rng.random() < 0.3 else rng.uniform(0, 1000)
+    text = f"{number:,.{rng.randint(0, 4)}f}"
+    if rng.random() < 0.5:
+        # Format Indonesia: titik ribuan, koma desimal
+        text = text.replace(',', '_').replace('.', ',').replace('_', '.')
+    elif rng.random() < 0.5:
+        text = text.replace(',', '')
+    return text
+
+
+def sheet_number_column(cells, mode, seed=1):
+    """
+    Kolom angka seperti di worksheet: format sesuai mode, ~3% kosong, ~3% '-' dan
+    ~0,5% teks bukan angka (catatan kaki, '(3,5)', dsb.).
+    """
+    rng = random.Random(seed)
+    garbage = ['n.a', '(3,5)', '3,5%', '12a', 'x']
+    column = []
+    for _ in range(cells):
+        roll = rng.random()
+        if roll < 0.03:
+            column.append('')
+        elif roll < 0.06:
+            column.append('-')
+        elif roll < 0.065:
+            column.append(rng.choice(garbage))
+        elif mode == number_parser.DECIMAL:
+            column.append(f"{rng.uniform(0, 100):.2f}".replace('.', ','))
+        elif mode == number_parser.POPULATION:
+            column.append(f"{rng.randint(0, 3_000_000):,}".replace(',', '.'))
+        else:
+            text = f"{rng.uniform(0, 1e6):,.2f}"
+            column.append(text.replace(',', '_').replace('.', ',').replace('_', '.'))
+    return pd.Series(column, dtype=object)
+
+
+def call_scalar(func, value):
+    try:
+        return func(value)
+    except OverflowError:
+        # int(float('inf')) di convert_kependudukan_value
+        return None
+
+
+def scalar_parse(func, value):
+    """Hasil fungsi skalar sebagai float (None -> NaN); print debug dibuang."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = call_scalar(func, value)
+    return math.nan if result is None else float(result)
+
+
+def same_number(a, b):
+    return (math.isnan(a) and math.isnan(b)) or a == b
+
+
+def best_time(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def canonical(records):
+    return sorted(
+        tuple((key, float(value) if isinstance(value, float) else value) for key, value in record.items())
+        for record in records
+    )
+
+
+class Command(BaseCommand):
+    help = 'Benchmark parser spreadsheet (spec engine dan parser angka vektor vs implementasi lama) pada data sintetis'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=2000, help='Jumlah baris lokasi (default: 2000)')
+        parser.add_argument('--years', type=int, default=40, help='Jumlah kolom tahun (default: 40)')
+        parser.add_argument('--cells', type=int, default=200000, help='Jumlah sel untuk benchmark parser angka (default: 200000)')
+        parser.add_argument('--repeat', type=int, default=5, help='Jumlah pengulangan, diambil yang tercepat (default: 5)')
+        parser.add_argument(
+            '--check',
+            type=int,
+            default=0,
+            metavar='N',
+            help='Cek N string acak + kasus tepi: parse_numbers harus sama dengan fungsi skalar di setiap mode'
+        )
+
+    def handle(self, *args, **options):
+        self.benchmark_wide_sheets(options['rows'], options['years'], options['repeat'])
+        self.stdout.write('')
+        self.benchmark_number_parser(options['cells'], options['repeat'])
+        if options['check']:
+            self.stdout.write('')
+            self.check_number_parser(options['check'])
+
+    def benchmark_wide_sheets(self, rows, years, repeat):
+        grid = synthetic_wide_grid(rows, years)
+        self.stdout.write(f'[INFO] Grid sintetis: {rows} baris x {years} tahun ({rows * years} sel), {repeat}x ulang')
+
+        for spec in (IPM_SPEC, IPM_PENGELUARAN_PER_KAPITA_SPEC):
+            # Parser mencetak progress; dibuang supaya tidak mengganggu output benchmark
+            with contextlib.redirect_stdout(io.StringIO()):
+                legacy = legacy_wide_sheet_records(legacy_parse_wide_sheet(grid), spec)
+                current = wide_sheet_records(parse_wide_year_sheet(grid, spec), spec).to_dict('records')
+
+                legacy_time = best_time(
+                    lambda: legacy_wide_sheet_records(legacy_parse_wide_sheet(grid), spec), repeat
+                )
+                current_time = best_time(
+                    lambda: wide_sheet_records(parse_wide_year_sheet(grid, spec), spec), repeat
+                )
+
+            if canonical(legacy) != canonical(current):
+                self.stdout.write(self.style.ERROR(
+                    f'   [ERROR] {spec.label}: hasil berbeda ({len(legacy)} vs {len(current)} record)'
+                ))
+                continue
+
+            self.stdout.write(self.style.SUCCESS(
+                f'   [OK] {spec.label}: {len(current)} record identik; '
+                f'lama {legacy_time * 1000:.1f} ms, spec engine {current_time * 1000:.1f} ms '
+                f'({legacy_time / current_time:.1f}x lebih cepat)'
+            ))
+
+    def benchmark_number_parser(self, cells, repeat):
+        self.stdout.write(f'[INFO] Parser angka: kolom worksheet sintetis {cells} sel, {repeat}x ulang')
+
+        for mode, func in SCALAR_PARSERS.items():
+            column = sheet_number_column(cells, mode)
+            with contextlib.redirect_stdout(io.StringIO()):
+                scalar_time = best_time(lambda: column.apply(lambda v: call_scalar(func, v)), repeat)
+                vector_time = best_time(lambda: number_parser.parse_numbers(column, mode), repeat)
+            self.stdout.write(self.style.SUCCESS(
+                f'   [OK] {mode}: skalar {scalar_time * 1000:.1f} ms, vektor {vector_time * 1000:.1f} ms '
+                f'({scalar_time / vector_time:.1f}x lebih cepat)'
+            ))
+
+    def check_number_parser(self, count):
+        rng = random.Random(2)
+        samples = NUMBER_EDGE_CASES + [random_number_string(rng) for _ in range(count)]
+        self.stdout.write(f'[INFO] Cek parse_numbers vs fungsi skalar: {len(samples)} nilai per mode')
+
+        failures = 0
+        for mode, func in SCALAR_PARSERS.items():
+            numbers, invalid = number_parser.parse_numbers(samples, mode)
+            mismatches = [
+                (value, scalar_parse(func, value), numbers[i])
+                for i, value in enumerate(samples)
+                if not same_number(scalar_parse(func, value), numbers[i])
+            ]
+            # Sel yang ditandai invalid harus NaN, sama seperti None pada fungsi skalar
+            bad_mask = int(np.count_nonzero(invalid & ~np.isnan(numbers)))
+            if mismatches or bad_mask:
+                failures += 1
+                self.stdout.write(self.style.ERROR(
+                    f'   [ERROR] {mode}: {len(mismatches)} nilai berbeda, contoh (input, skalar, vektor): {mismatches[:5]}'
+                ))
+            else:
+                self.stdout.write(self.style.SUCCESS(
+                    f'   [OK] {mode}: semua nilai sama, {int(np.count_nonzero(invalid))} sel ditandai invalid'
+                ))
+
+        if failures:
+            raise CommandError(f'parse_numbers berbeda dengan fungsi skalar pada {failures} mode')
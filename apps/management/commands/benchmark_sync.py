@@ -0,0 +1,322 @@
+"""
+Benchmark end-to-end sync_data: fetch -> parse -> save untuk setiap task
+(sync_ipm, sync_all_pdrb_pengeluaran, sync_all_inflasi, ...) terhadap snapshot
+replay, tanpa jaringan dan credentials.
+
+Setiap skala dijalankan di proses terpisah supaya peak RSS tidak terbawa dari
+skala sebelumnya, dan di database test sementara (kecuali --use-current-db).
+Pass pertama mengisi tabel kosong (insert), pass berikutnya di-force sehingga
+semua baris melewati jalur "tidak berubah" writer. Hasil ditulis sebagai JSON
+untuk dibandingkan antar commit dengan --compare.
+"""
+import contextlib
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from apps.services.data_source import REPLAY, use_source
+from apps.services.sheet_prefetch import grid_cache, prefetch_worksheets, service_worksheets
+from apps.services.sheets_client import INDICATOR_SHEET_ID
+from apps.services.synthetic_data import SyntheticScale, write_snapshot
+from apps.services.sync_metrics import PREFETCH_TASK, QueryCounter, recording, stage
+from apps.services.sync_orchestrator import SYNC_TYPES, build_tasks, run_task
+from apps.services.sync_state import force_resync
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Selisih waktu yang dianggap regresi oleh --compare
+REGRESSION_RATIO = 1.10
+REGRESSION_MIN_SECONDS = 0.05
+
+
+def peak_rss_mb():
+    """Peak resident set size proses ini dalam MB (None bila tidak tersedia)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux melaporkan KB, macOS byte
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def per_second(rows, seconds):
+    return round(rows / seconds, 1) if seconds > 0 else None
+
+
+def git_commit():
+    try:
+        completed = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=settings.BASE_DIR,
+            capture_output=True, text=True, timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+@contextlib.contextmanager
+def benchmark_database(use_current):
+    """Database test sementara (dibuat + migrate, dihapus setelahnya) atau database saat ini."""
+    if use_current:
+        yield connection.settings_dict['NAME']
+        return
+    old_name = connection.settings_dict['NAME']
+    test_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+    try:
+        yield test_name
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+class Command(BaseCommand):
+    help = 'Benchmark end-to-end fetch/parse/save semua service sync terhadap snapshot sintetis atau rekaman'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scales', type=str, default='1,10,100',
+                            help='Daftar skala ukuran grid sintetis, dipisah koma (default: 1,10,100)')
+        parser.add_argument('--snapshot', type=str,
+                            help='Direktori snapshot hasil sync_data --source record; dipakai apa adanya (skala 1)')
+        parser.add_argument('--type', type=str, choices=SYNC_TYPES, default='all',
+                            help='Jenis data yang di-benchmark (default: all)')
+        parser.add_argument('--passes', type=int, default=2,
+                            help='Jumlah pass per skala: pass 1 insert, pass berikutnya re-sync data yang sama (default: 2)')
+        parser.add_argument('--output', type=str, default='benchmark_sync.json',
+                            help='File JSON hasil benchmark (default: benchmark_sync.json)')
+        parser.add_argument('--compare', type=str,
+                            help='File JSON benchmark sebelumnya untuk dibandingkan')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--use-current-db', action='store_true',
+                            help='Tulis ke database yang dikonfigurasi, bukan database test sementara')
+        parser.add_argument('--no-isolate', action='store_true',
+                            help='Jalankan semua skala di proses ini (peak RSS jadi kumulatif)')
+        parser.add_argument('--verbose', action='store_true',
+                            help='Tampilkan output service selama benchmark')
+
+    def handle(self, *args, **options):
+        try:
+            scales = [float(value) for value in options['scales'].split(',') if value.strip()]
+        except ValueError:
+            raise CommandError(f"--scales tidak valid: {options['scales']}")
+        if options['snapshot']:
+            if not Path(options['snapshot']).is_dir():
+                raise CommandError(f"Direktori snapshot tidak ditemukan: {options['snapshot']}")
+            scales = [1.0]
+        if not scales or any(scale <= 0 for scale in scales):
+            raise CommandError('--scales harus berisi angka lebih besar dari 0')
+        if options['passes'] < 1:
+            raise CommandError('--passes minimal 1')
+
+        report = {
+            'benchmark': 'sync',
+            'created_at': timezone.now().isoformat(),
+            'git_commit': git_commit(),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'database': connection.vendor,
+            'type': options['type'],
+            'passes': options['passes'],
+            'source': options['snapshot'] or 'synthetic',
+            'runs': [],
+        }
+
+        for scale in scales:
+            self.stdout.write(f'[INFO] Benchmark skala {scale:g}x ...')
+            if len(scales) > 1 and not options['no_isolate']:
+                runs = self.run_isolated(scale, options)
+            else:
+                runs = self.run_scale(scale, options)
+            report['runs'].extend(runs)
+            for run in runs:
+                self.write_run(run)
+
+        output = Path(options['output'])
+        output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding='utf-8')
+        self.stdout.write(self.style.SUCCESS(f'[OK] Hasil benchmark ditulis ke {output}'))
+
+        if options['compare']:
+            self.compare(report, options['compare'])
+
+    def run_isolated(self, scale, options):
+        """Menjalankan satu skala di proses baru dan membaca hasil JSON-nya."""
+        fd, output = tempfile.mkstemp(prefix='benchmark_sync_', suffix='.json')
+        os.close(fd)
+        command = [
+            sys.executable, str(Path(settings.BASE_DIR) / 'manage.py'), 'benchmark_sync',
+            '--scales', f'{scale:g}', '--type', options['type'], '--passes', str(options['passes']),
+            '--seed', str(options['seed']), '--output', output,
+        ]
+        for flag in ('use_current_db', 'verbose'):
+            if options[flag]:
+                command.append('--' + flag.replace('_', '-'))
+        if options['snapshot']:
+            command += ['--snapshot', options['snapshot']]
+        try:
+            completed = subprocess.run(command, capture_output=not options['verbose'], text=True)
+            if completed.returncode != 0:
+                raise CommandError(f'Benchmark skala {scale:g}x gagal:\n{completed.stderr or ""}')
+            with open(output, encoding='utf-8') as f:
+                return json.load(f)['runs']
+        finally:
+            os.unlink(output)
+
+    def run_scale(self, scale, options):
+        """Semua pass untuk satu skala di proses ini. Returns daftar run (satu per pass)."""
+        snapshot_dir = options['snapshot']
+        temp_dir = None
+        if not snapshot_dir:
+            temp_dir = tempfile.mkdtemp(prefix='sync_snapshot_')
+            synthetic = SyntheticScale(seed=options['seed']).scaled(scale)
+            store = write_snapshot(temp_dir, synthetic)
+            snapshot_dir = temp_dir
+            self.stdout.write(f'   Snapshot sintetis: {store.summary()}')
+
+        tasks = build_tasks(options['type'])
+        services = [service for task in tasks for service in task.services]
+        titles = None if options['type'] == 'all' else service_worksheets(*services)
+        quiet = contextlib.nullcontext() if options['verbose'] else open(os.devnull, 'w')
+
+        runs = []
+        try:
+            with benchmark_database(options['use_current_db']), quiet as devnull:
+                for pass_index in range(options['passes']):
+                    name = 'initial' if pass_index == 0 else f'resync-{pass_index}'
+                    redirect = contextlib.redirect_stdout(devnull) if devnull else contextlib.nullcontext()
+                    with redirect:
+                        run = self.run_pass(tasks, titles if services else [], snapshot_dir)
+                    run.update({'scale': scale, 'pass': name})
+                    runs.append(run)
+        finally:
+            if temp_dir:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+        return runs
+
+    def run_pass(self, tasks, titles, snapshot_dir):
+        """Satu kali sync semua task dari snapshot, dengan pengukuran per tahap."""
+        results = []
+        started = time.perf_counter()
+        total_queries = QueryCounter()
+        with use_source(REPLAY, snapshot_dir), force_resync(), grid_cache.session(), \
+                recording() as recorder, total_queries.installed():
+            if titles != []:
+                task_queries = QueryCounter()
+                prefetch_started = time.perf_counter()
+                with recorder.task(PREFETCH_TASK), task_queries.installed(), stage('fetch') as measure:
+                    grids = prefetch_worksheets(INDICATOR_SHEET_ID, titles)
+                    measure.rows = sum(len(grid) for grid in grids.values())
+                results.append(self.task_entry(
+                    PREFETCH_TASK, recorder, time.perf_counter() - prefetch_started,
+                    task_queries.count, rows=measure.rows,
+                ))
+
+            for task in tasks:
+                task_queries = QueryCounter()
+                with recorder.task(task.name), task_queries.installed():
+                    result = run_task(task)
+                entry = self.task_entry(
+                    task.name, recorder, result.duration, task_queries.count,
+                    rows=result.created + result.updated + result.unchanged,
+                )
+                entry.update({
+                    'ok': result.ok, 'error': result.error,
+                    'created': result.created, 'updated': result.updated, 'unchanged': result.unchanged,
+                })
+                results.append(entry)
+
+        wall = time.perf_counter() - started
+        rows = sum(entry['rows'] for entry in results if entry['task'] != PREFETCH_TASK)
+        return {
+            'wall_seconds': round(wall, 4),
+            'rows': rows,
+            'rows_per_second': per_second(rows, wall),
+            'queries': total_queries.count,
+            'peak_rss_mb': peak_rss_mb(),
+            'tasks': results,
+        }
+
+    @staticmethod
+    def task_entry(name, recorder, seconds, queries, rows):
+        stages = {}
+        for stage_name, totals in recorder.stages(name).items():
+            stages[stage_name] = {
+                'seconds': round(totals['seconds'], 4),
+                'queries': totals['queries'],
+                'rows': totals['rows'],
+                'rows_per_second': per_second(totals['rows'], totals['seconds']),
+                'calls': totals['calls'],
+            }
+        return {
+            'task': name,
+            'wall_seconds': round(seconds, 4),
+            'rows': rows,
+            'rows_per_second': per_second(rows, seconds),
+            'queries': queries,
+            'peak_rss_mb': peak_rss_mb(),
+            'stages': stages,
+        }
+
+    def write_run(self, run):
+        self.stdout.write(
+            f"   [{run['scale']:g}x {run['pass']}] {run['rows']:,} baris dalam {run['wall_seconds']:.2f} detik "
+            f"({run['rows_per_second'] or 0:,.0f} baris/detik), {run['queries']:,} query, "
+            f"peak RSS {run['peak_rss_mb']} MB"
+        )
+        for entry in run['tasks']:
+            stages = ', '.join(
+                f"{name} {values['seconds']:.2f}s/{values['queries']}q" for name, values in entry['stages'].items()
+            )
+            status = '' if entry.get('ok', True) else f" [ERROR] {entry['error']}"
+            self.stdout.write(
+                f"      {entry['task']:<32} {entry['rows']:>9,} baris {entry['wall_seconds']:>8.2f}s "
+                f"{entry['queries']:>6,}q  {stages}{status}"
+            )
+        self.stdout.write('')
+
+    def compare(self, report, baseline_path):
+        """Membandingkan wall time per (skala, pass, task) dengan file JSON sebelumnya."""
+        try:
+            with open(baseline_path, encoding='utf-8') as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            raise CommandError(f'Tidak bisa membaca {baseline_path}: {e}')
+
+        def index(data):
+            return {
+                (run['scale'], run['pass'], entry['task']): entry
+                for run in data.get('runs', []) for entry in run['tasks']
+            }
+
+        old_entries = index(baseline)
+        self.stdout.write(f"[INFO] Dibandingkan dengan {baseline_path} (commit {baseline.get('git_commit') or '?'})")
+        regressions = 0
+        for key, entry in index(report).items():
+            old = old_entries.get(key)
+            if not old or not old['wall_seconds']:
+                continue
+            ratio = entry['wall_seconds'] / old['wall_seconds']
+            slower = ratio > REGRESSION_RATIO and entry['wall_seconds'] - old['wall_seconds'] > REGRESSION_MIN_SECONDS
+            regressions += slower
+            label = self.style.WARNING('[WARNING] lebih lambat') if slower else ''
+            self.stdout.write(
+                f"   {key[0]:g}x {key[1]:<10} {key[2]:<32} {old['wall_seconds']:>8.2f}s -> "
+                f"{entry['wall_seconds']:>8.2f}s ({ratio:.2f}x) {label}"
+            )
+        if regressions:
+            self.stdout.write(self.style.WARNING(f'[WARNING] {regressions} task lebih lambat dari baseline'))
+        else:
+            self.stdout.write(self.style.SUCCESS('[OK] Tidak ada regresi dibanding baseline'))
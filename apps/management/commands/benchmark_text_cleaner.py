@@ -0,0 +1,310 @@
+import html
+import json
+import logging
+import random
+import re
+import time
+
+from bs4 import BeautifulSoup
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.services import text_cleaner
+
+logger = logging.getLogger(__name__)
+
+
+def legacy_clean_html_content(text):
+    """Salinan BPSNewsService.clean_html_content lama sebagai pembanding."""
+    if not text or not isinstance(text, str):
+        return ""
+
+    # First, handle literal Unicode escape sequences like \u003C (which is <), \u003E (which is >), etc.
+    # These are Unicode escape sequences stored as literal strings
+    text = re.sub(r'\\u003C', '', text)
+    text = re.sub(r'\\u003E', '', text)
+    text = re.sub(r'\\u0022', '', text)  # "
+    text = re.sub(r'\\u0027', '', text)  # '
+    text = re.sub(r'\\u0020', ' ', text)  # space
+
+    # Handle other common escape sequences
+    text = re.sub(r'\\u000D\\u000A', ' ', text)
+    text = re.sub(r'\\u000D', ' ', text)
+    text = re.sub(r'\\u000A', ' ', text)
+    text = re.sub(r'\\u0009', ' ', text)  # tab
+    text = re.sub(r'\\u000B', ' ', text)  # vertical tab
+    text = re.sub(r'\\u000C', ' ', text)  # form feed
+    text = re.sub(r'\\r\\n', ' ', text)
+    text = re.sub(r'\\n', ' ', text)
+    text = re.sub(r'\\r', ' ', text)
+    text = re.sub(r'\\t', ' ', text)
+
+    # Try to decode Unicode escape sequences if they exist as literal strings
+    try:
+        # Replace literal \uXXXX patterns with actual characters
+        text = re.sub(r'\\u([0-9a-fA-F]{4})', 
+            lambda m: chr(int(m.group(1), 16)), text)
+    except Exception as e:
+        logger.warning(f"Error decoding Unicode escapes: {e}")
+
+    # Decode HTML entities terlebih dahulu
+    text = html.unescape(text)
+
+    # Remove style attributes and their content first
+    text = re.sub(r'style\s*=\s*["\'][^"\']*["\']', '', text, flags=re.IGNORECASE)
+    text = re.sub(r'style\s*=\s*[^\s>]*', '', text, flags=re.IGNORECASE)
+
+    # Gunakan BeautifulSoup jika tersedia
+    try:
+        # Parse dengan BeautifulSoup untuk menghapus semua HTML tags
+        soup = BeautifulSoup(text, 'html.parser')
+
+        # Ambil hanya teks, tanpa tag HTML
+        cleaned_text = soup.get_text(separator=' ', strip=False)
+
+        # Normalisasi whitespace: hapus multiple spaces, tabs, newlines berlebihan
+        cleaned_text = re.sub(r'\s+', ' ', cleaned_text)
+
+        # Hapus leading/trailing whitespace
+        cleaned_text = cleaned_text.strip()
+
+        return cleaned_text
+    except Exception as e:
+        logger.warning(f"Error menggunakan BeautifulSoup: {e}. Menggunakan fallback method.")
+
+        # Fallback method: hapus HTML tags dengan regex
+        # Hapus script dan style tags beserta isinya
+        text = re.sub(r'<script[^>]*>.*?</script>', '', text, flags=re.DOTALL | re.IGNORECASE)
+        text = re.sub(r'<style[^>]*>.*?</style>', '', text, flags=re.DOTALL | re.IGNORECASE)
+
+        # Hapus semua HTML tags
+        text = re.sub(r'<[^>]+>', '', text)
+
+        # Normalisasi whitespace
+        text = re.sub(r'\s+', ' ', text)
+
+        # Hapus leading/trailing whitespace
+        text = text.strip()
+
+        return text
+
+
+def legacy_clean_text_field(text, max_length=None):
+    """Salinan BPSNewsService.clean_text_field lama sebagai pembanding."""
+    if not text or not isinstance(text, str):
+        return ""
+
+    # Decode HTML entities
+    cleaned = html.unescape(text)
+
+    # Hapus HTML tags jika ada
+    cleaned = re.sub(r'<[^>]+>', '', cleaned)
+
+    # Normalisasi whitespace
+    cleaned = re.sub(r'\s+', ' ', cleaned)
+    cleaned = cleaned.strip()
+
+    # Truncate jika melebihi max_length
+    if max_length and len(cleaned) > max_length:
+        cleaned = cleaned[:max_length]
+
+    return cleaned
+
+
+def legacy_clean_abstract(text):
+    """Salinan rantai regex abstrak di save_publication_to_db lama sebagai pembanding."""
+    abstract_value = text or ''
+    if abstract_value:
+        # Handle literal escape sequences like "\u000D\u000A"
+        abstract_value = re.sub(r'\\u000D\\u000A', ' ', abstract_value, flags=re.IGNORECASE)
+        abstract_value = re.sub(r'\\u000D', ' ', abstract_value, flags=re.IGNORECASE)
+        abstract_value = re.sub(r'\\u000A', ' ', abstract_value, flags=re.IGNORECASE)
+        abstract_value = re.sub(r'\\u0009', ' ', abstract_value, flags=re.IGNORECASE)  # tab
+        abstract_value = re.sub(r'\\u000B', ' ', abstract_value, flags=re.IGNORECASE)  # vertical tab
+        abstract_value = re.sub(r'\\u000C', ' ', abstract_value, flags=re.IGNORECASE)  # form feed
+
+        # Handle other common escape sequences
+        abstract_value = re.sub(r'\\r\\n', ' ', abstract_value, flags=re.IGNORECASE)
+        abstract_value = re.sub(r'\\n', ' ', abstract_value, flags=re.IGNORECASE)
+        abstract_value = re.sub(r'\\r', ' ', abstract_value, flags=re.IGNORECASE)
+        abstract_value = re.sub(r'\\t', ' ', abstract_value, flags=re.IGNORECASE)
+
+        # Try to decode Unicode escape sequences
+        try:
+            abstract_value = re.sub(r'\\u([0-9a-fA-F]{4})', 
+                lambda m: chr(int(m.group(1), 16)), abstract_value)
+        except:
+            pass
+
+        # Remove actual control characters
+        abstract_value = re.sub(r'[\r\n]+', ' ', abstract_value)
+        abstract_value = re.sub(r'[\u0000-\u001F\u007F-\u009F]', ' ', abstract_value)
+
+        # Replace multiple spaces with single space
+        abstract_value = re.sub(r'[\s\t]+', ' ', abstract_value).strip()
+    return abstract_value
+
+
+SENTENCES = [
+    'Badan Pusat Statistik (BPS) Kota Surabaya merilis angka inflasi bulanan.',
+    'Tingkat penghunian kamar hotel berbintang mencapai 62,35 persen.',
+    'Nilai tukar petani naik 1,2 persen dibandingkan bulan sebelumnya.',
+    'Pertumbuhan ekonomi Surabaya triwulan III tercatat sebesar 5,76 persen (y-on-y).',
+    'Jumlah penduduk miskin turun menjadi 127,5 ribu jiwa & persentasenya 4,33 persen.',
+    'Kegiatan ini dihadiri oleh Kepala BPS Kota Surabaya beserta jajaran.',
+    'Data lengkap dapat diakses melalui surabayakota.bps.go.id.',
+]
+
+
+def synthetic_news_body(rng):
+    """Isi berita mirip respons API BPS: HTML dengan style/&nbsp;, sebagian dengan escape literal."""
+    paragraphs = []
+    for _ in range(rng.randint(3, 12)):
+        sentences = ' '.join(rng.choice(SENTENCES) for _ in range(rng.randint(1, 4)))
+        style = rng.choice(['', ' style="text-align: justify;"', ' class="MsoNormal" style="margin:0cm;line-height:150%"'])
+        sentences = sentences.replace(' persen', '&nbsp;persen', 1)
+        if rng.random() < 0.3:
+            sentences = f'<strong>{sentences}</strong><o:p></o:p>'
+        paragraphs.append(f'<p{style}>{sentences}</p>')
+    if rng.random() < 0.2:
+        paragraphs.append('<table><tr><td>Bulan</td><td nowrap>Inflasi</td></tr><tr><td>Januari</td><td>0,12</td></tr></table>')
+    body = '\r\n'.join(paragraphs) if rng.random() < 0.5 else '<br />'.join(paragraphs)
+
+    roll = rng.random()
+    if roll < 0.25:
+        # Respons yang HTML-nya ter-escape dua kali
+        body = body.replace('<', '\\u003C').replace('>', '\\u003E').replace('"', '\\u0022')
+    elif roll < 0.30:
+        body = body + '<!-- generated -->'
+    elif roll < 0.33:
+        body = body.replace('&nbsp;', '&amp;nbsp;')
+    elif roll < 0.40:
+        body = ' '.join(rng.choice(SENTENCES) for _ in range(8)) + '\\r\\n' + rng.choice(SENTENCES)
+    return body
+
+
+def synthetic_abstract(rng):
+    parts = [rng.choice(SENTENCES) for _ in range(rng.randint(2, 8))]
+    separators = ['\\r\\n', '\\u000D\\u000A', '\r\n', ' ', '\t', '\\u00e9']
+    return ''.join(part + rng.choice(separators) for part in parts)
+
+
+def synthetic_corpus(count, seed=0):
+    rng = random.Random(seed)
+    return [
+        {
+            'title': rng.choice(SENTENCES).replace('&', '&amp;') + rng.choice(['', ' <b>Rilis</b>']),
+            'news': synthetic_news_body(rng),
+            'abstract': synthetic_abstract(rng),
+        }
+        for _ in range(count)
+    ]
+
+
+def load_corpus(path):
+    """
+    Item API BPS dari file JSON: list item, satu respons list ({"data": [meta, items]}),
+    atau list respons.
+    """
+    with open(path, encoding='utf-8') as f:
+        payload = json.load(f)
+    payloads = payload if isinstance(payload, list) and payload and isinstance(payload[0], dict) and 'data' in payload[0] else [payload]
+    items = []
+    for page in payloads:
+        if isinstance(page, dict) and isinstance(page.get('data'), list) and len(page['data']) > 1:
+            items.extend(page['data'][1])
+        elif isinstance(page, list):
+            items.extend(page)
+    return [item for item in items if isinstance(item, dict)]
+
+
+def best_time(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+class Command(BaseCommand):
+    help = 'Benchmark text_cleaner vs cleaner HTML/abstrak lama pada korpus berita BPS (file JSON atau sintetis)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--corpus', type=str, help='File JSON berisi item/respons list API BPS (news/publication)')
+        parser.add_argument('--items', type=int, default=2000, help='Jumlah item korpus sintetis bila --corpus tidak diberikan (default: 2000)')
+        parser.add_argument('--repeat', type=int, default=3, help='Jumlah pengulangan, diambil yang tercepat (default: 3)')
+        parser.add_argument('--processes', type=int, default=0, help='Bandingkan juga clean_many dengan N proses pada backfill')
+        parser.add_argument('--backfill', type=int, default=20000, help='Jumlah berita untuk benchmark process pool (default: 20000)')
+
+    def handle(self, *args, **options):
+        if options['corpus']:
+            corpus = load_corpus(options['corpus'])
+            source = options['corpus']
+        else:
+            corpus = synthetic_corpus(options['items'])
+            source = 'sintetis'
+        if not corpus:
+            raise CommandError('Korpus kosong')
+
+        self.stdout.write(f'[INFO] Korpus {source}: {len(corpus)} item, {options["repeat"]}x ulang')
+        cases = [
+            ('isi berita', 'news', legacy_clean_html_content, text_cleaner.clean_html),
+            ('judul', 'title', lambda text: legacy_clean_text_field(text, max_length=255),
+             lambda text: text_cleaner.clean_text(text, max_length=255)),
+            ('abstrak', 'abstract', legacy_clean_abstract, text_cleaner.clean_abstract),
+        ]
+
+        failures = 0
+        for label, field, legacy, current in cases:
+            texts = [item.get(field) for item in corpus if item.get(field)]
+            if not texts:
+                continue
+            mismatches = [text for text in texts if legacy(text) != current(text)]
+            legacy_time = best_time(lambda: [legacy(text) for text in texts], options['repeat'])
+            current_time = best_time(lambda: [current(text) for text in texts], options['repeat'])
+
+            extra = ''
+            if field == 'news':
+                dom = sum(1 for text in texts if text_cleaner.uses_dom_parser(text))
+                extra = f'; DOM parser untuk {dom}/{len(texts)} item'
+            line = (
+                f'   {label}: lama {len(texts) / legacy_time:,.0f} item/detik, '
+                f'baru {len(texts) / current_time:,.0f} item/detik ({legacy_time / current_time:.1f}x){extra}'
+            )
+            if mismatches:
+                failures += 1
+                self.stdout.write(self.style.ERROR(
+                    f'   [ERROR] {label}: {len(mismatches)} hasil berbeda, contoh: {mismatches[0][:200]!r}'
+                ))
+                self.stdout.write(line)
+            else:
+                self.stdout.write(self.style.SUCCESS(f'   [OK] {label}: {len(texts)} hasil identik'))
+                self.stdout.write(line)
+
+        if options['processes'] > 1:
+            self.benchmark_process_pool(corpus, options['processes'], options['backfill'])
+
+        if failures:
+            raise CommandError(f'text_cleaner berbeda dengan cleaner lama pada {failures} field')
+
+    def benchmark_process_pool(self, corpus, processes, backfill):
+        bodies = [item.get('news') for item in corpus if item.get('news')]
+        if not bodies:
+            return
+        texts = (bodies * (backfill // len(bodies) + 1))[:backfill]
+        self.stdout.write('')
+        self.stdout.write(f'[INFO] Backfill {len(texts)} berita: serial vs {processes} proses')
+
+        started = time.perf_counter()
+        serial = text_cleaner.clean_many(texts, processes=1)
+        serial_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        pooled = text_cleaner.clean_many(texts, processes=processes, min_items=0)
+        pool_time = time.perf_counter() - started
+
+        status = self.style.SUCCESS('[OK]') if serial == pooled else self.style.ERROR('[ERROR] hasil berbeda,')
+        self.stdout.write(
+            f'   {status} serial {len(texts) / serial_time:,.0f} item/detik, '
+            f'{processes} proses {len(texts) / pool_time:,.0f} item/detik ({serial_time / pool_time:.1f}x, termasuk start proses)'
+        )
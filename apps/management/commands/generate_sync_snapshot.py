@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.services.data_source import DEFAULT_SNAPSHOT_DIR
+from apps.services.synthetic_data import SyntheticScale, write_snapshot
+
+
+class Command(BaseCommand):
+    help = (
+        'Membuat snapshot sintetis (workbook indikator + halaman API BPS) untuk '
+        'sync_data --source replay, tanpa credentials dan jaringan'
+    )
+
+    def add_arguments(self, parser):
+        defaults = SyntheticScale()
+        parser.add_argument('--output', type=str, default=str(DEFAULT_SNAPSHOT_DIR),
+                            help=f'Direktori snapshot (default: {DEFAULT_SNAPSHOT_DIR})')
+        parser.add_argument('--scale', type=float, default=1.0,
+                            help='Pengali ukuran grid dan jumlah item API, lihat SyntheticScale.scaled() (default: 1)')
+        parser.add_argument('--years', type=int, default=defaults.years,
+                            help=f'Jumlah tahun per worksheet (default: {defaults.years})')
+        parser.add_argument('--regions', type=int, default=defaults.regions,
+                            help=f'Jumlah kabupaten/kota di worksheet IPM/Gini (default: {defaults.regions})')
+        parser.add_argument('--commodities', type=int, default=defaults.commodities,
+                            help=f'Jumlah komoditas per worksheet Inflasi_perkom (default: {defaults.commodities})')
+        parser.add_argument('--perkom-years', type=int, default=defaults.perkom_years,
+                            help=f'Jumlah worksheet Inflasi_perkom_YYYY (default: {defaults.perkom_years})')
+        parser.add_argument('--news', type=int, default=defaults.news)
+        parser.add_argument('--publications', type=int, default=defaults.publications)
+        parser.add_argument('--infographics', type=int, default=defaults.infographics)
+        parser.add_argument('--end-year', type=int, default=defaults.end_year,
+                            help=f'Tahun terakhir di data (default: {defaults.end_year})')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        if options['scale'] <= 0:
+            raise CommandError('--scale harus lebih besar dari 0')
+
+        scale = SyntheticScale(
+            years=options['years'],
+            regions=options['regions'],
+            commodities=options['commodities'],
+            perkom_years=options['perkom_years'],
+            news=options['news'],
+            publications=options['publications'],
+            infographics=options['infographics'],
+            end_year=options['end_year'],
+            seed=options['seed'],
+        ).scaled(options['scale'])
+        self.stdout.write(
+            f'[INFO] Membuat snapshot sintetis: {scale.years} tahun, {scale.regions} wilayah, '
+            f'{scale.commodities} komoditas x {scale.perkom_years} tahun perkom, '
+            f'{scale.news} berita, {scale.publications} publikasi, {scale.infographics} infografis'
+        )
+        store = write_snapshot(options['output'], scale)
+        self.stdout.write(self.style.SUCCESS(f'[OK] Snapshot ditulis ke {store.directory}: {store.summary()}'))
+        self.stdout.write(f'[INFO] Jalankan: python manage.py sync_data --source replay --source-dir {store.directory}')
@@ -0,0 +1,82 @@
+"""
+Worker untuk antrian job sync (SyncJob) yang dibuat oleh endpoint /api/sync/*.
+
+Jalankan sebagai proses terpisah dari web server, mis.:
+
+    python manage.py run_sync_worker
+    python manage.py run_sync_worker --once     # proses job yang ada lalu keluar (cron)
+"""
+import os
+import socket
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+from django.utils import timezone
+
+from apps.models import SyncJob
+from apps.services import sync_jobs
+
+
+class Command(BaseCommand):
+    help = 'Menjalankan job sinkronisasi dari antrian /api/sync/*'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true',
+                            help='Proses semua job yang sedang menunggu lalu keluar')
+        parser.add_argument('--poll-interval', type=float, default=5.0,
+                            help='Jeda (detik) sebelum memeriksa antrian lagi saat kosong (default: 5)')
+        parser.add_argument('--workers', type=int, default=getattr(settings, 'SYNC_WORKERS', 1),
+                            help='Jumlah dataset dalam satu job yang di-sync bersamaan (default: settings SYNC_WORKERS atau 1)')
+        parser.add_argument('--max-jobs', type=int, default=0,
+                            help='Berhenti setelah N job (default: 0, tanpa batas)')
+
+    def handle(self, *args, **options):
+        if options['poll_interval'] <= 0:
+            raise CommandError('--poll-interval harus lebih besar dari 0')
+        worker = f"{socket.gethostname()}:{os.getpid()}"
+        workers = max(1, options['workers'])
+        processed = 0
+
+        self.stdout.write(self.style.SUCCESS(f'[INFO] Sync worker {worker} berjalan'))
+        try:
+            while not options['max_jobs'] or processed < options['max_jobs']:
+                close_old_connections()
+                stale = sync_jobs.fail_stale_jobs()
+                if stale:
+                    self.stdout.write(self.style.WARNING(f'[WARNING] {stale} job tanpa aktivitas ditandai gagal'))
+
+                job = sync_jobs.claim_next(worker)
+                if job is None:
+                    if options['once']:
+                        break
+                    time.sleep(options['poll_interval'])
+                    continue
+
+                self.run_job(job, workers)
+                processed += 1
+        except KeyboardInterrupt:
+            self.stdout.write('[INFO] Worker dihentikan')
+
+        self.stdout.write(f'[INFO] {processed} job diproses')
+
+    def run_job(self, job, workers):
+        self.stdout.write(f'[INFO] Job #{job.pk} ({job.sync_type}) dimulai')
+        try:
+            job = sync_jobs.execute(job, workers=workers)
+        except KeyboardInterrupt:
+            SyncJob.objects.filter(pk=job.pk).update(
+                status=SyncJob.Status.FAILED, error='Worker dihentikan', finished_at=timezone.now(),
+            )
+            raise
+
+        result = job.result
+        if job.status == SyncJob.Status.SUCCESS:
+            self.stdout.write(self.style.SUCCESS(
+                f"[OK] Job #{job.pk} selesai: {result['total_created']} data baru, "
+                f"{result['total_updated']} data diperbarui, {result['total_unchanged']} data tidak berubah"
+            ))
+        else:
+            self.stdout.write(self.style.ERROR(f'[ERROR] Job #{job.pk} gagal: {job.error}'))
+        self.stdout.write('')
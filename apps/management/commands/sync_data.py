@@ -1,28 +1,19 @@
-from django.core.management.base import BaseCommand
-from apps.services.API_service import (
-    IPMService, 
-    BPSNewsService, 
-    BPSPublicationService, 
-    BPSInfographicService,
-    HotelOccupancyCombinedService,
-    HotelOccupancyYearlyService,
-    GiniRatioService,
-    IPM_UHH_SPService,
-    IPM_HLSService,
-    IPM_RLSService,
-    IPM_PengeluaranPerKapitaService,
-    IPM_IndeksKesehatanService,
-    IPM_IndeksHidupLayakService,
-    IPM_IndeksPendidikanService,
-    KetenagakerjaanTPTService,
-    KetenagakerjaanTPAKService,
-    KemiskinanSurabayaService,
-    KemiskinanJawaTimurService,
-    KependudukanService,
-    PDRBPengeluaranService,
-    PDRBLapanganUsahaService,
-    InflasiService
-)
+from contextlib import nullcontext
+
+from django.core.management.base import BaseCommand, CommandError
+from apps.models import SyncRun
+from apps.services.bps_client import bps_client
+from apps.services.data_source import LIVE, MODES as SOURCE_MODES, current_source, use_source
+from apps.services.sheets_client import INDICATOR_SHEET_ID, sheets_registry
+from apps.services.sheet_prefetch import grid_cache, prefetch_worksheets, service_worksheets
+from apps.services.staged_load import LOAD_MODES, use_load_mode
+from apps.services.sync_orchestrator import SYNC_TYPES, build_tasks
+from apps.services.sync_state import force_resync
+from apps.services.sync_telemetry import track_run
+
+
+# Task pertama grup IPM sub-kategori; header grup dicetak sebelum task ini untuk --type all/ipm-all
+IPM_SUB_GROUP_START = 'IPM UHH SP'
 
 
 class Command(BaseCommand):
@@ -32,391 +23,136 @@ class Command(BaseCommand):
         parser.add_argument(
             '--type',
             type=str,
-            choices=[
-                'all', 'ipm', 'ipm-all', 'ipm-uhh-sp', 'ipm-hls', 'ipm-rls', 
-                'ipm-pengeluaran-per-kapita', 'ipm-indeks-kesehatan', 
-                'ipm-indeks-hidup-layak', 'ipm-indeks-pendidikan', 'gini-ratio',
-                'news', 'publications', 'infographics', 
-                'hotel-occupancy-combined', 'hotel-occupancy-yearly', 'hotel-occupancy',
-                'ketenagakerjaan-tpt', 'ketenagakerjaan-tpak', 'ketenagakerjaan',
-                'kemiskinan-surabaya', 'kemiskinan-jawa-timur', 'kemiskinan',
-                'kependudukan', 'pdrb-pengeluaran', 'pdrb-lapangan-usaha', 'pdrb',
-                'inflasi'
-            ],
+            choices=SYNC_TYPES,
             default='all',
             help='Jenis data yang akan di-sync (default: all)'
         )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Parse dan simpan ulang semua worksheet walaupun isinya tidak berubah, dan ambil semua halaman API BPS'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Jumlah dataset yang di-sync bersamaan (default: 1, berurutan)'
+        )
+        parser.add_argument(
+            '--source',
+            choices=SOURCE_MODES,
+            help='Sumber data: live, record (live + simpan snapshot) atau replay (dari snapshot, tanpa jaringan). '
+                 'Default: settings DATA_SOURCE_MODE atau live'
+        )
+        parser.add_argument(
+            '--source-dir',
+            type=str,
+            help='Direktori snapshot untuk --source record/replay (default: settings DATA_SOURCE_DIR atau sync_snapshots/)'
+        )
+        parser.add_argument(
+            '--load-mode',
+            choices=LOAD_MODES,
+            help='upsert: tulis langsung ke tabel live; staging: tulis tiap dataset ke tabel staging lalu '
+                 'gabungkan ke tabel live dalam satu transaksi. Default: settings SYNC_LOAD_MODE atau upsert'
+        )
+        parser.add_argument(
+            '--trigger',
+            choices=SyncRun.Trigger.values,
+            default=SyncRun.Trigger.COMMAND,
+            help='Pemicu yang dicatat di riwayat sinkronisasi (SyncRun) (default: command)'
+        )
 
     def handle(self, *args, **options):
         sync_type = options['type']
-        
+        if options['source_dir'] and not options['source']:
+            raise CommandError('--source-dir hanya berlaku bersama --source record/replay')
+        workers = max(1, options['workers'])
+        tasks = build_tasks(sync_type)
+
         self.stdout.write(self.style.SUCCESS('[INFO] Memulai sinkronisasi data...'))
         self.stdout.write('')
-        
-        if sync_type == 'all' or sync_type == 'ipm':
-            self.stdout.write('[INFO] Sinkronisasi data IPM dari spreadsheet...')
-            try:
-                created, updated = IPMService.sync_ipm()
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f'   [OK] IPM: {created} data baru, {updated} data diperbarui'
-                    )
-                )
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'   [ERROR] Error sync IPM: {str(e)}')
-                )
-            self.stdout.write('')
-        
-        # Sync IPM sub-categories
-        ipm_sub_categories = [
-            'ipm-uhh-sp', 'ipm-hls', 'ipm-rls', 'ipm-pengeluaran-per-kapita',
-            'ipm-indeks-kesehatan', 'ipm-indeks-hidup-layak', 'ipm-indeks-pendidikan'
-        ]
-        
-        if sync_type == 'all' or sync_type == 'ipm-all' or sync_type in ipm_sub_categories:
-            if sync_type == 'all' or sync_type == 'ipm-all':
-                self.stdout.write('[INFO] Sinkronisasi semua data IPM sub-kategori dari spreadsheet...')
-                self.stdout.write('')
-            
-            # IPM UHH SP
-            if sync_type == 'all' or sync_type == 'ipm-all' or sync_type == 'ipm-uhh-sp':
-                self.stdout.write('[INFO] Sinkronisasi data IPM UHH SP...')
-                try:
-                    created, updated = IPM_UHH_SPService.sync_ipm_uhh_sp()
-                    self.stdout.write(
-                        self.style.SUCCESS(
-                            f'   [OK] IPM UHH SP: {created} data baru, {updated} data diperbarui'
-                        )
-                    )
-                except Exception as e:
-                    self.stdout.write(
-                        self.style.ERROR(f'   [ERROR] Error sync IPM UHH SP: {str(e)}')
-                    )
-                self.stdout.write('')
-            
-            # IPM HLS
-            if sync_type == 'all' or sync_type == 'ipm-all' or sync_type == 'ipm-hls':
-                self.stdout.write('[INFO] Sinkronisasi data IPM HLS...')
-                try:
-                    created, updated = IPM_HLSService.sync_ipm_hls()
-                    self.stdout.write(
-                        self.style.SUCCESS(
-                            f'   [OK] IPM HLS: {created} data baru, {updated} data diperbarui'
-                        )
-                    )
-                except Exception as e:
-                    self.stdout.write(
-                        self.style.ERROR(f'   [ERROR] Error sync IPM HLS: {str(e)}')
-                    )
-                self.stdout.write('')
-            
-            # IPM RLS
-            if sync_type == 'all' or sync_type == 'ipm-all' or sync_type == 'ipm-rls':
-                self.stdout.write('[INFO] Sinkronisasi data IPM RLS...')
-                try:
-                    created, updated = IPM_RLSService.sync_ipm_rls()
-                    self.stdout.write(
-                        self.style.SUCCESS(
-                            f'   [OK] IPM RLS: {created} data baru, {updated} data diperbarui'
-                        )
-                    )
-                except Exception as e:
-                    self.stdout.write(
-                        self.style.ERROR(f'   [ERROR] Error sync IPM RLS: {str(e)}')
-                    )
-                self.stdout.write('')
-            
-            # IPM Pengeluaran per Kapita
-            if sync_type == 'all' or sync_type == 'ipm-all' or sync_type == 'ipm-pengeluaran-per-kapita':
-                self.stdout.write('[INFO] Sinkronisasi data IPM Pengeluaran per Kapita...')
-                try:
-                    created, updated = IPM_PengeluaranPerKapitaService.sync_ipm_pengeluaran_per_kapita()
-                    self.stdout.write(
-                        self.style.SUCCESS(
-                            f'   [OK] IPM Pengeluaran per Kapita: {created} data baru, {updated} data diperbarui'
-                        )
-                    )
-                except Exception as e:
-                    self.stdout.write(
-                        self.style.ERROR(f'   [ERROR] Error sync IPM Pengeluaran per Kapita: {str(e)}')
-                    )
-                self.stdout.write('')
-            
-            # IPM Indeks Kesehatan
-            if sync_type == 'all' or sync_type == 'ipm-all' or sync_type == 'ipm-indeks-kesehatan':
-                self.stdout.write('[INFO] Sinkronisasi data IPM Indeks Kesehatan...')
-                try:
-                    created, updated = IPM_IndeksKesehatanService.sync_ipm_indeks_kesehatan()
-                    self.stdout.write(
-                        self.style.SUCCESS(
-                            f'   [OK] IPM Indeks Kesehatan: {created} data baru, {updated} data diperbarui'
-                        )
-                    )
-                except Exception as e:
-                    self.stdout.write(
-                        self.style.ERROR(f'   [ERROR] Error sync IPM Indeks Kesehatan: {str(e)}')
-                    )
-                self.stdout.write('')
-            
-            # IPM Indeks Hidup Layak
-            if sync_type == 'all' or sync_type == 'ipm-all' or sync_type == 'ipm-indeks-hidup-layak':
-                self.stdout.write('[INFO] Sinkronisasi data IPM Indeks Hidup Layak...')
-                try:
-                    created, updated = IPM_IndeksHidupLayakService.sync_ipm_indeks_hidup_layak()
-                    self.stdout.write(
-                        self.style.SUCCESS(
-                            f'   [OK] IPM Indeks Hidup Layak: {created} data baru, {updated} data diperbarui'
-                        )
-                    )
-                except Exception as e:
-                    self.stdout.write(
-                        self.style.ERROR(f'   [ERROR] Error sync IPM Indeks Hidup Layak: {str(e)}')
-                    )
-                self.stdout.write('')
-            
-            # IPM Indeks Pendidikan
-            if sync_type == 'all' or sync_type == 'ipm-all' or sync_type == 'ipm-indeks-pendidikan':
-                self.stdout.write('[INFO] Sinkronisasi data IPM Indeks Pendidikan...')
-                try:
-                    created, updated = IPM_IndeksPendidikanService.sync_ipm_indeks_pendidikan()
-                    self.stdout.write(
-                        self.style.SUCCESS(
-                            f'   [OK] IPM Indeks Pendidikan: {created} data baru, {updated} data diperbarui'
-                        )
-                    )
-                except Exception as e:
-                    self.stdout.write(
-                        self.style.ERROR(f'   [ERROR] Error sync IPM Indeks Pendidikan: {str(e)}')
-                    )
+
+        # Grid hasil prefetch hanya berlaku selama satu kali sync
+        force_context = force_resync() if options['force'] else nullcontext()
+        source_context = use_source(options['source'], options['source_dir']) if options['source'] else nullcontext()
+        load_context = use_load_mode(options['load_mode']) if options['load_mode'] else nullcontext()
+        with source_context, load_context, grid_cache.session(), force_context:
+            source = current_source()
+            if source.mode != LIVE:
+                self.stdout.write(f'[INFO] Sumber data: {source.describe()}')
                 self.stdout.write('')
-        
-        if sync_type == 'all' or sync_type == 'gini-ratio':
-            self.stdout.write('[INFO] Sinkronisasi data Gini Ratio dari spreadsheet...')
-            try:
-                created, updated = GiniRatioService.sync_gini_ratio()
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f'   [OK] Gini Ratio: {created} data baru, {updated} data diperbarui'
-                    )
-                )
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'   [ERROR] Error sync Gini Ratio: {str(e)}')
-                )
-            self.stdout.write('')
-        
-        if sync_type == 'all' or sync_type == 'news':
-            self.stdout.write('[INFO] Sinkronisasi data News dari API BPS...')
-            try:
-                created, updated = BPSNewsService.sync_news()
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f'   [OK] News: {created} data baru, {updated} data diperbarui'
-                    )
-                )
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'   [ERROR] Error sync News: {str(e)}')
-                )
-            self.stdout.write('')
-        
-        if sync_type == 'all' or sync_type == 'publications':
-            self.stdout.write('[INFO] Sinkronisasi data Publications dari API BPS...')
-            try:
-                created, updated = BPSPublicationService.sync_publication()
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f'   [OK] Publications: {created} data baru, {updated} data diperbarui'
-                    )
-                )
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'   [ERROR] Error sync Publications: {str(e)}')
-                )
-            self.stdout.write('')
-        
-        if sync_type == 'all' or sync_type == 'infographics':
-            self.stdout.write('[INFO] Sinkronisasi data Infographics dari API BPS...')
-            try:
-                created, updated = BPSInfographicService.sync_infographic()
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f'   [OK] Infographics: {created} data baru, {updated} data diperbarui'
-                    )
-                )
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'   [ERROR] Error sync Infographics: {str(e)}')
-                )
-            self.stdout.write('')
-        
-        if sync_type == 'all' or sync_type == 'hotel-occupancy-combined' or sync_type == 'hotel-occupancy':
-            self.stdout.write('[INFO] Sinkronisasi data Hotel Occupancy (Gabung Semua) dari spreadsheet...')
-            try:
-                created, updated = HotelOccupancyCombinedService.sync_hotel_occupancy_combined()
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f'   [OK] Hotel Occupancy (Gabung Semua): {created} data baru, {updated} data diperbarui'
-                    )
-                )
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'   [ERROR] Error sync Hotel Occupancy (Gabung Semua): {str(e)}')
-                )
-            self.stdout.write('')
-        
-        if sync_type == 'all' or sync_type == 'hotel-occupancy-yearly' or sync_type == 'hotel-occupancy':
-            self.stdout.write('[INFO] Sinkronisasi data Hotel Occupancy (Year-to-Year) dari spreadsheet...')
-            try:
-                created, updated = HotelOccupancyYearlyService.sync_hotel_occupancy_yearly()
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f'   [OK] Hotel Occupancy (Year-to-Year): {created} data baru, {updated} data diperbarui'
-                    )
-                )
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'   [ERROR] Error sync Hotel Occupancy (Year-to-Year): {str(e)}')
-                )
-            self.stdout.write('')
-        
-        # Ketenagakerjaan sync
-        if sync_type == 'all' or sync_type == 'ketenagakerjaan-tpt' or sync_type == 'ketenagakerjaan':
-            self.stdout.write('[INFO] Sinkronisasi data Ketenagakerjaan TPT dari spreadsheet...')
-            try:
-                created, updated = KetenagakerjaanTPTService.sync_ketenagakerjaan_tpt()
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f'   [OK] Ketenagakerjaan TPT: {created} data baru, {updated} data diperbarui'
-                    )
-                )
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'   [ERROR] Error sync Ketenagakerjaan TPT: {str(e)}')
-                )
-            self.stdout.write('')
-        
-        if sync_type == 'all' or sync_type == 'ketenagakerjaan-tpak' or sync_type == 'ketenagakerjaan':
-            self.stdout.write('[INFO] Sinkronisasi data Ketenagakerjaan TPAK dari spreadsheet...')
-            try:
-                created, updated = KetenagakerjaanTPAKService.sync_ketenagakerjaan_tpak()
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f'   [OK] Ketenagakerjaan TPAK: {created} data baru, {updated} data diperbarui'
-                    )
-                )
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'   [ERROR] Error sync Ketenagakerjaan TPAK: {str(e)}')
-                )
-            self.stdout.write('')
-        
-        # Kemiskinan sync
-        if sync_type == 'all' or sync_type == 'kemiskinan-surabaya' or sync_type == 'kemiskinan':
-            self.stdout.write('[INFO] Sinkronisasi data Kemiskinan Surabaya dari spreadsheet...')
-            try:
-                created, updated = KemiskinanSurabayaService.sync_kemiskinan_surabaya()
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f'   [OK] Kemiskinan Surabaya: {created} data baru, {updated} data diperbarui'
-                    )
-                )
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'   [ERROR] Error sync Kemiskinan Surabaya: {str(e)}')
-                )
-            self.stdout.write('')
-        
-        if sync_type == 'all' or sync_type == 'kemiskinan-jawa-timur' or sync_type == 'kemiskinan':
-            self.stdout.write('[INFO] Sinkronisasi data Kemiskinan Jawa Timur dari spreadsheet...')
-            try:
-                created, updated = KemiskinanJawaTimurService.sync_kemiskinan_jawa_timur()
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f'   [OK] Kemiskinan Jawa Timur: {created} data baru, {updated} data diperbarui'
-                    )
-                )
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'   [ERROR] Error sync Kemiskinan Jawa Timur: {str(e)}')
-                )
-            self.stdout.write('')
-        
-        # Kependudukan sync
-        if sync_type == 'all' or sync_type == 'kependudukan':
-            self.stdout.write('[INFO] Sinkronisasi data Kependudukan dari spreadsheet...')
-            try:
-                created, updated = KependudukanService.sync_kependudukan()
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f'   [OK] Kependudukan: {created} data baru, {updated} data diperbarui'
-                    )
-                )
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'   [ERROR] Error sync Kependudukan: {str(e)}')
-                )
-            self.stdout.write('')
-        
-        # PDRB Pengeluaran sync
-        if sync_type == 'all' or sync_type == 'pdrb-pengeluaran' or sync_type == 'pdrb':
-            self.stdout.write('[INFO] Sinkronisasi data PDRB Pengeluaran dari spreadsheet...')
-            try:
-                results = PDRBPengeluaranService.sync_all_pdrb_pengeluaran()
-                total_created = sum(r['created'] for r in results.values())
-                total_updated = sum(r['updated'] for r in results.values())
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f'   [OK] PDRB Pengeluaran: {total_created} data baru, {total_updated} data diperbarui'
-                    )
-                )
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'   [ERROR] Error sync PDRB Pengeluaran: {str(e)}')
-                )
-            self.stdout.write('')
-        
-        # PDRB Lapangan Usaha sync
-        if sync_type == 'all' or sync_type == 'pdrb-lapangan-usaha' or sync_type == 'pdrb':
-            self.stdout.write('[INFO] Sinkronisasi data PDRB Lapangan Usaha dari spreadsheet...')
-            try:
-                results = PDRBLapanganUsahaService.sync_all_pdrb_lapangan_usaha()
-                total_created = sum(r['created'] for r in results.values())
-                total_updated = sum(r['updated'] for r in results.values())
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f'   [OK] PDRB Lapangan Usaha: {total_created} data baru, {total_updated} data diperbarui'
-                    )
-                )
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'   [ERROR] Error sync PDRB Lapangan Usaha: {str(e)}')
-                )
-            self.stdout.write('')
-        
-        # Inflasi sync
-        if sync_type == 'all' or sync_type == 'inflasi':
-            self.stdout.write('[INFO] Sinkronisasi data Inflasi dari spreadsheet...')
-            try:
-                results = InflasiService.sync_all_inflasi()
-                total_created = sum(r['created'] for r in results.values())
-                total_updated = sum(r['updated'] for r in results.values())
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f'   [OK] Inflasi: {total_created} data baru, {total_updated} data diperbarui'
-                    )
-                )
+            with track_run(sync_type, options['trigger']) as telemetry:
+                self.prefetch_sheets(sync_type, tasks, telemetry)
+                self.run_sync(sync_type, tasks, telemetry, workers)
+
+        self.stdout.write(f'[INFO] Google Sheets client - {sheets_registry.report()}')
+        self.stdout.write(f'[INFO] Google Sheets {grid_cache.report()}')
+        if bps_client.stats()['requests']:
+            self.stdout.write(f'[INFO] API BPS - {bps_client.report()}')
+        self.stdout.write(self.style.SUCCESS('[OK] Sinkronisasi selesai!'))
+
+    def prefetch_sheets(self, sync_type, tasks, telemetry):
+        """Mengambil semua worksheet yang dibutuhkan sync_type dalam satu/beberapa batchGet."""
+        services = [service for task in tasks for service in task.services]
+        if not services:
+            # Tipe API BPS (news, publications, infographics) tidak membaca spreadsheet
+            return
+        # Juga untuk --type all: worksheet yang tidak dipakai atau sudah ditutup
+        # (mis. Inflasi_perkom tahun lalu) tidak ikut dibaca
+        titles = service_worksheets(*services)
+
+        self.stdout.write('[INFO] Prefetch worksheet dari spreadsheet...')
+        try:
+            with telemetry.prefetch():
+                prefetch_worksheets(INDICATOR_SHEET_ID, titles)
+        except Exception as e:
+            # Service tetap bisa membaca worksheet satu per satu
+            self.stdout.write(
+                self.style.WARNING(f'   [WARNING] Prefetch gagal, membaca per worksheet: {str(e)}')
+            )
+        self.stdout.write('')
+
+    def run_sync(self, sync_type, tasks, telemetry, workers=1):
+        """
+        Menjalankan semua task untuk sync_type; pengukurannya dicatat ke SyncRun milik `telemetry`.
+
+        workers=1: berurutan, output persis seperti sebelumnya (info -> hasil per task).
+        workers>1: task berjalan di thread pool, ringkasan dicetak setelah semua selesai
+        dengan urutan task yang sama.
+        """
+        if workers <= 1:
+            def on_start(task):
+                if task.name == IPM_SUB_GROUP_START and sync_type in ('all', 'ipm-all'):
+                    self.stdout.write('[INFO] Sinkronisasi semua data IPM sub-kategori dari spreadsheet...')
+                    self.stdout.write('')
+                self.stdout.write(f'[INFO] {task.info}')
+
+            telemetry.run_tasks(tasks, workers=1, on_start=on_start, on_result=self.write_result)
+            return
+
+        self.stdout.write(f'[INFO] Menjalankan {len(tasks)} task sinkronisasi dengan {workers} worker...')
+        self.stdout.write('')
+        results = telemetry.run_tasks(tasks, workers=workers)
+        for result in results:
+            self.stdout.write(f'[INFO] {result.task.info}')
+            self.write_result(result)
+
+    def write_result(self, result):
+        task = result.task
+        if result.ok:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f'   [OK] {task.name}: {result.created} data baru, {result.updated} data diperbarui, {result.unchanged} data tidak berubah'
+                )
+            )
+            if task.sheet_details and result.sheets:
                 # Print per-sheet summary
-                for sheet_name, counts in results.items():
+                for sheet_name, counts in result.sheets.items():
                     self.stdout.write(
-                        f'      - {sheet_name}: {counts["created"]} created, {counts["updated"]} updated'
+                        f'      - {sheet_name}: {counts["created"]} created, {counts["updated"]} updated, {counts["unchanged"]} unchanged'
                     )
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'   [ERROR] Error sync Inflasi: {str(e)}')
-                )
-            self.stdout.write('')
-        
-        self.stdout.write(self.style.SUCCESS('[OK] Sinkronisasi selesai!'))
-
+        else:
+            self.stdout.write(
+                self.style.ERROR(f'   [ERROR] Error sync {task.name}: {result.error}')
+            )
+        self.stdout.write('')
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-18 10:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apps', '0013_bookmark'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(max_length=100, verbose_name='Sumber')),
+                ('key', models.CharField(max_length=255, verbose_name='Nama Sheet')),
+                ('content_hash', models.CharField(max_length=64, verbose_name='Hash Konten')),
+                ('row_count', models.PositiveIntegerField(default=0, verbose_name='Jumlah Baris')),
+                ('synced_at', models.DateTimeField(auto_now=True, verbose_name='Terakhir Sync')),
+            ],
+            options={
+                'verbose_name': 'Status Sinkronisasi',
+                'verbose_name_plural': 'Status Sinkronisasi',
+                'unique_together': {('source', 'key')},
+            },
+        ),
+    ]
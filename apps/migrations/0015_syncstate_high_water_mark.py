@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apps', '0014_syncstate'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='syncstate',
+            name='full_synced_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Terakhir Sync Penuh'),
+        ),
+        migrations.AddField(
+            model_name='syncstate',
+            name='high_water_mark',
+            field=models.CharField(blank=True, default='', max_length=255, verbose_name='Item Terbaru'),
+        ),
+        migrations.AlterField(
+            model_name='syncstate',
+            name='content_hash',
+            field=models.CharField(blank=True, max_length=64, verbose_name='Hash Konten'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apps', '0015_syncstate_high_water_mark'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sync_type', models.CharField(max_length=50, verbose_name='Jenis Data')),
+                ('status', models.CharField(choices=[('queued', 'Menunggu'), ('running', 'Berjalan'), ('success', 'Selesai'), ('failed', 'Gagal')], default='queued', max_length=10, verbose_name='Status')),
+                ('progress', models.JSONField(blank=True, default=dict, verbose_name='Progress')),
+                ('result', models.JSONField(blank=True, default=dict, verbose_name='Hasil')),
+                ('error', models.TextField(blank=True, verbose_name='Error')),
+                ('worker', models.CharField(blank=True, max_length=255, verbose_name='Worker')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Dibuat')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='Mulai')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Selesai')),
+                ('heartbeat_at', models.DateTimeField(blank=True, null=True, verbose_name='Aktivitas Terakhir')),
+            ],
+            options={
+                'verbose_name': 'Job Sinkronisasi',
+                'verbose_name_plural': 'Job Sinkronisasi',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='apps_syncjo_status_445d67_idx')],
+            },
+        ),
+    ]
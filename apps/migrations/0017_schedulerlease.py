@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apps', '0016_syncjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SchedulerLease',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True, verbose_name='Nama')),
+                ('holder', models.CharField(blank=True, max_length=255, verbose_name='Pemegang')),
+                ('acquired_at', models.DateTimeField(blank=True, null=True, verbose_name='Diambil')),
+                ('renewed_at', models.DateTimeField(blank=True, null=True, verbose_name='Diperpanjang')),
+                ('expires_at', models.DateTimeField(blank=True, null=True, verbose_name='Kedaluwarsa')),
+            ],
+            options={
+                'verbose_name': 'Lease Scheduler',
+                'verbose_name_plural': 'Lease Scheduler',
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apps', '0017_schedulerlease'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DatasetSchedule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task_name', models.CharField(max_length=100, unique=True, verbose_name='Dataset')),
+                ('cadence', models.CharField(max_length=20, verbose_name='Frekuensi Rilis')),
+                ('interval_hours', models.FloatField(verbose_name='Interval Pemeriksaan (jam)')),
+                ('change_period_hours', models.FloatField(blank=True, null=True, verbose_name='Rata-rata Jarak Perubahan (jam)')),
+                ('next_run_at', models.DateTimeField(verbose_name='Sync Berikutnya')),
+                ('last_run_at', models.DateTimeField(blank=True, null=True, verbose_name='Sync Terakhir')),
+                ('last_changed_at', models.DateTimeField(blank=True, null=True, verbose_name='Perubahan Terakhir')),
+                ('unchanged_runs', models.PositiveIntegerField(default=0, verbose_name='Sync Tanpa Perubahan')),
+                ('last_error', models.TextField(blank=True, verbose_name='Error Terakhir')),
+            ],
+            options={
+                'verbose_name': 'Jadwal Sinkronisasi',
+                'verbose_name_plural': 'Jadwal Sinkronisasi',
+                'ordering': ['next_run_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:39
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apps', '0018_datasetschedule'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('trigger', models.CharField(choices=[('command', 'Command'), ('scheduler', 'Scheduler'), ('api', 'API')], max_length=20, verbose_name='Pemicu')),
+                ('sync_type', models.CharField(max_length=50, verbose_name='Jenis Sync')),
+                ('status', models.CharField(choices=[('running', 'Berjalan'), ('success', 'Berhasil'), ('failed', 'Gagal')], default='running', max_length=20, verbose_name='Status')),
+                ('started_at', models.DateTimeField(auto_now_add=True, verbose_name='Mulai')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Selesai')),
+                ('duration_seconds', models.FloatField(default=0, verbose_name='Durasi (detik)')),
+                ('created', models.PositiveIntegerField(default=0, verbose_name='Data Baru')),
+                ('updated', models.PositiveIntegerField(default=0, verbose_name='Data Diperbarui')),
+                ('unchanged', models.PositiveIntegerField(default=0, verbose_name='Data Tidak Berubah')),
+                ('queries', models.PositiveIntegerField(default=0, verbose_name='Query SQL')),
+                ('error', models.TextField(blank=True, verbose_name='Error')),
+            ],
+            options={
+                'verbose_name': 'Riwayat Sinkronisasi',
+                'verbose_name_plural': 'Riwayat Sinkronisasi',
+                'ordering': ['-started_at'],
+                'indexes': [models.Index(fields=['started_at'], name='apps_syncru_started_60f743_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='SyncStep',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task', models.CharField(max_length=100, verbose_name='Task')),
+                ('key', models.CharField(blank=True, max_length=255, verbose_name='Worksheet / Daftar API')),
+                ('status', models.CharField(choices=[('running', 'Berjalan'), ('success', 'Berhasil'), ('failed', 'Gagal')], max_length=20, verbose_name='Status')),
+                ('duration_seconds', models.FloatField(default=0, verbose_name='Durasi (detik)')),
+                ('fetch_seconds', models.FloatField(default=0, verbose_name='Fetch (detik)')),
+                ('parse_seconds', models.FloatField(default=0, verbose_name='Parse (detik)')),
+                ('save_seconds', models.FloatField(default=0, verbose_name='Write (detik)')),
+                ('state_seconds', models.FloatField(default=0, verbose_name='Cek Perubahan (detik)')),
+                ('bytes_read', models.BigIntegerField(default=0, verbose_name='Byte Dibaca')),
+                ('cells_read', models.BigIntegerField(default=0, verbose_name='Sel Dibaca')),
+                ('created', models.PositiveIntegerField(default=0, verbose_name='Data Baru')),
+                ('updated', models.PositiveIntegerField(default=0, verbose_name='Data Diperbarui')),
+                ('unchanged', models.PositiveIntegerField(default=0, verbose_name='Data Tidak Berubah')),
+                ('skipped', models.BooleanField(default=False, verbose_name='Dilewati (Tidak Berubah)')),
+                ('queries', models.PositiveIntegerField(default=0, verbose_name='Query SQL')),
+                ('error', models.TextField(blank=True, verbose_name='Error')),
+                ('run', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='steps', to='apps.syncrun', verbose_name='Riwayat')),
+            ],
+            options={
+                'verbose_name': 'Langkah Sinkronisasi',
+                'verbose_name_plural': 'Langkah Sinkronisasi',
+                'ordering': ['run', 'task', 'key'],
+                'indexes': [models.Index(fields=['task', 'key'], name='apps_syncst_task_27f9e2_idx')],
+            },
+        ),
+    ]
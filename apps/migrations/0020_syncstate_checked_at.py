@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apps', '0019_syncrun_syncstep'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='syncstate',
+            name='checked_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Terakhir Dicek'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apps', '0020_syncstate_checked_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IndicatorSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=100, unique=True, verbose_name='Kunci Indikator')),
+                ('position', models.PositiveIntegerField(default=0, verbose_name='Urutan')),
+                ('name', models.CharField(max_length=255, verbose_name='Nama Indikator')),
+                ('value', models.DecimalField(blank=True, decimal_places=3, max_digits=24, null=True, verbose_name='Nilai Terbaru')),
+                ('previous_value', models.DecimalField(blank=True, decimal_places=3, max_digits=24, null=True, verbose_name='Nilai Sebelumnya')),
+                ('unit', models.CharField(blank=True, max_length=20, verbose_name='Satuan')),
+                ('year', models.IntegerField(blank=True, null=True, verbose_name='Tahun')),
+                ('period', models.CharField(max_length=50, verbose_name='Periode')),
+                ('previous_period', models.CharField(blank=True, max_length=50, verbose_name='Periode Sebelumnya')),
+                ('change', models.FloatField(blank=True, null=True, verbose_name='Perubahan')),
+                ('change_percent', models.FloatField(blank=True, null=True, verbose_name='Perubahan (%)')),
+                ('change_type', models.CharField(max_length=20, verbose_name='Jenis Perubahan')),
+                ('is_currency', models.BooleanField(default=False, verbose_name='Nilai Rupiah')),
+                ('computed_at', models.DateTimeField(auto_now=True, verbose_name='Dihitung Pada')),
+            ],
+            options={
+                'verbose_name': 'Snapshot Indikator Dashboard',
+                'verbose_name_plural': 'Snapshot Indikator Dashboard',
+                'ordering': ['position'],
+                'indexes': [models.Index(fields=['position'], name='apps_indica_positio_e237e7_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apps', '0021_indicatorsnapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DatasetVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dataset', models.CharField(max_length=100, unique=True, verbose_name='Dataset')),
+                ('version', models.PositiveBigIntegerField(default=0, verbose_name='Versi')),
+                ('changed_at', models.DateTimeField(blank=True, null=True, verbose_name='Terakhir Berubah')),
+            ],
+            options={
+                'verbose_name': 'Versi Dataset',
+                'verbose_name_plural': 'Versi Dataset',
+            },
+        ),
+    ]
@@ -0,0 +1,317 @@
+# Generated by Django 5.2.7 on 2026-10-18 12:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Copy of apps.models.region_key at the time of this migration; later changes to the
+# model code must not change how this migration fills existing rows
+PROVINCE_REGION_KEY = 'JAWA TIMUR'
+CITY_ONLY_REGIONS = ('SURABAYA', 'BATU')
+
+
+def region_key(location_name):
+    key = ' '.join(str(location_name).upper().replace('.', ' ').split())
+    if 'JAWA TIMUR' in key or 'JATIM' in key:
+        return PROVINCE_REGION_KEY
+    for prefix in ('KABUPATEN ', 'KAB '):
+        if key.startswith(prefix):
+            return key[len(prefix):]
+    for prefix in ('KOTAMADYA ', 'KOTA '):
+        if key.startswith(prefix):
+            return 'KOTA ' + key[len(prefix):]
+    if key in CITY_ONLY_REGIONS:
+        return 'KOTA ' + key
+    return key
+
+
+REGIONAL_MODELS = (
+    'HumanDevelopmentIndex', 'GiniRatio', 'IPM_UHH_SP', 'IPM_HLS', 'IPM_RLS', 'IPM_PengeluaranPerKapita',
+    'IPM_IndeksKesehatan', 'IPM_IndeksHidupLayak', 'IPM_IndeksPendidikan',
+)
+
+
+def region_defaults(code):
+    # Copy of Region.defaults_for at the time of this migration
+    if code == PROVINCE_REGION_KEY:
+        return {'name': code.title(), 'region_type': 'PROVINSI'}
+    if code.startswith('KOTA '):
+        return {'name': code.title(), 'region_type': 'KOTA'}
+    return {'name': f"Kabupaten {code.title()}"[:255], 'region_type': 'KABUPATEN'}
+
+
+def fill_regions(apps, schema_editor):
+    Region = apps.get_model('apps', 'Region')
+    names = {
+        model_name: apps.get_model('apps', model_name).objects.values_list('location_name', flat=True).distinct()
+        for model_name in REGIONAL_MODELS
+    }
+    aliases = {}
+    for location_names in names.values():
+        for location_name in location_names:
+            aliases.setdefault(region_key(location_name), set()).add(location_name)
+    regions = {}
+    for code, spellings in sorted(aliases.items()):
+        regions[code] = Region.objects.create(code=code, aliases=sorted(spellings), **region_defaults(code))
+
+    for model_name, location_names in names.items():
+        model = apps.get_model('apps', model_name)
+        for location_name in location_names:
+            model.objects.filter(location_name=location_name).update(region=regions[region_key(location_name)])
+
+        # Dua ejaan wilayah yang sama pada satu tahun ('Surabaya' / 'KOTA SURABAYA') menjadi
+        # duplikat key (region, year); baris terbaru (pk terbesar) yang dipertahankan
+        seen = set()
+        duplicates = []
+        for pk, region_id, year in model.objects.order_by('-pk').values_list('pk', 'region_id', 'year'):
+            if (region_id, year) in seen:
+                duplicates.append(pk)
+            seen.add((region_id, year))
+        if duplicates:
+            model.objects.filter(pk__in=duplicates).delete()
+
+
+def fill_location_type(apps, schema_editor):
+    # Reverse: isi ulang kolom location_type dengan aturan sync lama (nama diawali 'KOTA')
+    for model_name in REGIONAL_MODELS:
+        model = apps.get_model('apps', model_name)
+        model.objects.filter(location_name__startswith='KOTA').update(location_type='MUNICIPALITY')
+        model.objects.exclude(location_name__startswith='KOTA').update(location_type='REGENCY')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apps', '0022_datasetversion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Region',
+            fields=[
+                ('id', models.SmallAutoField(primary_key=True, serialize=False)),
+                ('code', models.CharField(max_length=255, unique=True, verbose_name='Kode Wilayah')),
+                ('name', models.CharField(max_length=255, verbose_name='Nama Wilayah')),
+                ('region_type', models.CharField(choices=[('KABUPATEN', 'Kabupaten'), ('KOTA', 'Kota'), ('PROVINSI', 'Provinsi')], max_length=10, verbose_name='Tipe Wilayah')),
+                ('aliases', models.JSONField(blank=True, default=list, verbose_name='Alias')),
+            ],
+            options={
+                'verbose_name': 'Wilayah',
+                'verbose_name_plural': 'Wilayah',
+                'ordering': ['code'],
+            },
+        ),
+        migrations.AddField(
+            model_name='giniratio',
+            name='region',
+            field=models.ForeignKey(db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='apps.region', verbose_name='Wilayah'),
+        ),
+        migrations.AddField(
+            model_name='humandevelopmentindex',
+            name='region',
+            field=models.ForeignKey(db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='apps.region', verbose_name='Wilayah'),
+        ),
+        migrations.AddField(
+            model_name='ipm_hls',
+            name='region',
+            field=models.ForeignKey(db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='apps.region', verbose_name='Wilayah'),
+        ),
+        migrations.AddField(
+            model_name='ipm_indekshiduplayak',
+            name='region',
+            field=models.ForeignKey(db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='apps.region', verbose_name='Wilayah'),
+        ),
+        migrations.AddField(
+            model_name='ipm_indekskesehatan',
+            name='region',
+            field=models.ForeignKey(db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='apps.region', verbose_name='Wilayah'),
+        ),
+        migrations.AddField(
+            model_name='ipm_indekspendidikan',
+            name='region',
+            field=models.ForeignKey(db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='apps.region', verbose_name='Wilayah'),
+        ),
+        migrations.AddField(
+            model_name='ipm_pengeluaranperkapita',
+            name='region',
+            field=models.ForeignKey(db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='apps.region', verbose_name='Wilayah'),
+        ),
+        migrations.AddField(
+            model_name='ipm_rls',
+            name='region',
+            field=models.ForeignKey(db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='apps.region', verbose_name='Wilayah'),
+        ),
+        migrations.AddField(
+            model_name='ipm_uhh_sp',
+            name='region',
+            field=models.ForeignKey(db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='apps.region', verbose_name='Wilayah'),
+        ),
+        migrations.RunPython(fill_regions, fill_location_type),
+        migrations.AlterField(
+            model_name='giniratio',
+            name='region',
+            field=models.ForeignKey(db_index=False, editable=False, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='apps.region', verbose_name='Wilayah'),
+        ),
+        migrations.AlterField(
+            model_name='humandevelopmentindex',
+            name='region',
+            field=models.ForeignKey(db_index=False, editable=False, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='apps.region', verbose_name='Wilayah'),
+        ),
+        migrations.AlterField(
+            model_name='ipm_hls',
+            name='region',
+            field=models.ForeignKey(db_index=False, editable=False, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='apps.region', verbose_name='Wilayah'),
+        ),
+        migrations.AlterField(
+            model_name='ipm_indekshiduplayak',
+            name='region',
+            field=models.ForeignKey(db_index=False, editable=False, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='apps.region', verbose_name='Wilayah'),
+        ),
+        migrations.AlterField(
+            model_name='ipm_indekskesehatan',
+            name='region',
+            field=models.ForeignKey(db_index=False, editable=False, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='apps.region', verbose_name='Wilayah'),
+        ),
+        migrations.AlterField(
+            model_name='ipm_indekspendidikan',
+            name='region',
+            field=models.ForeignKey(db_index=False, editable=False, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='apps.region', verbose_name='Wilayah'),
+        ),
+        migrations.AlterField(
+            model_name='ipm_pengeluaranperkapita',
+            name='region',
+            field=models.ForeignKey(db_index=False, editable=False, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='apps.region', verbose_name='Wilayah'),
+        ),
+        migrations.AlterField(
+            model_name='ipm_rls',
+            name='region',
+            field=models.ForeignKey(db_index=False, editable=False, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='apps.region', verbose_name='Wilayah'),
+        ),
+        migrations.AlterField(
+            model_name='ipm_uhh_sp',
+            name='region',
+            field=models.ForeignKey(db_index=False, editable=False, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='apps.region', verbose_name='Wilayah'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='giniratio',
+            unique_together={('region', 'year')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='humandevelopmentindex',
+            unique_together={('region', 'year')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='ipm_hls',
+            unique_together={('region', 'year')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='ipm_indekshiduplayak',
+            unique_together={('region', 'year')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='ipm_indekskesehatan',
+            unique_together={('region', 'year')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='ipm_indekspendidikan',
+            unique_together={('region', 'year')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='ipm_pengeluaranperkapita',
+            unique_together={('region', 'year')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='ipm_rls',
+            unique_together={('region', 'year')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='ipm_uhh_sp',
+            unique_together={('region', 'year')},
+        ),
+        # Hanya state: default untuk kolom location_type yang dibuat ulang saat migrasi dibalik;
+        # isinya lalu diisi fill_location_type
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='giniratio',
+                    name='location_type',
+                    field=models.CharField(choices=[('REGENCY', 'Kabupaten'), ('MUNICIPALITY', 'Kota')], default='REGENCY', max_length=20, verbose_name='Tipe Lokasi'),
+                ),
+                migrations.AlterField(
+                    model_name='humandevelopmentindex',
+                    name='location_type',
+                    field=models.CharField(choices=[('REGENCY', 'Kabupaten'), ('MUNICIPALITY', 'Kota')], default='REGENCY', max_length=20, verbose_name='Tipe Lokasi'),
+                ),
+                migrations.AlterField(
+                    model_name='ipm_hls',
+                    name='location_type',
+                    field=models.CharField(choices=[('REGENCY', 'Kabupaten'), ('MUNICIPALITY', 'Kota')], default='REGENCY', max_length=20, verbose_name='Tipe Lokasi'),
+                ),
+                migrations.AlterField(
+                    model_name='ipm_indekshiduplayak',
+                    name='location_type',
+                    field=models.CharField(choices=[('REGENCY', 'Kabupaten'), ('MUNICIPALITY', 'Kota')], default='REGENCY', max_length=20, verbose_name='Tipe Lokasi'),
+                ),
+                migrations.AlterField(
+                    model_name='ipm_indekskesehatan',
+                    name='location_type',
+                    field=models.CharField(choices=[('REGENCY', 'Kabupaten'), ('MUNICIPALITY', 'Kota')], default='REGENCY', max_length=20, verbose_name='Tipe Lokasi'),
+                ),
+                migrations.AlterField(
+                    model_name='ipm_indekspendidikan',
+                    name='location_type',
+                    field=models.CharField(choices=[('REGENCY', 'Kabupaten'), ('MUNICIPALITY', 'Kota')], default='REGENCY', max_length=20, verbose_name='Tipe Lokasi'),
+                ),
+                migrations.AlterField(
+                    model_name='ipm_pengeluaranperkapita',
+                    name='location_type',
+                    field=models.CharField(choices=[('REGENCY', 'Kabupaten'), ('MUNICIPALITY', 'Kota')], default='REGENCY', max_length=20, verbose_name='Tipe Lokasi'),
+                ),
+                migrations.AlterField(
+                    model_name='ipm_rls',
+                    name='location_type',
+                    field=models.CharField(choices=[('REGENCY', 'Kabupaten'), ('MUNICIPALITY', 'Kota')], default='REGENCY', max_length=20, verbose_name='Tipe Lokasi'),
+                ),
+                migrations.AlterField(
+                    model_name='ipm_uhh_sp',
+                    name='location_type',
+                    field=models.CharField(choices=[('REGENCY', 'Kabupaten'), ('MUNICIPALITY', 'Kota')], default='REGENCY', max_length=20, verbose_name='Tipe Lokasi'),
+                ),
+            ],
+        ),
+        migrations.RemoveField(
+            model_name='giniratio',
+            name='location_type',
+        ),
+        migrations.RemoveField(
+            model_name='humandevelopmentindex',
+            name='location_type',
+        ),
+        migrations.RemoveField(
+            model_name='ipm_hls',
+            name='location_type',
+        ),
+        migrations.RemoveField(
+            model_name='ipm_indekshiduplayak',
+            name='location_type',
+        ),
+        migrations.RemoveField(
+            model_name='ipm_indekskesehatan',
+            name='location_type',
+        ),
+        migrations.RemoveField(
+            model_name='ipm_indekspendidikan',
+            name='location_type',
+        ),
+        migrations.RemoveField(
+            model_name='ipm_pengeluaranperkapita',
+            name='location_type',
+        ),
+        migrations.RemoveField(
+            model_name='ipm_rls',
+            name='location_type',
+        ),
+        migrations.RemoveField(
+            model_name='ipm_uhh_sp',
+            name='location_type',
+        ),
+    ]
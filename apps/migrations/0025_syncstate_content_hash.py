@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-18 12:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apps', '0024_region'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='syncstate',
+            name='content_hash',
+            field=models.CharField(blank=True, max_length=80, verbose_name='Hash Konten'),
+        ),
+    ]
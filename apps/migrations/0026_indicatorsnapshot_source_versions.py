@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-18 12:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apps', '0025_syncstate_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='indicatorsnapshot',
+            name='source_versions',
+            field=models.TextField(blank=True, verbose_name='Versi Dataset Sumber'),
+        ),
+    ]
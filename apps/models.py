@@ -84,21 +84,126 @@ class Bookmark(models.Model):
     def __str__(self):
         return f'{self.user.username} bookmarked {self.content_object}'
 
-class HumanDevelopmentIndex(models.Model):
+# Region key: the sheets spell the same region several ways ('KOTA SURABAYA', 'Surabaya',
+# 'Jawa Timur', 'JATIM'); every spelling resolves to one Region through this normalized key.
+PROVINCE_REGION_KEY = 'JAWA TIMUR'
+# Cities without a regency of the same name: the bare name still means the city
+CITY_ONLY_REGIONS = ('SURABAYA', 'BATU')
+
+
+def region_key(location_name):
     """
-    Stores the Human Development Index (IPM) for a specific location and year.
-    This model is designed to hold the transposed data.
+    Normalized region key of a location spelling, e.g. 'Surabaya' / 'Kota  Surabaya' ->
+    'KOTA SURABAYA', 'Kab. Malang' -> 'MALANG', 'Prov. Jatim' -> 'JAWA TIMUR'.
+    """
+    key = ' '.join(str(location_name).upper().replace('.', ' ').split())
+    if 'JAWA TIMUR' in key or 'JATIM' in key:
+        return PROVINCE_REGION_KEY
+    for prefix in ('KABUPATEN ', 'KAB '):
+        if key.startswith(prefix):
+            return key[len(prefix):]
+    for prefix in ('KOTAMADYA ', 'KOTA '):
+        if key.startswith(prefix):
+            return 'KOTA ' + key[len(prefix):]
+    if key in CITY_ONLY_REGIONS:
+        return 'KOTA ' + key
+    return key
+
+
+class Region(models.Model):
+    """
+    Region dimension shared by the regional indicator models (IPM, Gini Ratio, IPM_*).
+    code is the normalized region_key(); aliases lists every sheet spelling resolved to it.
+    """
+    class RegionType(models.TextChoices):
+        KABUPATEN = 'KABUPATEN', 'Kabupaten'
+        KOTA = 'KOTA', 'Kota'
+        PROVINSI = 'PROVINSI', 'Provinsi'
+
+    id = models.SmallAutoField(primary_key=True)
+    code = models.CharField(max_length=255, unique=True, verbose_name="Kode Wilayah")
+    name = models.CharField(max_length=255, verbose_name="Nama Wilayah")
+    region_type = models.CharField(max_length=10, choices=RegionType.choices, verbose_name="Tipe Wilayah")
+    aliases = models.JSONField(default=list, blank=True, verbose_name="Alias")
+
+    def __str__(self):
+        return self.name
+
+    @classmethod
+    def defaults_for(cls, code):
+        """name / region_type of a new region, derived from its code."""
+        if code == PROVINCE_REGION_KEY:
+            return {'name': code.title(), 'region_type': cls.RegionType.PROVINSI}
+        if code.startswith('KOTA '):
+            return {'name': code.title(), 'region_type': cls.RegionType.KOTA}
+        return {'name': f"Kabupaten {code.title()}"[:255], 'region_type': cls.RegionType.KABUPATEN}
+
+    class Meta:
+        ordering = ['code']
+        verbose_name = "Wilayah"
+        verbose_name_plural = "Wilayah"
+
+
+class RegionQuerySet(models.QuerySet):
+    def for_region(self, *location_names):
+        """Rows of the given regions, in any spelling (seek on the (region, year) index)."""
+        return self.filter(region__code__in={region_key(name) for name in location_names})
+
+
+class RegionalIndicator(models.Model):
+    """
+    Base for indicator models with one row per region and year; the natural key is
+    (region, year). location_name only keeps the sheet spelling for display. region is
+    resolved from it once per sheet at sync time (apps.services.regions.resolve_regions)
+    and by save() when location_name changed.
     """
     class LocationType(models.TextChoices):
         REGENCY = 'REGENCY', 'Kabupaten'
         MUNICIPALITY = 'MUNICIPALITY', 'Kota'
 
-    location_name = models.CharField(max_length=255, verbose_name="Nama Lokasi")
-    location_type = models.CharField(
-        max_length=20,
-        choices=LocationType.choices,
-        verbose_name="Tipe Lokasi"
+    region = models.ForeignKey(
+        Region, on_delete=models.PROTECT, editable=False,
+        related_name='+', verbose_name="Wilayah",
+        # Sudah tercakup unique (region, year) di Meta masing-masing model
+        db_index=False,
     )
+
+    objects = RegionQuerySet.as_manager()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Ejaan yang menghasilkan region tersimpan; save() hanya me-resolve ulang bila berubah
+        instance._region_location_name = instance.__dict__.get('location_name')
+        return instance
+
+    @property
+    def location_type(self):
+        """REGENCY / MUNICIPALITY, derived from region.region_type (the province counts as REGENCY)."""
+        if self.region.region_type == Region.RegionType.KOTA:
+            return self.LocationType.MUNICIPALITY
+        return self.LocationType.REGENCY
+
+    def save(self, *args, **kwargs):
+        if self.region_id is None or self.location_name != getattr(self, '_region_location_name', None):
+            from apps.services.regions import resolve_regions
+
+            self.region_id = resolve_regions([self.location_name])[self.location_name]
+            self._region_location_name = self.location_name
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None and 'location_name' in update_fields:
+                kwargs['update_fields'] = {*update_fields, 'region'}
+        super().save(*args, **kwargs)
+
+    class Meta:
+        abstract = True
+
+class HumanDevelopmentIndex(RegionalIndicator):
+    """
+    Stores the Human Development Index (IPM) for a specific location and year.
+    This model is designed to hold the transposed data.
+    """
+    location_name = models.CharField(max_length=255, verbose_name="Nama Lokasi")
     year = models.PositiveSmallIntegerField(verbose_name="Tahun")
     ipm_value = models.DecimalField(max_digits=5, decimal_places=2, verbose_name="Nilai IPM")
 
@@ -106,7 +211,7 @@ class HumanDevelopmentIndex(models.Model):
         return f"{self.location_name} ({self.year}) - {self.ipm_value}"
     
     class Meta:
-        unique_together = ('location_name', 'year')
+        unique_together = ('region', 'year')
         verbose_name = "Indeks Pembangunan Manusia"
         verbose_name_plural = "Indeks Pembangunan Manusia"
 
@@ -152,21 +257,12 @@ class HotelOccupancyYearly(models.Model):
         verbose_name = "Tingkat Hunian Hotel (Year-to-Year)"
         verbose_name_plural = "Tingkat Hunian Hotel (Year-to-Year)"
 
-class GiniRatio(models.Model):
+class GiniRatio(RegionalIndicator):
     """
     Stores the Gini Ratio for a specific location and year.
     Data is fetched from "Gini Ratio (bu septa)_Y-to-Y" sheet in Google Sheets.
     """
-    class LocationType(models.TextChoices):
-        REGENCY = 'REGENCY', 'Kabupaten'
-        MUNICIPALITY = 'MUNICIPALITY', 'Kota'
-
     location_name = models.CharField(max_length=255, verbose_name="Nama Lokasi")
-    location_type = models.CharField(
-        max_length=20,
-        choices=LocationType.choices,
-        verbose_name="Tipe Lokasi"
-    )
     year = models.PositiveSmallIntegerField(verbose_name="Tahun")
     gini_ratio_value = models.DecimalField(max_digits=5, decimal_places=3, verbose_name="Nilai Gini Ratio")
 
@@ -174,26 +270,17 @@ class GiniRatio(models.Model):
         return f"{self.location_name} ({self.year}) - {self.gini_ratio_value}"
     
     class Meta:
-        unique_together = ('location_name', 'year')
+        unique_together = ('region', 'year')
         verbose_name = "Gini Ratio"
         verbose_name_plural = "Gini Ratio"
 
 # IPM Sub-Categories Models
-class IPM_UHH_SP(models.Model):
+class IPM_UHH_SP(RegionalIndicator):
     """
     Stores IPM Usia Harapan Hidup saat Lahir (SP) for a specific location and year.
     Data is fetched from "IPM_UHH SP_Y-to-Y " sheet in Google Sheets.
     """
-    class LocationType(models.TextChoices):
-        REGENCY = 'REGENCY', 'Kabupaten'
-        MUNICIPALITY = 'MUNICIPALITY', 'Kota'
-
     location_name = models.CharField(max_length=255, verbose_name="Nama Lokasi")
-    location_type = models.CharField(
-        max_length=20,
-        choices=LocationType.choices,
-        verbose_name="Tipe Lokasi"
-    )
     year = models.PositiveSmallIntegerField(verbose_name="Tahun")
     value = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Nilai UHH SP")
 
@@ -201,25 +288,16 @@ class IPM_UHH_SP(models.Model):
         return f"{self.location_name} ({self.year}) - {self.value}"
     
     class Meta:
-        unique_together = ('location_name', 'year')
+        unique_together = ('region', 'year')
         verbose_name = "IPM Usia Harapan Hidup saat Lahir (SP)"
         verbose_name_plural = "IPM Usia Harapan Hidup saat Lahir (SP)"
 
-class IPM_HLS(models.Model):
+class IPM_HLS(RegionalIndicator):
     """
     Stores IPM Harapan Lama Sekolah for a specific location and year.
     Data is fetched from "IPM_HLS_Y-to-Y" sheet in Google Sheets.
     """
-    class LocationType(models.TextChoices):
-        REGENCY = 'REGENCY', 'Kabupaten'
-        MUNICIPALITY = 'MUNICIPALITY', 'Kota'
-
     location_name = models.CharField(max_length=255, verbose_name="Nama Lokasi")
-    location_type = models.CharField(
-        max_length=20,
-        choices=LocationType.choices,
-        verbose_name="Tipe Lokasi"
-    )
     year = models.PositiveSmallIntegerField(verbose_name="Tahun")
     value = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Nilai HLS")
 
@@ -227,25 +305,16 @@ class IPM_HLS(models.Model):
         return f"{self.location_name} ({self.year}) - {self.value}"
     
     class Meta:
-        unique_together = ('location_name', 'year')
+        unique_together = ('region', 'year')
         verbose_name = "IPM Harapan Lama Sekolah"
         verbose_name_plural = "IPM Harapan Lama Sekolah"
 
-class IPM_RLS(models.Model):
+class IPM_RLS(RegionalIndicator):
     """
     Stores IPM Rata-rata Lama Sekolah for a specific location and year.
     Data is fetched from "IPM_RLS_Y-to-Y" sheet in Google Sheets.
     """
-    class LocationType(models.TextChoices):
-        REGENCY = 'REGENCY', 'Kabupaten'
-        MUNICIPALITY = 'MUNICIPALITY', 'Kota'
-
     location_name = models.CharField(max_length=255, verbose_name="Nama Lokasi")
-    location_type = models.CharField(
-        max_length=20,
-        choices=LocationType.choices,
-        verbose_name="Tipe Lokasi"
-    )
     year = models.PositiveSmallIntegerField(verbose_name="Tahun")
     value = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Nilai RLS")
 
@@ -253,25 +322,16 @@ class IPM_RLS(models.Model):
         return f"{self.location_name} ({self.year}) - {self.value}"
     
     class Meta:
-        unique_together = ('location_name', 'year')
+        unique_together = ('region', 'year')
         verbose_name = "IPM Rata-rata Lama Sekolah"
         verbose_name_plural = "IPM Rata-rata Lama Sekolah"
 
-class IPM_PengeluaranPerKapita(models.Model):
+class IPM_PengeluaranPerKapita(RegionalIndicator):
     """
     Stores IPM Pengeluaran per Kapita for a specific location and year.
     Data is fetched from "IPM_Pengeluaran per kapita_Y-to-Y" sheet in Google Sheets.
     """
-    class LocationType(models.TextChoices):
-        REGENCY = 'REGENCY', 'Kabupaten'
-        MUNICIPALITY = 'MUNICIPALITY', 'Kota'
-
     location_name = models.CharField(max_length=255, verbose_name="Nama Lokasi")
-    location_type = models.CharField(
-        max_length=20,
-        choices=LocationType.choices,
-        verbose_name="Tipe Lokasi"
-    )
     year = models.PositiveSmallIntegerField(verbose_name="Tahun")
     value = models.DecimalField(max_digits=15, decimal_places=2, verbose_name="Nilai Pengeluaran per Kapita")
 
@@ -279,25 +339,16 @@ class IPM_PengeluaranPerKapita(models.Model):
         return f"{self.location_name} ({self.year}) - {self.value}"
     
     class Meta:
-        unique_together = ('location_name', 'year')
+        unique_together = ('region', 'year')
         verbose_name = "IPM Pengeluaran per Kapita"
         verbose_name_plural = "IPM Pengeluaran per Kapita"
 
-class IPM_IndeksKesehatan(models.Model):
+class IPM_IndeksKesehatan(RegionalIndicator):
     """
     Stores IPM Indeks Kesehatan for a specific location and year.
     Data is fetched from "IPM_Indeks Kesehatan_Y-to-Y" sheet in Google Sheets.
     """
-    class LocationType(models.TextChoices):
-        REGENCY = 'REGENCY', 'Kabupaten'
-        MUNICIPALITY = 'MUNICIPALITY', 'Kota'
-
     location_name = models.CharField(max_length=255, verbose_name="Nama Lokasi")
-    location_type = models.CharField(
-        max_length=20,
-        choices=LocationType.choices,
-        verbose_name="Tipe Lokasi"
-    )
     year = models.PositiveSmallIntegerField(verbose_name="Tahun")
     value = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Nilai Indeks Kesehatan")
 
@@ -305,25 +356,16 @@ class IPM_IndeksKesehatan(models.Model):
         return f"{self.location_name} ({self.year}) - {self.value}"
     
     class Meta:
-        unique_together = ('location_name', 'year')
+        unique_together = ('region', 'year')
         verbose_name = "IPM Indeks Kesehatan"
         verbose_name_plural = "IPM Indeks Kesehatan"
 
-class IPM_IndeksHidupLayak(models.Model):
+class IPM_IndeksHidupLayak(RegionalIndicator):
     """
     Stores IPM Indeks Hidup Layak for a specific location and year.
     Data is fetched from "IPM_Indeks Hidup Layak_Y-to-Y" sheet in Google Sheets.
     """
-    class LocationType(models.TextChoices):
-        REGENCY = 'REGENCY', 'Kabupaten'
-        MUNICIPALITY = 'MUNICIPALITY', 'Kota'
-
     location_name = models.CharField(max_length=255, verbose_name="Nama Lokasi")
-    location_type = models.CharField(
-        max_length=20,
-        choices=LocationType.choices,
-        verbose_name="Tipe Lokasi"
-    )
     year = models.PositiveSmallIntegerField(verbose_name="Tahun")
     value = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Nilai Indeks Hidup Layak")
 
@@ -331,25 +373,16 @@ class IPM_IndeksHidupLayak(models.Model):
         return f"{self.location_name} ({self.year}) - {self.value}"
     
     class Meta:
-        unique_together = ('location_name', 'year')
+        unique_together = ('region', 'year')
         verbose_name = "IPM Indeks Hidup Layak"
         verbose_name_plural = "IPM Indeks Hidup Layak"
 
-class IPM_IndeksPendidikan(models.Model):
+class IPM_IndeksPendidikan(RegionalIndicator):
     """
     Stores IPM Indeks Pendidikan for a specific location and year.
     Data is fetched from "IPM_Indeks Pendidikan_Y-to-Y" sheet in Google Sheets.
     """
-    class LocationType(models.TextChoices):
-        REGENCY = 'REGENCY', 'Kabupaten'
-        MUNICIPALITY = 'MUNICIPALITY', 'Kota'
-
     location_name = models.CharField(max_length=255, verbose_name="Nama Lokasi")
-    location_type = models.CharField(
-        max_length=20,
-        choices=LocationType.choices,
-        verbose_name="Tipe Lokasi"
-    )
     year = models.PositiveSmallIntegerField(verbose_name="Tahun")
     value = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Nilai Indeks Pendidikan")
 
@@ -357,7 +390,7 @@ class IPM_IndeksPendidikan(models.Model):
         return f"{self.location_name} ({self.year}) - {self.value}"
     
     class Meta:
-        unique_together = ('location_name', 'year')
+        unique_together = ('region', 'year')
         verbose_name = "IPM Indeks Pendidikan"
         verbose_name_plural = "IPM Indeks Pendidikan"
 
@@ -1142,4 +1175,241 @@ class InflasiPerKomoditas(models.Model):
             models.Index(fields=['year', 'month']),
             models.Index(fields=['commodity_code', 'flag', 'year']),
         ]
-        
\ No newline at end of file
+
+
+class SyncState(models.Model):
+    """
+    Stores the state of each source at its last successful sync.
+    Worksheets: content hash (prefixed with the parser version), used by sync_data to skip sheets
+    that have not changed, and the last time the hash was compared (closed worksheets are only
+    re-read after a while).
+    BPS API lists: high-water mark (newest item seen), used for incremental pagination.
+    """
+    source = models.CharField(max_length=100, verbose_name="Sumber")
+    key = models.CharField(max_length=255, verbose_name="Nama Sheet")
+    content_hash = models.CharField(max_length=80, blank=True, verbose_name="Hash Konten")
+    row_count = models.PositiveIntegerField(default=0, verbose_name="Jumlah Baris")
+    high_water_mark = models.CharField(max_length=255, blank=True, default='', verbose_name="Item Terbaru")
+    full_synced_at = models.DateTimeField(null=True, blank=True, verbose_name="Terakhir Sync Penuh")
+    synced_at = models.DateTimeField(auto_now=True, verbose_name="Terakhir Sync")
+    checked_at = models.DateTimeField(null=True, blank=True, verbose_name="Terakhir Dicek")
+
+    def __str__(self):
+        return f"{self.key} ({self.synced_at:%Y-%m-%d %H:%M})"
+
+    class Meta:
+        unique_together = ('source', 'key')
+        verbose_name = "Status Sinkronisasi"
+        verbose_name_plural = "Status Sinkronisasi"
+
+
+class SyncJob(models.Model):
+    """
+    A sync requested through the /api/sync/* endpoints.
+    The endpoint only enqueues the job; the run_sync_worker command claims and executes it,
+    writing per-sheet progress while running and the final counts when done.
+    """
+    class Status(models.TextChoices):
+        QUEUED = 'queued', 'Menunggu'
+        RUNNING = 'running', 'Berjalan'
+        SUCCESS = 'success', 'Selesai'
+        FAILED = 'failed', 'Gagal'
+
+    sync_type = models.CharField(max_length=50, verbose_name="Jenis Data")
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.QUEUED,
+        verbose_name="Status"
+    )
+    progress = models.JSONField(default=dict, blank=True, verbose_name="Progress")
+    result = models.JSONField(default=dict, blank=True, verbose_name="Hasil")
+    error = models.TextField(blank=True, verbose_name="Error")
+    worker = models.CharField(max_length=255, blank=True, verbose_name="Worker")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Dibuat")
+    started_at = models.DateTimeField(null=True, blank=True, verbose_name="Mulai")
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name="Selesai")
+    heartbeat_at = models.DateTimeField(null=True, blank=True, verbose_name="Aktivitas Terakhir")
+
+    def __str__(self):
+        return f"#{self.pk} {self.sync_type} ({self.status})"
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+        verbose_name = "Job Sinkronisasi"
+        verbose_name_plural = "Job Sinkronisasi"
+
+
+class SchedulerLease(models.Model):
+    """
+    Time-limited leadership lease for singletons that must run in one process of the cluster
+    (the daily sync scheduler). The holder renews it periodically; once it expires another
+    process may take it over.
+    """
+    name = models.CharField(max_length=100, unique=True, verbose_name="Nama")
+    holder = models.CharField(max_length=255, blank=True, verbose_name="Pemegang")
+    acquired_at = models.DateTimeField(null=True, blank=True, verbose_name="Diambil")
+    renewed_at = models.DateTimeField(null=True, blank=True, verbose_name="Diperpanjang")
+    expires_at = models.DateTimeField(null=True, blank=True, verbose_name="Kedaluwarsa")
+
+    def __str__(self):
+        return f"{self.name}: {self.holder or '-'}"
+
+    class Meta:
+        verbose_name = "Lease Scheduler"
+        verbose_name_plural = "Lease Scheduler"
+
+
+class DatasetSchedule(models.Model):
+    """
+    Adaptive sync schedule of one dataset (a sync_data task).
+    The check interval starts from the dataset's release cadence, backs off while the source
+    stays unchanged, and tightens around the expected next release learned from past changes.
+    """
+    task_name = models.CharField(max_length=100, unique=True, verbose_name="Dataset")
+    cadence = models.CharField(max_length=20, verbose_name="Frekuensi Rilis")
+    interval_hours = models.FloatField(verbose_name="Interval Pemeriksaan (jam)")
+    change_period_hours = models.FloatField(null=True, blank=True, verbose_name="Rata-rata Jarak Perubahan (jam)")
+    next_run_at = models.DateTimeField(verbose_name="Sync Berikutnya")
+    last_run_at = models.DateTimeField(null=True, blank=True, verbose_name="Sync Terakhir")
+    last_changed_at = models.DateTimeField(null=True, blank=True, verbose_name="Perubahan Terakhir")
+    unchanged_runs = models.PositiveIntegerField(default=0, verbose_name="Sync Tanpa Perubahan")
+    last_error = models.TextField(blank=True, verbose_name="Error Terakhir")
+
+    def __str__(self):
+        return f"{self.task_name} ({self.cadence}, berikutnya {self.next_run_at:%Y-%m-%d %H:%M})"
+
+    class Meta:
+        ordering = ['next_run_at']
+        verbose_name = "Jadwal Sinkronisasi"
+        verbose_name_plural = "Jadwal Sinkronisasi"
+
+
+class SyncRun(models.Model):
+    """
+    Telemetry of one sync run (sync_data command, API job or scheduled dataset):
+    totals over all of its steps. Per-task and per-worksheet figures are in SyncStep.
+    """
+
+    class Trigger(models.TextChoices):
+        COMMAND = 'command', 'Command'
+        SCHEDULER = 'scheduler', 'Scheduler'
+        API = 'api', 'API'
+
+    class Status(models.TextChoices):
+        RUNNING = 'running', 'Berjalan'
+        SUCCESS = 'success', 'Berhasil'
+        FAILED = 'failed', 'Gagal'
+
+    trigger = models.CharField(max_length=20, choices=Trigger.choices, verbose_name="Pemicu")
+    sync_type = models.CharField(max_length=50, verbose_name="Jenis Sync")
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.RUNNING, verbose_name="Status")
+    started_at = models.DateTimeField(auto_now_add=True, verbose_name="Mulai")
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name="Selesai")
+    duration_seconds = models.FloatField(default=0, verbose_name="Durasi (detik)")
+    created = models.PositiveIntegerField(default=0, verbose_name="Data Baru")
+    updated = models.PositiveIntegerField(default=0, verbose_name="Data Diperbarui")
+    unchanged = models.PositiveIntegerField(default=0, verbose_name="Data Tidak Berubah")
+    queries = models.PositiveIntegerField(default=0, verbose_name="Query SQL")
+    error = models.TextField(blank=True, verbose_name="Error")
+
+    def __str__(self):
+        return f"#{self.pk} {self.sync_type} ({self.status}, {self.started_at:%Y-%m-%d %H:%M})"
+
+    class Meta:
+        ordering = ['-started_at']
+        indexes = [
+            models.Index(fields=['started_at']),
+        ]
+        verbose_name = "Riwayat Sinkronisasi"
+        verbose_name_plural = "Riwayat Sinkronisasi"
+
+
+class SyncStep(models.Model):
+    """
+    Telemetry of one task of a SyncRun (key is empty) or one worksheet / BPS API list
+    within that task (key is the worksheet title or API model).
+    """
+    run = models.ForeignKey(SyncRun, on_delete=models.CASCADE, related_name='steps', verbose_name="Riwayat")
+    task = models.CharField(max_length=100, verbose_name="Task")
+    key = models.CharField(max_length=255, blank=True, verbose_name="Worksheet / Daftar API")
+    status = models.CharField(max_length=20, choices=SyncRun.Status.choices, verbose_name="Status")
+    duration_seconds = models.FloatField(default=0, verbose_name="Durasi (detik)")
+    fetch_seconds = models.FloatField(default=0, verbose_name="Fetch (detik)")
+    parse_seconds = models.FloatField(default=0, verbose_name="Parse (detik)")
+    save_seconds = models.FloatField(default=0, verbose_name="Write (detik)")
+    state_seconds = models.FloatField(default=0, verbose_name="Cek Perubahan (detik)")
+    bytes_read = models.BigIntegerField(default=0, verbose_name="Byte Dibaca")
+    cells_read = models.BigIntegerField(default=0, verbose_name="Sel Dibaca")
+    created = models.PositiveIntegerField(default=0, verbose_name="Data Baru")
+    updated = models.PositiveIntegerField(default=0, verbose_name="Data Diperbarui")
+    unchanged = models.PositiveIntegerField(default=0, verbose_name="Data Tidak Berubah")
+    skipped = models.BooleanField(default=False, verbose_name="Dilewati (Tidak Berubah)")
+    queries = models.PositiveIntegerField(default=0, verbose_name="Query SQL")
+    error = models.TextField(blank=True, verbose_name="Error")
+
+    def __str__(self):
+        return f"{self.task} {self.key}".strip()
+
+    class Meta:
+        ordering = ['run', 'task', 'key']
+        indexes = [
+            models.Index(fields=['task', 'key']),
+        ]
+        verbose_name = "Langkah Sinkronisasi"
+        verbose_name_plural = "Langkah Sinkronisasi"
+
+
+class IndicatorSnapshot(models.Model):
+    """
+    Precomputed dashboard indicator (one carousel card): latest and previous value of a
+    Surabaya series with their period labels and the change between them.
+    Rebuilt from the indicator tables at the end of each sync, and by the dashboard when the
+    dataset versions it was computed from (source_versions) are outdated, e.g. after an admin edit.
+    """
+    key = models.CharField(max_length=100, unique=True, verbose_name="Kunci Indikator")
+    position = models.PositiveIntegerField(default=0, verbose_name="Urutan")
+    name = models.CharField(max_length=255, verbose_name="Nama Indikator")
+    value = models.DecimalField(max_digits=24, decimal_places=3, null=True, blank=True, verbose_name="Nilai Terbaru")
+    previous_value = models.DecimalField(max_digits=24, decimal_places=3, null=True, blank=True, verbose_name="Nilai Sebelumnya")
+    unit = models.CharField(max_length=20, blank=True, verbose_name="Satuan")
+    year = models.IntegerField(null=True, blank=True, verbose_name="Tahun")
+    period = models.CharField(max_length=50, verbose_name="Periode")
+    previous_period = models.CharField(max_length=50, blank=True, verbose_name="Periode Sebelumnya")
+    change = models.FloatField(null=True, blank=True, verbose_name="Perubahan")
+    change_percent = models.FloatField(null=True, blank=True, verbose_name="Perubahan (%)")
+    change_type = models.CharField(max_length=20, verbose_name="Jenis Perubahan")
+    is_currency = models.BooleanField(default=False, verbose_name="Nilai Rupiah")
+    computed_at = models.DateTimeField(auto_now=True, verbose_name="Dihitung Pada")
+    source_versions = models.TextField(blank=True, verbose_name="Versi Dataset Sumber")
+
+    def __str__(self):
+        return f"{self.name} ({self.period}) - {self.value}"
+
+    class Meta:
+        ordering = ['position']
+        indexes = [
+            models.Index(fields=['position']),
+        ]
+        verbose_name = "Snapshot Indikator Dashboard"
+        verbose_name_plural = "Snapshot Indikator Dashboard"
+
+
+class DatasetVersion(models.Model):
+    """
+    Version counter of one synced table (model label). Bumped by bulk_upsert whenever a sync
+    creates or updates rows; cached page contexts are keyed by the versions they read.
+    """
+    dataset = models.CharField(max_length=100, unique=True, verbose_name="Dataset")
+    version = models.PositiveBigIntegerField(default=0, verbose_name="Versi")
+    changed_at = models.DateTimeField(null=True, blank=True, verbose_name="Terakhir Berubah")
+
+    def __str__(self):
+        return f"{self.dataset} v{self.version}"
+
+    class Meta:
+        verbose_name = "Versi Dataset"
+        verbose_name_plural = "Versi Dataset"
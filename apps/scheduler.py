@@ -1,71 +1,190 @@
 """
-Scheduler untuk menjalankan sinkronisasi data secara otomatis setiap hari.
-Menggunakan APScheduler untuk menjalankan task setiap hari jam 02:00 AM.
+Scheduler untuk menjalankan sinkronisasi data secara otomatis.
+Menggunakan APScheduler dengan satu job per dataset yang jadwalnya mengikuti
+frekuensi rilis dataset tersebut (lihat apps.services.sync_cadence), hanya di
+satu proses per cluster (lihat apps.services.leader_election).
 """
+import atexit
 import logging
-import sys
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.cron import CronTrigger
-from django_apscheduler.jobstores import DjangoJobStore, register_events
+from apscheduler.triggers.interval import IntervalTrigger
+from django_apscheduler.models import DjangoJob
 from django.conf import settings
 from django.core.management import call_command
+from django.db import close_old_connections
+from django.utils import timezone
+
+from apps.services import sync_cadence
+from apps.services.leader_election import LeaderElector, get_lease
 
 logger = logging.getLogger(__name__)
 
+SCHEDULER_LEASE_NAME = 'sync-scheduler'
+
+_elector = None
+_scheduler = None
+
 
 def sync_all_data():
     """
-    Fungsi untuk menjalankan sinkronisasi semua data.
-    Memanggil management command sync_data dengan type 'all'.
+    Fungsi untuk menjalankan sinkronisasi semua data sekaligus.
+    Memanggil management command sync_data dengan type 'all'. Tidak lagi
+    dijadwalkan (diganti sync_dataset per dataset), tetap ada untuk dipanggil manual.
     """
+    if not holds_lease():
+        # Lease hilang sejak job dijadwalkan; leader baru yang menjalankan
+        logger.warning("[SCHEDULER] Proses ini bukan leader, sinkronisasi dilewati")
+        print("[SCHEDULER] Proses ini bukan leader, sinkronisasi dilewati")
+        return
     try:
         logger.info("[SCHEDULER] Memulai sinkronisasi data otomatis...")
         print("[SCHEDULER] Memulai sinkronisasi data otomatis...")
         
         # Memanggil management command sync_data dengan type 'all'
-        call_command('sync_data', '--type', 'all')
+        call_command(
+            'sync_data', '--type', 'all', '--workers', str(getattr(settings, 'SYNC_WORKERS', 1)),
+            '--trigger', 'scheduler',
+        )
         
         logger.info("[SCHEDULER] Sinkronisasi data selesai!")
         print("[SCHEDULER] Sinkronisasi data selesai!")
     except Exception as e:
         logger.error(f"[SCHEDULER] Error saat sinkronisasi data: {str(e)}")
         print(f"[SCHEDULER] Error saat sinkronisasi data: {str(e)}")
-        # Jangan raise exception agar scheduler tetap berjalan
+        # Jangan raise exception agar scheduler tetap berjalan; error dan task yang gagal
+        # sudah tercatat di SyncRun (admin: Riwayat Sinkronisasi)
 
 
-def start_scheduler():
+def sync_dataset(task_name):
     """
-    Memulai scheduler untuk menjalankan sinkronisasi otomatis.
-    Task akan berjalan setiap hari jam 02:00 AM (timezone sesuai settings).
+    Job scheduler untuk satu dataset: sync, lalu menjadwalkan dirinya lagi pada
+    waktu yang dihitung dari cadence dan riwayat perubahan dataset tersebut.
     """
-    scheduler = BackgroundScheduler(timezone=settings.TIME_ZONE)
-    
-    # Menggunakan DjangoJobStore untuk menyimpan job di database
-    scheduler.add_jobstore(DjangoJobStore(), "default")
-    
-    # Menambahkan job untuk sinkronisasi data setiap hari jam 02:00 AM
+    # Thread APScheduler dipakai ulang; buang koneksi DB yang sudah kedaluwarsa
+    close_old_connections()
+    # Dicek ke backend lease sebelum setiap dataset: lease bisa sudah diambil proses lain
+    # sementara job ini antre di belakang dataset lain
+    if not holds_lease():
+        logger.warning(f"[SCHEDULER] Proses ini bukan leader, sync {task_name} dilewati")
+        print(f"[SCHEDULER] Proses ini bukan leader, sync {task_name} dilewati")
+        return
+    try:
+        schedule = sync_cadence.run_dataset(task_name)
+        next_run_at = schedule.next_run_at
+    except Exception as e:
+        logger.error(f"[SCHEDULER] Error saat sinkronisasi {task_name}: {str(e)}")
+        print(f"[SCHEDULER] Error saat sinkronisasi {task_name}: {str(e)}")
+        # Jangan raise exception agar dataset tetap terjadwal
+        next_run_at = timezone.now() + sync_cadence.POLICIES[sync_cadence.TASKS_BY_NAME[task_name].cadence].min_check
+
+    scheduler = _scheduler
+    if scheduler is not None and scheduler.running:
+        scheduler.modify_job(_dataset_job_id(task_name), next_run_time=next_run_at)
+
+
+def _dataset_job_id(task_name):
+    return f'sync_dataset:{task_name}'
+
+
+def _add_dataset_job(scheduler, task_name, next_run_at):
+    # Interval trigger hanya cadangan (batas backoff cadence); setiap run menggeser next_run_time sendiri
+    policy = sync_cadence.POLICIES[sync_cadence.TASKS_BY_NAME[task_name].cadence]
     scheduler.add_job(
-        sync_all_data,
-        trigger=CronTrigger(hour=2, minute=0),  # Setiap hari jam 02:00 AM
-        id='sync_all_data_daily',
-        name='Sinkronisasi Data Harian',
+        sync_dataset,
+        trigger=IntervalTrigger(seconds=policy.max_check.total_seconds()),
+        args=[task_name],
+        id=_dataset_job_id(task_name),
+        name=f'Sinkronisasi {task_name}',
+        next_run_time=next_run_at,
         replace_existing=True,
-        max_instances=1,  # Hanya satu instance yang berjalan pada satu waktu
+        coalesce=True,
+        max_instances=1,
+        misfire_grace_time=None,  # Job yang terlambat (mis. antre di belakang dataset lain) tetap dijalankan
     )
+
+
+def _build_scheduler():
+    """BackgroundScheduler dengan satu job per dataset, dijadwalkan dari DatasetSchedule."""
+    # Jadwal disimpan di DatasetSchedule, jadi job store di memori cukup (dibangun ulang setiap
+    # proses menjadi leader) dan tidak ada tulisan APScheduler yang berebut database dengan sync.
+    # Dataset dijalankan satu per satu (atau SYNC_WORKERS sekaligus) supaya kuota API tidak habis bersamaan.
+    return BackgroundScheduler(
+        timezone=settings.TIME_ZONE,
+        executors={'default': ThreadPoolExecutor(max(1, getattr(settings, 'SYNC_WORKERS', 1)))},
+    )
+
+
+def _schedule_datasets(scheduler):
+    """Mendaftarkan job setiap dataset dan menghapus job sync harian lama dari DjangoJobStore."""
+    DjangoJob.objects.filter(id='sync_all_data_daily').delete()
     
-    # Register events untuk logging
-    register_events(scheduler)
-    
+    now = timezone.now()
+    for schedule in sync_cadence.ensure_schedules(now):
+        _add_dataset_job(scheduler, schedule.task_name, max(schedule.next_run_at, now))
+        logger.info(f"[SCHEDULER] {schedule.task_name} ({schedule.cadence}): {schedule.next_run_at:%Y-%m-%d %H:%M}")
+
+
+def _on_elected():
+    """Proses ini menjadi leader: mulai menjalankan job."""
+    global _scheduler
+    logger.info("[SCHEDULER] Proses ini menjadi leader, memulai scheduler...")
+    print("[SCHEDULER] Proses ini menjadi leader, memulai scheduler...")
+    scheduler = _build_scheduler()
     try:
-        logger.info("[SCHEDULER] Memulai scheduler...")
-        print("[SCHEDULER] Memulai scheduler...")
         scheduler.start()
-        logger.info("[SCHEDULER] Scheduler berhasil dimulai. Task akan berjalan setiap hari jam 02:00 AM.")
-        print("[SCHEDULER] Scheduler berhasil dimulai. Task akan berjalan setiap hari jam 02:00 AM.")
+        _scheduler = scheduler
+        _schedule_datasets(scheduler)
     except Exception as e:
         logger.error(f"[SCHEDULER] Error saat memulai scheduler: {str(e)}")
         print(f"[SCHEDULER] Error saat memulai scheduler: {str(e)}")
-        # Shutdown scheduler jika ada error
-        scheduler.shutdown()
-        sys.exit(1)
+        # Leader election melepas lease sehingga proses lain bisa mencoba
+        raise
+    logger.info("[SCHEDULER] Scheduler berhasil dimulai dengan jadwal per dataset.")
+    print("[SCHEDULER] Scheduler berhasil dimulai dengan jadwal per dataset (lihat admin Jadwal Sinkronisasi).")
+
+
+def _on_demoted():
+    """Lease hilang atau proses berhenti: hentikan scheduler agar tidak ada dua leader."""
+    global _scheduler
+    scheduler, _scheduler = _scheduler, None
+    if scheduler is None:
+        return
+    logger.warning("[SCHEDULER] Tidak lagi menjadi leader, scheduler dihentikan")
+    print("[SCHEDULER] Tidak lagi menjadi leader, scheduler dihentikan")
+    if scheduler.running:
+        scheduler.shutdown(wait=False)
+
+
+def is_leader():
+    """True bila scheduler di proses ini yang aktif di cluster."""
+    return _elector is not None and _elector.is_leader
+
 
+def holds_lease():
+    """Seperti is_leader(), tetapi juga memastikan ke backend lease bahwa lease masih dipegang proses ini."""
+    return _elector is not None and _elector.holds_lease()
+
+
+def start_scheduler():
+    """
+    Memulai scheduler untuk menjalankan sinkronisasi otomatis.
+    
+    Dipanggil di setiap proses web, tetapi hanya satu proses di cluster yang
+    menjalankan job: proses ini ikut leader election (lease di database, atau
+    Redis bila SCHEDULER_LOCK_BACKEND='redis') dan baru memulai
+    BackgroundScheduler setelah memegang lease. Bila leader mati, proses lain
+    mengambil alih setelah lease kedaluwarsa (SCHEDULER_LEASE_SECONDS).
+    Setiap dataset berjalan sesuai DatasetSchedule.next_run_at (timezone sesuai settings).
+    """
+    global _elector
+    if _elector is not None:
+        return _elector
+    
+    _elector = LeaderElector(get_lease(SCHEDULER_LEASE_NAME), _on_elected, _on_demoted)
+    _elector.start()
+    # Melepas lease saat proses berhenti normal supaya proses lain langsung mengambil alih
+    atexit.register(_elector.stop)
+    logger.info("[SCHEDULER] Leader election dimulai")
+    print("[SCHEDULER] Leader election dimulai, scheduler aktif bila proses ini menjadi leader")
+    return _elector
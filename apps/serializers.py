@@ -14,7 +14,7 @@ from .models import (
     PDRBLapanganUsahaADHBTriwulanan, PDRBLapanganUsahaADHKTriwulanan,
     PDRBLapanganUsahaDistribusiTriwulanan, PDRBLapanganUsahaLajuQtoQ,
     PDRBLapanganUsahaLajuYtoY, PDRBLapanganUsahaLajuCtoC,
-    Inflasi, InflasiPerKomoditas, Bookmark
+    Inflasi, InflasiPerKomoditas, Bookmark, SyncJob
 )
 from django.db.models import fields
 from django.contrib.contenttypes.models import ContentType
@@ -142,7 +142,11 @@ class BookmarkSerializer(serializers.ModelSerializer):
         validated_data.pop('content_type_name', None)
         return Bookmark.objects.create(**validated_data)
 
-class HumanDevelopmentIndexSerializer(serializers.ModelSerializer):
+class RegionalIndicatorSerializer(serializers.ModelSerializer):
+    # Diturunkan dari Region (tidak disimpan per baris); queryset perlu select_related('region')
+    location_type = serializers.CharField(read_only=True)
+
+class HumanDevelopmentIndexSerializer(RegionalIndicatorSerializer):
     class Meta:
         model = HumanDevelopmentIndex
         fields = ['id', 'location_name', 'location_type', 'year', 'ipm_value']
@@ -157,42 +161,42 @@ class HotelOccupancyYearlySerializer(serializers.ModelSerializer):
         model = HotelOccupancyYearly
         fields = ['id', 'year', 'mktj', 'tpk', 'rlmta', 'rlmtnus', 'rlmtgab', 'gpr']
 
-class GiniRatioSerializer(serializers.ModelSerializer):
+class GiniRatioSerializer(RegionalIndicatorSerializer):
     class Meta:
         model = GiniRatio
         fields = ['id', 'location_name', 'location_type', 'year', 'gini_ratio_value']
 
-class IPM_UHH_SPSerializer(serializers.ModelSerializer):
+class IPM_UHH_SPSerializer(RegionalIndicatorSerializer):
     class Meta:
         model = IPM_UHH_SP
         fields = ['id', 'location_name', 'location_type', 'year', 'value']
 
-class IPM_HLSSerializer(serializers.ModelSerializer):
+class IPM_HLSSerializer(RegionalIndicatorSerializer):
     class Meta:
         model = IPM_HLS
         fields = ['id', 'location_name', 'location_type', 'year', 'value']
 
-class IPM_RLSSerializer(serializers.ModelSerializer):
+class IPM_RLSSerializer(RegionalIndicatorSerializer):
     class Meta:
         model = IPM_RLS
         fields = ['id', 'location_name', 'location_type', 'year', 'value']
 
-class IPM_PengeluaranPerKapitaSerializer(serializers.ModelSerializer):
+class IPM_PengeluaranPerKapitaSerializer(RegionalIndicatorSerializer):
     class Meta:
         model = IPM_PengeluaranPerKapita
         fields = ['id', 'location_name', 'location_type', 'year', 'value']
 
-class IPM_IndeksKesehatanSerializer(serializers.ModelSerializer):
+class IPM_IndeksKesehatanSerializer(RegionalIndicatorSerializer):
     class Meta:
         model = IPM_IndeksKesehatan
         fields = ['id', 'location_name', 'location_type', 'year', 'value']
 
-class IPM_IndeksHidupLayakSerializer(serializers.ModelSerializer):
+class IPM_IndeksHidupLayakSerializer(RegionalIndicatorSerializer):
     class Meta:
         model = IPM_IndeksHidupLayak
         fields = ['id', 'location_name', 'location_type', 'year', 'value']
 
-class IPM_IndeksPendidikanSerializer(serializers.ModelSerializer):
+class IPM_IndeksPendidikanSerializer(RegionalIndicatorSerializer):
     class Meta:
         model = IPM_IndeksPendidikan
         fields = ['id', 'location_name', 'location_type', 'year', 'value']
@@ -341,3 +345,14 @@ class InflasiPerKomoditasSerializer(serializers.ModelSerializer):
     class Meta:
         model = InflasiPerKomoditas
         fields = ['id', 'commodity_code', 'commodity_name', 'flag', 'year', 'month', 'value']
+
+# Sync Job Serializer
+class SyncJobSerializer(serializers.ModelSerializer):
+    job_id = serializers.IntegerField(source='id', read_only=True)
+
+    class Meta:
+        model = SyncJob
+        fields = [
+            'job_id', 'sync_type', 'status', 'progress', 'result', 'error',
+            'created_at', 'started_at', 'finished_at',
+        ]
@@ -3,13 +3,27 @@ import requests
 import logging
 import gspread
 import pandas as pd
-from oauth2client.service_account import ServiceAccountCredentials
 import re
-import html
-from bs4 import BeautifulSoup
 from django.conf import settings
 import time
 import math
+from datetime import datetime, timedelta
+from django.utils import timezone
+from apps.services.sheets_client import INDICATOR_SHEET_ID, sheets_registry
+from apps.services.bps_client import bps_client
+from apps.services import text_cleaner
+from apps.services.sheet_prefetch import get_worksheet_values
+from apps.services.bulk_writer import bulk_upsert, drop_blank_rows, numeric_values, text_values
+from apps.services.sync_state import frozen_state, run_sheet_sync, run_bps_sync
+from apps.services.number_parser import (
+    DECIMAL, SPREADSHEET, INDONESIAN, POPULATION, parse_numbers, report_invalid,
+)
+from apps.services.sheet_specs import (
+    IPM_SPEC, GINI_RATIO_SPEC,
+    IPM_UHH_SP_SPEC, IPM_HLS_SPEC, IPM_RLS_SPEC, IPM_PENGELUARAN_PER_KAPITA_SPEC,
+    IPM_INDEKS_KESEHATAN_SPEC, IPM_INDEKS_HIDUP_LAYAK_SPEC, IPM_INDEKS_PENDIDIKAN_SPEC,
+    fetch_wide_sheet, save_wide_sheet, round_like_python,
+)
 from apps.models import (
     HumanDevelopmentIndex, Publication, Infographic, News, 
     HotelOccupancyCombined, HotelOccupancyYearly, GiniRatio,
@@ -27,219 +41,56 @@ from apps.models import (
     PDRBLapanganUsahaLajuYtoY, PDRBLapanganUsahaLajuCtoC,
     Inflasi, InflasiPerKomoditas
 )
-from apps.serializers import (
-    HumanDevelopmentIndexSerializer, PublicationSerializer, InfographicSerializer, 
-    NewsSerializer, HotelOccupancyCombinedSerializer, HotelOccupancyYearlySerializer, 
-    GiniRatioSerializer, IPM_UHH_SPSerializer, IPM_HLSSerializer, IPM_RLSSerializer,
-    IPM_PengeluaranPerKapitaSerializer, IPM_IndeksKesehatanSerializer,
-    IPM_IndeksHidupLayakSerializer, IPM_IndeksPendidikanSerializer,
-    KetenagakerjaanTPTSerializer, KetenagakerjaanTPAKSerializer, KemiskinanSurabayaSerializer,
-    KemiskinanJawaTimurSerializer, KependudukanSerializer,
-    PDRBPengeluaranADHBSerializer, PDRBPengeluaranADHKSerializer, PDRBPengeluaranDistribusiSerializer,
-    PDRBPengeluaranLajuPDRBSerializer, PDRBPengeluaranADHBTriwulananSerializer,
-    PDRBPengeluaranADHKTriwulananSerializer, PDRBPengeluaranDistribusiTriwulananSerializer,
-    PDRBPengeluaranLajuQtoQSerializer, PDRBPengeluaranLajuYtoYSerializer, PDRBPengeluaranLajuCtoCSerializer,
-    PDRBLapanganUsahaADHBSerializer, PDRBLapanganUsahaADHKSerializer, PDRBLapanganUsahaDistribusiSerializer,
-    PDRBLapanganUsahaLajuPDRBSerializer, PDRBLapanganUsahaLajuImplisitSerializer,
-    PDRBLapanganUsahaADHBTriwulananSerializer, PDRBLapanganUsahaADHKTriwulananSerializer,
-    PDRBLapanganUsahaDistribusiTriwulananSerializer, PDRBLapanganUsahaLajuQtoQSerializer,
-    PDRBLapanganUsahaLajuYtoYSerializer, PDRBLapanganUsahaLajuCtoCSerializer,
-    InflasiSerializer, InflasiPerKomoditasSerializer
-)
 
 logger = logging.getLogger(__name__)
 
+# Field model hotel occupancy (bulanan & tahunan) -> kolom hasil fetch
+HOTEL_OCCUPANCY_COLUMNS = {
+    'mktj': 'MKTJ', 'tpk': 'TPK', 'rlmta': 'RLMTA',
+    'rlmtnus': 'RLMTNUS', 'rlmtgab': 'RLMTGAB', 'gpr': 'GPR',
+}
+# Kolom nilai Kemiskinan (Surabaya & Jawa Timur); nama kolom fetch = nama field model
+KEMISKINAN_FIELDS = (
+    'jumlah_penduduk_miskin', 'persentase_penduduk_miskin',
+    'indeks_kedalaman_kemiskinan_p1', 'indeks_keparahan_kemiskinan_p2', 'garis_kemiskinan',
+)
+
 
 class IPMService:
+    SPEC = IPM_SPEC
+    WORKSHEET_NAME = IPM_SPEC.worksheet_name
+
     @staticmethod
     def fetch_ipm_data():
         """Fetches and processes IPM data from Google Sheets into a long-format DataFrame."""
-        print("[INFO] Fetching IPM data from Google Sheets...")
-        try:
-            # Scope akses Google Sheets dan Google Drive
-            scope = [
-                'https://www.googleapis.com/auth/spreadsheets',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            # Autentikasi
-            credentials = ServiceAccountCredentials.from_json_keyfile_name('credentials.json', scope)
-            client = gspread.authorize(credentials)
-
-            # ID Google Sheet dari link
-            SHEET_ID = "1keS9YFYO1qzAawWgLh2U2pY6xX5ppKUnhbdHQYfU5HM"
-            sheet = client.open_by_key(SHEET_ID).worksheet("Indeks Pembangunan Manusia Menu_Y-to-Y")
-
-            # Ambil semua data dan buat DataFrame
-            data = sheet.get_all_values()
-            if not data or len(data) < 2:
-                print("[WARNING] No data found in sheet")
-                return pd.DataFrame()
-            
-            headers = data[0]
-            data_rows = data[1:]
-            df = pd.DataFrame(data_rows, columns=headers)
-            print(f"[OK] Raw data fetched with shape: {df.shape}")
-
-            # --- Data Cleaning and Transformation ---
-            # Rename column to standard name - handle various column name formats
-            if 'Kabupaten/Kota\nRegency/Municipality' in df.columns:
-                df = df.rename(columns={'Kabupaten/Kota\nRegency/Municipality': 'Kabupaten/Kota'})
-            elif 'Kabupaten/Kot' in df.columns:
-                df = df.rename(columns={'Kabupaten/Kot': 'Kabupaten/Kota'})
-            elif 'Provinsi' in df.columns:
-                df = df.rename(columns={'Provinsi': 'Kabupaten/Kota'})
-                print(f"[INFO] Found and renamed location column: 'Provinsi' -> 'Kabupaten/Kota'")
-            elif 'Kabupaten/Kota' not in df.columns:
-                # Try to find the location column
-                location_col_found = False
-                for col in df.columns:
-                    col_lower = str(col).lower()
-                    if 'kabupaten' in col_lower or 'kota' in col_lower or 'kot' in col_lower or 'provinsi' in col_lower:
-                        df = df.rename(columns={col: 'Kabupaten/Kota'})
-                        location_col_found = True
-                        print(f"[INFO] Found and renamed location column: '{col}' -> 'Kabupaten/Kota'")
-                        break
-                
-                if not location_col_found:
-                    print(f"[ERROR] Location column not found. Available columns: {df.columns.tolist()}")
-                    return pd.DataFrame()
-            
-            # Remove empty columns
-            empty_columns = [col for col in df.columns if col == '']
-            if empty_columns:
-                df = df.drop(columns=empty_columns)
-
-            # Find year columns
-            year_columns = [col for col in df.columns if col.isdigit() and len(col) == 4]
-            if not year_columns:
-                # Try to find year columns that might be strings
-                for col in df.columns:
-                    if col != 'Kabupaten/Kota' and str(col).strip().isdigit():
-                        year_columns.append(col)
-            
-            if not year_columns:
-                print("[ERROR] No year columns found")
-                return pd.DataFrame()
-
-            # Melt DataFrame to long format
-            try:
-                df_melted = pd.melt(df, id_vars=['Kabupaten/Kota'], value_vars=year_columns,
-                                    var_name='Tahun', value_name='Value')
-            except KeyError as e:
-                print(f"[ERROR] Error during melt operation: {e}")
-                print(f"[DEBUG] Available columns: {df.columns.tolist()}")
-                return pd.DataFrame()
-
-            # Convert data types
-            df_melted['Tahun'] = pd.to_numeric(df_melted['Tahun'], errors='coerce')
-            
-            # Convert value to numeric, handling both comma and dot as decimal separator
-            # Handle both formats: "12.34" (dot) and "12,34" (comma)
-            df_melted['Value'] = df_melted['Value'].astype(str)
-            # Replace comma with dot for decimal separator
-            df_melted['Value'] = df_melted['Value'].str.replace(',', '.', regex=False)
-            # Convert to numeric
-            df_melted['Value'] = pd.to_numeric(df_melted['Value'], errors='coerce')
-
-            # Hapus baris dengan nilai IPM yang tidak valid/kosong
-            df_melted.dropna(subset=['Value'], inplace=True)
-            df_melted.dropna(subset=['Tahun'], inplace=True)
-
-            print(f"[OK] Data processed. Total valid records: {len(df_melted)}")
-            return df_melted
-
-        except gspread.exceptions.SpreadsheetNotFound:
-            logger.error(f"Spreadsheet with ID '{SHEET_ID}' not found.")
-            print(f"[ERROR] Spreadsheet with ID '{SHEET_ID}' not found.")
-        except gspread.exceptions.WorksheetNotFound:
-            logger.error(f"Worksheet 'Indeks Pembangunan Manusia Menu' not found.")
-            print(f"[ERROR] Worksheet 'Indeks Pembangunan Manusia Menu' not found.")
-        except KeyError as e:
-            logger.error(f"KeyError while processing IPM data: {e}")
-            print(f"[ERROR] KeyError: {e}")
-        except Exception as e:
-            logger.error(f"An error occurred while fetching/processing IPM data: {e}")
-            print(f"[ERROR] Unexpected error: {e}")
-        return pd.DataFrame() # Return empty DataFrame on error
+        return fetch_wide_sheet(IPM_SPEC)
 
     @staticmethod
     def save_ipm_to_db(ipm_df):
-        """Saves the processed IPM DataFrame to the database using a serializer."""
-        if ipm_df.empty:
-            print("[WARNING] No IPM data to save.")
-            return 0, 0
-
-        created_count = 0
-        updated_count = 0
-
-        for index, row in ipm_df.iterrows():
-            location_name = str(row['Kabupaten/Kota']).strip()
-
-            # Skip any residual non-data rows
-            if not location_name or "Sumber/Source" in location_name:
-                continue
-
-            # Determine location type
-            location_type = HumanDevelopmentIndex.LocationType.MUNICIPALITY if location_name.startswith("KOTA") else HumanDevelopmentIndex.LocationType.REGENCY
-
-            data_to_serialize = {
-                'location_name': location_name,
-                'location_type': location_type.value,
-                'year': row['Tahun'],
-                'ipm_value': row['Value']
-            }
-
-            # Coba dapatkan instance yang ada terlebih dahulu
-            try:
-                instance = HumanDevelopmentIndex.objects.get(location_name=location_name, year=row['Tahun'])
-            except HumanDevelopmentIndex.DoesNotExist:
-                instance = None
-
-            # Berikan instance ke serializer jika ada (untuk mode update)
-            serializer = HumanDevelopmentIndexSerializer(instance=instance, data=data_to_serialize)
-
-            if serializer.is_valid():
-                # Gunakan serializer.save() yang akan menangani create atau update secara otomatis
-                obj = serializer.save()
-                created = instance is None # Jika instance sebelumnya tidak ada, berarti ini adalah create
-                if created:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saat menyimpan IPM untuk {location_name} tahun {row['Tahun']}: {serializer.errors}")
-
-        print(f"[INFO] Total IPM records created: {created_count}, updated: {updated_count}")
-        return created_count, updated_count
+        """Saves the processed IPM DataFrame to the database with a single bulk upsert."""
+        return save_wide_sheet(IPM_SPEC, ipm_df)
 
     @classmethod
     def sync_ipm(cls):
         """Fungsi utama untuk sinkronisasi data API -> database."""
-        ipm_df = cls.fetch_ipm_data()
-        created_count, updated_count = cls.save_ipm_to_db(ipm_df)
-        return created_count, updated_count
+        return run_sheet_sync(
+            INDICATOR_SHEET_ID, cls.WORKSHEET_NAME, HumanDevelopmentIndex.objects.all(),
+            fetch=cls.fetch_ipm_data, save=cls.save_ipm_to_db,
+        )
 
 class HotelOccupancyCombinedService:
+    WORKSHEET_NAME = "Tingkat Hunian Hotel (bu tanti)_M-to-M"
+
     @staticmethod
     def fetch_hotel_occupancy_combined_data():
         """Fetches and processes hotel occupancy combined data from Google Sheets."""
         print("[INFO] Fetching Hotel Occupancy Combined data from Google Sheets...")
         try:
-            # Scope akses Google Sheets dan Google Drive
-            scope = [
-                'https://www.googleapis.com/auth/spreadsheets',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            # Autentikasi
-            credentials = ServiceAccountCredentials.from_json_keyfile_name('credentials.json', scope)
-            client = gspread.authorize(credentials)
-
             # ID Google Sheet dari link (sama seperti HumanDevelopmentIndex)
-            SHEET_ID = "1keS9YFYO1qzAawWgLh2U2pY6xX5ppKUnhbdHQYfU5HM"
-            sheet = client.open_by_key(SHEET_ID).worksheet("Tingkat Hunian Hotel (bu tanti)_M-to-M")
+            SHEET_ID = INDICATOR_SHEET_ID
 
             # Ambil semua data dan buat DataFrame
-            data = sheet.get_all_values()
+            data = get_worksheet_values(SHEET_ID, HotelOccupancyCombinedService.WORKSHEET_NAME)
             if not data or len(data) < 2:
                 print("[WARNING] No data found in sheet")
                 return pd.DataFrame()
@@ -286,13 +137,10 @@ class HotelOccupancyCombinedService:
             numeric_cols = ['MKTJ', 'TPK', 'RLMTA', 'RLMTNUS', 'RLMTGAB', 'GPR']
             for col in numeric_cols:
                 if col in df.columns:
-                    # Convert value to numeric, handling both comma and dot as decimal separator
-                    # Handle both formats: "12.34" (dot) and "12,34" (comma)
-                    df[col] = df[col].astype(str)
-                    # Replace comma with dot for decimal separator
-                    df[col] = df[col].str.replace(',', '.', regex=False)
-                    # Convert to numeric
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
+                    # "12.34" dan "12,34" sama-sama desimal
+                    numbers, invalid = parse_numbers(df[col], DECIMAL)
+                    report_invalid(f"Hotel Occupancy (Gabung Semua) {col}", df[col], invalid)
+                    df[col] = numbers
             
             # Hapus baris dengan tahun yang tidak valid
             df = df.dropna(subset=['Tahun'])
@@ -318,89 +166,38 @@ class HotelOccupancyCombinedService:
         """Saves the processed hotel occupancy combined DataFrame to the database."""
         if df.empty:
             print("[WARNING] No hotel occupancy combined data to save.")
-            return 0, 0
-
-        created_count = 0
-        updated_count = 0
-
-        # Helper function to round decimal values to 2 decimal places
-        def round_decimal(value, decimal_places=2):
-            """Round a value to specified decimal places, handling None and NaN."""
-            if value is None or pd.isna(value):
-                return None
-            try:
-                return round(float(value), decimal_places)
-            except (ValueError, TypeError):
-                return None
-
-        for index, row in df.iterrows():
-            year = int(row['Tahun']) if pd.notna(row['Tahun']) else None
-            month = str(row['Bulan']).strip() if pd.notna(row['Bulan']) else None
-
-            if not year or not month:
-                continue
+            return 0, 0, 0
 
-            data_to_serialize = {
-                'year': year,
-                'month': month,
-                'mktj': round_decimal(row.get('MKTJ'), 2),
-                'tpk': round_decimal(row.get('TPK'), 2),
-                'rlmta': round_decimal(row.get('RLMTA'), 2),
-                'rlmtnus': round_decimal(row.get('RLMTNUS'), 2),
-                'rlmtgab': round_decimal(row.get('RLMTGAB'), 2),
-                'gpr': round_decimal(row.get('GPR'), 2),
-            }
-
-            # Coba dapatkan instance yang ada terlebih dahulu
-            try:
-                instance = HotelOccupancyCombined.objects.get(year=year, month=month)
-            except HotelOccupancyCombined.DoesNotExist:
-                instance = None
-
-            # Berikan instance ke serializer jika ada (untuk mode update)
-            serializer = HotelOccupancyCombinedSerializer(instance=instance, data=data_to_serialize)
-
-            if serializer.is_valid():
-                obj = serializer.save()
-                created = instance is None
-                if created:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saat menyimpan hotel occupancy combined untuk {year}-{month}: {serializer.errors}")
+        records = pd.DataFrame({'year': df['Tahun'], 'month': text_values(df['Bulan'])})
+        for field, column in HOTEL_OCCUPANCY_COLUMNS.items():
+            records[field] = round_like_python(numeric_values(df, column), 2)
+        records = drop_blank_rows(records, ['year', 'month'])
 
-        print(f"[INFO] Total hotel occupancy combined records created: {created_count}, updated: {updated_count}")
-        return created_count, updated_count
+        created_count, updated_count, unchanged_count = bulk_upsert(HotelOccupancyCombined, records, label="hotel occupancy combined")
+        print(f"[INFO] Total hotel occupancy combined records created: {created_count}, updated: {updated_count}, unchanged: {unchanged_count}")
+        return created_count, updated_count, unchanged_count
 
     @classmethod
     def sync_hotel_occupancy_combined(cls):
         """Fungsi utama untuk sinkronisasi data Google Sheets -> database."""
-        df = cls.fetch_hotel_occupancy_combined_data()
-        created_count, updated_count = cls.save_hotel_occupancy_combined_to_db(df)
-        return created_count, updated_count
+        return run_sheet_sync(
+            INDICATOR_SHEET_ID, cls.WORKSHEET_NAME, HotelOccupancyCombined.objects.all(),
+            fetch=cls.fetch_hotel_occupancy_combined_data, save=cls.save_hotel_occupancy_combined_to_db,
+        )
 
 class HotelOccupancyYearlyService:
+    WORKSHEET_NAME = "Tingkat Hunian Hotel (bu tanti)_Y-to-Y"
+
     @staticmethod
     def fetch_hotel_occupancy_yearly_data():
         """Fetches and processes hotel occupancy yearly data from Google Sheets."""
         print("[INFO] Fetching Hotel Occupancy Yearly data from Google Sheets...")
         try:
-            # Scope akses Google Sheets dan Google Drive
-            scope = [
-                'https://www.googleapis.com/auth/spreadsheets',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            # Autentikasi
-            credentials = ServiceAccountCredentials.from_json_keyfile_name('credentials.json', scope)
-            client = gspread.authorize(credentials)
-
             # ID Google Sheet dari link (sama seperti HumanDevelopmentIndex)
-            SHEET_ID = "1keS9YFYO1qzAawWgLh2U2pY6xX5ppKUnhbdHQYfU5HM"
-            sheet = client.open_by_key(SHEET_ID).worksheet("Tingkat Hunian Hotel (bu tanti)_Y-to-Y")
+            SHEET_ID = INDICATOR_SHEET_ID
 
             # Ambil semua data dan buat DataFrame
-            data = sheet.get_all_values()
+            data = get_worksheet_values(SHEET_ID, HotelOccupancyYearlyService.WORKSHEET_NAME)
             if not data or len(data) < 2:
                 print("[WARNING] No data found in sheet")
                 return pd.DataFrame()
@@ -444,13 +241,10 @@ class HotelOccupancyYearlyService:
             numeric_cols = ['MKTJ', 'TPK', 'RLMTA', 'RLMTNUS', 'RLMTGAB', 'GPR']
             for col in numeric_cols:
                 if col in df.columns:
-                    # Convert value to numeric, handling both comma and dot as decimal separator
-                    # Handle both formats: "12.34" (dot) and "12,34" (comma)
-                    df[col] = df[col].astype(str)
-                    # Replace comma with dot for decimal separator
-                    df[col] = df[col].str.replace(',', '.', regex=False)
-                    # Convert to numeric
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
+                    # "12.34" dan "12,34" sama-sama desimal
+                    numbers, invalid = parse_numbers(df[col], DECIMAL)
+                    report_invalid(f"Hotel Occupancy (Year-to-Year) {col}", df[col], invalid)
+                    df[col] = numbers
             
             # Hapus baris dengan tahun yang tidak valid
             df = df.dropna(subset=['Tahun'])
@@ -472,207 +266,46 @@ class HotelOccupancyYearlyService:
         """Saves the processed hotel occupancy yearly DataFrame to the database."""
         if df.empty:
             print("[WARNING] No hotel occupancy yearly data to save.")
-            return 0, 0
-
-        created_count = 0
-        updated_count = 0
-
-        # Helper function to round decimal values to 2 decimal places
-        def round_decimal(value, decimal_places=2):
-            """Round a value to specified decimal places, handling None and NaN."""
-            if value is None or pd.isna(value):
-                return None
-            try:
-                return round(float(value), decimal_places)
-            except (ValueError, TypeError):
-                return None
+            return 0, 0, 0
 
-        for index, row in df.iterrows():
-            year = int(row['Tahun']) if pd.notna(row['Tahun']) else None
+        records = pd.DataFrame({'year': df['Tahun']})
+        for field, column in HOTEL_OCCUPANCY_COLUMNS.items():
+            records[field] = round_like_python(numeric_values(df, column), 2)
+        records = drop_blank_rows(records, ['year'])
 
-            if not year:
-                continue
-
-            data_to_serialize = {
-                'year': year,
-                'mktj': round_decimal(row.get('MKTJ'), 2),
-                'tpk': round_decimal(row.get('TPK'), 2),
-                'rlmta': round_decimal(row.get('RLMTA'), 2),
-                'rlmtnus': round_decimal(row.get('RLMTNUS'), 2),
-                'rlmtgab': round_decimal(row.get('RLMTGAB'), 2),
-                'gpr': round_decimal(row.get('GPR'), 2),
-            }
-
-            # Coba dapatkan instance yang ada terlebih dahulu
-            try:
-                instance = HotelOccupancyYearly.objects.get(year=year)
-            except HotelOccupancyYearly.DoesNotExist:
-                instance = None
-
-            # Berikan instance ke serializer jika ada (untuk mode update)
-            serializer = HotelOccupancyYearlySerializer(instance=instance, data=data_to_serialize)
-
-            if serializer.is_valid():
-                obj = serializer.save()
-                created = instance is None
-                if created:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saat menyimpan hotel occupancy yearly untuk {year}: {serializer.errors}")
-
-        print(f"[INFO] Total hotel occupancy yearly records created: {created_count}, updated: {updated_count}")
-        return created_count, updated_count
+        created_count, updated_count, unchanged_count = bulk_upsert(HotelOccupancyYearly, records, label="hotel occupancy yearly")
+        print(f"[INFO] Total hotel occupancy yearly records created: {created_count}, updated: {updated_count}, unchanged: {unchanged_count}")
+        return created_count, updated_count, unchanged_count
 
     @classmethod
     def sync_hotel_occupancy_yearly(cls):
         """Fungsi utama untuk sinkronisasi data Google Sheets -> database."""
-        df = cls.fetch_hotel_occupancy_yearly_data()
-        created_count, updated_count = cls.save_hotel_occupancy_yearly_to_db(df)
-        return created_count, updated_count
+        return run_sheet_sync(
+            INDICATOR_SHEET_ID, cls.WORKSHEET_NAME, HotelOccupancyYearly.objects.all(),
+            fetch=cls.fetch_hotel_occupancy_yearly_data, save=cls.save_hotel_occupancy_yearly_to_db,
+        )
 
 class GiniRatioService:
+    SPEC = GINI_RATIO_SPEC
+    WORKSHEET_NAME = GINI_RATIO_SPEC.worksheet_name
+
     @staticmethod
     def fetch_gini_ratio_data():
         """Fetches and processes Gini Ratio data from Google Sheets into a long-format DataFrame."""
-        print("[INFO] Fetching Gini Ratio data from Google Sheets...")
-        try:
-            # Scope akses Google Sheets dan Google Drive
-            scope = [
-                'https://www.googleapis.com/auth/spreadsheets',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            # Autentikasi
-            credentials = ServiceAccountCredentials.from_json_keyfile_name('credentials.json', scope)
-            client = gspread.authorize(credentials)
-
-            # ID Google Sheet dari link
-            SHEET_ID = "1keS9YFYO1qzAawWgLh2U2pY6xX5ppKUnhbdHQYfU5HM"
-            sheet = client.open_by_key(SHEET_ID).worksheet("Gini Ratio (bu septa)_Y-to-Y")
-
-            # Ambil semua data dan buat DataFrame
-            data = sheet.get_all_values()
-            if not data or len(data) < 2:
-                print("[WARNING] No data found in sheet")
-                return pd.DataFrame()
-            
-            headers = data[0]
-            data_rows = data[1:]
-            df = pd.DataFrame(data_rows, columns=headers)
-            print(f"[OK] Raw data fetched with shape: {df.shape}")
-
-            # --- Data Cleaning and Transformation ---
-            # Rename column A to standard name
-            if 'Kabupaten/Kot' in df.columns:
-                df = df.rename(columns={'Kabupaten/Kot': 'Kabupaten/Kota'})
-            elif 'Kabupaten/Kota' not in df.columns:
-                # Try to find the location column
-                for col in df.columns:
-                    if 'kabupaten' in col.lower() or 'kota' in col.lower() or 'kot' in col.lower():
-                        df = df.rename(columns={col: 'Kabupaten/Kota'})
-                        break
-            
-            # Remove empty columns
-            empty_columns = [col for col in df.columns if col == '']
-            if empty_columns:
-                df = df.drop(columns=empty_columns)
-
-            # Melt DataFrame to long format
-            year_columns = [col for col in df.columns if col.isdigit() and len(col) == 4]
-            if not year_columns:
-                # Try to find year columns that might be strings
-                for col in df.columns:
-                    if col != 'Kabupaten/Kota' and str(col).strip().isdigit():
-                        year_columns.append(col)
-            
-            if not year_columns:
-                print("[ERROR] No year columns found")
-                return pd.DataFrame()
-
-            df_melted = pd.melt(df, id_vars=['Kabupaten/Kota'], value_vars=year_columns,
-                                var_name='Tahun', value_name='Value')
-
-            # Convert data types
-            df_melted['Tahun'] = pd.to_numeric(df_melted['Tahun'], errors='coerce')
-            # Convert value to numeric, handling both comma and dot as decimal separator
-            df_melted['Value'] = df_melted['Value'].astype(str).str.replace(',', '.', regex=False)
-            df_melted['Value'] = pd.to_numeric(df_melted['Value'], errors='coerce')
-
-            # Hapus baris dengan nilai Gini Ratio yang tidak valid/kosong
-            df_melted.dropna(subset=['Value'], inplace=True)
-            
-            # Hapus baris dengan tahun yang tidak valid
-            df_melted.dropna(subset=['Tahun'], inplace=True)
-
-            print(f"[OK] Data processed. Total valid records: {len(df_melted)}")
-            return df_melted
-
-        except gspread.exceptions.SpreadsheetNotFound:
-            logger.error(f"Spreadsheet with ID '{SHEET_ID}' not found.")
-        except gspread.exceptions.WorksheetNotFound:
-            logger.error(f"Worksheet 'Gini Ratio (bu septa)_Y-to-Y' not found.")
-        except Exception as e:
-            logger.error(f"An error occurred while fetching/processing Gini Ratio data: {e}")
-            print(f"[ERROR] {e}")
-        return pd.DataFrame() # Return empty DataFrame on error
+        return fetch_wide_sheet(GINI_RATIO_SPEC)
 
     @staticmethod
     def save_gini_ratio_to_db(gini_df):
-        """Saves the processed Gini Ratio DataFrame to the database using a serializer."""
-        if gini_df.empty:
-            print("[WARNING] No Gini Ratio data to save.")
-            return 0, 0
-
-        created_count = 0
-        updated_count = 0
-
-        for index, row in gini_df.iterrows():
-            location_name = str(row['Kabupaten/Kota']).strip()
-
-            # Skip any residual non-data rows
-            if not location_name or "Sumber/Source" in location_name or location_name == '':
-                continue
-
-            # Determine location type
-            location_type = GiniRatio.LocationType.MUNICIPALITY if location_name.startswith("KOTA") else GiniRatio.LocationType.REGENCY
-
-            data_to_serialize = {
-                'location_name': location_name,
-                'location_type': location_type.value,
-                'year': int(row['Tahun']),
-                'gini_ratio_value': row['Value']
-            }
-
-            # Coba dapatkan instance yang ada terlebih dahulu
-            try:
-                instance = GiniRatio.objects.get(location_name=location_name, year=int(row['Tahun']))
-            except GiniRatio.DoesNotExist:
-                instance = None
-
-            # Berikan instance ke serializer jika ada (untuk mode update)
-            serializer = GiniRatioSerializer(instance=instance, data=data_to_serialize)
-
-            if serializer.is_valid():
-                # Gunakan serializer.save() yang akan menangani create atau update secara otomatis
-                obj = serializer.save()
-                created = instance is None # Jika instance sebelumnya tidak ada, berarti ini adalah create
-                if created:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saat menyimpan Gini Ratio untuk {location_name} tahun {row['Tahun']}: {serializer.errors}")
-
-        print(f"[INFO] Total Gini Ratio records created: {created_count}, updated: {updated_count}")
-        return created_count, updated_count
+        """Saves the processed Gini Ratio DataFrame to the database with a single bulk upsert."""
+        return save_wide_sheet(GINI_RATIO_SPEC, gini_df)
 
     @classmethod
     def sync_gini_ratio(cls):
         """Fungsi utama untuk sinkronisasi data Google Sheets -> database."""
-        gini_df = cls.fetch_gini_ratio_data()
-        created_count, updated_count = cls.save_gini_ratio_to_db(gini_df)
-        return created_count, updated_count
+        return run_sheet_sync(
+            INDICATOR_SHEET_ID, cls.WORKSHEET_NAME, GiniRatio.objects.all(),
+            fetch=cls.fetch_gini_ratio_data, save=cls.save_gini_ratio_to_db,
+        )
         
 class BPSNewsService:
     """
@@ -683,105 +316,17 @@ class BPSNewsService:
     @staticmethod
     def clean_html_content(text):
         """
-        Membersihkan HTML tags dan entities dari teks.
-        Menggunakan BeautifulSoup jika tersedia, jika tidak menggunakan regex fallback.
-        Juga membersihkan karakter escape Unicode seperti \u003C, \u003E, dll.
+        Membersihkan HTML tags dan entities dari teks, termasuk escape Unicode
+        literal seperti \u003C, \u003E. Lihat apps.services.text_cleaner.
         """
-        if not text or not isinstance(text, str):
-            return ""
-        
-        # First, handle literal Unicode escape sequences like \u003C (which is <), \u003E (which is >), etc.
-        # These are Unicode escape sequences stored as literal strings
-        text = re.sub(r'\\u003C', '', text)
-        text = re.sub(r'\\u003E', '', text)
-        text = re.sub(r'\\u0022', '', text)  # "
-        text = re.sub(r'\\u0027', '', text)  # '
-        text = re.sub(r'\\u0020', ' ', text)  # space
-        
-        # Handle other common escape sequences
-        text = re.sub(r'\\u000D\\u000A', ' ', text)
-        text = re.sub(r'\\u000D', ' ', text)
-        text = re.sub(r'\\u000A', ' ', text)
-        text = re.sub(r'\\u0009', ' ', text)  # tab
-        text = re.sub(r'\\u000B', ' ', text)  # vertical tab
-        text = re.sub(r'\\u000C', ' ', text)  # form feed
-        text = re.sub(r'\\r\\n', ' ', text)
-        text = re.sub(r'\\n', ' ', text)
-        text = re.sub(r'\\r', ' ', text)
-        text = re.sub(r'\\t', ' ', text)
-        
-        # Try to decode Unicode escape sequences if they exist as literal strings
-        try:
-            # Replace literal \uXXXX patterns with actual characters
-            text = re.sub(r'\\u([0-9a-fA-F]{4})', 
-                lambda m: chr(int(m.group(1), 16)), text)
-        except Exception as e:
-            logger.warning(f"Error decoding Unicode escapes: {e}")
-        
-        # Decode HTML entities terlebih dahulu
-        text = html.unescape(text)
-        
-        # Remove style attributes and their content first
-        text = re.sub(r'style\s*=\s*["\'][^"\']*["\']', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'style\s*=\s*[^\s>]*', '', text, flags=re.IGNORECASE)
-        
-        # Gunakan BeautifulSoup jika tersedia
-        try:
-            # Parse dengan BeautifulSoup untuk menghapus semua HTML tags
-            soup = BeautifulSoup(text, 'html.parser')
-            
-            # Ambil hanya teks, tanpa tag HTML
-            cleaned_text = soup.get_text(separator=' ', strip=False)
-            
-            # Normalisasi whitespace: hapus multiple spaces, tabs, newlines berlebihan
-            cleaned_text = re.sub(r'\s+', ' ', cleaned_text)
-            
-            # Hapus leading/trailing whitespace
-            cleaned_text = cleaned_text.strip()
-            
-            return cleaned_text
-        except Exception as e:
-            logger.warning(f"Error menggunakan BeautifulSoup: {e}. Menggunakan fallback method.")
-            
-            # Fallback method: hapus HTML tags dengan regex
-            # Hapus script dan style tags beserta isinya
-            text = re.sub(r'<script[^>]*>.*?</script>', '', text, flags=re.DOTALL | re.IGNORECASE)
-            text = re.sub(r'<style[^>]*>.*?</style>', '', text, flags=re.DOTALL | re.IGNORECASE)
-            
-            # Hapus semua HTML tags
-            text = re.sub(r'<[^>]+>', '', text)
-            
-            # Normalisasi whitespace
-            text = re.sub(r'\s+', ' ', text)
-            
-            # Hapus leading/trailing whitespace
-            text = text.strip()
-            
-            return text
+        return text_cleaner.clean_html(text)
 
     @staticmethod
     def clean_text_field(text, max_length=None):
         """
         Membersihkan field teks biasa (title, category_name, dll).
         """
-        if not text or not isinstance(text, str):
-            return ""
-        
-        # Decode HTML entities
-        cleaned = html.unescape(text)
-        
-        # Hapus HTML tags jika ada
-        cleaned = re.sub(r'<[^>]+>', '', cleaned)
-        
-        # Normalisasi whitespace
-        cleaned = re.sub(r'\s+', ' ', cleaned)
-        cleaned = cleaned.strip()
-        
-        # Truncate jika melebihi max_length
-        if max_length and len(cleaned) > max_length:
-            cleaned = cleaned[:max_length]
-        
-        return cleaned
+        return text_cleaner.clean_text(text, max_length)
 
     @staticmethod
     def validate_and_clean_news_id(news_id):
@@ -825,36 +370,34 @@ class BPSNewsService:
 
     @staticmethod
     def fetch_news_data():
-        base_url = f"https://webapi.bps.go.id/v1/api/list/model/news/lang/ind/domain/3578/key/{settings.API_KEY}/"
-        first_page = requests.get(f"{base_url}?page=1").json()
-        total_pages = first_page["data"][0]["pages"]
-        all_news = first_page["data"][1]
-        for page in range(2, total_pages + 1):
-            print(f"📡 Fetching page {page} ...")    
-            response = requests.get(f"{base_url}?page={page}")
-            response.raise_for_status()
-            data = response.json()
-            if "data" in data and len(data["data"]) > 1:
-                all_news.extend(data["data"][1])
+        # Halaman 2..N diambil bersamaan lewat session bersama (keep-alive, retry, timeout)
+        all_news = bps_client.fetch_all_pages("news")
         print(f"✅ Total berita diambil: {len(all_news)}")
         return all_news
     @staticmethod
     def save_news_to_db(news_list):
-        """Simpan hasil fetch ke database menggunakan serializer dengan cleaning data."""
-        created_count = 0
-        updated_count = 0
+        """Simpan hasil fetch ke database (bulk upsert pada news_id) dengan cleaning data."""
+        records = []
         skipped_count = 0
-        
+
+        valid_items = []
         for item in news_list:
             # Validasi dan clean news_id
             news_id = BPSNewsService.validate_and_clean_news_id(item.get('news_id'))
             if not news_id:
                 skipped_count += 1
                 continue
-            
+            valid_items.append((news_id, item))
+
+        # Isi berita dibersihkan sekaligus; backfill besar bisa dibagi ke process pool
+        contents = text_cleaner.clean_many(
+            [item.get('news') for _, item in valid_items],
+            processes=getattr(settings, 'TEXT_CLEAN_PROCESSES', 1),
+        )
+
+        for (news_id, item), cleaned_content in zip(valid_items, contents):
             # Clean semua field menggunakan fungsi cleaning
             cleaned_title = BPSNewsService.clean_text_field(item.get('title'), max_length=255)
-            cleaned_content = BPSNewsService.clean_html_content(item.get('news'))
             cleaned_category_id = BPSNewsService.clean_text_field(item.get('newscat_id'), max_length=255)
             cleaned_category_name = BPSNewsService.clean_text_field(item.get('newscat_name'), max_length=255)
             cleaned_picture_url = BPSNewsService.clean_url(item.get('picture'))
@@ -875,7 +418,7 @@ class BPSNewsService:
                     release_date = None
             
             # Map API fields to model fields dengan data yang sudah dibersihkan
-            data_to_serialize = {
+            record = {
                 'news_id': news_id,
                 'title': cleaned_title,
                 'content': cleaned_content,
@@ -885,50 +428,32 @@ class BPSNewsService:
                 'picture_url': cleaned_picture_url
             }
             
-            serializer = NewsSerializer(data=data_to_serialize)
-            if serializer.is_valid():
-                obj, created = News.objects.update_or_create(
-                    news_id=news_id,
-                    defaults=serializer.validated_data
-                )
-                if created:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                logger.error(f"Error saat menyimpan news_id {news_id}: {serializer.errors}")
-                skipped_count += 1
+            records.append(record)
         
-        print(f"💾 Total berita dibuat: {created_count}, diperbarui: {updated_count}, di-skip: {skipped_count}")
-        return created_count, updated_count
+        created_count, updated_count, unchanged_count = bulk_upsert(News, records, unique_fields=['news_id'], label="news")
+        skipped_count += len(records) - created_count - updated_count - unchanged_count
+        print(f"💾 Total berita dibuat: {created_count}, diperbarui: {updated_count}, tidak berubah: {unchanged_count}, di-skip: {skipped_count}")
+        return created_count, updated_count, unchanged_count
 
     @classmethod
     def sync_news(cls):
         """Fungsi utama untuk sinkronisasi data API -> database."""
-        news_list = cls.fetch_news_data()
-        created_count, updated_count = cls.save_news_to_db(news_list)
-        return created_count, updated_count
+        return run_bps_sync(
+            'news', News.objects.all(), 'news_id',
+            item_key=lambda item: cls.validate_and_clean_news_id(item.get('news_id')),
+            save=cls.save_news_to_db,
+        )
 class BPSPublicationService:
     @staticmethod
     def fetch_publication_data():
-        base_url = f"https://webapi.bps.go.id/v1/api/list/model/publication/lang/ind/domain/3578/key/{settings.API_KEY}/"
-        first_page = requests.get(f"{base_url}?page=1").json()
-        total_pages = first_page["data"][0]["pages"]
-        all_publication = first_page["data"][1]
-        for page in range(2, total_pages + 1):
-            print(f"📡 Fetching page {page} ...")    
-            response = requests.get(f"{base_url}?page={page}")
-            response.raise_for_status()
-            data = response.json()
-            if "data" in data and len(data["data"]) > 1:
-                all_publication.extend(data["data"][1])
+        # Halaman 2..N diambil bersamaan lewat session bersama (keep-alive, retry, timeout)
+        all_publication = bps_client.fetch_all_pages("publication")
         print(f"✅ Total publikasi diambil: {len(all_publication)}")
         return all_publication
     @staticmethod
     def save_publication_to_db(publication_list):
-        """Simpan hasil fetch ke database menggunakan serializer."""
-        created_count = 0
-        updated_count = 0
+        """Simpan hasil fetch ke database (bulk upsert pada pub_id)."""
+        records = []
         for item in publication_list:
             pub_id = item.get('pub_id')
             if not pub_id:
@@ -944,38 +469,10 @@ class BPSPublicationService:
             if image_value and len(image_value) > 500:
                 image_value = image_value[:500]
             
-            # Clean abstract from special characters
-            abstract_value = item.get('abstract', '') or ''
-            if abstract_value:
-                # Handle literal escape sequences like "\u000D\u000A"
-                abstract_value = re.sub(r'\\u000D\\u000A', ' ', abstract_value, flags=re.IGNORECASE)
-                abstract_value = re.sub(r'\\u000D', ' ', abstract_value, flags=re.IGNORECASE)
-                abstract_value = re.sub(r'\\u000A', ' ', abstract_value, flags=re.IGNORECASE)
-                abstract_value = re.sub(r'\\u0009', ' ', abstract_value, flags=re.IGNORECASE)  # tab
-                abstract_value = re.sub(r'\\u000B', ' ', abstract_value, flags=re.IGNORECASE)  # vertical tab
-                abstract_value = re.sub(r'\\u000C', ' ', abstract_value, flags=re.IGNORECASE)  # form feed
-                
-                # Handle other common escape sequences
-                abstract_value = re.sub(r'\\r\\n', ' ', abstract_value, flags=re.IGNORECASE)
-                abstract_value = re.sub(r'\\n', ' ', abstract_value, flags=re.IGNORECASE)
-                abstract_value = re.sub(r'\\r', ' ', abstract_value, flags=re.IGNORECASE)
-                abstract_value = re.sub(r'\\t', ' ', abstract_value, flags=re.IGNORECASE)
-                
-                # Try to decode Unicode escape sequences
-                try:
-                    abstract_value = re.sub(r'\\u([0-9a-fA-F]{4})', 
-                        lambda m: chr(int(m.group(1), 16)), abstract_value)
-                except:
-                    pass
-                
-                # Remove actual control characters
-                abstract_value = re.sub(r'[\r\n]+', ' ', abstract_value)
-                abstract_value = re.sub(r'[\u0000-\u001F\u007F-\u009F]', ' ', abstract_value)
-                
-                # Replace multiple spaces with single space
-                abstract_value = re.sub(r'[\s\t]+', ' ', abstract_value).strip()
+            # Clean abstract from special characters (escape literal, karakter kontrol, spasi)
+            abstract_value = text_cleaner.clean_abstract(item.get('abstract', '') or '')
             
-            data_to_serialize = {
+            record = {
                 'pub_id': pub_id,
                 'title': item.get('title'),
                 'abstract': abstract_value,
@@ -985,83 +482,54 @@ class BPSPublicationService:
                 'size': item.get('size')
             }
             
-            # Get existing instance if it exists
-            existing_obj = None
-            try:
-                existing_obj = Publication.objects.get(pub_id=pub_id)
-                # Use existing instance for update
-                serializer = PublicationSerializer(existing_obj, data=data_to_serialize, partial=True)
-            except Publication.DoesNotExist:
-                # New instance, use data only
-                serializer = PublicationSerializer(data=data_to_serialize)
-            
-            if serializer.is_valid():
-                serializer.save()
-                if existing_obj:
-                    updated_count += 1
-                else:
-                    created_count += 1
-            else:
-                print(f"❌ Error saat menyimpan pub_id {pub_id}: {serializer.errors}")
-        print(f"💾 Total publikasi dibuat: {created_count}, diperbarui: {updated_count}")
-        return created_count, updated_count
+            records.append(record)
+        
+        created_count, updated_count, unchanged_count = bulk_upsert(Publication, records, label="publikasi")
+        print(f"💾 Total publikasi dibuat: {created_count}, diperbarui: {updated_count}, tidak berubah: {unchanged_count}")
+        return created_count, updated_count, unchanged_count
 
     @classmethod
     def sync_publication(cls):
         """Fungsi utama untuk sinkronisasi data API -> database."""
-        publication_list = cls.fetch_publication_data()
-        created_count, updated_count = cls.save_publication_to_db(publication_list)
-        return created_count, updated_count
+        return run_bps_sync(
+            'publication', Publication.objects.all(), 'pub_id',
+            item_key=lambda item: item.get('pub_id') or None,
+            save=cls.save_publication_to_db,
+        )
 
 class BPSInfographicService:
     @staticmethod
     def fetch_infographic_data():
-        base_url = f"https://webapi.bps.go.id/v1/api/list/model/infographic/lang/ind/domain/3578/key/{settings.API_KEY}/"
-        first_page = requests.get(f"{base_url}?page=1").json()
-        total_pages = first_page["data"][0]["pages"]
-        all_infographic = first_page["data"][1]
-        for page in range(2, total_pages + 1):
-            print(f"📡 Fetching page {page} ...")    
-            response = requests.get(f"{base_url}?page={page}")
-            response.raise_for_status()
-            data = response.json()
-            if "data" in data and len(data["data"]) > 1:
-                all_infographic.extend(data["data"][1])
+        # Halaman 2..N diambil bersamaan lewat session bersama (keep-alive, retry, timeout)
+        all_infographic = bps_client.fetch_all_pages("infographic")
         print(f"✅ Total infografis diambil: {len(all_infographic)}")
         return all_infographic
     @staticmethod
     def save_infographic_to_db(infographic_list):
-        """Simpan hasil fetch ke database menggunakan serializer."""
-        created_count = 0
-        updated_count = 0
+        """Simpan hasil fetch ke database (bulk upsert pada title)."""
+        records = []
         for item in infographic_list:
             # Map API fields to model fields
-            data_to_serialize = {
+            record = {
                 'title': item.get('title'),
                 'image': item.get('img'),
                 'dl': item.get('dl')
             }
-            serializer = InfographicSerializer(data=data_to_serialize)
-            if serializer.is_valid():
-                obj, created = Infographic.objects.update_or_create(
-                    title=item.get("title"), # Assuming title is unique for infographics
-                    defaults=serializer.validated_data
-                )
-                if created:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"❌ Error saat menyimpan infografis {item.get('title')}: {serializer.errors}")
-        print(f"💾 Total infografis dibuat: {created_count}, diperbarui: {updated_count}")
-        return created_count, updated_count
+            records.append(record)
+        
+        # title bukan unique di database, jadi writer memakai SELECT + bulk_update untuk baris yang sudah ada
+        created_count, updated_count, unchanged_count = bulk_upsert(Infographic, records, unique_fields=['title'], label="infografis")
+        print(f"💾 Total infografis dibuat: {created_count}, diperbarui: {updated_count}, tidak berubah: {unchanged_count}")
+        return created_count, updated_count, unchanged_count
 
     @classmethod
     def sync_infographic(cls):
         """Fungsi utama untuk sinkronisasi data API -> database."""
-        infographic_list = cls.fetch_infographic_data()
-        created_count, updated_count = cls.save_infographic_to_db(infographic_list)
-        return created_count, updated_count
+        return run_bps_sync(
+            'infographic', Infographic.objects.all(), 'title',
+            item_key=lambda item: item.get('title') or None,
+            save=cls.save_infographic_to_db,
+        )
 # def _fetch_bps_data(model: str):
 #     """
 #     Fetches data from the BPS Web API for a given model, handling pagination.
@@ -1150,1106 +618,158 @@ class BPSInfographicService:
 # ========== IPM Sub-Categories Services ==========
 
 class IPM_UHH_SPService:
+    SPEC = IPM_UHH_SP_SPEC
+    WORKSHEET_NAME = IPM_UHH_SP_SPEC.worksheet_name
+
     @staticmethod
     def fetch_ipm_uhh_sp_data():
         """Fetches and processes IPM UHH SP data from Google Sheets into a long-format DataFrame."""
-        print("[INFO] Fetching IPM UHH SP data from Google Sheets...")
-        try:
-            scope = [
-                'https://www.googleapis.com/auth/spreadsheets',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            credentials = ServiceAccountCredentials.from_json_keyfile_name('credentials.json', scope)
-            client = gspread.authorize(credentials)
-
-            SHEET_ID = "1keS9YFYO1qzAawWgLh2U2pY6xX5ppKUnhbdHQYfU5HM"
-            sheet = client.open_by_key(SHEET_ID).worksheet("IPM_UHH SP_Y-to-Y ")
-
-            data = sheet.get_all_values()
-            if not data or len(data) < 2:
-                print("[WARNING] No data found in sheet")
-                return pd.DataFrame()
-            
-            headers = data[0]
-            data_rows = data[1:]
-            df = pd.DataFrame(data_rows, columns=headers)
-            print(f"[OK] Raw data fetched with shape: {df.shape}")
-
-            # --- Data Cleaning and Transformation ---
-            # Rename column to standard name - handle various column name formats
-            if 'Kabupaten/Kota\nRegency/Municipality' in df.columns:
-                df = df.rename(columns={'Kabupaten/Kota\nRegency/Municipality': 'Kabupaten/Kota'})
-            elif 'Kabupaten/Kot' in df.columns:
-                df = df.rename(columns={'Kabupaten/Kot': 'Kabupaten/Kota'})
-            elif 'Provinsi' in df.columns:
-                df = df.rename(columns={'Provinsi': 'Kabupaten/Kota'})
-                print(f"[INFO] Found and renamed location column: 'Provinsi' -> 'Kabupaten/Kota'")
-            elif 'Kabupaten/Kota' not in df.columns:
-                # Try to find the location column
-                location_col_found = False
-                for col in df.columns:
-                    col_lower = str(col).lower()
-                    if 'kabupaten' in col_lower or 'kota' in col_lower or 'kot' in col_lower or 'provinsi' in col_lower:
-                        df = df.rename(columns={col: 'Kabupaten/Kota'})
-                        location_col_found = True
-                        print(f"[INFO] Found and renamed location column: '{col}' -> 'Kabupaten/Kota'")
-                        break
-                
-                if not location_col_found:
-                    print(f"[ERROR] Location column not found. Available columns: {df.columns.tolist()}")
-                    return pd.DataFrame()
-            
-            # Remove empty columns
-            empty_columns = [col for col in df.columns if col == '']
-            if empty_columns:
-                df = df.drop(columns=empty_columns)
-
-            # Find year columns
-            year_columns = [col for col in df.columns if col.isdigit() and len(col) == 4]
-            if not year_columns:
-                # Try to find year columns that might be strings
-                for col in df.columns:
-                    if col != 'Kabupaten/Kota' and str(col).strip().isdigit():
-                        year_columns.append(col)
-            
-            if not year_columns:
-                print("[ERROR] No year columns found")
-                return pd.DataFrame()
-
-            # Melt DataFrame to long format
-            try:
-                df_melted = pd.melt(df, id_vars=['Kabupaten/Kota'], value_vars=year_columns,
-                                    var_name='Tahun', value_name='Value')
-            except KeyError as e:
-                print(f"[ERROR] Error during melt operation: {e}")
-                print(f"[DEBUG] Available columns: {df.columns.tolist()}")
-                return pd.DataFrame()
-
-            # Convert data types
-            df_melted['Tahun'] = pd.to_numeric(df_melted['Tahun'], errors='coerce')
-            
-            # Convert value to numeric, handling both comma and dot as decimal separator
-            # Handle both formats: "12.34" (dot) and "12,34" (comma)
-            df_melted['Value'] = df_melted['Value'].astype(str)
-            # Replace comma with dot for decimal separator
-            df_melted['Value'] = df_melted['Value'].str.replace(',', '.', regex=False)
-            # Convert to numeric
-            df_melted['Value'] = pd.to_numeric(df_melted['Value'], errors='coerce')
-            
-            # Remove rows with invalid/empty values
-            df_melted.dropna(subset=['Value'], inplace=True)
-            df_melted.dropna(subset=['Tahun'], inplace=True)
-
-            print(f"[OK] Data processed. Total valid records: {len(df_melted)}")
-            return df_melted
-
-        except gspread.exceptions.SpreadsheetNotFound:
-            logger.error(f"Spreadsheet with ID '{SHEET_ID}' not found.")
-            print(f"[ERROR] Spreadsheet with ID '{SHEET_ID}' not found.")
-        except gspread.exceptions.WorksheetNotFound:
-            logger.error(f"Worksheet 'IPM_UHH SP_Y-to-Y ' not found.")
-            print(f"[ERROR] Worksheet 'IPM_UHH SP_Y-to-Y ' not found.")
-        except KeyError as e:
-            logger.error(f"KeyError while processing IPM UHH SP data: {e}")
-            print(f"[ERROR] KeyError: {e}")
-        except Exception as e:
-            logger.error(f"An error occurred while fetching/processing IPM UHH SP data: {e}")
-            print(f"[ERROR] Unexpected error: {e}")
-        return pd.DataFrame()
+        return fetch_wide_sheet(IPM_UHH_SP_SPEC)
 
     @staticmethod
     def save_ipm_uhh_sp_to_db(df):
         """Saves the processed IPM UHH SP DataFrame to the database."""
-        if df.empty:
-            print("[WARNING] No IPM UHH SP data to save.")
-            return 0, 0
-
-        created_count = 0
-        updated_count = 0
-
-        for index, row in df.iterrows():
-            location_name = str(row['Kabupaten/Kota']).strip()
-            if not location_name or "Sumber/Source" in location_name:
-                continue
-
-            location_type = IPM_UHH_SP.LocationType.MUNICIPALITY if location_name.startswith("KOTA") else IPM_UHH_SP.LocationType.REGENCY
-
-            data_to_serialize = {
-                'location_name': location_name,
-                'location_type': location_type.value,
-                'year': row['Tahun'],
-                'value': row['Value']
-            }
-
-            try:
-                instance = IPM_UHH_SP.objects.get(location_name=location_name, year=row['Tahun'])
-            except IPM_UHH_SP.DoesNotExist:
-                instance = None
-
-            serializer = IPM_UHH_SPSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saat menyimpan IPM UHH SP untuk {location_name} tahun {row['Tahun']}: {serializer.errors}")
-
-        print(f"[INFO] Total IPM UHH SP records created: {created_count}, updated: {updated_count}")
-        return created_count, updated_count
+        return save_wide_sheet(IPM_UHH_SP_SPEC, df)
 
     @classmethod
     def sync_ipm_uhh_sp(cls):
         """Fungsi utama untuk sinkronisasi data Google Sheets -> database."""
-        df = cls.fetch_ipm_uhh_sp_data()
-        created_count, updated_count = cls.save_ipm_uhh_sp_to_db(df)
-        return created_count, updated_count
+        return run_sheet_sync(
+            INDICATOR_SHEET_ID, cls.WORKSHEET_NAME, IPM_UHH_SP.objects.all(),
+            fetch=cls.fetch_ipm_uhh_sp_data, save=cls.save_ipm_uhh_sp_to_db,
+        )
 
 class IPM_HLSService:
+    SPEC = IPM_HLS_SPEC
+    WORKSHEET_NAME = IPM_HLS_SPEC.worksheet_name
+
     @staticmethod
     def fetch_ipm_hls_data():
         """Fetches and processes IPM HLS data from Google Sheets into a long-format DataFrame."""
-        print("[INFO] Fetching IPM HLS data from Google Sheets...")
-        try:
-            scope = [
-                'https://www.googleapis.com/auth/spreadsheets',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            credentials = ServiceAccountCredentials.from_json_keyfile_name('credentials.json', scope)
-            client = gspread.authorize(credentials)
+        return fetch_wide_sheet(IPM_HLS_SPEC)
 
-            SHEET_ID = "1keS9YFYO1qzAawWgLh2U2pY6xX5ppKUnhbdHQYfU5HM"
-            sheet = client.open_by_key(SHEET_ID).worksheet("IPM_HLS_Y-to-Y")
+    @staticmethod
+    def save_ipm_hls_to_db(df):
+        """Saves the processed IPM HLS DataFrame to the database."""
+        return save_wide_sheet(IPM_HLS_SPEC, df)
 
-            data = sheet.get_all_values()
-            if not data or len(data) < 2:
-                print("[WARNING] No data found in sheet")
-                return pd.DataFrame()
-            
-            headers = data[0]
-            data_rows = data[1:]
-            df = pd.DataFrame(data_rows, columns=headers)
-            print(f"[OK] Raw data fetched with shape: {df.shape}")
-
-            # --- Data Cleaning and Transformation ---
-            # Rename column to standard name - handle various column name formats
-            if 'Kabupaten/Kota\nRegency/Municipality' in df.columns:
-                df = df.rename(columns={'Kabupaten/Kota\nRegency/Municipality': 'Kabupaten/Kota'})
-            elif 'Kabupaten/Kot' in df.columns:
-                df = df.rename(columns={'Kabupaten/Kot': 'Kabupaten/Kota'})
-            elif 'Provinsi' in df.columns:
-                df = df.rename(columns={'Provinsi': 'Kabupaten/Kota'})
-                print(f"[INFO] Found and renamed location column: 'Provinsi' -> 'Kabupaten/Kota'")
-            elif 'Kabupaten/Kota' not in df.columns:
-                # Try to find the location column
-                location_col_found = False
-                for col in df.columns:
-                    col_lower = str(col).lower()
-                    if 'kabupaten' in col_lower or 'kota' in col_lower or 'kot' in col_lower or 'provinsi' in col_lower:
-                        df = df.rename(columns={col: 'Kabupaten/Kota'})
-                        location_col_found = True
-                        print(f"[INFO] Found and renamed location column: '{col}' -> 'Kabupaten/Kota'")
-                        break
-                
-                if not location_col_found:
-                    print(f"[ERROR] Location column not found. Available columns: {df.columns.tolist()}")
-                    return pd.DataFrame()
-            
-            # Remove empty columns
-            empty_columns = [col for col in df.columns if col == '']
-            if empty_columns:
-                df = df.drop(columns=empty_columns)
-
-            # Find year columns
-            year_columns = [col for col in df.columns if col.isdigit() and len(col) == 4]
-            if not year_columns:
-                # Try to find year columns that might be strings
-                for col in df.columns:
-                    if col != 'Kabupaten/Kota' and str(col).strip().isdigit():
-                        year_columns.append(col)
-            
-            if not year_columns:
-                print("[ERROR] No year columns found")
-                return pd.DataFrame()
-
-            # Melt DataFrame to long format
-            try:
-                df_melted = pd.melt(df, id_vars=['Kabupaten/Kota'], value_vars=year_columns,
-                                    var_name='Tahun', value_name='Value')
-            except KeyError as e:
-                print(f"[ERROR] Error during melt operation: {e}")
-                print(f"[DEBUG] Available columns: {df.columns.tolist()}")
-                return pd.DataFrame()
-
-            # Convert data types
-            df_melted['Tahun'] = pd.to_numeric(df_melted['Tahun'], errors='coerce')
-            
-            # Convert value to numeric, handling both comma and dot as decimal separator
-            # Handle both formats: "12.34" (dot) and "12,34" (comma)
-            df_melted['Value'] = df_melted['Value'].astype(str)
-            # Replace comma with dot for decimal separator
-            df_melted['Value'] = df_melted['Value'].str.replace(',', '.', regex=False)
-            # Convert to numeric
-            df_melted['Value'] = pd.to_numeric(df_melted['Value'], errors='coerce')
-            
-            # Remove rows with invalid/empty values
-            df_melted.dropna(subset=['Value'], inplace=True)
-            df_melted.dropna(subset=['Tahun'], inplace=True)
-
-            print(f"[OK] Data processed. Total valid records: {len(df_melted)}")
-            return df_melted
-
-        except gspread.exceptions.SpreadsheetNotFound:
-            logger.error(f"Spreadsheet with ID '{SHEET_ID}' not found.")
-            print(f"[ERROR] Spreadsheet with ID '{SHEET_ID}' not found.")
-        except gspread.exceptions.WorksheetNotFound:
-            logger.error(f"Worksheet 'IPM_HLS_Y-to-Y' not found.")
-            print(f"[ERROR] Worksheet 'IPM_HLS_Y-to-Y' not found.")
-        except KeyError as e:
-            logger.error(f"KeyError while processing IPM HLS data: {e}")
-            print(f"[ERROR] KeyError: {e}")
-        except Exception as e:
-            logger.error(f"An error occurred while fetching/processing IPM HLS data: {e}")
-            print(f"[ERROR] Unexpected error: {e}")
-        return pd.DataFrame()
-
-    @staticmethod
-    def save_ipm_hls_to_db(df):
-        """Saves the processed IPM HLS DataFrame to the database."""
-        if df.empty:
-            print("[WARNING] No IPM HLS data to save.")
-            return 0, 0
-
-        created_count = 0
-        updated_count = 0
-
-        for index, row in df.iterrows():
-            location_name = str(row['Kabupaten/Kota']).strip()
-            if not location_name or "Sumber/Source" in location_name:
-                continue
-
-            location_type = IPM_HLS.LocationType.MUNICIPALITY if location_name.startswith("KOTA") else IPM_HLS.LocationType.REGENCY
-
-            data_to_serialize = {
-                'location_name': location_name,
-                'location_type': location_type.value,
-                'year': row['Tahun'],
-                'value': row['Value']
-            }
-
-            try:
-                instance = IPM_HLS.objects.get(location_name=location_name, year=row['Tahun'])
-            except IPM_HLS.DoesNotExist:
-                instance = None
-
-            serializer = IPM_HLSSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saat menyimpan IPM HLS untuk {location_name} tahun {row['Tahun']}: {serializer.errors}")
-
-        print(f"[INFO] Total IPM HLS records created: {created_count}, updated: {updated_count}")
-        return created_count, updated_count
-
-    @classmethod
-    def sync_ipm_hls(cls):
-        """Fungsi utama untuk sinkronisasi data Google Sheets -> database."""
-        df = cls.fetch_ipm_hls_data()
-        created_count, updated_count = cls.save_ipm_hls_to_db(df)
-        return created_count, updated_count
+    @classmethod
+    def sync_ipm_hls(cls):
+        """Fungsi utama untuk sinkronisasi data Google Sheets -> database."""
+        return run_sheet_sync(
+            INDICATOR_SHEET_ID, cls.WORKSHEET_NAME, IPM_HLS.objects.all(),
+            fetch=cls.fetch_ipm_hls_data, save=cls.save_ipm_hls_to_db,
+        )
 
 class IPM_RLSService:
+    SPEC = IPM_RLS_SPEC
+    WORKSHEET_NAME = IPM_RLS_SPEC.worksheet_name
+
     @staticmethod
     def fetch_ipm_rls_data():
         """Fetches and processes IPM RLS data from Google Sheets into a long-format DataFrame."""
-        print("[INFO] Fetching IPM RLS data from Google Sheets...")
-        try:
-            scope = [
-                'https://www.googleapis.com/auth/spreadsheets',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            credentials = ServiceAccountCredentials.from_json_keyfile_name('credentials.json', scope)
-            client = gspread.authorize(credentials)
-
-            SHEET_ID = "1keS9YFYO1qzAawWgLh2U2pY6xX5ppKUnhbdHQYfU5HM"
-            sheet = client.open_by_key(SHEET_ID).worksheet("IPM_RLS_Y-to-Y")
-
-            data = sheet.get_all_values()
-            if not data or len(data) < 2:
-                print("[WARNING] No data found in sheet")
-                return pd.DataFrame()
-            
-            headers = data[0]
-            data_rows = data[1:]
-            df = pd.DataFrame(data_rows, columns=headers)
-            print(f"[OK] Raw data fetched with shape: {df.shape}")
-
-            # --- Data Cleaning and Transformation ---
-            # Rename column to standard name - handle various column name formats
-            if 'Kabupaten/Kota\nRegency/Municipality' in df.columns:
-                df = df.rename(columns={'Kabupaten/Kota\nRegency/Municipality': 'Kabupaten/Kota'})
-            elif 'Kabupaten/Kot' in df.columns:
-                df = df.rename(columns={'Kabupaten/Kot': 'Kabupaten/Kota'})
-            elif 'Provinsi' in df.columns:
-                df = df.rename(columns={'Provinsi': 'Kabupaten/Kota'})
-                print(f"[INFO] Found and renamed location column: 'Provinsi' -> 'Kabupaten/Kota'")
-            elif 'Kabupaten/Kota' not in df.columns:
-                # Try to find the location column
-                location_col_found = False
-                for col in df.columns:
-                    col_lower = str(col).lower()
-                    if 'kabupaten' in col_lower or 'kota' in col_lower or 'kot' in col_lower or 'provinsi' in col_lower:
-                        df = df.rename(columns={col: 'Kabupaten/Kota'})
-                        location_col_found = True
-                        print(f"[INFO] Found and renamed location column: '{col}' -> 'Kabupaten/Kota'")
-                        break
-                
-                if not location_col_found:
-                    print(f"[ERROR] Location column not found. Available columns: {df.columns.tolist()}")
-                    return pd.DataFrame()
-            
-            # Remove empty columns
-            empty_columns = [col for col in df.columns if col == '']
-            if empty_columns:
-                df = df.drop(columns=empty_columns)
-
-            # Find year columns
-            year_columns = [col for col in df.columns if col.isdigit() and len(col) == 4]
-            if not year_columns:
-                # Try to find year columns that might be strings
-                for col in df.columns:
-                    if col != 'Kabupaten/Kota' and str(col).strip().isdigit():
-                        year_columns.append(col)
-            
-            if not year_columns:
-                print("[ERROR] No year columns found")
-                return pd.DataFrame()
-
-            # Melt DataFrame to long format
-            try:
-                df_melted = pd.melt(df, id_vars=['Kabupaten/Kota'], value_vars=year_columns,
-                                    var_name='Tahun', value_name='Value')
-            except KeyError as e:
-                print(f"[ERROR] Error during melt operation: {e}")
-                print(f"[DEBUG] Available columns: {df.columns.tolist()}")
-                return pd.DataFrame()
-
-            # Convert data types
-            df_melted['Tahun'] = pd.to_numeric(df_melted['Tahun'], errors='coerce')
-            
-            # Convert value to numeric, handling both comma and dot as decimal separator
-            # Handle both formats: "12.34" (dot) and "12,34" (comma)
-            df_melted['Value'] = df_melted['Value'].astype(str)
-            # Replace comma with dot for decimal separator
-            df_melted['Value'] = df_melted['Value'].str.replace(',', '.', regex=False)
-            # Convert to numeric
-            df_melted['Value'] = pd.to_numeric(df_melted['Value'], errors='coerce')
-            
-            # Remove rows with invalid/empty values
-            df_melted.dropna(subset=['Value'], inplace=True)
-            df_melted.dropna(subset=['Tahun'], inplace=True)
-
-            print(f"[OK] Data processed. Total valid records: {len(df_melted)}")
-            return df_melted
-
-        except gspread.exceptions.SpreadsheetNotFound:
-            logger.error(f"Spreadsheet with ID '{SHEET_ID}' not found.")
-            print(f"[ERROR] Spreadsheet with ID '{SHEET_ID}' not found.")
-        except gspread.exceptions.WorksheetNotFound:
-            logger.error(f"Worksheet 'IPM_RLS_Y-to-Y' not found.")
-            print(f"[ERROR] Worksheet 'IPM_RLS_Y-to-Y' not found.")
-        except KeyError as e:
-            logger.error(f"KeyError while processing IPM RLS data: {e}")
-            print(f"[ERROR] KeyError: {e}")
-        except Exception as e:
-            logger.error(f"An error occurred while fetching/processing IPM RLS data: {e}")
-            print(f"[ERROR] Unexpected error: {e}")
-        return pd.DataFrame()
+        return fetch_wide_sheet(IPM_RLS_SPEC)
 
     @staticmethod
     def save_ipm_rls_to_db(df):
         """Saves the processed IPM RLS DataFrame to the database."""
-        if df.empty:
-            print("[WARNING] No IPM RLS data to save.")
-            return 0, 0
-
-        created_count = 0
-        updated_count = 0
-
-        for index, row in df.iterrows():
-            location_name = str(row['Kabupaten/Kota']).strip()
-            if not location_name or "Sumber/Source" in location_name:
-                continue
-
-            location_type = IPM_RLS.LocationType.MUNICIPALITY if location_name.startswith("KOTA") else IPM_RLS.LocationType.REGENCY
-
-            data_to_serialize = {
-                'location_name': location_name,
-                'location_type': location_type.value,
-                'year': row['Tahun'],
-                'value': row['Value']
-            }
-
-            try:
-                instance = IPM_RLS.objects.get(location_name=location_name, year=row['Tahun'])
-            except IPM_RLS.DoesNotExist:
-                instance = None
-
-            serializer = IPM_RLSSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saat menyimpan IPM RLS untuk {location_name} tahun {row['Tahun']}: {serializer.errors}")
-
-        print(f"[INFO] Total IPM RLS records created: {created_count}, updated: {updated_count}")
-        return created_count, updated_count
+        return save_wide_sheet(IPM_RLS_SPEC, df)
 
     @classmethod
     def sync_ipm_rls(cls):
         """Fungsi utama untuk sinkronisasi data Google Sheets -> database."""
-        df = cls.fetch_ipm_rls_data()
-        created_count, updated_count = cls.save_ipm_rls_to_db(df)
-        return created_count, updated_count
+        return run_sheet_sync(
+            INDICATOR_SHEET_ID, cls.WORKSHEET_NAME, IPM_RLS.objects.all(),
+            fetch=cls.fetch_ipm_rls_data, save=cls.save_ipm_rls_to_db,
+        )
 
 class IPM_PengeluaranPerKapitaService:
+    SPEC = IPM_PENGELUARAN_PER_KAPITA_SPEC
+    WORKSHEET_NAME = IPM_PENGELUARAN_PER_KAPITA_SPEC.worksheet_name
+
     @staticmethod
     def fetch_ipm_pengeluaran_per_kapita_data():
         """Fetches and processes IPM Pengeluaran per Kapita data from Google Sheets into a long-format DataFrame."""
-        print("[INFO] Fetching IPM Pengeluaran per Kapita data from Google Sheets...")
-        try:
-            scope = [
-                'https://www.googleapis.com/auth/spreadsheets',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            credentials = ServiceAccountCredentials.from_json_keyfile_name('credentials.json', scope)
-            client = gspread.authorize(credentials)
-
-            SHEET_ID = "1keS9YFYO1qzAawWgLh2U2pY6xX5ppKUnhbdHQYfU5HM"
-            sheet = client.open_by_key(SHEET_ID).worksheet("IPM_Pengeluaran per kapita_Y-to-Y")
-
-            data = sheet.get_all_values()
-            if not data or len(data) < 2:
-                print("[WARNING] No data found in sheet")
-                return pd.DataFrame()
-            
-            headers = data[0]
-            data_rows = data[1:]
-            df = pd.DataFrame(data_rows, columns=headers)
-            print(f"[OK] Raw data fetched with shape: {df.shape}")
-
-            # --- Data Cleaning and Transformation ---
-            # Rename column to standard name - handle various column name formats
-            if 'Kabupaten/Kota\nRegency/Municipality' in df.columns:
-                df = df.rename(columns={'Kabupaten/Kota\nRegency/Municipality': 'Kabupaten/Kota'})
-            elif 'Kabupaten/Kot' in df.columns:
-                df = df.rename(columns={'Kabupaten/Kot': 'Kabupaten/Kota'})
-            elif 'Provinsi' in df.columns:
-                df = df.rename(columns={'Provinsi': 'Kabupaten/Kota'})
-                print(f"[INFO] Found and renamed location column: 'Provinsi' -> 'Kabupaten/Kota'")
-            elif 'Kabupaten/Kota' not in df.columns:
-                # Try to find the location column
-                location_col_found = False
-                for col in df.columns:
-                    col_lower = str(col).lower()
-                    if 'kabupaten' in col_lower or 'kota' in col_lower or 'kot' in col_lower or 'provinsi' in col_lower:
-                        df = df.rename(columns={col: 'Kabupaten/Kota'})
-                        location_col_found = True
-                        print(f"[INFO] Found and renamed location column: '{col}' -> 'Kabupaten/Kota'")
-                        break
-                
-                if not location_col_found:
-                    print(f"[ERROR] Location column not found. Available columns: {df.columns.tolist()}")
-                    return pd.DataFrame()
-            
-            # Remove empty columns
-            empty_columns = [col for col in df.columns if col == '']
-            if empty_columns:
-                df = df.drop(columns=empty_columns)
-
-            # Find year columns
-            year_columns = [col for col in df.columns if col.isdigit() and len(col) == 4]
-            if not year_columns:
-                # Try to find year columns that might be strings
-                for col in df.columns:
-                    if col != 'Kabupaten/Kota' and str(col).strip().isdigit():
-                        year_columns.append(col)
-            
-            if not year_columns:
-                print("[ERROR] No year columns found")
-                return pd.DataFrame()
-
-            # Melt DataFrame to long format
-            try:
-                df_melted = pd.melt(df, id_vars=['Kabupaten/Kota'], value_vars=year_columns,
-                                    var_name='Tahun', value_name='Value')
-            except KeyError as e:
-                print(f"[ERROR] Error during melt operation: {e}")
-                print(f"[DEBUG] Available columns: {df.columns.tolist()}")
-                return pd.DataFrame()
-
-            # Convert data types
-            df_melted['Tahun'] = pd.to_numeric(df_melted['Tahun'], errors='coerce')
-            
-            # Convert value to numeric, handling both comma and dot as decimal separator
-            # Handle both formats: "12.34" (dot) and "12,34" (comma)
-            df_melted['Value'] = df_melted['Value'].astype(str)
-            # Replace comma with dot for decimal separator
-            df_melted['Value'] = df_melted['Value'].str.replace(',', '.', regex=False)
-            # Convert to numeric
-            df_melted['Value'] = pd.to_numeric(df_melted['Value'], errors='coerce')
-            
-            # Remove rows with invalid/empty values
-            df_melted.dropna(subset=['Value'], inplace=True)
-            df_melted.dropna(subset=['Tahun'], inplace=True)
-
-            print(f"[OK] Data processed. Total valid records: {len(df_melted)}")
-            return df_melted
-
-        except gspread.exceptions.SpreadsheetNotFound:
-            logger.error(f"Spreadsheet with ID '{SHEET_ID}' not found.")
-            print(f"[ERROR] Spreadsheet with ID '{SHEET_ID}' not found.")
-        except gspread.exceptions.WorksheetNotFound:
-            logger.error(f"Worksheet 'IPM_Pengeluaran per kapita_Y-to-Y' not found.")
-            print(f"[ERROR] Worksheet 'IPM_Pengeluaran per kapita_Y-to-Y' not found.")
-        except KeyError as e:
-            logger.error(f"KeyError while processing IPM Pengeluaran per Kapita data: {e}")
-            print(f"[ERROR] KeyError: {e}")
-        except Exception as e:
-            logger.error(f"An error occurred while fetching/processing IPM Pengeluaran per Kapita data: {e}")
-            print(f"[ERROR] Unexpected error: {e}")
-        return pd.DataFrame()
+        return fetch_wide_sheet(IPM_PENGELUARAN_PER_KAPITA_SPEC)
 
     @staticmethod
     def save_ipm_pengeluaran_per_kapita_to_db(df):
         """Saves the processed IPM Pengeluaran per Kapita DataFrame to the database."""
-        if df.empty:
-            print("[WARNING] No IPM Pengeluaran per Kapita data to save.")
-            return 0, 0
-
-        created_count = 0
-        updated_count = 0
-
-        for index, row in df.iterrows():
-            location_name = str(row['Kabupaten/Kota']).strip()
-            if not location_name or "Sumber/Source" in location_name:
-                continue
-
-            location_type = IPM_PengeluaranPerKapita.LocationType.MUNICIPALITY if location_name.startswith("KOTA") else IPM_PengeluaranPerKapita.LocationType.REGENCY
-
-            # Round value to 2 decimal places to match model's decimal_places=2
-            value = round(float(row['Value']), 2) if pd.notna(row['Value']) else None
-
-            data_to_serialize = {
-                'location_name': location_name,
-                'location_type': location_type.value,
-                'year': row['Tahun'],
-                'value': value
-            }
-
-            try:
-                instance = IPM_PengeluaranPerKapita.objects.get(location_name=location_name, year=row['Tahun'])
-            except IPM_PengeluaranPerKapita.DoesNotExist:
-                instance = None
-
-            serializer = IPM_PengeluaranPerKapitaSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saat menyimpan IPM Pengeluaran per Kapita untuk {location_name} tahun {row['Tahun']}: {serializer.errors}")
-
-        print(f"[INFO] Total IPM Pengeluaran per Kapita records created: {created_count}, updated: {updated_count}")
-        return created_count, updated_count
+        return save_wide_sheet(IPM_PENGELUARAN_PER_KAPITA_SPEC, df)
 
     @classmethod
     def sync_ipm_pengeluaran_per_kapita(cls):
         """Fungsi utama untuk sinkronisasi data Google Sheets -> database."""
-        df = cls.fetch_ipm_pengeluaran_per_kapita_data()
-        created_count, updated_count = cls.save_ipm_pengeluaran_per_kapita_to_db(df)
-        return created_count, updated_count
+        return run_sheet_sync(
+            INDICATOR_SHEET_ID, cls.WORKSHEET_NAME, IPM_PengeluaranPerKapita.objects.all(),
+            fetch=cls.fetch_ipm_pengeluaran_per_kapita_data, save=cls.save_ipm_pengeluaran_per_kapita_to_db,
+        )
 
 class IPM_IndeksKesehatanService:
+    SPEC = IPM_INDEKS_KESEHATAN_SPEC
+    WORKSHEET_NAME = IPM_INDEKS_KESEHATAN_SPEC.worksheet_name
+
     @staticmethod
     def fetch_ipm_indeks_kesehatan_data():
         """Fetches and processes IPM Indeks Kesehatan data from Google Sheets into a long-format DataFrame."""
-        print("[INFO] Fetching IPM Indeks Kesehatan data from Google Sheets...")
-        try:
-            scope = [
-                'https://www.googleapis.com/auth/spreadsheets',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            credentials = ServiceAccountCredentials.from_json_keyfile_name('credentials.json', scope)
-            client = gspread.authorize(credentials)
-
-            SHEET_ID = "1keS9YFYO1qzAawWgLh2U2pY6xX5ppKUnhbdHQYfU5HM"
-            sheet = client.open_by_key(SHEET_ID).worksheet("IPM_Indeks Kesehatan_Y-to-Y")
-
-            data = sheet.get_all_values()
-            if not data or len(data) < 2:
-                print("[WARNING] No data found in sheet")
-                return pd.DataFrame()
-            
-            headers = data[0]
-            data_rows = data[1:]
-            df = pd.DataFrame(data_rows, columns=headers)
-            print(f"[OK] Raw data fetched with shape: {df.shape}")
-
-            # --- Data Cleaning and Transformation ---
-            # Rename column to standard name - handle various column name formats
-            if 'Kabupaten/Kota\nRegency/Municipality' in df.columns:
-                df = df.rename(columns={'Kabupaten/Kota\nRegency/Municipality': 'Kabupaten/Kota'})
-            elif 'Kabupaten/Kot' in df.columns:
-                df = df.rename(columns={'Kabupaten/Kot': 'Kabupaten/Kota'})
-            elif 'Provinsi' in df.columns:
-                df = df.rename(columns={'Provinsi': 'Kabupaten/Kota'})
-                print(f"[INFO] Found and renamed location column: 'Provinsi' -> 'Kabupaten/Kota'")
-            elif 'Kabupaten/Kota' not in df.columns:
-                # Try to find the location column
-                location_col_found = False
-                for col in df.columns:
-                    col_lower = str(col).lower()
-                    if 'kabupaten' in col_lower or 'kota' in col_lower or 'kot' in col_lower or 'provinsi' in col_lower:
-                        df = df.rename(columns={col: 'Kabupaten/Kota'})
-                        location_col_found = True
-                        print(f"[INFO] Found and renamed location column: '{col}' -> 'Kabupaten/Kota'")
-                        break
-                
-                if not location_col_found:
-                    print(f"[ERROR] Location column not found. Available columns: {df.columns.tolist()}")
-                    return pd.DataFrame()
-            
-            # Remove empty columns
-            empty_columns = [col for col in df.columns if col == '']
-            if empty_columns:
-                df = df.drop(columns=empty_columns)
-
-            # Find year columns
-            year_columns = [col for col in df.columns if col.isdigit() and len(col) == 4]
-            if not year_columns:
-                # Try to find year columns that might be strings
-                for col in df.columns:
-                    if col != 'Kabupaten/Kota' and str(col).strip().isdigit():
-                        year_columns.append(col)
-            
-            if not year_columns:
-                print("[ERROR] No year columns found")
-                return pd.DataFrame()
-
-            # Melt DataFrame to long format
-            try:
-                df_melted = pd.melt(df, id_vars=['Kabupaten/Kota'], value_vars=year_columns,
-                                    var_name='Tahun', value_name='Value')
-            except KeyError as e:
-                print(f"[ERROR] Error during melt operation: {e}")
-                print(f"[DEBUG] Available columns: {df.columns.tolist()}")
-                return pd.DataFrame()
-
-            # Convert data types
-            df_melted['Tahun'] = pd.to_numeric(df_melted['Tahun'], errors='coerce')
-            
-            # Convert value to numeric, handling both comma and dot as decimal separator
-            # Handle both formats: "12.34" (dot) and "12,34" (comma)
-            df_melted['Value'] = df_melted['Value'].astype(str)
-            # Replace comma with dot for decimal separator
-            df_melted['Value'] = df_melted['Value'].str.replace(',', '.', regex=False)
-            # Convert to numeric
-            df_melted['Value'] = pd.to_numeric(df_melted['Value'], errors='coerce')
-            
-            # Remove rows with invalid/empty values
-            df_melted.dropna(subset=['Value'], inplace=True)
-            df_melted.dropna(subset=['Tahun'], inplace=True)
-
-            print(f"[OK] Data processed. Total valid records: {len(df_melted)}")
-            return df_melted
-
-        except gspread.exceptions.SpreadsheetNotFound:
-            logger.error(f"Spreadsheet with ID '{SHEET_ID}' not found.")
-            print(f"[ERROR] Spreadsheet with ID '{SHEET_ID}' not found.")
-        except gspread.exceptions.WorksheetNotFound:
-            logger.error(f"Worksheet 'IPM_Indeks Kesehatan_Y-to-Y' not found.")
-            print(f"[ERROR] Worksheet 'IPM_Indeks Kesehatan_Y-to-Y' not found.")
-        except KeyError as e:
-            logger.error(f"KeyError while processing IPM Indeks Kesehatan data: {e}")
-            print(f"[ERROR] KeyError: {e}")
-        except Exception as e:
-            logger.error(f"An error occurred while fetching/processing IPM Indeks Kesehatan data: {e}")
-            print(f"[ERROR] Unexpected error: {e}")
-        return pd.DataFrame()
+        return fetch_wide_sheet(IPM_INDEKS_KESEHATAN_SPEC)
 
     @staticmethod
     def save_ipm_indeks_kesehatan_to_db(df):
         """Saves the processed IPM Indeks Kesehatan DataFrame to the database."""
-        if df.empty:
-            print("[WARNING] No IPM Indeks Kesehatan data to save.")
-            return 0, 0
-
-        created_count = 0
-        updated_count = 0
-
-        for index, row in df.iterrows():
-            location_name = str(row['Kabupaten/Kota']).strip()
-            if not location_name or "Sumber/Source" in location_name:
-                continue
-
-            location_type = IPM_IndeksKesehatan.LocationType.MUNICIPALITY if location_name.startswith("KOTA") else IPM_IndeksKesehatan.LocationType.REGENCY
-
-            data_to_serialize = {
-                'location_name': location_name,
-                'location_type': location_type.value,
-                'year': row['Tahun'],
-                'value': row['Value']
-            }
-
-            try:
-                instance = IPM_IndeksKesehatan.objects.get(location_name=location_name, year=row['Tahun'])
-            except IPM_IndeksKesehatan.DoesNotExist:
-                instance = None
-
-            serializer = IPM_IndeksKesehatanSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saat menyimpan IPM Indeks Kesehatan untuk {location_name} tahun {row['Tahun']}: {serializer.errors}")
-
-        print(f"[INFO] Total IPM Indeks Kesehatan records created: {created_count}, updated: {updated_count}")
-        return created_count, updated_count
+        return save_wide_sheet(IPM_INDEKS_KESEHATAN_SPEC, df)
 
     @classmethod
     def sync_ipm_indeks_kesehatan(cls):
         """Fungsi utama untuk sinkronisasi data Google Sheets -> database."""
-        df = cls.fetch_ipm_indeks_kesehatan_data()
-        created_count, updated_count = cls.save_ipm_indeks_kesehatan_to_db(df)
-        return created_count, updated_count
+        return run_sheet_sync(
+            INDICATOR_SHEET_ID, cls.WORKSHEET_NAME, IPM_IndeksKesehatan.objects.all(),
+            fetch=cls.fetch_ipm_indeks_kesehatan_data, save=cls.save_ipm_indeks_kesehatan_to_db,
+        )
 
 class IPM_IndeksHidupLayakService:
+    SPEC = IPM_INDEKS_HIDUP_LAYAK_SPEC
+    WORKSHEET_NAME = IPM_INDEKS_HIDUP_LAYAK_SPEC.worksheet_name
+
     @staticmethod
     def fetch_ipm_indeks_hidup_layak_data():
         """Fetches and processes IPM Indeks Hidup Layak data from Google Sheets into a long-format DataFrame."""
-        print("[INFO] Fetching IPM Indeks Hidup Layak data from Google Sheets...")
-        try:
-            scope = [
-                'https://www.googleapis.com/auth/spreadsheets',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            credentials = ServiceAccountCredentials.from_json_keyfile_name('credentials.json', scope)
-            client = gspread.authorize(credentials)
-
-            SHEET_ID = "1keS9YFYO1qzAawWgLh2U2pY6xX5ppKUnhbdHQYfU5HM"
-            sheet = client.open_by_key(SHEET_ID).worksheet("IPM_Indeks Hidup Layak_Y-to-Y")
-
-            data = sheet.get_all_values()
-            if not data or len(data) < 2:
-                print("[WARNING] No data found in sheet")
-                return pd.DataFrame()
-            
-            headers = data[0]
-            data_rows = data[1:]
-            df = pd.DataFrame(data_rows, columns=headers)
-            print(f"[OK] Raw data fetched with shape: {df.shape}")
-
-            # --- Data Cleaning and Transformation ---
-            # Rename column to standard name - handle various column name formats
-            if 'Kabupaten/Kota\nRegency/Municipality' in df.columns:
-                df = df.rename(columns={'Kabupaten/Kota\nRegency/Municipality': 'Kabupaten/Kota'})
-            elif 'Kabupaten/Kot' in df.columns:
-                df = df.rename(columns={'Kabupaten/Kot': 'Kabupaten/Kota'})
-            elif 'Provinsi' in df.columns:
-                df = df.rename(columns={'Provinsi': 'Kabupaten/Kota'})
-                print(f"[INFO] Found and renamed location column: 'Provinsi' -> 'Kabupaten/Kota'")
-            elif 'Kabupaten/Kota' not in df.columns:
-                # Try to find the location column
-                location_col_found = False
-                for col in df.columns:
-                    col_lower = str(col).lower()
-                    if 'kabupaten' in col_lower or 'kota' in col_lower or 'kot' in col_lower or 'provinsi' in col_lower:
-                        df = df.rename(columns={col: 'Kabupaten/Kota'})
-                        location_col_found = True
-                        print(f"[INFO] Found and renamed location column: '{col}' -> 'Kabupaten/Kota'")
-                        break
-                
-                if not location_col_found:
-                    print(f"[ERROR] Location column not found. Available columns: {df.columns.tolist()}")
-                    return pd.DataFrame()
-            
-            # Remove empty columns
-            empty_columns = [col for col in df.columns if col == '']
-            if empty_columns:
-                df = df.drop(columns=empty_columns)
-
-            # Find year columns
-            year_columns = [col for col in df.columns if col.isdigit() and len(col) == 4]
-            if not year_columns:
-                # Try to find year columns that might be strings
-                for col in df.columns:
-                    if col != 'Kabupaten/Kota' and str(col).strip().isdigit():
-                        year_columns.append(col)
-            
-            if not year_columns:
-                print("[ERROR] No year columns found")
-                return pd.DataFrame()
-
-            # Melt DataFrame to long format
-            try:
-                df_melted = pd.melt(df, id_vars=['Kabupaten/Kota'], value_vars=year_columns,
-                                    var_name='Tahun', value_name='Value')
-            except KeyError as e:
-                print(f"[ERROR] Error during melt operation: {e}")
-                print(f"[DEBUG] Available columns: {df.columns.tolist()}")
-                return pd.DataFrame()
-
-            # Convert data types
-            df_melted['Tahun'] = pd.to_numeric(df_melted['Tahun'], errors='coerce')
-            
-            # Convert value to numeric, handling both comma and dot as decimal separator
-            # Handle both formats: "12.34" (dot) and "12,34" (comma)
-            df_melted['Value'] = df_melted['Value'].astype(str)
-            # Replace comma with dot for decimal separator
-            df_melted['Value'] = df_melted['Value'].str.replace(',', '.', regex=False)
-            # Convert to numeric
-            df_melted['Value'] = pd.to_numeric(df_melted['Value'], errors='coerce')
-            
-            # Remove rows with invalid/empty values
-            df_melted.dropna(subset=['Value'], inplace=True)
-            df_melted.dropna(subset=['Tahun'], inplace=True)
-
-            print(f"[OK] Data processed. Total valid records: {len(df_melted)}")
-            return df_melted
-
-        except gspread.exceptions.SpreadsheetNotFound:
-            logger.error(f"Spreadsheet with ID '{SHEET_ID}' not found.")
-            print(f"[ERROR] Spreadsheet with ID '{SHEET_ID}' not found.")
-        except gspread.exceptions.WorksheetNotFound:
-            logger.error(f"Worksheet 'IPM_Indeks Hidup Layak_Y-to-Y' not found.")
-            print(f"[ERROR] Worksheet 'IPM_Indeks Hidup Layak_Y-to-Y' not found.")
-        except KeyError as e:
-            logger.error(f"KeyError while processing IPM Indeks Hidup Layak data: {e}")
-            print(f"[ERROR] KeyError: {e}")
-        except Exception as e:
-            logger.error(f"An error occurred while fetching/processing IPM Indeks Hidup Layak data: {e}")
-            print(f"[ERROR] Unexpected error: {e}")
-        return pd.DataFrame()
+        return fetch_wide_sheet(IPM_INDEKS_HIDUP_LAYAK_SPEC)
 
     @staticmethod
     def save_ipm_indeks_hidup_layak_to_db(df):
         """Saves the processed IPM Indeks Hidup Layak DataFrame to the database."""
-        if df.empty:
-            print("[WARNING] No IPM Indeks Hidup Layak data to save.")
-            return 0, 0
-
-        created_count = 0
-        updated_count = 0
-
-        for index, row in df.iterrows():
-            location_name = str(row['Kabupaten/Kota']).strip()
-            if not location_name or "Sumber/Source" in location_name:
-                continue
-
-            location_type = IPM_IndeksHidupLayak.LocationType.MUNICIPALITY if location_name.startswith("KOTA") else IPM_IndeksHidupLayak.LocationType.REGENCY
-
-            data_to_serialize = {
-                'location_name': location_name,
-                'location_type': location_type.value,
-                'year': row['Tahun'],
-                'value': row['Value']
-            }
-
-            try:
-                instance = IPM_IndeksHidupLayak.objects.get(location_name=location_name, year=row['Tahun'])
-            except IPM_IndeksHidupLayak.DoesNotExist:
-                instance = None
-
-            serializer = IPM_IndeksHidupLayakSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saat menyimpan IPM Indeks Hidup Layak untuk {location_name} tahun {row['Tahun']}: {serializer.errors}")
-
-        print(f"[INFO] Total IPM Indeks Hidup Layak records created: {created_count}, updated: {updated_count}")
-        return created_count, updated_count
+        return save_wide_sheet(IPM_INDEKS_HIDUP_LAYAK_SPEC, df)
 
     @classmethod
     def sync_ipm_indeks_hidup_layak(cls):
         """Fungsi utama untuk sinkronisasi data Google Sheets -> database."""
-        df = cls.fetch_ipm_indeks_hidup_layak_data()
-        created_count, updated_count = cls.save_ipm_indeks_hidup_layak_to_db(df)
-        return created_count, updated_count
+        return run_sheet_sync(
+            INDICATOR_SHEET_ID, cls.WORKSHEET_NAME, IPM_IndeksHidupLayak.objects.all(),
+            fetch=cls.fetch_ipm_indeks_hidup_layak_data, save=cls.save_ipm_indeks_hidup_layak_to_db,
+        )
 
 class IPM_IndeksPendidikanService:
+    SPEC = IPM_INDEKS_PENDIDIKAN_SPEC
+    WORKSHEET_NAME = IPM_INDEKS_PENDIDIKAN_SPEC.worksheet_name
+
     @staticmethod
     def fetch_ipm_indeks_pendidikan_data():
         """Fetches and processes IPM Indeks Pendidikan data from Google Sheets into a long-format DataFrame."""
-        print("[INFO] Fetching IPM Indeks Pendidikan data from Google Sheets...")
-        try:
-            scope = [
-                'https://www.googleapis.com/auth/spreadsheets',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            credentials = ServiceAccountCredentials.from_json_keyfile_name('credentials.json', scope)
-            client = gspread.authorize(credentials)
-
-            SHEET_ID = "1keS9YFYO1qzAawWgLh2U2pY6xX5ppKUnhbdHQYfU5HM"
-            sheet = client.open_by_key(SHEET_ID).worksheet("IPM_Indeks Pendidikan_Y-to-Y")
-
-            data = sheet.get_all_values()
-            if not data or len(data) < 2:
-                print("[WARNING] No data found in sheet")
-                return pd.DataFrame()
-            
-            headers = data[0]
-            data_rows = data[1:]
-            df = pd.DataFrame(data_rows, columns=headers)
-            print(f"[OK] Raw data fetched with shape: {df.shape}")
-
-            # --- Data Cleaning and Transformation ---
-            # Rename column to standard name - handle various column name formats
-            if 'Kabupaten/Kota\nRegency/Municipality' in df.columns:
-                df = df.rename(columns={'Kabupaten/Kota\nRegency/Municipality': 'Kabupaten/Kota'})
-            elif 'Kabupaten/Kot' in df.columns:
-                df = df.rename(columns={'Kabupaten/Kot': 'Kabupaten/Kota'})
-            elif 'Provinsi' in df.columns:
-                df = df.rename(columns={'Provinsi': 'Kabupaten/Kota'})
-                print(f"[INFO] Found and renamed location column: 'Provinsi' -> 'Kabupaten/Kota'")
-            elif 'Kabupaten/Kota' not in df.columns:
-                # Try to find the location column
-                location_col_found = False
-                for col in df.columns:
-                    col_lower = str(col).lower()
-                    if 'kabupaten' in col_lower or 'kota' in col_lower or 'kot' in col_lower or 'provinsi' in col_lower:
-                        df = df.rename(columns={col: 'Kabupaten/Kota'})
-                        location_col_found = True
-                        print(f"[INFO] Found and renamed location column: '{col}' -> 'Kabupaten/Kota'")
-                        break
-                
-                if not location_col_found:
-                    print(f"[ERROR] Location column not found. Available columns: {df.columns.tolist()}")
-                    return pd.DataFrame()
-            
-            # Remove empty columns
-            empty_columns = [col for col in df.columns if col == '']
-            if empty_columns:
-                df = df.drop(columns=empty_columns)
-
-            # Find year columns
-            year_columns = [col for col in df.columns if col.isdigit() and len(col) == 4]
-            if not year_columns:
-                # Try to find year columns that might be strings
-                for col in df.columns:
-                    if col != 'Kabupaten/Kota' and str(col).strip().isdigit():
-                        year_columns.append(col)
-            
-            if not year_columns:
-                print("[ERROR] No year columns found")
-                return pd.DataFrame()
-
-            # Melt DataFrame to long format
-            try:
-                df_melted = pd.melt(df, id_vars=['Kabupaten/Kota'], value_vars=year_columns,
-                                    var_name='Tahun', value_name='Value')
-            except KeyError as e:
-                print(f"[ERROR] Error during melt operation: {e}")
-                print(f"[DEBUG] Available columns: {df.columns.tolist()}")
-                return pd.DataFrame()
-
-            # Convert data types
-            df_melted['Tahun'] = pd.to_numeric(df_melted['Tahun'], errors='coerce')
-            
-            # Convert value to numeric, handling both comma and dot as decimal separator
-            # Handle both formats: "12.34" (dot) and "12,34" (comma)
-            df_melted['Value'] = df_melted['Value'].astype(str)
-            # Replace comma with dot for decimal separator
-            df_melted['Value'] = df_melted['Value'].str.replace(',', '.', regex=False)
-            # Convert to numeric
-            df_melted['Value'] = pd.to_numeric(df_melted['Value'], errors='coerce')
-            
-            # Remove rows with invalid/empty values
-            df_melted.dropna(subset=['Value'], inplace=True)
-            df_melted.dropna(subset=['Tahun'], inplace=True)
-
-            print(f"[OK] Data processed. Total valid records: {len(df_melted)}")
-            return df_melted
-
-        except gspread.exceptions.SpreadsheetNotFound:
-            logger.error(f"Spreadsheet with ID '{SHEET_ID}' not found.")
-            print(f"[ERROR] Spreadsheet with ID '{SHEET_ID}' not found.")
-        except gspread.exceptions.WorksheetNotFound:
-            logger.error(f"Worksheet 'IPM_Indeks Pendidikan_Y-to-Y' not found.")
-            print(f"[ERROR] Worksheet 'IPM_Indeks Pendidikan_Y-to-Y' not found.")
-        except KeyError as e:
-            logger.error(f"KeyError while processing IPM Indeks Pendidikan data: {e}")
-            print(f"[ERROR] KeyError: {e}")
-        except Exception as e:
-            logger.error(f"An error occurred while fetching/processing IPM Indeks Pendidikan data: {e}")
-            print(f"[ERROR] Unexpected error: {e}")
-        return pd.DataFrame()
+        return fetch_wide_sheet(IPM_INDEKS_PENDIDIKAN_SPEC)
 
     @staticmethod
     def save_ipm_indeks_pendidikan_to_db(df):
         """Saves the processed IPM Indeks Pendidikan DataFrame to the database."""
-        if df.empty:
-            print("[WARNING] No IPM Indeks Pendidikan data to save.")
-            return 0, 0
-
-        created_count = 0
-        updated_count = 0
-
-        for index, row in df.iterrows():
-            location_name = str(row['Kabupaten/Kota']).strip()
-            if not location_name or "Sumber/Source" in location_name:
-                continue
-
-            location_type = IPM_IndeksPendidikan.LocationType.MUNICIPALITY if location_name.startswith("KOTA") else IPM_IndeksPendidikan.LocationType.REGENCY
-
-            data_to_serialize = {
-                'location_name': location_name,
-                'location_type': location_type.value,
-                'year': row['Tahun'],
-                'value': row['Value']
-            }
-
-            try:
-                instance = IPM_IndeksPendidikan.objects.get(location_name=location_name, year=row['Tahun'])
-            except IPM_IndeksPendidikan.DoesNotExist:
-                instance = None
-
-            serializer = IPM_IndeksPendidikanSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saat menyimpan IPM Indeks Pendidikan untuk {location_name} tahun {row['Tahun']}: {serializer.errors}")
-
-        print(f"[INFO] Total IPM Indeks Pendidikan records created: {created_count}, updated: {updated_count}")
-        return created_count, updated_count
+        return save_wide_sheet(IPM_INDEKS_PENDIDIKAN_SPEC, df)
 
     @classmethod
     def sync_ipm_indeks_pendidikan(cls):
         """Fungsi utama untuk sinkronisasi data Google Sheets -> database."""
-        df = cls.fetch_ipm_indeks_pendidikan_data()
-        created_count, updated_count = cls.save_ipm_indeks_pendidikan_to_db(df)
-        return created_count, updated_count
+        return run_sheet_sync(
+            INDICATOR_SHEET_ID, cls.WORKSHEET_NAME, IPM_IndeksPendidikan.objects.all(),
+            fetch=cls.fetch_ipm_indeks_pendidikan_data, save=cls.save_ipm_indeks_pendidikan_to_db,
+        )
 
 def convert_value_to_numeric(value):
     """
@@ -2319,22 +839,16 @@ def convert_value_to_numeric(value):
 # ========== Kemiskinan Services ==========
 
 class KemiskinanSurabayaService:
+    WORKSHEET_NAME = "Kemiskinan(Surabaya)_YtoY"
+
     @staticmethod
     def fetch_kemiskinan_surabaya_data():
         """Fetches and processes Kemiskinan Surabaya data from Google Sheets."""
         print("[INFO] Fetching Kemiskinan Surabaya data from Google Sheets...")
         try:
-            scope = [
-                'https://www.googleapis.com/auth/spreadsheets',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            credentials = ServiceAccountCredentials.from_json_keyfile_name('credentials.json', scope)
-            client = gspread.authorize(credentials)
+            SHEET_ID = INDICATOR_SHEET_ID
 
-            SHEET_ID = "1keS9YFYO1qzAawWgLh2U2pY6xX5ppKUnhbdHQYfU5HM"
-            sheet = client.open_by_key(SHEET_ID).worksheet("Kemiskinan(Surabaya)_YtoY")
-
-            data = sheet.get_all_values()
+            data = get_worksheet_values(SHEET_ID, KemiskinanSurabayaService.WORKSHEET_NAME)
             if not data or len(data) < 2:
                 print("[WARNING] No data found in sheet")
                 return pd.DataFrame()
@@ -2362,9 +876,10 @@ class KemiskinanSurabayaService:
             # Convert year to numeric
             df_melted['Tahun'] = pd.to_numeric(df_melted['Tahun'], errors='coerce')
             
-            # Convert value - handle "-" and both decimal formats
-            df_melted['Value'] = df_melted['Value'].astype(str)
-            df_melted['Value'] = df_melted['Value'].apply(convert_value_to_numeric)
+            # Convert value - handle "-" and both decimal formats (aturan convert_value_to_numeric)
+            numbers, invalid = parse_numbers(df_melted['Value'], INDONESIAN)
+            report_invalid("Kemiskinan Surabaya", df_melted['Value'], invalid)
+            df_melted['Value'] = numbers
             
             # Pivot to get indicators as columns
             df_pivot = df_melted.pivot_table(index='Tahun', columns=indicator_col, values='Value', aggfunc='first').reset_index()
@@ -2417,68 +932,36 @@ class KemiskinanSurabayaService:
         """Saves the processed Kemiskinan Surabaya DataFrame to the database."""
         if df.empty:
             print("[WARNING] No Kemiskinan Surabaya data to save.")
-            return 0, 0
-
-        created_count = 0
-        updated_count = 0
-
-        for index, row in df.iterrows():
-            year = int(row['Tahun']) if pd.notna(row['Tahun']) else None
+            return 0, 0, 0
 
-            if not year:
-                continue
+        records = pd.DataFrame({'year': df['Tahun']})
+        for field in KEMISKINAN_FIELDS:
+            records[field] = numeric_values(df, field)
+        records = drop_blank_rows(records, ['year'])
 
-            data_to_serialize = {
-                'year': year,
-                'jumlah_penduduk_miskin': row.get('jumlah_penduduk_miskin') if pd.notna(row.get('jumlah_penduduk_miskin')) else None,
-                'persentase_penduduk_miskin': row.get('persentase_penduduk_miskin') if pd.notna(row.get('persentase_penduduk_miskin')) else None,
-                'indeks_kedalaman_kemiskinan_p1': row.get('indeks_kedalaman_kemiskinan_p1') if pd.notna(row.get('indeks_kedalaman_kemiskinan_p1')) else None,
-                'indeks_keparahan_kemiskinan_p2': row.get('indeks_keparahan_kemiskinan_p2') if pd.notna(row.get('indeks_keparahan_kemiskinan_p2')) else None,
-                'garis_kemiskinan': row.get('garis_kemiskinan') if pd.notna(row.get('garis_kemiskinan')) else None,
-            }
-
-            try:
-                instance = KemiskinanSurabaya.objects.get(year=year)
-            except KemiskinanSurabaya.DoesNotExist:
-                instance = None
-
-            serializer = KemiskinanSurabayaSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saat menyimpan Kemiskinan Surabaya untuk tahun {year}: {serializer.errors}")
-
-        print(f"[INFO] Total Kemiskinan Surabaya records created: {created_count}, updated: {updated_count}")
-        return created_count, updated_count
+        created_count, updated_count, unchanged_count = bulk_upsert(KemiskinanSurabaya, records, label="Kemiskinan Surabaya")
+        print(f"[INFO] Total Kemiskinan Surabaya records created: {created_count}, updated: {updated_count}, unchanged: {unchanged_count}")
+        return created_count, updated_count, unchanged_count
 
     @classmethod
     def sync_kemiskinan_surabaya(cls):
         """Fungsi utama untuk sinkronisasi data Google Sheets -> database."""
-        df = cls.fetch_kemiskinan_surabaya_data()
-        created_count, updated_count = cls.save_kemiskinan_surabaya_to_db(df)
-        return created_count, updated_count
+        return run_sheet_sync(
+            INDICATOR_SHEET_ID, cls.WORKSHEET_NAME, KemiskinanSurabaya.objects.all(),
+            fetch=cls.fetch_kemiskinan_surabaya_data, save=cls.save_kemiskinan_surabaya_to_db,
+        )
 
 class KemiskinanJawaTimurService:
+    WORKSHEET_NAME = "Kemiskinan(JawaTimur)_YtoY_"
+
     @staticmethod
     def fetch_kemiskinan_jawa_timur_data():
         """Fetches and processes Kemiskinan Jawa Timur data from Google Sheets."""
         print("[INFO] Fetching Kemiskinan Jawa Timur data from Google Sheets...")
         try:
-            scope = [
-                'https://www.googleapis.com/auth/spreadsheets',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            credentials = ServiceAccountCredentials.from_json_keyfile_name('credentials.json', scope)
-            client = gspread.authorize(credentials)
+            SHEET_ID = INDICATOR_SHEET_ID
 
-            SHEET_ID = "1keS9YFYO1qzAawWgLh2U2pY6xX5ppKUnhbdHQYfU5HM"
-            sheet = client.open_by_key(SHEET_ID).worksheet("Kemiskinan(JawaTimur)_YtoY_")
-
-            data = sheet.get_all_values()
+            data = get_worksheet_values(SHEET_ID, KemiskinanJawaTimurService.WORKSHEET_NAME)
             if not data or len(data) < 2:
                 print("[WARNING] No data found in sheet")
                 return pd.DataFrame()
@@ -2506,9 +989,10 @@ class KemiskinanJawaTimurService:
             # Convert year to numeric
             df_melted['Tahun'] = pd.to_numeric(df_melted['Tahun'], errors='coerce')
             
-            # Convert value - handle "-" and both decimal formats
-            df_melted['Value'] = df_melted['Value'].astype(str)
-            df_melted['Value'] = df_melted['Value'].apply(convert_value_to_numeric)
+            # Convert value - handle "-" and both decimal formats (aturan convert_value_to_numeric)
+            numbers, invalid = parse_numbers(df_melted['Value'], INDONESIAN)
+            report_invalid("Kemiskinan Jawa Timur", df_melted['Value'], invalid)
+            df_melted['Value'] = numbers
             
             # Pivot to get indicators as columns
             df_pivot = df_melted.pivot_table(index='Tahun', columns=indicator_col, values='Value', aggfunc='first').reset_index()
@@ -2558,53 +1042,27 @@ class KemiskinanJawaTimurService:
 
     @staticmethod
     def save_kemiskinan_jawa_timur_to_db(df):
-        """Saves the processed Kemiskinan Jawa Timur DataFrame to the database."""
-        if df.empty:
-            print("[WARNING] No Kemiskinan Jawa Timur data to save.")
-            return 0, 0
-
-        created_count = 0
-        updated_count = 0
-
-        for index, row in df.iterrows():
-            year = int(row['Tahun']) if pd.notna(row['Tahun']) else None
-
-            if not year:
-                continue
-
-            data_to_serialize = {
-                'year': year,
-                'jumlah_penduduk_miskin': row.get('jumlah_penduduk_miskin') if pd.notna(row.get('jumlah_penduduk_miskin')) else None,
-                'persentase_penduduk_miskin': row.get('persentase_penduduk_miskin') if pd.notna(row.get('persentase_penduduk_miskin')) else None,
-                'indeks_kedalaman_kemiskinan_p1': row.get('indeks_kedalaman_kemiskinan_p1') if pd.notna(row.get('indeks_kedalaman_kemiskinan_p1')) else None,
-                'indeks_keparahan_kemiskinan_p2': row.get('indeks_keparahan_kemiskinan_p2') if pd.notna(row.get('indeks_keparahan_kemiskinan_p2')) else None,
-                'garis_kemiskinan': row.get('garis_kemiskinan') if pd.notna(row.get('garis_kemiskinan')) else None,
-            }
+        """Saves the processed Kemiskinan Jawa Timur DataFrame to the database."""
+        if df.empty:
+            print("[WARNING] No Kemiskinan Jawa Timur data to save.")
+            return 0, 0, 0
 
-            try:
-                instance = KemiskinanJawaTimur.objects.get(year=year)
-            except KemiskinanJawaTimur.DoesNotExist:
-                instance = None
-
-            serializer = KemiskinanJawaTimurSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saat menyimpan Kemiskinan Jawa Timur untuk tahun {year}: {serializer.errors}")
+        records = pd.DataFrame({'year': df['Tahun']})
+        for field in KEMISKINAN_FIELDS:
+            records[field] = numeric_values(df, field)
+        records = drop_blank_rows(records, ['year'])
 
-        print(f"[INFO] Total Kemiskinan Jawa Timur records created: {created_count}, updated: {updated_count}")
-        return created_count, updated_count
+        created_count, updated_count, unchanged_count = bulk_upsert(KemiskinanJawaTimur, records, label="Kemiskinan Jawa Timur")
+        print(f"[INFO] Total Kemiskinan Jawa Timur records created: {created_count}, updated: {updated_count}, unchanged: {unchanged_count}")
+        return created_count, updated_count, unchanged_count
 
     @classmethod
     def sync_kemiskinan_jawa_timur(cls):
         """Fungsi utama untuk sinkronisasi data Google Sheets -> database."""
-        df = cls.fetch_kemiskinan_jawa_timur_data()
-        created_count, updated_count = cls.save_kemiskinan_jawa_timur_to_db(df)
-        return created_count, updated_count
+        return run_sheet_sync(
+            INDICATOR_SHEET_ID, cls.WORKSHEET_NAME, KemiskinanJawaTimur.objects.all(),
+            fetch=cls.fetch_kemiskinan_jawa_timur_data, save=cls.save_kemiskinan_jawa_timur_to_db,
+        )
 
 # ========== Helper function untuk convert nilai kependudukan ==========
 def convert_kependudukan_value(value):
@@ -2637,23 +1095,17 @@ def convert_kependudukan_value(value):
 # ========== Kependudukan Services ==========
 
 class KependudukanService:
+    WORKSHEET_NAME = "Kependudukan_gabungan"
+
     @staticmethod
     def fetch_kependudukan_data():
         """Fetches and processes Kependudukan data from Google Sheets."""
         print("[INFO] Fetching Kependudukan data from Google Sheets...")
         try:
-            scope = [
-                'https://www.googleapis.com/auth/spreadsheets',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            credentials = ServiceAccountCredentials.from_json_keyfile_name('credentials.json', scope)
-            client = gspread.authorize(credentials)
-
-            SHEET_ID = "1keS9YFYO1qzAawWgLh2U2pY6xX5ppKUnhbdHQYfU5HM"
-            sheet = client.open_by_key(SHEET_ID).worksheet("Kependudukan_gabungan")
+            SHEET_ID = INDICATOR_SHEET_ID
 
             # Get all data
-            data = sheet.get_all_values()
+            data = get_worksheet_values(SHEET_ID, KependudukanService.WORKSHEET_NAME)
             if not data or len(data) < 3:
                 print("[WARNING] No data found in sheet or insufficient rows")
                 return pd.DataFrame()
@@ -2725,16 +1177,12 @@ class KependudukanService:
                 # Process each data column
                 for col_idx, (year, gender) in column_mapping.items():
                     if col_idx < len(row):
-                        value_str = str(row[col_idx]).strip()
-                        
-                        # Convert value using kependudukan-specific function (removes all "." and ",")
-                        population = convert_kependudukan_value(value_str)
-                        
+                        # Nilai mentah; dikonversi sekaligus per kolom setelah DataFrame dibuat
                         records.append({
                             'age_group': age_group,
                             'year': year,
                             'gender': gender,
-                            'population': population
+                            'population': row[col_idx]
                         })
             
             df = pd.DataFrame(records)
@@ -2743,6 +1191,11 @@ class KependudukanService:
                 print("[WARNING] No valid records found after processing")
                 return pd.DataFrame()
             
+            # Aturan convert_kependudukan_value: hapus semua "." dan "," (hanya formatting)
+            population, invalid = parse_numbers(df['population'], POPULATION)
+            report_invalid("Kependudukan", df['population'], invalid)
+            df['population'] = population
+            
             # Remove rows with invalid data
             df = df.dropna(subset=['age_group', 'year', 'gender'])
             
@@ -2767,75 +1220,43 @@ class KependudukanService:
         """Saves the processed Kependudukan DataFrame to the database."""
         if df.empty:
             print("[WARNING] No Kependudukan data to save.")
-            return 0, 0
-
-        created_count = 0
-        updated_count = 0
-
-        for index, row in df.iterrows():
-            age_group = str(row['age_group']).strip() if pd.notna(row['age_group']) else None
-            year = int(row['year']) if pd.notna(row['year']) else None
-            gender = str(row['gender']).strip() if pd.notna(row['gender']) else None
-            population = row['population'] if pd.notna(row['population']) and row['population'] != 0 else None
-
-            if not age_group or not year or not gender:
-                continue
-
-            data_to_serialize = {
-                'age_group': age_group,
-                'year': year,
-                'gender': gender,
-                'population': population
-            }
-
-            try:
-                instance = Kependudukan.objects.get(
-                    age_group=age_group,
-                    year=year,
-                    gender=gender
-                )
-            except Kependudukan.DoesNotExist:
-                instance = None
-
-            serializer = KependudukanSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saat menyimpan Kependudukan untuk {age_group} {year} {gender}: {serializer.errors}")
-
-        print(f"[INFO] Total Kependudukan records created: {created_count}, updated: {updated_count}")
-        return created_count, updated_count
+            return 0, 0, 0
+
+        population = numeric_values(df, 'population')
+        records = pd.DataFrame({
+            'age_group': text_values(df['age_group']),
+            'year': df['year'],
+            'gender': text_values(df['gender']),
+            # Populasi 0 disimpan sebagai kosong
+            'population': population.where(population != 0),
+        })
+        records = drop_blank_rows(records, ['age_group', 'year', 'gender'])
+
+        created_count, updated_count, unchanged_count = bulk_upsert(Kependudukan, records, label="Kependudukan")
+        print(f"[INFO] Total Kependudukan records created: {created_count}, updated: {updated_count}, unchanged: {unchanged_count}")
+        return created_count, updated_count, unchanged_count
 
     @classmethod
     def sync_kependudukan(cls):
         """Fungsi utama untuk sinkronisasi data Google Sheets -> database."""
-        df = cls.fetch_kependudukan_data()
-        created_count, updated_count = cls.save_kependudukan_to_db(df)
-        return created_count, updated_count
+        return run_sheet_sync(
+            INDICATOR_SHEET_ID, cls.WORKSHEET_NAME, Kependudukan.objects.all(),
+            fetch=cls.fetch_kependudukan_data, save=cls.save_kependudukan_to_db,
+        )
 
 # ========== Ketenagakerjaan Services ==========
 
 class KetenagakerjaanTPTService:
+    WORKSHEET_NAME = "Ketenagakerjaan_TPT"
+
     @staticmethod
     def fetch_ketenagakerjaan_tpt_data():
         """Fetches and processes Ketenagakerjaan TPT data from Google Sheets."""
         print("[INFO] Fetching Ketenagakerjaan TPT data from Google Sheets...")
         try:
-            scope = [
-                'https://www.googleapis.com/auth/spreadsheets',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            credentials = ServiceAccountCredentials.from_json_keyfile_name('credentials.json', scope)
-            client = gspread.authorize(credentials)
+            SHEET_ID = INDICATOR_SHEET_ID
 
-            SHEET_ID = "1keS9YFYO1qzAawWgLh2U2pY6xX5ppKUnhbdHQYfU5HM"
-            sheet = client.open_by_key(SHEET_ID).worksheet("Ketenagakerjaan_TPT")
-
-            data = sheet.get_all_values()
+            data = get_worksheet_values(SHEET_ID, KetenagakerjaanTPTService.WORKSHEET_NAME)
             if not data or len(data) < 2:
                 print("[WARNING] No data found in sheet")
                 return pd.DataFrame()
@@ -2901,8 +1322,9 @@ class KetenagakerjaanTPTService:
             # Convert values - handle "-" and both decimal formats
             for col in ['Laki_Laki', 'Perempuan', 'Total']:
                 if col in df_clean.columns:
-                    df_clean[col] = df_clean[col].astype(str)
-                    df_clean[col] = df_clean[col].apply(convert_value_to_numeric)
+                    numbers, invalid = parse_numbers(df_clean[col], INDONESIAN)
+                    report_invalid(f"Ketenagakerjaan TPT {col}", df_clean[col], invalid)
+                    df_clean[col] = numbers
             
             # Remove rows with invalid year
             df_clean = df_clean.dropna(subset=['Tahun'])
@@ -2926,69 +1348,39 @@ class KetenagakerjaanTPTService:
         """Saves the processed Ketenagakerjaan TPT DataFrame to the database."""
         if df.empty:
             print("[WARNING] No Ketenagakerjaan TPT data to save.")
-            return 0, 0
-
-        created_count = 0
-        updated_count = 0
-
-        for index, row in df.iterrows():
-            year = int(row['Tahun']) if pd.notna(row['Tahun']) else None
-            laki_laki = row.get('Laki_Laki') if pd.notna(row.get('Laki_Laki')) else None
-            perempuan = row.get('Perempuan') if pd.notna(row.get('Perempuan')) else None
-            total = row.get('Total') if pd.notna(row.get('Total')) else None
-
-            if not year:
-                continue
-
-            data_to_serialize = {
-                'year': year,
-                'laki_laki': laki_laki,
-                'perempuan': perempuan,
-                'total': total
-            }
+            return 0, 0, 0
 
-            try:
-                instance = KetenagakerjaanTPT.objects.get(year=year)
-            except KetenagakerjaanTPT.DoesNotExist:
-                instance = None
-
-            serializer = KetenagakerjaanTPTSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saat menyimpan Ketenagakerjaan TPT untuk tahun {year}: {serializer.errors}")
+        records = pd.DataFrame({
+            'year': df['Tahun'],
+            'laki_laki': numeric_values(df, 'Laki_Laki'),
+            'perempuan': numeric_values(df, 'Perempuan'),
+            'total': numeric_values(df, 'Total'),
+        })
+        records = drop_blank_rows(records, ['year'])
 
-        print(f"[INFO] Total Ketenagakerjaan TPT records created: {created_count}, updated: {updated_count}")
-        return created_count, updated_count
+        created_count, updated_count, unchanged_count = bulk_upsert(KetenagakerjaanTPT, records, label="Ketenagakerjaan TPT")
+        print(f"[INFO] Total Ketenagakerjaan TPT records created: {created_count}, updated: {updated_count}, unchanged: {unchanged_count}")
+        return created_count, updated_count, unchanged_count
 
     @classmethod
     def sync_ketenagakerjaan_tpt(cls):
         """Fungsi utama untuk sinkronisasi data Google Sheets -> database."""
-        df = cls.fetch_ketenagakerjaan_tpt_data()
-        created_count, updated_count = cls.save_ketenagakerjaan_tpt_to_db(df)
-        return created_count, updated_count
+        return run_sheet_sync(
+            INDICATOR_SHEET_ID, cls.WORKSHEET_NAME, KetenagakerjaanTPT.objects.all(),
+            fetch=cls.fetch_ketenagakerjaan_tpt_data, save=cls.save_ketenagakerjaan_tpt_to_db,
+        )
 
 class KetenagakerjaanTPAKService:
+    WORKSHEET_NAME = "Ketenagakerjaan_TPAK"
+
     @staticmethod
     def fetch_ketenagakerjaan_tpak_data():
         """Fetches and processes Ketenagakerjaan TPAK data from Google Sheets."""
         print("[INFO] Fetching Ketenagakerjaan TPAK data from Google Sheets...")
         try:
-            scope = [
-                'https://www.googleapis.com/auth/spreadsheets',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            credentials = ServiceAccountCredentials.from_json_keyfile_name('credentials.json', scope)
-            client = gspread.authorize(credentials)
-
-            SHEET_ID = "1keS9YFYO1qzAawWgLh2U2pY6xX5ppKUnhbdHQYfU5HM"
-            sheet = client.open_by_key(SHEET_ID).worksheet("Ketenagakerjaan_TPAK")
+            SHEET_ID = INDICATOR_SHEET_ID
 
-            data = sheet.get_all_values()
+            data = get_worksheet_values(SHEET_ID, KetenagakerjaanTPAKService.WORKSHEET_NAME)
             if not data or len(data) < 2:
                 print("[WARNING] No data found in sheet")
                 return pd.DataFrame()
@@ -3054,8 +1446,9 @@ class KetenagakerjaanTPAKService:
             # Convert values - handle "-" and both decimal formats
             for col in ['Laki_Laki', 'Perempuan', 'Total']:
                 if col in df_clean.columns:
-                    df_clean[col] = df_clean[col].astype(str)
-                    df_clean[col] = df_clean[col].apply(convert_value_to_numeric)
+                    numbers, invalid = parse_numbers(df_clean[col], INDONESIAN)
+                    report_invalid(f"Ketenagakerjaan TPAK {col}", df_clean[col], invalid)
+                    df_clean[col] = numbers
             
             # Remove rows with invalid year
             df_clean = df_clean.dropna(subset=['Tahun'])
@@ -3079,51 +1472,27 @@ class KetenagakerjaanTPAKService:
         """Saves the processed Ketenagakerjaan TPAK DataFrame to the database."""
         if df.empty:
             print("[WARNING] No Ketenagakerjaan TPAK data to save.")
-            return 0, 0
-
-        created_count = 0
-        updated_count = 0
-
-        for index, row in df.iterrows():
-            year = int(row['Tahun']) if pd.notna(row['Tahun']) else None
-            laki_laki = row.get('Laki_Laki') if pd.notna(row.get('Laki_Laki')) else None
-            perempuan = row.get('Perempuan') if pd.notna(row.get('Perempuan')) else None
-            total = row.get('Total') if pd.notna(row.get('Total')) else None
-
-            if not year:
-                continue
+            return 0, 0, 0
 
-            data_to_serialize = {
-                'year': year,
-                'laki_laki': laki_laki,
-                'perempuan': perempuan,
-                'total': total
-            }
-
-            try:
-                instance = KetenagakerjaanTPAK.objects.get(year=year)
-            except KetenagakerjaanTPAK.DoesNotExist:
-                instance = None
-
-            serializer = KetenagakerjaanTPAKSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saat menyimpan Ketenagakerjaan TPAK untuk tahun {year}: {serializer.errors}")
+        records = pd.DataFrame({
+            'year': df['Tahun'],
+            'laki_laki': numeric_values(df, 'Laki_Laki'),
+            'perempuan': numeric_values(df, 'Perempuan'),
+            'total': numeric_values(df, 'Total'),
+        })
+        records = drop_blank_rows(records, ['year'])
 
-        print(f"[INFO] Total Ketenagakerjaan TPAK records created: {created_count}, updated: {updated_count}")
-        return created_count, updated_count
+        created_count, updated_count, unchanged_count = bulk_upsert(KetenagakerjaanTPAK, records, label="Ketenagakerjaan TPAK")
+        print(f"[INFO] Total Ketenagakerjaan TPAK records created: {created_count}, updated: {updated_count}, unchanged: {unchanged_count}")
+        return created_count, updated_count, unchanged_count
 
     @classmethod
     def sync_ketenagakerjaan_tpak(cls):
         """Fungsi utama untuk sinkronisasi data Google Sheets -> database."""
-        df = cls.fetch_ketenagakerjaan_tpak_data()
-        created_count, updated_count = cls.save_ketenagakerjaan_tpak_to_db(df)
-        return created_count, updated_count
+        return run_sheet_sync(
+            INDICATOR_SHEET_ID, cls.WORKSHEET_NAME, KetenagakerjaanTPAK.objects.all(),
+            fetch=cls.fetch_ketenagakerjaan_tpak_data, save=cls.save_ketenagakerjaan_tpak_to_db,
+        )
 
 
 # Helper function untuk parse tahun dengan asterisk
@@ -3192,9 +1561,32 @@ def convert_value(value):
         return None
 
 
+def save_pdrb_records(model, df, category_field, label, log_label):
+    """
+    Menyimpan DataFrame PDRB (hasil fetch_pdrb_*_data) ke model PDRB Pengeluaran /
+    Lapangan Usaha, tahunan maupun triwulanan (bila df punya kolom 'quarter').
+    """
+    if df.empty:
+        print(f"[WARNING] No {label} data to save.")
+        return 0, 0, 0
+
+    records = pd.DataFrame({
+        category_field: text_values(df[category_field]),
+        'year': df['year'],
+    })
+    if 'quarter' in df.columns:
+        records['quarter'] = text_values(df['quarter'])
+    records['preliminary_flag'] = df['preliminary_flag'] if 'preliminary_flag' in df.columns else ''
+    records['value'] = numeric_values(df, 'value')
+
+    created_count, updated_count, unchanged_count = bulk_upsert(model, records, label=label)
+    print(f"[INFO] {log_label}: {created_count} created, {updated_count} updated, {unchanged_count} unchanged")
+    return created_count, updated_count, unchanged_count
+
+
 # PDRB Pengeluaran Service
 class PDRBPengeluaranService:
-    SHEET_ID = "1keS9YFYO1qzAawWgLh2U2pY6xX5ppKUnhbdHQYfU5HM"
+    SHEET_ID = INDICATOR_SHEET_ID
     
     @staticmethod
     def fetch_pdrb_pengeluaran_data(sheet_name, is_quarterly=False):
@@ -3210,19 +1602,9 @@ class PDRBPengeluaranService:
         """
         print(f"[INFO] Fetching PDRB Pengeluaran data from sheet: {sheet_name}...")
         try:
-            # Autentikasi
-            scope = [
-                'https://www.googleapis.com/auth/spreadsheets',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            credentials = ServiceAccountCredentials.from_json_keyfile_name('credentials.json', scope)
-            client = gspread.authorize(credentials)
-            
-            # Buka sheet
-            sheet = client.open_by_key(PDRBPengeluaranService.SHEET_ID).worksheet(sheet_name)
-            
-            # Ambil semua data
-            data = sheet.get_all_values()
+            # Buka sheet (client dan metadata dari registry bersama)
+            # Ambil semua data (dari cache prefetch bila tersedia)
+            data = get_worksheet_values(PDRBPengeluaranService.SHEET_ID, sheet_name)
             if not data or len(data) < 2:
                 print(f"[WARNING] No data found in sheet {sheet_name}")
                 return pd.DataFrame()
@@ -3342,7 +1724,6 @@ class PDRBPengeluaranService:
                             continue
                         
                         value = row[col_idx] if col_idx < len(row) else None
-                        value = convert_value(value)
                         
                         records.append({
                             'expenditure_category': category,
@@ -3435,7 +1816,6 @@ class PDRBPengeluaranService:
                             continue
                         
                         value = row[col_idx] if col_idx < len(row) else None
-                        value = convert_value(value)
                         
                         records.append({
                             'expenditure_category': category,
@@ -3445,6 +1825,11 @@ class PDRBPengeluaranService:
                         })
             
             df = pd.DataFrame(records)
+            if not df.empty:
+                # Aturan convert_value, untuk seluruh kolom sekaligus
+                values, invalid = parse_numbers(df['value'], SPREADSHEET)
+                report_invalid(f"PDRB Pengeluaran {sheet_name}", df['value'], invalid)
+                df['value'] = values
             print(f"[OK] Data fetched and processed. Total records: {len(df)}")
             return df
             
@@ -3456,504 +1841,80 @@ class PDRBPengeluaranService:
     @staticmethod
     def save_pdrb_adhb_to_db(df):
         """Save PDRB Pengeluaran ADHB data to database."""
-        if df.empty:
-            print("[WARNING] No PDRB Pengeluaran ADHB data to save.")
-            return 0, 0
-        
-        created_count = 0
-        updated_count = 0
-        
-        for index, row in df.iterrows():
-            # Handle None/NaN values properly
-            value = row['value']
-            if pd.isna(value) or value is None:
-                value = None
-            else:
-                try:
-                    value = float(value)
-                except (ValueError, TypeError):
-                    value = None
-            
-            data_to_serialize = {
-                'expenditure_category': str(row['expenditure_category']).strip(),
-                'year': int(row['year']),
-                'preliminary_flag': row.get('preliminary_flag', ''),
-                'value': value
-            }
-            
-            try:
-                instance = PDRBPengeluaranADHB.objects.get(
-                    expenditure_category=data_to_serialize['expenditure_category'],
-                    year=data_to_serialize['year']
-                )
-            except PDRBPengeluaranADHB.DoesNotExist:
-                instance = None
-            
-            serializer = PDRBPengeluaranADHBSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saving PDRB ADHB: {serializer.errors}")
-        
-        print(f"[INFO] PDRB ADHB: {created_count} created, {updated_count} updated")
-        return created_count, updated_count
+        return save_pdrb_records(PDRBPengeluaranADHB, df, 'expenditure_category', "PDRB Pengeluaran ADHB", "PDRB ADHB")
     
     @staticmethod
     def save_pdrb_adhk_to_db(df):
         """Save PDRB Pengeluaran ADHK data to database."""
-        if df.empty:
-            print("[WARNING] No PDRB Pengeluaran ADHK data to save.")
-            return 0, 0
-        
-        created_count = 0
-        updated_count = 0
-        
-        for index, row in df.iterrows():
-            # Handle None/NaN values properly
-            value = row['value']
-            if pd.isna(value) or value is None:
-                value = None
-            else:
-                try:
-                    value = float(value)
-                except (ValueError, TypeError):
-                    value = None
-            
-            data_to_serialize = {
-                'expenditure_category': str(row['expenditure_category']).strip(),
-                'year': int(row['year']),
-                'preliminary_flag': row.get('preliminary_flag', ''),
-                'value': value
-            }
-            
-            try:
-                instance = PDRBPengeluaranADHK.objects.get(
-                    expenditure_category=data_to_serialize['expenditure_category'],
-                    year=data_to_serialize['year']
-                )
-            except PDRBPengeluaranADHK.DoesNotExist:
-                instance = None
-            
-            serializer = PDRBPengeluaranADHKSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saving PDRB ADHK: {serializer.errors}")
-        
-        print(f"[INFO] PDRB ADHK: {created_count} created, {updated_count} updated")
-        return created_count, updated_count
+        return save_pdrb_records(PDRBPengeluaranADHK, df, 'expenditure_category', "PDRB Pengeluaran ADHK", "PDRB ADHK")
     
     @staticmethod
     def save_pdrb_distribusi_to_db(df):
         """Save PDRB Pengeluaran Distribusi data to database."""
-        if df.empty:
-            print("[WARNING] No PDRB Pengeluaran Distribusi data to save.")
-            return 0, 0
-        
-        created_count = 0
-        updated_count = 0
-        
-        for index, row in df.iterrows():
-            # Handle None/NaN values properly
-            value = row['value']
-            if pd.isna(value) or value is None:
-                value = None
-            else:
-                try:
-                    value = float(value)
-                except (ValueError, TypeError):
-                    value = None
-            
-            data_to_serialize = {
-                'expenditure_category': str(row['expenditure_category']).strip(),
-                'year': int(row['year']),
-                'preliminary_flag': row.get('preliminary_flag', ''),
-                'value': value
-            }
-            
-            try:
-                instance = PDRBPengeluaranDistribusi.objects.get(
-                    expenditure_category=data_to_serialize['expenditure_category'],
-                    year=data_to_serialize['year']
-                )
-            except PDRBPengeluaranDistribusi.DoesNotExist:
-                instance = None
-            
-            serializer = PDRBPengeluaranDistribusiSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saving PDRB Distribusi: {serializer.errors}")
-        
-        print(f"[INFO] PDRB Distribusi: {created_count} created, {updated_count} updated")
-        return created_count, updated_count
+        return save_pdrb_records(PDRBPengeluaranDistribusi, df, 'expenditure_category', "PDRB Pengeluaran Distribusi", "PDRB Distribusi")
     
     @staticmethod
     def save_pdrb_laju_pdrb_to_db(df):
         """Save PDRB Pengeluaran Laju PDRB data to database."""
-        if df.empty:
-            print("[WARNING] No PDRB Pengeluaran Laju PDRB data to save.")
-            return 0, 0
-        
-        created_count = 0
-        updated_count = 0
-        
-        for index, row in df.iterrows():
-            # Handle None/NaN values properly
-            value = row['value']
-            if pd.isna(value) or value is None:
-                value = None
-            else:
-                try:
-                    value = float(value)
-                except (ValueError, TypeError):
-                    value = None
-            
-            data_to_serialize = {
-                'expenditure_category': str(row['expenditure_category']).strip(),
-                'year': int(row['year']),
-                'preliminary_flag': row.get('preliminary_flag', ''),
-                'value': value
-            }
-            
-            try:
-                instance = PDRBPengeluaranLajuPDRB.objects.get(
-                    expenditure_category=data_to_serialize['expenditure_category'],
-                    year=data_to_serialize['year']
-                )
-            except PDRBPengeluaranLajuPDRB.DoesNotExist:
-                instance = None
-            
-            serializer = PDRBPengeluaranLajuPDRBSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saving PDRB Laju PDRB: {serializer.errors}")
-        
-        print(f"[INFO] PDRB Laju PDRB: {created_count} created, {updated_count} updated")
-        return created_count, updated_count
+        return save_pdrb_records(PDRBPengeluaranLajuPDRB, df, 'expenditure_category', "PDRB Pengeluaran Laju PDRB", "PDRB Laju PDRB")
     
     @staticmethod
     def save_pdrb_adhb_triwulanan_to_db(df):
         """Save PDRB Pengeluaran ADHB Triwulanan data to database."""
-        if df.empty:
-            print("[WARNING] No PDRB Pengeluaran ADHB Triwulanan data to save.")
-            return 0, 0
-        
-        created_count = 0
-        updated_count = 0
-        
-        for index, row in df.iterrows():
-            # Handle None/NaN values properly
-            value = row['value']
-            if pd.isna(value) or value is None:
-                value = None
-            else:
-                try:
-                    value = float(value)
-                except (ValueError, TypeError):
-                    value = None
-            
-            data_to_serialize = {
-                'expenditure_category': str(row['expenditure_category']).strip(),
-                'year': int(row['year']),
-                'quarter': str(row['quarter']),
-                'preliminary_flag': row.get('preliminary_flag', ''),
-                'value': value
-            }
-            
-            try:
-                instance = PDRBPengeluaranADHBTriwulanan.objects.get(
-                    expenditure_category=data_to_serialize['expenditure_category'],
-                    year=data_to_serialize['year'],
-                    quarter=data_to_serialize['quarter']
-                )
-            except PDRBPengeluaranADHBTriwulanan.DoesNotExist:
-                instance = None
-            
-            serializer = PDRBPengeluaranADHBTriwulananSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saving PDRB ADHB Triwulanan: {serializer.errors}")
-        
-        print(f"[INFO] PDRB ADHB Triwulanan: {created_count} created, {updated_count} updated")
-        return created_count, updated_count
+        return save_pdrb_records(PDRBPengeluaranADHBTriwulanan, df, 'expenditure_category', "PDRB Pengeluaran ADHB Triwulanan", "PDRB ADHB Triwulanan")
     
     @staticmethod
     def save_pdrb_adhk_triwulanan_to_db(df):
         """Save PDRB Pengeluaran ADHK Triwulanan data to database."""
-        if df.empty:
-            print("[WARNING] No PDRB Pengeluaran ADHK Triwulanan data to save.")
-            return 0, 0
-        
-        created_count = 0
-        updated_count = 0
-        
-        for index, row in df.iterrows():
-            # Handle None/NaN values properly
-            value = row['value']
-            if pd.isna(value) or value is None:
-                value = None
-            else:
-                try:
-                    value = float(value)
-                except (ValueError, TypeError):
-                    value = None
-            
-            data_to_serialize = {
-                'expenditure_category': str(row['expenditure_category']).strip(),
-                'year': int(row['year']),
-                'quarter': str(row['quarter']),
-                'preliminary_flag': row.get('preliminary_flag', ''),
-                'value': value
-            }
-            
-            try:
-                instance = PDRBPengeluaranADHKTriwulanan.objects.get(
-                    expenditure_category=data_to_serialize['expenditure_category'],
-                    year=data_to_serialize['year'],
-                    quarter=data_to_serialize['quarter']
-                )
-            except PDRBPengeluaranADHKTriwulanan.DoesNotExist:
-                instance = None
-            
-            serializer = PDRBPengeluaranADHKTriwulananSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saving PDRB ADHK Triwulanan: {serializer.errors}")
-        
-        print(f"[INFO] PDRB ADHK Triwulanan: {created_count} created, {updated_count} updated")
-        return created_count, updated_count
+        return save_pdrb_records(PDRBPengeluaranADHKTriwulanan, df, 'expenditure_category', "PDRB Pengeluaran ADHK Triwulanan", "PDRB ADHK Triwulanan")
     
     @staticmethod
     def save_pdrb_distribusi_triwulanan_to_db(df):
         """Save PDRB Pengeluaran Distribusi Triwulanan data to database."""
-        if df.empty:
-            print("[WARNING] No PDRB Pengeluaran Distribusi Triwulanan data to save.")
-            return 0, 0
-        
-        created_count = 0
-        updated_count = 0
-        
-        for index, row in df.iterrows():
-            # Handle None/NaN values properly
-            value = row['value']
-            if pd.isna(value) or value is None:
-                value = None
-            else:
-                try:
-                    value = float(value)
-                except (ValueError, TypeError):
-                    value = None
-            
-            data_to_serialize = {
-                'expenditure_category': str(row['expenditure_category']).strip(),
-                'year': int(row['year']),
-                'quarter': str(row['quarter']),
-                'preliminary_flag': row.get('preliminary_flag', ''),
-                'value': value
-            }
-            
-            try:
-                instance = PDRBPengeluaranDistribusiTriwulanan.objects.get(
-                    expenditure_category=data_to_serialize['expenditure_category'],
-                    year=data_to_serialize['year'],
-                    quarter=data_to_serialize['quarter']
-                )
-            except PDRBPengeluaranDistribusiTriwulanan.DoesNotExist:
-                instance = None
-            
-            serializer = PDRBPengeluaranDistribusiTriwulananSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saving PDRB Distribusi Triwulanan: {serializer.errors}")
-        
-        print(f"[INFO] PDRB Distribusi Triwulanan: {created_count} created, {updated_count} updated")
-        return created_count, updated_count
+        return save_pdrb_records(PDRBPengeluaranDistribusiTriwulanan, df, 'expenditure_category', "PDRB Pengeluaran Distribusi Triwulanan", "PDRB Distribusi Triwulanan")
     
     @staticmethod
     def save_pdrb_laju_qtoq_to_db(df):
         """Save PDRB Pengeluaran Laju Q-to-Q data to database."""
-        if df.empty:
-            print("[WARNING] No PDRB Pengeluaran Laju Q-to-Q data to save.")
-            return 0, 0
-        
-        created_count = 0
-        updated_count = 0
-        
-        for index, row in df.iterrows():
-            # Handle None/NaN values properly
-            value = row['value']
-            if pd.isna(value) or value is None:
-                value = None
-            else:
-                try:
-                    value = float(value)
-                except (ValueError, TypeError):
-                    value = None
-            
-            data_to_serialize = {
-                'expenditure_category': str(row['expenditure_category']).strip(),
-                'year': int(row['year']),
-                'quarter': str(row['quarter']),
-                'preliminary_flag': row.get('preliminary_flag', ''),
-                'value': value
-            }
-            
-            try:
-                instance = PDRBPengeluaranLajuQtoQ.objects.get(
-                    expenditure_category=data_to_serialize['expenditure_category'],
-                    year=data_to_serialize['year'],
-                    quarter=data_to_serialize['quarter']
-                )
-            except PDRBPengeluaranLajuQtoQ.DoesNotExist:
-                instance = None
-            
-            serializer = PDRBPengeluaranLajuQtoQSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saving PDRB Laju Q-to-Q: {serializer.errors}")
-        
-        print(f"[INFO] PDRB Laju Q-to-Q: {created_count} created, {updated_count} updated")
-        return created_count, updated_count
+        return save_pdrb_records(PDRBPengeluaranLajuQtoQ, df, 'expenditure_category', "PDRB Pengeluaran Laju Q-to-Q", "PDRB Laju Q-to-Q")
     
     @staticmethod
     def save_pdrb_laju_ytoy_to_db(df):
         """Save PDRB Pengeluaran Laju Y-to-Y data to database."""
-        if df.empty:
-            print("[WARNING] No PDRB Pengeluaran Laju Y-to-Y data to save.")
-            return 0, 0
-        
-        created_count = 0
-        updated_count = 0
-        
-        for index, row in df.iterrows():
-            # Handle None/NaN values properly
-            value = row['value']
-            if pd.isna(value) or value is None:
-                value = None
-            else:
-                try:
-                    value = float(value)
-                except (ValueError, TypeError):
-                    value = None
-            
-            data_to_serialize = {
-                'expenditure_category': str(row['expenditure_category']).strip(),
-                'year': int(row['year']),
-                'quarter': str(row['quarter']),
-                'preliminary_flag': row.get('preliminary_flag', ''),
-                'value': value
-            }
-            
-            try:
-                instance = PDRBPengeluaranLajuYtoY.objects.get(
-                    expenditure_category=data_to_serialize['expenditure_category'],
-                    year=data_to_serialize['year'],
-                    quarter=data_to_serialize['quarter']
-                )
-            except PDRBPengeluaranLajuYtoY.DoesNotExist:
-                instance = None
-            
-            serializer = PDRBPengeluaranLajuYtoYSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saving PDRB Laju Y-to-Y: {serializer.errors}")
-        
-        print(f"[INFO] PDRB Laju Y-to-Y: {created_count} created, {updated_count} updated")
-        return created_count, updated_count
+        return save_pdrb_records(PDRBPengeluaranLajuYtoY, df, 'expenditure_category', "PDRB Pengeluaran Laju Y-to-Y", "PDRB Laju Y-to-Y")
     
     @staticmethod
     def save_pdrb_laju_ctoc_to_db(df):
         """Save PDRB Pengeluaran Laju C-to-C data to database."""
-        if df.empty:
-            print("[WARNING] No PDRB Pengeluaran Laju C-to-C data to save.")
-            return 0, 0
-        
-        created_count = 0
-        updated_count = 0
+        return save_pdrb_records(PDRBPengeluaranLajuCtoC, df, 'expenditure_category', "PDRB Pengeluaran Laju C-to-C", "PDRB Laju C-to-C")
+    
+    @classmethod
+    def sheet_plan(cls):
+        """Daftar (nama sheet, model, fungsi save, is_quarterly) yang di-sync oleh service ini."""
+        # Annual sheets
+        sheets_annual = [
+            ("PDRB Pengeluaran_ADHB", PDRBPengeluaranADHB, cls.save_pdrb_adhb_to_db, False),
+            ("PDRB Pengeluaran_ADHK", PDRBPengeluaranADHK, cls.save_pdrb_adhk_to_db, False),
+            ("PDRB Pengeluaran_Distribusi", PDRBPengeluaranDistribusi, cls.save_pdrb_distribusi_to_db, False),
+            ("PDRB Pengeluaran_Laju PDRB", PDRBPengeluaranLajuPDRB, cls.save_pdrb_laju_pdrb_to_db, False),
+        ]
         
-        for index, row in df.iterrows():
-            # Handle None/NaN values properly
-            value = row['value']
-            if pd.isna(value) or value is None:
-                value = None
-            else:
-                try:
-                    value = float(value)
-                except (ValueError, TypeError):
-                    value = None
-            
-            data_to_serialize = {
-                'expenditure_category': str(row['expenditure_category']).strip(),
-                'year': int(row['year']),
-                'quarter': str(row['quarter']),
-                'preliminary_flag': row.get('preliminary_flag', ''),
-                'value': value
-            }
-            
-            try:
-                instance = PDRBPengeluaranLajuCtoC.objects.get(
-                    expenditure_category=data_to_serialize['expenditure_category'],
-                    year=data_to_serialize['year'],
-                    quarter=data_to_serialize['quarter']
-                )
-            except PDRBPengeluaranLajuCtoC.DoesNotExist:
-                instance = None
-            
-            serializer = PDRBPengeluaranLajuCtoCSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saving PDRB Laju C-to-C: {serializer.errors}")
+        # Quarterly sheets
+        sheets_quarterly = [
+            ("PDRB Pengeluaran_ADHB_Triwulanan", PDRBPengeluaranADHBTriwulanan, cls.save_pdrb_adhb_triwulanan_to_db, True),
+            ("PDRB Pengeluaran_ADHK_Triwulanan", PDRBPengeluaranADHKTriwulanan, cls.save_pdrb_adhk_triwulanan_to_db, True),
+            ("PDRB Pengeluaran_Distribusi_Triwulanan", PDRBPengeluaranDistribusiTriwulanan, cls.save_pdrb_distribusi_triwulanan_to_db, True),
+            ("Laju Pertumbuhan_q-to-q_PDRB Pengeluaran_ Triwulan", PDRBPengeluaranLajuQtoQ, cls.save_pdrb_laju_qtoq_to_db, True),
+            ("Laju Pertumbuhan_y-to-y_PDRB Pengeluaran_ Triwulan", PDRBPengeluaranLajuYtoY, cls.save_pdrb_laju_ytoy_to_db, True),
+            ("Laju Pertumbuhan_c-to-c_PDRB Pengeluaran_ Triwulan", PDRBPengeluaranLajuCtoC, cls.save_pdrb_laju_ctoc_to_db, True),
+        ]
         
-        print(f"[INFO] PDRB Laju C-to-C: {created_count} created, {updated_count} updated")
-        return created_count, updated_count
+        return sheets_annual + sheets_quarterly
+    
+    @classmethod
+    def worksheet_names(cls):
+        """Judul worksheet yang dibaca service ini (dipakai untuk prefetch)."""
+        return [sheet_name for sheet_name, _, _, _ in cls.sheet_plan()]
     
     @classmethod
     def sync_all_pdrb_pengeluaran(cls):
@@ -3964,41 +1925,24 @@ class PDRBPengeluaranService:
         
         results = {}
         
-        # Annual sheets
-        sheets_annual = [
-            ("PDRB Pengeluaran_ADHB", cls.save_pdrb_adhb_to_db, False),
-            ("PDRB Pengeluaran_ADHK", cls.save_pdrb_adhk_to_db, False),
-            ("PDRB Pengeluaran_Distribusi", cls.save_pdrb_distribusi_to_db, False),
-            ("PDRB Pengeluaran_Laju PDRB", cls.save_pdrb_laju_pdrb_to_db, False),
-        ]
-        
-        # Quarterly sheets
-        sheets_quarterly = [
-            ("PDRB Pengeluaran_ADHB_Triwulanan", cls.save_pdrb_adhb_triwulanan_to_db, True),
-            ("PDRB Pengeluaran_ADHK_Triwulanan", cls.save_pdrb_adhk_triwulanan_to_db, True),
-            ("PDRB Pengeluaran_Distribusi_Triwulanan", cls.save_pdrb_distribusi_triwulanan_to_db, True),
-            ("Laju Pertumbuhan_q-to-q_PDRB Pengeluaran_ Triwulan", cls.save_pdrb_laju_qtoq_to_db, True),
-            ("Laju Pertumbuhan_y-to-y_PDRB Pengeluaran_ Triwulan", cls.save_pdrb_laju_ytoy_to_db, True),
-            ("Laju Pertumbuhan_c-to-c_PDRB Pengeluaran_ Triwulan", cls.save_pdrb_laju_ctoc_to_db, True),
-        ]
-        
-        all_sheets = sheets_annual + sheets_quarterly
+        all_sheets = cls.sheet_plan()
         
-        for sheet_name, save_func, is_quarterly in all_sheets:
+        for sheet_name, model, save_func, is_quarterly in all_sheets:
             print(f"\n[PROCESSING] {sheet_name}...")
-            df = cls.fetch_pdrb_pengeluaran_data(sheet_name, is_quarterly=is_quarterly)
-            if not df.empty:
-                created, updated = save_func(df)
-                results[sheet_name] = {'created': created, 'updated': updated}
-            else:
+            created, updated, unchanged = run_sheet_sync(
+                cls.SHEET_ID, sheet_name, model.objects.all(),
+                fetch=lambda: cls.fetch_pdrb_pengeluaran_data(sheet_name, is_quarterly=is_quarterly),
+                save=save_func,
+            )
+            if created + updated + unchanged == 0:
                 print(f"[WARNING] No data found for {sheet_name}")
-                results[sheet_name] = {'created': 0, 'updated': 0}
+            results[sheet_name] = {'created': created, 'updated': updated, 'unchanged': unchanged}
         
         print("\n" + "="*60)
         print("SYNC COMPLETE - SUMMARY")
         print("="*60)
         for sheet_name, counts in results.items():
-            print(f"{sheet_name}: {counts['created']} created, {counts['updated']} updated")
+            print(f"{sheet_name}: {counts['created']} created, {counts['updated']} updated, {counts['unchanged']} unchanged")
         print("="*60 + "\n")
         
         return results
@@ -4006,7 +1950,7 @@ class PDRBPengeluaranService:
 
 # PDRB Lapangan Usaha Service
 class PDRBLapanganUsahaService:
-    SHEET_ID = "1keS9YFYO1qzAawWgLh2U2pY6xX5ppKUnhbdHQYfU5HM"
+    SHEET_ID = INDICATOR_SHEET_ID
     
     @staticmethod
     def fetch_pdrb_lapangan_usaha_data(sheet_name, is_quarterly=False):
@@ -4022,19 +1966,9 @@ class PDRBLapanganUsahaService:
         """
         print(f"[INFO] Fetching PDRB Lapangan Usaha data from sheet: {sheet_name}...")
         try:
-            # Autentikasi
-            scope = [
-                'https://www.googleapis.com/auth/spreadsheets',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            credentials = ServiceAccountCredentials.from_json_keyfile_name('credentials.json', scope)
-            client = gspread.authorize(credentials)
-            
-            # Buka sheet
-            sheet = client.open_by_key(PDRBLapanganUsahaService.SHEET_ID).worksheet(sheet_name)
-            
-            # Ambil semua data
-            data = sheet.get_all_values()
+            # Buka sheet (client dan metadata dari registry bersama)
+            # Ambil semua data (dari cache prefetch bila tersedia)
+            data = get_worksheet_values(PDRBLapanganUsahaService.SHEET_ID, sheet_name)
             if not data or len(data) < 2:
                 print(f"[WARNING] No data found in sheet {sheet_name}")
                 return pd.DataFrame()
@@ -4158,8 +2092,7 @@ class PDRBLapanganUsahaService:
                         if col_idx >= len(row):
                             continue
                         
-                        value_str = str(row[col_idx]).strip()
-                        value = convert_value(value_str)
+                        value = row[col_idx]
                         
                         records.append({
                             'industry_category': category,
@@ -4257,8 +2190,7 @@ class PDRBLapanganUsahaService:
                         if col_idx >= len(row):
                             continue
                         
-                        value_str = str(row[col_idx]).strip()
-                        value = convert_value(value_str)
+                        value = row[col_idx]
                         
                         records.append({
                             'industry_category': category,
@@ -4273,555 +2205,104 @@ class PDRBLapanganUsahaService:
                 print(f"[WARNING] No valid records found after processing sheet {sheet_name}")
                 return pd.DataFrame()
             
+            # Aturan convert_value, untuk seluruh kolom sekaligus
+            values, invalid = parse_numbers(df['value'], SPREADSHEET)
+            report_invalid(f"PDRB Lapangan Usaha {sheet_name}", df['value'], invalid)
+            df['value'] = values
+            
             print(f"[OK] Data processed. Total valid records: {len(df)}")
             return df
             
         except Exception as e:
-            logger.error(f"Error fetching PDRB Lapangan Usaha data from {sheet_name}: {e}")
-            print(f"[ERROR] {e}")
-            import traceback
-            traceback.print_exc()
-            return pd.DataFrame()
-    
-    @staticmethod
-    def save_pdrb_lapus_adhb_to_db(df):
-        """Save PDRB Lapangan Usaha ADHB data to database."""
-        if df.empty:
-            print("[WARNING] No PDRB Lapangan Usaha ADHB data to save.")
-            return 0, 0
-        
-        created_count = 0
-        updated_count = 0
-        
-        for index, row in df.iterrows():
-            value = row['value']
-            if pd.isna(value) or value is None:
-                value = None
-            else:
-                try:
-                    value = float(value)
-                except (ValueError, TypeError):
-                    value = None
-            
-            data_to_serialize = {
-                'industry_category': str(row['industry_category']).strip(),
-                'year': int(row['year']),
-                'preliminary_flag': row.get('preliminary_flag', ''),
-                'value': value
-            }
-            
-            try:
-                instance = PDRBLapanganUsahaADHB.objects.get(
-                    industry_category=data_to_serialize['industry_category'],
-                    year=data_to_serialize['year']
-                )
-            except PDRBLapanganUsahaADHB.DoesNotExist:
-                instance = None
-            
-            serializer = PDRBLapanganUsahaADHBSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saving PDRB Lapus ADHB: {serializer.errors}")
-        
-        print(f"[INFO] PDRB Lapus ADHB: {created_count} created, {updated_count} updated")
-        return created_count, updated_count
-    
-    @staticmethod
-    def save_pdrb_lapus_adhk_to_db(df):
-        """Save PDRB Lapangan Usaha ADHK data to database."""
-        if df.empty:
-            print("[WARNING] No PDRB Lapangan Usaha ADHK data to save.")
-            return 0, 0
-        
-        created_count = 0
-        updated_count = 0
-        
-        for index, row in df.iterrows():
-            value = row['value']
-            if pd.isna(value) or value is None:
-                value = None
-            else:
-                try:
-                    value = float(value)
-                except (ValueError, TypeError):
-                    value = None
-            
-            data_to_serialize = {
-                'industry_category': str(row['industry_category']).strip(),
-                'year': int(row['year']),
-                'preliminary_flag': row.get('preliminary_flag', ''),
-                'value': value
-            }
-            
-            try:
-                instance = PDRBLapanganUsahaADHK.objects.get(
-                    industry_category=data_to_serialize['industry_category'],
-                    year=data_to_serialize['year']
-                )
-            except PDRBLapanganUsahaADHK.DoesNotExist:
-                instance = None
-            
-            serializer = PDRBLapanganUsahaADHKSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saving PDRB Lapus ADHK: {serializer.errors}")
-        
-        print(f"[INFO] PDRB Lapus ADHK: {created_count} created, {updated_count} updated")
-        return created_count, updated_count
+            logger.error(f"Error fetching PDRB Lapangan Usaha data from {sheet_name}: {e}")
+            print(f"[ERROR] {e}")
+            import traceback
+            traceback.print_exc()
+            return pd.DataFrame()
+    
+    @staticmethod
+    def save_pdrb_lapus_adhb_to_db(df):
+        """Save PDRB Lapangan Usaha ADHB data to database."""
+        return save_pdrb_records(PDRBLapanganUsahaADHB, df, 'industry_category', "PDRB Lapangan Usaha ADHB", "PDRB Lapus ADHB")
+    
+    @staticmethod
+    def save_pdrb_lapus_adhk_to_db(df):
+        """Save PDRB Lapangan Usaha ADHK data to database."""
+        return save_pdrb_records(PDRBLapanganUsahaADHK, df, 'industry_category', "PDRB Lapangan Usaha ADHK", "PDRB Lapus ADHK")
     
     @staticmethod
     def save_pdrb_lapus_distribusi_to_db(df):
         """Save PDRB Lapangan Usaha Distribusi data to database."""
-        if df.empty:
-            print("[WARNING] No PDRB Lapangan Usaha Distribusi data to save.")
-            return 0, 0
-        
-        created_count = 0
-        updated_count = 0
-        
-        for index, row in df.iterrows():
-            value = row['value']
-            if pd.isna(value) or value is None:
-                value = None
-            else:
-                try:
-                    value = float(value)
-                except (ValueError, TypeError):
-                    value = None
-            
-            data_to_serialize = {
-                'industry_category': str(row['industry_category']).strip(),
-                'year': int(row['year']),
-                'preliminary_flag': row.get('preliminary_flag', ''),
-                'value': value
-            }
-            
-            try:
-                instance = PDRBLapanganUsahaDistribusi.objects.get(
-                    industry_category=data_to_serialize['industry_category'],
-                    year=data_to_serialize['year']
-                )
-            except PDRBLapanganUsahaDistribusi.DoesNotExist:
-                instance = None
-            
-            serializer = PDRBLapanganUsahaDistribusiSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saving PDRB Lapus Distribusi: {serializer.errors}")
-        
-        print(f"[INFO] PDRB Lapus Distribusi: {created_count} created, {updated_count} updated")
-        return created_count, updated_count
+        return save_pdrb_records(PDRBLapanganUsahaDistribusi, df, 'industry_category', "PDRB Lapangan Usaha Distribusi", "PDRB Lapus Distribusi")
     
     @staticmethod
     def save_pdrb_lapus_laju_pdrb_to_db(df):
         """Save PDRB Lapangan Usaha Laju PDRB data to database."""
-        if df.empty:
-            print("[WARNING] No PDRB Lapangan Usaha Laju PDRB data to save.")
-            return 0, 0
-        
-        created_count = 0
-        updated_count = 0
-        
-        for index, row in df.iterrows():
-            value = row['value']
-            if pd.isna(value) or value is None:
-                value = None
-            else:
-                try:
-                    value = float(value)
-                except (ValueError, TypeError):
-                    value = None
-            
-            data_to_serialize = {
-                'industry_category': str(row['industry_category']).strip(),
-                'year': int(row['year']),
-                'preliminary_flag': row.get('preliminary_flag', ''),
-                'value': value
-            }
-            
-            try:
-                instance = PDRBLapanganUsahaLajuPDRB.objects.get(
-                    industry_category=data_to_serialize['industry_category'],
-                    year=data_to_serialize['year']
-                )
-            except PDRBLapanganUsahaLajuPDRB.DoesNotExist:
-                instance = None
-            
-            serializer = PDRBLapanganUsahaLajuPDRBSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saving PDRB Lapus Laju PDRB: {serializer.errors}")
-        
-        print(f"[INFO] PDRB Lapus Laju PDRB: {created_count} created, {updated_count} updated")
-        return created_count, updated_count
+        return save_pdrb_records(PDRBLapanganUsahaLajuPDRB, df, 'industry_category', "PDRB Lapangan Usaha Laju PDRB", "PDRB Lapus Laju PDRB")
     
     @staticmethod
     def save_pdrb_lapus_laju_implisit_to_db(df):
         """Save PDRB Lapangan Usaha Laju Implisit data to database."""
-        if df.empty:
-            print("[WARNING] No PDRB Lapangan Usaha Laju Implisit data to save.")
-            return 0, 0
-        
-        created_count = 0
-        updated_count = 0
-        
-        for index, row in df.iterrows():
-            value = row['value']
-            if pd.isna(value) or value is None:
-                value = None
-            else:
-                try:
-                    value = float(value)
-                except (ValueError, TypeError):
-                    value = None
-            
-            data_to_serialize = {
-                'industry_category': str(row['industry_category']).strip(),
-                'year': int(row['year']),
-                'preliminary_flag': row.get('preliminary_flag', ''),
-                'value': value
-            }
-            
-            try:
-                instance = PDRBLapanganUsahaLajuImplisit.objects.get(
-                    industry_category=data_to_serialize['industry_category'],
-                    year=data_to_serialize['year']
-                )
-            except PDRBLapanganUsahaLajuImplisit.DoesNotExist:
-                instance = None
-            
-            serializer = PDRBLapanganUsahaLajuImplisitSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saving PDRB Lapus Laju Implisit: {serializer.errors}")
-        
-        print(f"[INFO] PDRB Lapus Laju Implisit: {created_count} created, {updated_count} updated")
-        return created_count, updated_count
+        return save_pdrb_records(PDRBLapanganUsahaLajuImplisit, df, 'industry_category', "PDRB Lapangan Usaha Laju Implisit", "PDRB Lapus Laju Implisit")
     
     @staticmethod
     def save_pdrb_lapus_adhb_triwulanan_to_db(df):
         """Save PDRB Lapangan Usaha ADHB Triwulanan data to database."""
-        if df.empty:
-            print("[WARNING] No PDRB Lapangan Usaha ADHB Triwulanan data to save.")
-            return 0, 0
-        
-        created_count = 0
-        updated_count = 0
-        
-        for index, row in df.iterrows():
-            value = row['value']
-            if pd.isna(value) or value is None:
-                value = None
-            else:
-                try:
-                    value = float(value)
-                except (ValueError, TypeError):
-                    value = None
-            
-            data_to_serialize = {
-                'industry_category': str(row['industry_category']).strip(),
-                'year': int(row['year']),
-                'quarter': str(row['quarter']).strip(),
-                'preliminary_flag': row.get('preliminary_flag', ''),
-                'value': value
-            }
-            
-            try:
-                instance = PDRBLapanganUsahaADHBTriwulanan.objects.get(
-                    industry_category=data_to_serialize['industry_category'],
-                    year=data_to_serialize['year'],
-                    quarter=data_to_serialize['quarter']
-                )
-            except PDRBLapanganUsahaADHBTriwulanan.DoesNotExist:
-                instance = None
-            
-            serializer = PDRBLapanganUsahaADHBTriwulananSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saving PDRB Lapus ADHB Triwulanan: {serializer.errors}")
-        
-        print(f"[INFO] PDRB Lapus ADHB Triwulanan: {created_count} created, {updated_count} updated")
-        return created_count, updated_count
+        return save_pdrb_records(PDRBLapanganUsahaADHBTriwulanan, df, 'industry_category', "PDRB Lapangan Usaha ADHB Triwulanan", "PDRB Lapus ADHB Triwulanan")
     
     @staticmethod
     def save_pdrb_lapus_adhk_triwulanan_to_db(df):
         """Save PDRB Lapangan Usaha ADHK Triwulanan data to database."""
-        if df.empty:
-            print("[WARNING] No PDRB Lapangan Usaha ADHK Triwulanan data to save.")
-            return 0, 0
-        
-        created_count = 0
-        updated_count = 0
-        
-        for index, row in df.iterrows():
-            value = row['value']
-            if pd.isna(value) or value is None:
-                value = None
-            else:
-                try:
-                    value = float(value)
-                except (ValueError, TypeError):
-                    value = None
-            
-            data_to_serialize = {
-                'industry_category': str(row['industry_category']).strip(),
-                'year': int(row['year']),
-                'quarter': str(row['quarter']).strip(),
-                'preliminary_flag': row.get('preliminary_flag', ''),
-                'value': value
-            }
-            
-            try:
-                instance = PDRBLapanganUsahaADHKTriwulanan.objects.get(
-                    industry_category=data_to_serialize['industry_category'],
-                    year=data_to_serialize['year'],
-                    quarter=data_to_serialize['quarter']
-                )
-            except PDRBLapanganUsahaADHKTriwulanan.DoesNotExist:
-                instance = None
-            
-            serializer = PDRBLapanganUsahaADHKTriwulananSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saving PDRB Lapus ADHK Triwulanan: {serializer.errors}")
-        
-        print(f"[INFO] PDRB Lapus ADHK Triwulanan: {created_count} created, {updated_count} updated")
-        return created_count, updated_count
+        return save_pdrb_records(PDRBLapanganUsahaADHKTriwulanan, df, 'industry_category', "PDRB Lapangan Usaha ADHK Triwulanan", "PDRB Lapus ADHK Triwulanan")
     
     @staticmethod
     def save_pdrb_lapus_distribusi_triwulanan_to_db(df):
         """Save PDRB Lapangan Usaha Distribusi Triwulanan data to database."""
-        if df.empty:
-            print("[WARNING] No PDRB Lapangan Usaha Distribusi Triwulanan data to save.")
-            return 0, 0
-        
-        created_count = 0
-        updated_count = 0
-        
-        for index, row in df.iterrows():
-            value = row['value']
-            if pd.isna(value) or value is None:
-                value = None
-            else:
-                try:
-                    value = float(value)
-                except (ValueError, TypeError):
-                    value = None
-            
-            data_to_serialize = {
-                'industry_category': str(row['industry_category']).strip(),
-                'year': int(row['year']),
-                'quarter': str(row['quarter']).strip(),
-                'preliminary_flag': row.get('preliminary_flag', ''),
-                'value': value
-            }
-            
-            try:
-                instance = PDRBLapanganUsahaDistribusiTriwulanan.objects.get(
-                    industry_category=data_to_serialize['industry_category'],
-                    year=data_to_serialize['year'],
-                    quarter=data_to_serialize['quarter']
-                )
-            except PDRBLapanganUsahaDistribusiTriwulanan.DoesNotExist:
-                instance = None
-            
-            serializer = PDRBLapanganUsahaDistribusiTriwulananSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saving PDRB Lapus Distribusi Triwulanan: {serializer.errors}")
-        
-        print(f"[INFO] PDRB Lapus Distribusi Triwulanan: {created_count} created, {updated_count} updated")
-        return created_count, updated_count
+        return save_pdrb_records(PDRBLapanganUsahaDistribusiTriwulanan, df, 'industry_category', "PDRB Lapangan Usaha Distribusi Triwulanan", "PDRB Lapus Distribusi Triwulanan")
     
     @staticmethod
     def save_pdrb_lapus_laju_qtoq_to_db(df):
         """Save PDRB Lapangan Usaha Laju Q-to-Q data to database."""
-        if df.empty:
-            print("[WARNING] No PDRB Lapangan Usaha Laju Q-to-Q data to save.")
-            return 0, 0
-        
-        created_count = 0
-        updated_count = 0
-        
-        for index, row in df.iterrows():
-            value = row['value']
-            if pd.isna(value) or value is None:
-                value = None
-            else:
-                try:
-                    value = float(value)
-                except (ValueError, TypeError):
-                    value = None
-            
-            data_to_serialize = {
-                'industry_category': str(row['industry_category']).strip(),
-                'year': int(row['year']),
-                'quarter': str(row['quarter']).strip(),
-                'preliminary_flag': row.get('preliminary_flag', ''),
-                'value': value
-            }
-            
-            try:
-                instance = PDRBLapanganUsahaLajuQtoQ.objects.get(
-                    industry_category=data_to_serialize['industry_category'],
-                    year=data_to_serialize['year'],
-                    quarter=data_to_serialize['quarter']
-                )
-            except PDRBLapanganUsahaLajuQtoQ.DoesNotExist:
-                instance = None
-            
-            serializer = PDRBLapanganUsahaLajuQtoQSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saving PDRB Lapus Laju Q-to-Q: {serializer.errors}")
-        
-        print(f"[INFO] PDRB Lapus Laju Q-to-Q: {created_count} created, {updated_count} updated")
-        return created_count, updated_count
+        return save_pdrb_records(PDRBLapanganUsahaLajuQtoQ, df, 'industry_category', "PDRB Lapangan Usaha Laju Q-to-Q", "PDRB Lapus Laju Q-to-Q")
     
     @staticmethod
     def save_pdrb_lapus_laju_ytoy_to_db(df):
         """Save PDRB Lapangan Usaha Laju Y-to-Y data to database."""
-        if df.empty:
-            print("[WARNING] No PDRB Lapangan Usaha Laju Y-to-Y data to save.")
-            return 0, 0
-        
-        created_count = 0
-        updated_count = 0
-        
-        for index, row in df.iterrows():
-            value = row['value']
-            if pd.isna(value) or value is None:
-                value = None
-            else:
-                try:
-                    value = float(value)
-                except (ValueError, TypeError):
-                    value = None
-            
-            data_to_serialize = {
-                'industry_category': str(row['industry_category']).strip(),
-                'year': int(row['year']),
-                'quarter': str(row['quarter']).strip(),
-                'preliminary_flag': row.get('preliminary_flag', ''),
-                'value': value
-            }
-            
-            try:
-                instance = PDRBLapanganUsahaLajuYtoY.objects.get(
-                    industry_category=data_to_serialize['industry_category'],
-                    year=data_to_serialize['year'],
-                    quarter=data_to_serialize['quarter']
-                )
-            except PDRBLapanganUsahaLajuYtoY.DoesNotExist:
-                instance = None
-            
-            serializer = PDRBLapanganUsahaLajuYtoYSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saving PDRB Lapus Laju Y-to-Y: {serializer.errors}")
-        
-        print(f"[INFO] PDRB Lapus Laju Y-to-Y: {created_count} created, {updated_count} updated")
-        return created_count, updated_count
+        return save_pdrb_records(PDRBLapanganUsahaLajuYtoY, df, 'industry_category', "PDRB Lapangan Usaha Laju Y-to-Y", "PDRB Lapus Laju Y-to-Y")
     
     @staticmethod
     def save_pdrb_lapus_laju_ctoc_to_db(df):
         """Save PDRB Lapangan Usaha Laju C-to-C data to database."""
-        if df.empty:
-            print("[WARNING] No PDRB Lapangan Usaha Laju C-to-C data to save.")
-            return 0, 0
-        
-        created_count = 0
-        updated_count = 0
+        return save_pdrb_records(PDRBLapanganUsahaLajuCtoC, df, 'industry_category', "PDRB Lapangan Usaha Laju C-to-C", "PDRB Lapus Laju C-to-C")
+    
+    @classmethod
+    def sheet_plan(cls):
+        """Daftar (nama sheet, model, fungsi save, is_quarterly) yang di-sync oleh service ini."""
+        # Annual sheets
+        sheets_annual = [
+            ("PDRB Lapus_ADHB", PDRBLapanganUsahaADHB, cls.save_pdrb_lapus_adhb_to_db, False),
+            ("PDRB Lapus_ADHK", PDRBLapanganUsahaADHK, cls.save_pdrb_lapus_adhk_to_db, False),
+            ("PDRB Lapus_Distribusi", PDRBLapanganUsahaDistribusi, cls.save_pdrb_lapus_distribusi_to_db, False),
+            ("PDRB Lapus_Laju PDRB", PDRBLapanganUsahaLajuPDRB, cls.save_pdrb_lapus_laju_pdrb_to_db, False),
+            ("PDRB Lapus_Laju Implisit", PDRBLapanganUsahaLajuImplisit, cls.save_pdrb_lapus_laju_implisit_to_db, False),
+        ]
         
-        for index, row in df.iterrows():
-            value = row['value']
-            if pd.isna(value) or value is None:
-                value = None
-            else:
-                try:
-                    value = float(value)
-                except (ValueError, TypeError):
-                    value = None
-            
-            data_to_serialize = {
-                'industry_category': str(row['industry_category']).strip(),
-                'year': int(row['year']),
-                'quarter': str(row['quarter']).strip(),
-                'preliminary_flag': row.get('preliminary_flag', ''),
-                'value': value
-            }
-            
-            try:
-                instance = PDRBLapanganUsahaLajuCtoC.objects.get(
-                    industry_category=data_to_serialize['industry_category'],
-                    year=data_to_serialize['year'],
-                    quarter=data_to_serialize['quarter']
-                )
-            except PDRBLapanganUsahaLajuCtoC.DoesNotExist:
-                instance = None
-            
-            serializer = PDRBLapanganUsahaLajuCtoCSerializer(instance=instance, data=data_to_serialize)
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saving PDRB Lapus Laju C-to-C: {serializer.errors}")
+        # Quarterly sheets
+        sheets_quarterly = [
+            ("PDRB Lapus_ADHB_Triwulanan", PDRBLapanganUsahaADHBTriwulanan, cls.save_pdrb_lapus_adhb_triwulanan_to_db, True),
+            ("PDRB Lapus_ADHK_Triwulanan", PDRBLapanganUsahaADHKTriwulanan, cls.save_pdrb_lapus_adhk_triwulanan_to_db, True),
+            ("PDRB Lapus_Distribusi_Triwulanan", PDRBLapanganUsahaDistribusiTriwulanan, cls.save_pdrb_lapus_distribusi_triwulanan_to_db, True),
+            ("Laju Pertumbuhan_q-to-q_PDRB Lapus_ Triwulan", PDRBLapanganUsahaLajuQtoQ, cls.save_pdrb_lapus_laju_qtoq_to_db, True),
+            ("Laju Pertumbuhan_y-to-y_PDRB Lapus_ Triwulan", PDRBLapanganUsahaLajuYtoY, cls.save_pdrb_lapus_laju_ytoy_to_db, True),
+            ("Laju Pertumbuhan_c-to-c_PDRB Lapus_ Triwulan", PDRBLapanganUsahaLajuCtoC, cls.save_pdrb_lapus_laju_ctoc_to_db, True),
+        ]
         
-        print(f"[INFO] PDRB Lapus Laju C-to-C: {created_count} created, {updated_count} updated")
-        return created_count, updated_count
+        return sheets_annual + sheets_quarterly
+    
+    @classmethod
+    def worksheet_names(cls):
+        """Judul worksheet yang dibaca service ini (dipakai untuk prefetch)."""
+        return [sheet_name for sheet_name, _, _, _ in cls.sheet_plan()]
     
     @classmethod
     def sync_all_pdrb_lapangan_usaha(cls):
@@ -4832,42 +2313,24 @@ class PDRBLapanganUsahaService:
         
         results = {}
         
-        # Annual sheets
-        sheets_annual = [
-            ("PDRB Lapus_ADHB", cls.save_pdrb_lapus_adhb_to_db, False),
-            ("PDRB Lapus_ADHK", cls.save_pdrb_lapus_adhk_to_db, False),
-            ("PDRB Lapus_Distribusi", cls.save_pdrb_lapus_distribusi_to_db, False),
-            ("PDRB Lapus_Laju PDRB", cls.save_pdrb_lapus_laju_pdrb_to_db, False),
-            ("PDRB Lapus_Laju Implisit", cls.save_pdrb_lapus_laju_implisit_to_db, False),
-        ]
-        
-        # Quarterly sheets
-        sheets_quarterly = [
-            ("PDRB Lapus_ADHB_Triwulanan", cls.save_pdrb_lapus_adhb_triwulanan_to_db, True),
-            ("PDRB Lapus_ADHK_Triwulanan", cls.save_pdrb_lapus_adhk_triwulanan_to_db, True),
-            ("PDRB Lapus_Distribusi_Triwulanan", cls.save_pdrb_lapus_distribusi_triwulanan_to_db, True),
-            ("Laju Pertumbuhan_q-to-q_PDRB Lapus_ Triwulan", cls.save_pdrb_lapus_laju_qtoq_to_db, True),
-            ("Laju Pertumbuhan_y-to-y_PDRB Lapus_ Triwulan", cls.save_pdrb_lapus_laju_ytoy_to_db, True),
-            ("Laju Pertumbuhan_c-to-c_PDRB Lapus_ Triwulan", cls.save_pdrb_lapus_laju_ctoc_to_db, True),
-        ]
-        
-        all_sheets = sheets_annual + sheets_quarterly
+        all_sheets = cls.sheet_plan()
         
-        for sheet_name, save_func, is_quarterly in all_sheets:
+        for sheet_name, model, save_func, is_quarterly in all_sheets:
             print(f"\n[PROCESSING] {sheet_name}...")
-            df = cls.fetch_pdrb_lapangan_usaha_data(sheet_name, is_quarterly=is_quarterly)
-            if not df.empty:
-                created, updated = save_func(df)
-                results[sheet_name] = {'created': created, 'updated': updated}
-            else:
+            created, updated, unchanged = run_sheet_sync(
+                cls.SHEET_ID, sheet_name, model.objects.all(),
+                fetch=lambda: cls.fetch_pdrb_lapangan_usaha_data(sheet_name, is_quarterly=is_quarterly),
+                save=save_func,
+            )
+            if created + updated + unchanged == 0:
                 print(f"[WARNING] No data found for {sheet_name}")
-                results[sheet_name] = {'created': 0, 'updated': 0}
+            results[sheet_name] = {'created': created, 'updated': updated, 'unchanged': unchanged}
         
         print("\n" + "="*60)
         print("SYNC COMPLETE - SUMMARY")
         print("="*60)
         for sheet_name, counts in results.items():
-            print(f"{sheet_name}: {counts['created']} created, {counts['updated']} updated")
+            print(f"{sheet_name}: {counts['created']} created, {counts['updated']} updated, {counts['unchanged']} unchanged")
         print("="*60 + "\n")
         
         return results
@@ -4881,7 +2344,12 @@ class InflasiService:
     1. Sheet "Inflasi" - data inflasi umum per bulan dan tahun
     2. Sheet "Inflasi_perkom_YYYY" - data inflasi per komoditas per tahun
     """
-    SHEET_ID = "1keS9YFYO1qzAawWgLh2U2pY6xX5ppKUnhbdHQYfU5HM"
+    SHEET_ID = INDICATOR_SHEET_ID
+    # Jumlah record per chunk parser -> writer untuk sheet Inflasi_perkom_YYYY
+    PERKOM_CHUNK_SIZE = getattr(settings, 'INFLASI_PERKOM_CHUNK_SIZE', 2000)
+    # Sheet perkom tahun lalu dianggap ditutup N hari setelah akhir tahunnya (setelah rilis
+    # inflasi Desember); sesudah itu hanya sheet tahun berjalan yang dibaca setiap sync
+    PERKOM_CLOSE_GRACE_DAYS = getattr(settings, 'INFLASI_PERKOM_CLOSE_GRACE_DAYS', 45)
     
     # Mapping bulan dari nama Indonesia ke format model
     # Note: Di model, November menggunakan value 'NOPEMBER' bukan 'NOVEMBER'
@@ -4903,13 +2371,8 @@ class InflasiService:
     
     @staticmethod
     def get_client():
-        """Mendapatkan client Google Sheets yang sudah di-authenticate."""
-        scope = [
-            'https://www.googleapis.com/auth/spreadsheets',
-            'https://www.googleapis.com/auth/drive'
-        ]
-        credentials = ServiceAccountCredentials.from_json_keyfile_name('credentials.json', scope)
-        return gspread.authorize(credentials)
+        """Mendapatkan client Google Sheets yang sudah di-authenticate (dipakai bersama lewat sheets_registry)."""
+        return sheets_registry.get_client()
     
     @staticmethod
     def fetch_inflasi_data():
@@ -4920,16 +2383,12 @@ class InflasiService:
         """
         print("[INFO] Fetching Inflasi data from Google Sheets...")
         try:
-            client = InflasiService.get_client()
-            spreadsheet = client.open_by_key(InflasiService.SHEET_ID)
-            
             try:
-                sheet = spreadsheet.worksheet("Inflasi")
+                data = get_worksheet_values(InflasiService.SHEET_ID, "Inflasi")
             except gspread.exceptions.WorksheetNotFound:
                 print("[WARNING] Sheet 'Inflasi' not found")
                 return pd.DataFrame()
             
-            data = sheet.get_all_values()
             if not data or len(data) < 3:
                 print("[WARNING] No data found in Inflasi sheet")
                 return pd.DataFrame()
@@ -4968,36 +2427,35 @@ class InflasiService:
                     for row_idx, row in enumerate(data_rows):
                         if col_idx < len(row):
                             month_name = row[0].strip().upper() if row else ""
-                            value_str = row[col_idx].strip() if col_idx < len(row) else ""
                             
                             # Skip jika bukan bulan yang valid
                             if month_name not in InflasiService.MONTH_MAPPING:
                                 continue
                             
-                            # Convert value
-                            try:
-                                # Replace comma with dot for decimal
-                                value_str = value_str.replace(',', '.')
-                                value = float(value_str) if value_str else None
-                            except (ValueError, AttributeError):
-                                value = None
-                            
-                            if value is not None:
-                                records.append({
-                                    'year': current_year,
-                                    'month': InflasiService.MONTH_MAPPING[month_name],
-                                    current_type: value
-                                })
+                            # Nilai mentah; dikonversi sekaligus setelah DataFrame dibuat
+                            records.append({
+                                'year': current_year,
+                                'month': InflasiService.MONTH_MAPPING[month_name],
+                                'type': current_type,
+                                'value': row[col_idx]
+                            })
+            
+            df = pd.DataFrame(records)
+            if not df.empty:
+                values, invalid = parse_numbers(df['value'], DECIMAL)
+                report_invalid("Inflasi", df['value'], invalid)
+                df['value'] = values
+                df = df.dropna(subset=['value'])
             
-            # Convert to DataFrame dan group by year-month untuk menggabungkan Bulanan, Kumulatif, YoY
-            if records:
-                df = pd.DataFrame(records)
-                # Group by year and month, aggregate values
-                df = df.groupby(['year', 'month']).agg({
-                    'bulanan': 'first',
-                    'kumulatif': 'first',
-                    'yoy': 'first'
-                }).reset_index()
+            # Group by year-month untuk menggabungkan Bulanan, Kumulatif, YoY dalam satu baris
+            if not df.empty:
+                df = (
+                    df.groupby(['year', 'month', 'type'])['value'].first()
+                    .unstack('type')
+                    .reindex(columns=['bulanan', 'kumulatif', 'yoy'])
+                    .reset_index()
+                )
+                df.columns.name = None
                 
                 print(f"[OK] Inflasi data processed. Total records: {len(df)}")
                 return df
@@ -5011,71 +2469,92 @@ class InflasiService:
             return pd.DataFrame()
     
     @staticmethod
-    def fetch_inflasi_perkom_data(sheet_name):
+    def _perkom_columns(header_row):
+        """Index kolom kode, nama, flag dan {bulan: index} dari baris header sheet perkom."""
+        kode_idx = None
+        nama_idx = None
+        flag_idx = None
+        month_cols = {}  # month_name -> column_index
+        
+        for idx, header in enumerate(h.strip().upper() for h in header_row):
+            if 'KODE' in header or 'CODE' in header:
+                kode_idx = idx
+            elif 'NAMA' in header or 'NAME' in header or 'KOMODITAS' in header:
+                nama_idx = idx
+            elif 'FLAG' in header:
+                flag_idx = idx
+            elif header in InflasiService.MONTH_MAPPING:
+                month_cols[InflasiService.MONTH_MAPPING[header]] = idx
+        return kode_idx, nama_idx, flag_idx, month_cols
+    
+    @staticmethod
+    def iter_inflasi_perkom_chunks(sheet_name, chunk_size=None):
         """
-        Mengambil data dari sheet "Inflasi_perkom_YYYY".
+        Mengambil data dari sheet "Inflasi_perkom_YYYY" sebagai generator chunk.
         Format: 
         - Column A = Kode Komoditas
         - Column B = Nama Komoditas
         - Column C = Flag
         - Column D+ = Bulan (JANUARI, FEBRUARI, etc.)
+        
+        Yields:
+            list of dict siap bulk_upsert (commodity_code, commodity_name, flag, year,
+            month, value) berisi paling banyak chunk_size record. Hanya satu chunk
+            yang ada di memori pada satu waktu, berapa pun jumlah komoditas x bulan.
         """
+        chunk_size = chunk_size or InflasiService.PERKOM_CHUNK_SIZE
         print(f"[INFO] Fetching data from sheet '{sheet_name}'...")
         try:
-            client = InflasiService.get_client()
-            spreadsheet = client.open_by_key(InflasiService.SHEET_ID)
-            
-            try:
-                sheet = spreadsheet.worksheet(sheet_name)
-            except gspread.exceptions.WorksheetNotFound:
-                print(f"[WARNING] Sheet '{sheet_name}' not found")
-                return pd.DataFrame()
-            
-            data = sheet.get_all_values()
-            if not data or len(data) < 2:
-                print(f"[WARNING] No data found in sheet '{sheet_name}'")
-                return pd.DataFrame()
-            
-            # Extract year from sheet name (e.g., "Inflasi_perkom_2025" -> 2025)
-            year_match = re.search(r'(\d{4})', sheet_name)
-            if not year_match:
-                print(f"[WARNING] Could not extract year from sheet name '{sheet_name}'")
-                return pd.DataFrame()
-            
-            year = int(year_match.group(1))
-            
-            # Row 0 = Headers (Kode Komoditas, Nama Komoditas, Flag, JANUARI, FEBRUARI, etc.)
-            headers = [h.strip().upper() for h in data[0]]
-            data_rows = data[1:]
-            
-            # Find column indices
-            kode_idx = None
-            nama_idx = None
-            flag_idx = None
-            month_cols = {}  # month_name -> column_index
-            
-            for idx, header in enumerate(headers):
-                if 'KODE' in header or 'CODE' in header:
-                    kode_idx = idx
-                elif 'NAMA' in header or 'NAME' in header or 'KOMODITAS' in header:
-                    nama_idx = idx
-                elif 'FLAG' in header:
-                    flag_idx = idx
-                elif header in InflasiService.MONTH_MAPPING:
-                    month_cols[InflasiService.MONTH_MAPPING[header]] = idx
-            
-            if kode_idx is None or nama_idx is None:
-                print(f"[WARNING] Could not find required columns in sheet '{sheet_name}'")
-                return pd.DataFrame()
-            
-            # Process data rows
-            records = []
-            for row in data_rows:
+            data = get_worksheet_values(InflasiService.SHEET_ID, sheet_name)
+        except gspread.exceptions.WorksheetNotFound:
+            print(f"[WARNING] Sheet '{sheet_name}' not found")
+            return
+        
+        if not data or len(data) < 2:
+            print(f"[WARNING] No data found in sheet '{sheet_name}'")
+            return
+        
+        # Extract year from sheet name (e.g., "Inflasi_perkom_2025" -> 2025)
+        year_match = re.search(r'(\d{4})', sheet_name)
+        if not year_match:
+            print(f"[WARNING] Could not extract year from sheet name '{sheet_name}'")
+            return
+        
+        year = int(year_match.group(1))
+        
+        # Row 0 = Headers (Kode Komoditas, Nama Komoditas, Flag, JANUARI, FEBRUARI, etc.)
+        kode_idx, nama_idx, flag_idx, month_cols = InflasiService._perkom_columns(data[0])
+        if kode_idx is None or nama_idx is None:
+            print(f"[WARNING] Could not find required columns in sheet '{sheet_name}'")
+            return
+        
+        total = 0
+        invalid_count = 0
+        invalid_samples = []
+        records = []
+        
+        def parsed(records):
+            # Nilai mentah dikonversi sekaligus per chunk; sel kosong/gagal dibuang
+            nonlocal invalid_count
+            raw = [record['value'] for record in records]
+            values, invalid = parse_numbers(raw, DECIMAL)
+            invalid_count += int(invalid.sum())
+            invalid_samples.extend(value for value, bad in zip(raw, invalid) if bad)
+            del invalid_samples[5:]
+            kept = []
+            for record, value in zip(records, values.tolist()):
+                if not math.isnan(value):
+                    record['value'] = value
+                    kept.append(record)
+            return kept
+        
+        try:
+            for row in data[1:]:
                 if len(row) <= max(kode_idx, nama_idx):
                     continue
                 
-                kode = str(row[kode_idx]).strip() if kode_idx < len(row) else ""
-                nama = str(row[nama_idx]).strip() if nama_idx < len(row) else ""
+                kode = str(row[kode_idx]).strip()
+                nama = str(row[nama_idx]).strip()
                 flag = str(row[flag_idx]).strip() if flag_idx and flag_idx < len(row) else ""
                 
                 # Skip jika kode atau nama kosong
@@ -5085,44 +2564,57 @@ class InflasiService:
                 # Process monthly values
                 for month, col_idx in month_cols.items():
                     if col_idx < len(row):
-                        value_str = str(row[col_idx]).strip()
-                        try:
-                            # Replace comma with dot for decimal
-                            value_str = value_str.replace(',', '.')
-                            value = float(value_str) if value_str and value_str != '' else None
-                        except (ValueError, AttributeError):
-                            value = None
-                        
-                        if value is not None:
-                            records.append({
-                                'commodity_code': kode,
-                                'commodity_name': nama,
-                                'flag': flag if flag else None,
-                                'year': year,
-                                'month': month,
-                                'value': value
-                            })
-            
-            if records:
-                df = pd.DataFrame(records)
-                print(f"[OK] Sheet '{sheet_name}' processed. Total records: {len(df)}")
-                return df
-            else:
-                print(f"[WARNING] No valid records found in sheet '{sheet_name}'")
-                return pd.DataFrame()
+                        records.append({
+                            'commodity_code': kode,
+                            'commodity_name': nama,
+                            'flag': flag if flag else None,
+                            'year': year,
+                            'month': month,
+                            'value': row[col_idx]
+                        })
                 
+                if len(records) >= chunk_size:
+                    chunk = parsed(records)
+                    records = []
+                    if chunk:
+                        total += len(chunk)
+                        yield chunk
+            
+            chunk = parsed(records)
+            records = []
+            if chunk:
+                total += len(chunk)
+                yield chunk
         except Exception as e:
             logger.error(f"Error fetching data from sheet '{sheet_name}': {e}")
             print(f"[ERROR] {e}")
+            raise
+        
+        if invalid_count:
+            print(f"[WARNING] Inflasi {sheet_name}: {invalid_count} sel tidak bisa dikonversi ke angka, contoh: {invalid_samples}")
+        if total:
+            print(f"[OK] Sheet '{sheet_name}' processed. Total records: {total}")
+        else:
+            print(f"[WARNING] No valid records found in sheet '{sheet_name}'")
+    
+    @staticmethod
+    def fetch_inflasi_perkom_data(sheet_name):
+        """
+        Mengambil seluruh data sheet "Inflasi_perkom_YYYY" sebagai satu DataFrame.
+        Sync memakai iter_inflasi_perkom_chunks() supaya memori tidak tumbuh
+        dengan ukuran sheet; fungsi ini untuk pemakaian ad-hoc.
+        """
+        try:
+            records = [record for chunk in InflasiService.iter_inflasi_perkom_chunks(sheet_name) for record in chunk]
+        except Exception:
             return pd.DataFrame()
+        return pd.DataFrame(records)
     
     @staticmethod
     def find_perkom_sheets():
         """Mencari semua sheet dengan pattern 'Inflasi_perkom_YYYY'."""
         try:
-            client = InflasiService.get_client()
-            spreadsheet = client.open_by_key(InflasiService.SHEET_ID)
-            all_sheets = spreadsheet.worksheets()
+            all_sheets = sheets_registry.worksheets(InflasiService.SHEET_ID)
             
             perkom_sheets = []
             pattern = re.compile(r'Inflasi_perkom_(\d{4})', re.IGNORECASE)
@@ -5139,110 +2631,91 @@ class InflasiService:
             print(f"[ERROR] {e}")
             return []
     
+    @staticmethod
+    def perkom_year(sheet_name):
+        """Tahun dari judul sheet perkom (mis. "Inflasi_perkom_2025" -> 2025)."""
+        return int(re.search(r'(\d{4})', sheet_name).group(1))
+    
+    @classmethod
+    def perkom_closed_at(cls, sheet_name, perkom_sheets):
+        """
+        Waktu sheet perkom dianggap ditutup (lihat run_sheet_sync closed_at): akhir
+        tahunnya + PERKOM_CLOSE_GRACE_DAYS. None untuk sheet tahun terbaru, yang
+        selalu dibaca walaupun tahunnya sudah lewat (sheet tahun baru belum dibuat).
+        """
+        year = cls.perkom_year(sheet_name)
+        if year >= max(cls.perkom_year(name) for name in perkom_sheets):
+            return None
+        return timezone.make_aware(datetime(year + 1, 1, 1)) + timedelta(days=cls.PERKOM_CLOSE_GRACE_DAYS)
+    
+    @classmethod
+    def worksheet_names(cls):
+        """
+        Judul worksheet yang dibaca service ini: sheet 'Inflasi' dan sheet perkom
+        yang belum ditutup atau sudah waktunya dicek ulang.
+        """
+        perkom_sheets = cls.find_perkom_sheets()
+        return ["Inflasi"] + [
+            sheet_name for sheet_name in perkom_sheets
+            if frozen_state(cls.SHEET_ID, sheet_name, cls.perkom_closed_at(sheet_name, perkom_sheets)) is None
+        ]
+    
     @staticmethod
     def save_inflasi_to_db(df):
         """Menyimpan data inflasi umum ke database."""
         if df.empty:
             print("[WARNING] No Inflasi data to save.")
-            return 0, 0
-        
-        created_count = 0
-        updated_count = 0
-        
-        for index, row in df.iterrows():
-            year = int(row['year']) if pd.notna(row['year']) else None
-            month = row['month'] if pd.notna(row['month']) else None
-            
-            if not year or not month:
-                continue
-            
-            data_to_serialize = {
-                'year': year,
-                'month': month,
-                'bulanan': float(row['bulanan']) if pd.notna(row.get('bulanan')) else None,
-                'kumulatif': float(row['kumulatif']) if pd.notna(row.get('kumulatif')) else None,
-                'yoy': float(row['yoy']) if pd.notna(row.get('yoy')) else None,
-            }
-            
-            try:
-                instance = Inflasi.objects.get(year=year, month=month)
-            except Inflasi.DoesNotExist:
-                instance = None
-            
-            serializer = InflasiSerializer(instance=instance, data=data_to_serialize)
-            
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saving Inflasi for {year}-{month}: {serializer.errors}")
-        
-        print(f"[INFO] Inflasi records: {created_count} created, {updated_count} updated")
-        return created_count, updated_count
+            return 0, 0, 0
+        
+        records = pd.DataFrame({
+            'year': df['year'],
+            'month': df['month'],
+            'bulanan': numeric_values(df, 'bulanan'),
+            'kumulatif': numeric_values(df, 'kumulatif'),
+            'yoy': numeric_values(df, 'yoy'),
+        })
+        records = drop_blank_rows(records, ['year', 'month'])
+        
+        created_count, updated_count, unchanged_count = bulk_upsert(Inflasi, records, label="Inflasi")
+        print(f"[INFO] Inflasi records: {created_count} created, {updated_count} updated, {unchanged_count} unchanged")
+        return created_count, updated_count, unchanged_count
+    
+    @staticmethod
+    def save_inflasi_perkom_chunk(records):
+        """Menyimpan satu chunk dari iter_inflasi_perkom_chunks() ke database."""
+        # IMPORTANT: 'flag' termasuk natural key karena commodity_code yang sama
+        # bisa muncul dengan flag berbeda (mis. kode "11" dengan Flag 1 dan Flag 2)
+        return bulk_upsert(InflasiPerKomoditas, records, label="InflasiPerKomoditas")
     
     @staticmethod
     def save_inflasi_perkom_to_db(df):
         """Menyimpan data inflasi per komoditas ke database."""
         if df.empty:
             print("[WARNING] No InflasiPerKomoditas data to save.")
-            return 0, 0
-        
-        created_count = 0
-        updated_count = 0
-        
-        for index, row in df.iterrows():
-            commodity_code = str(row['commodity_code']).strip()
-            year = int(row['year']) if pd.notna(row['year']) else None
-            month = row['month'] if pd.notna(row['month']) else None
-            
-            if not commodity_code or not year or not month:
-                continue
-            
-            data_to_serialize = {
-                'commodity_code': commodity_code,
-                'commodity_name': str(row['commodity_name']).strip(),
-                'flag': str(row['flag']).strip() if pd.notna(row.get('flag')) else None,
-                'year': year,
-                'month': month,
-                'value': float(row['value']) if pd.notna(row.get('value')) else None,
-            }
-            
-            # IMPORTANT: Include 'flag' in the query because same commodity_code 
-            # can exist with different flags (e.g., code "11" can be Flag 1 or Flag 2)
-            flag_value = data_to_serialize.get('flag')
-            try:
-                instance = InflasiPerKomoditas.objects.get(
-                    commodity_code=commodity_code,
-                    flag=flag_value,
-                    year=year,
-                    month=month
-                )
-            except InflasiPerKomoditas.DoesNotExist:
-                instance = None
-            
-            serializer = InflasiPerKomoditasSerializer(instance=instance, data=data_to_serialize)
-            
-            if serializer.is_valid():
-                serializer.save()
-                if instance is None:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            else:
-                print(f"[ERROR] Error saving InflasiPerKomoditas for {commodity_code}-{year}-{month}: {serializer.errors}")
-        
-        print(f"[INFO] InflasiPerKomoditas records: {created_count} created, {updated_count} updated")
-        return created_count, updated_count
+            return 0, 0, 0
+        
+        records = pd.DataFrame({
+            'commodity_code': df['commodity_code'].astype(str).str.strip(),
+            'commodity_name': df['commodity_name'].astype(str).str.strip(),
+            # 'flag' termasuk natural key: commodity_code yang sama bisa muncul dengan flag berbeda
+            'flag': text_values(df['flag']) if 'flag' in df.columns else None,
+            'year': df['year'],
+            'month': df['month'],
+            'value': numeric_values(df, 'value'),
+        })
+        records = drop_blank_rows(records, ['commodity_code', 'year', 'month'])
+        
+        created_count, updated_count, unchanged_count = bulk_upsert(InflasiPerKomoditas, records, label="InflasiPerKomoditas")
+        print(f"[INFO] InflasiPerKomoditas records: {created_count} created, {updated_count} updated, {unchanged_count} unchanged")
+        return created_count, updated_count, unchanged_count
     
     @classmethod
     def sync_all_inflasi(cls):
         """
         Fungsi utama untuk sinkronisasi semua data inflasi.
         - Mengambil data dari sheet "Inflasi"
-        - Mengambil data dari semua sheet "Inflasi_perkom_YYYY" yang ditemukan
+        - Mengambil data dari semua sheet "Inflasi_perkom_YYYY" yang ditemukan; sheet tahun
+          yang sudah ditutup (perkom_closed_at) hanya dibaca saat dicek ulang berkala
         - Menyimpan semua data ke database
         """
         print("\n" + "="*60)
@@ -5253,31 +2726,36 @@ class InflasiService:
         
         # 1. Sync data Inflasi umum
         print("[PROCESSING] Sheet 'Inflasi'...")
-        df_inflasi = cls.fetch_inflasi_data()
-        if not df_inflasi.empty:
-            created, updated = cls.save_inflasi_to_db(df_inflasi)
-            results['Inflasi'] = {'created': created, 'updated': updated}
-        else:
+        created, updated, unchanged = run_sheet_sync(
+            cls.SHEET_ID, "Inflasi", Inflasi.objects.all(),
+            fetch=cls.fetch_inflasi_data, save=cls.save_inflasi_to_db,
+        )
+        if created + updated + unchanged == 0:
             print("[WARNING] No data found for 'Inflasi' sheet")
-            results['Inflasi'] = {'created': 0, 'updated': 0}
+        results['Inflasi'] = {'created': created, 'updated': updated, 'unchanged': unchanged}
         
         # 2. Sync data Inflasi per komoditas
         perkom_sheets = cls.find_perkom_sheets()
         for sheet_name in perkom_sheets:
             print(f"\n[PROCESSING] Sheet '{sheet_name}'...")
-            df_perkom = cls.fetch_inflasi_perkom_data(sheet_name)
-            if not df_perkom.empty:
-                created, updated = cls.save_inflasi_perkom_to_db(df_perkom)
-                results[sheet_name] = {'created': created, 'updated': updated}
-            else:
+            year = cls.perkom_year(sheet_name)
+            created, updated, unchanged = run_sheet_sync(
+                cls.SHEET_ID, sheet_name, InflasiPerKomoditas.objects.filter(year=year),
+                fetch=lambda: cls.iter_inflasi_perkom_chunks(sheet_name),
+                save=cls.save_inflasi_perkom_chunk,
+                stream=True,
+                closed_at=cls.perkom_closed_at(sheet_name, perkom_sheets),
+            )
+            print(f"[INFO] InflasiPerKomoditas records: {created} created, {updated} updated, {unchanged} unchanged")
+            if created + updated + unchanged == 0:
                 print(f"[WARNING] No data found for '{sheet_name}'")
-                results[sheet_name] = {'created': 0, 'updated': 0}
+            results[sheet_name] = {'created': created, 'updated': updated, 'unchanged': unchanged}
         
         print("\n" + "="*60)
         print("INFLASI SYNC COMPLETE - SUMMARY")
         print("="*60)
         for sheet_name, counts in results.items():
-            print(f"{sheet_name}: {counts['created']} created, {counts['updated']} updated")
+            print(f"{sheet_name}: {counts['created']} created, {counts['updated']} updated, {counts['unchanged']} unchanged")
         print("="*60 + "\n")
         
         return results
\ No newline at end of file
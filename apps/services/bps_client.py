@@ -0,0 +1,230 @@
+"""
+Client Web API BPS (webapi.bps.go.id) yang dipakai bersama oleh service News,
+Publication dan Infographic.
+
+Sebelumnya setiap fetch_* memanggil requests.get() tanpa Session dan tanpa
+timeout, lalu mengambil halaman 2..N satu per satu. Client ini memakai satu
+requests.Session dengan connection pool (keep-alive) dan retry + backoff,
+membaca jumlah halaman dari respons pertama, lalu mengambil sisa halaman
+secara bersamaan di thread pool dengan batas laju request. Urutan item tetap
+mengikuti urutan halaman.
+"""
+import contextvars
+import logging
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from apps.services.data_source import REPLAY, RECORD, current_source
+
+logger = logging.getLogger(__name__)
+
+BPS_API_BASE_URL = "https://webapi.bps.go.id/v1/api"
+# Domain BPS Kota Surabaya
+BPS_DOMAIN = "3578"
+
+
+class RateLimiter:
+    """Membatasi laju request (per detik) dari semua thread yang memakai client yang sama."""
+
+    def __init__(self, per_second):
+        self.interval = 1.0 / per_second if per_second and per_second > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class BPSClient:
+    """
+    Thread-safe client untuk endpoint list Web API BPS.
+
+    - Satu requests.Session per proses; koneksi HTTPS dipakai ulang (keep-alive).
+    - Request GET di-retry dengan exponential backoff untuk error koneksi dan
+      status 429/5xx (header Retry-After dihormati).
+    - Semua request punya timeout (connect, read).
+    """
+
+    TIMEOUT = getattr(settings, 'BPS_API_TIMEOUT', (5, 30))
+    WORKERS = getattr(settings, 'BPS_API_WORKERS', 8)
+    RATE_LIMIT = getattr(settings, 'BPS_API_RATE_LIMIT', 10)    # request per detik, 0 = tanpa batas
+    RETRIES = getattr(settings, 'BPS_API_RETRIES', 3)
+    BACKOFF_FACTOR = 0.5
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, base_url=BPS_API_BASE_URL, domain=BPS_DOMAIN):
+        self.base_url = base_url
+        self.domain = domain
+        self._lock = threading.Lock()
+        self._session = None
+        self._limiter = RateLimiter(self.RATE_LIMIT)
+        self._stats = {'requests': 0, 'pages': 0, 'seconds': 0.0}
+        self._bytes = defaultdict(int)
+
+    def _create_session(self):
+        retry = Retry(
+            total=self.RETRIES,
+            backoff_factor=self.BACKOFF_FACTOR,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, self.WORKERS), max_retries=retry)
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    @property
+    def session(self):
+        with self._lock:
+            if self._session is None:
+                self._session = self._create_session()
+            return self._session
+
+    def list_url(self, model):
+        return f"{self.base_url}/list/model/{model}/lang/ind/domain/{self.domain}/key/{settings.API_KEY}/"
+
+    def get_page(self, model, page):
+        """
+        Mengambil satu halaman endpoint list dan mengembalikan JSON-nya.
+        Pada mode replay halaman dibaca dari snapshot, pada mode record juga disimpan ke sana.
+        """
+        source = current_source()
+        if source.mode == REPLAY:
+            payload = source.store.read_page(self.domain, model, page)
+            with self._lock:
+                self._stats['requests'] += 1
+                self._bytes[model] += source.store.page_size(self.domain, model, page)
+            return payload
+
+        self._limiter.wait()
+        response = self.session.get(self.list_url(model), params={'page': page}, timeout=self.TIMEOUT)
+        with self._lock:
+            self._stats['requests'] += 1
+            self._bytes[model] += len(response.content)
+        response.raise_for_status()
+        payload = response.json()
+        if source.mode == RECORD:
+            source.store.write_page(self.domain, model, page, payload)
+        return payload
+
+    @staticmethod
+    def page_items(payload):
+        """Daftar item dari respons list BPS (data[1]), kosong bila tidak ada."""
+        data = payload.get('data') if isinstance(payload, dict) else None
+        if isinstance(data, list) and len(data) > 1 and isinstance(data[1], list):
+            return data[1]
+        return []
+
+    @staticmethod
+    def total_pages(model, payload):
+        """Jumlah halaman dari respons halaman 1 (data[0]['pages']), None bila respons tidak berisi data."""
+        data = payload.get('data') if isinstance(payload, dict) else None
+        if not isinstance(data, list) or not data or not isinstance(data[0], dict):
+            logger.warning(f"Respons API BPS untuk '{model}' tidak berisi data: {payload}")
+            return None
+        return int(data[0].get('pages') or 1)
+
+    def fetch_all_pages(self, model, workers=None):
+        """
+        Mengambil semua halaman endpoint list untuk `model` (news, publication, infographic).
+
+        Halaman 1 diambil lebih dulu untuk membaca jumlah halaman; halaman 2..N
+        diambil bersamaan oleh `workers` thread. Item dikembalikan dalam urutan
+        halaman, sama seperti loop serial sebelumnya.
+        """
+        started = time.perf_counter()
+        first_page = self.get_page(model, 1)
+        total_pages = self.total_pages(model, first_page)
+        if total_pages is None:
+            return []
+
+        items = list(self.page_items(first_page))
+        remaining = range(2, total_pages + 1)
+        workers = max(1, min(workers or self.WORKERS, len(remaining) or 1))
+
+        if remaining:
+            print(f"📡 Fetching {len(remaining)} halaman {model} lagi dengan {workers} worker ...")
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='bps') as executor:
+                # Context disalin per halaman supaya thread worker memakai sumber data
+                # (use_source) yang sama; hasil dibaca sesuai urutan halaman, bukan urutan selesai
+                futures = [
+                    executor.submit(contextvars.copy_context().run, self.get_page, model, page)
+                    for page in remaining
+                ]
+                for future in futures:
+                    items.extend(self.page_items(future.result()))
+
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._stats['pages'] += total_pages
+            self._stats['seconds'] += elapsed
+        logger.info(f"BPS {model}: {total_pages} halaman, {len(items)} item dalam {elapsed:.1f} detik")
+        return items
+
+    def fetch_new_pages(self, model, reached_known):
+        """
+        Mengambil halaman terbaru dulu, berhenti setelah halaman yang berisi item lama.
+
+        Daftar BPS diurutkan dari yang terbaru, jadi begitu satu halaman memuat
+        item yang sudah pernah disimpan, halaman berikutnya hanya berisi item
+        lama. reached_known(items) menentukan apakah halaman itu sudah mencapai
+        item lama. Returns (items, jumlah halaman yang diambil).
+        """
+        started = time.perf_counter()
+        items = []
+        page = 1
+        total_pages = 1
+        while page <= total_pages:
+            payload = self.get_page(model, page)
+            if page == 1:
+                total_pages = self.total_pages(model, payload)
+                if total_pages is None:
+                    return [], 1
+
+            page_items = self.page_items(payload)
+            items.extend(page_items)
+            if not page_items or reached_known(page_items):
+                break
+            page += 1
+
+        pages = min(page, total_pages)
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._stats['pages'] += pages
+            self._stats['seconds'] += elapsed
+        logger.info(f"BPS {model} (incremental): {pages}/{total_pages} halaman, {len(items)} item dalam {elapsed:.1f} detik")
+        return items, pages
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats)
+
+    def bytes_read(self, model):
+        """Total byte respons yang sudah dibaca untuk `model` sejak proses dimulai."""
+        with self._lock:
+            return self._bytes[model]
+
+    def report(self):
+        """Ringkasan satu baris untuk output sync_data/log."""
+        stats = self.stats()
+        return f"{stats['pages']} halaman, {stats['requests']} request, {stats['seconds']:.1f} detik"
+
+
+# Instance tunggal per proses
+bps_client = BPSClient()
@@ -0,0 +1,309 @@
+"""
+Writer bulk upsert generik untuk fungsi save_*_to_db.
+
+Sebelumnya setiap baris DataFrame diproses dengan .objects.get(), validasi
+serializer (yang juga mengecek unique_together ke DB) lalu INSERT/UPDATE
+sendiri-sendiri, di luar transaksi: minimal tiga query per baris. bulk_upsert()
+memvalidasi semua baris di memori dengan field model, lalu menulis per batch
+dengan satu SELECT untuk baris yang sudah ada dan satu
+bulk_create(update_conflicts=True), semuanya di dalam satu transaksi.
+
+Baris yang sudah ada dibandingkan dulu di memori (diff), sehingga hanya baris
+baru dan baris yang nilainya berubah yang ditulis; sync harian yang datanya
+hampir tidak berubah praktis tidak menulis apa pun.
+
+Selama LoadSession aktif di thread ini (mode load 'staging', lihat
+apps.services.staged_load), baris baru/berubah ditulis ke tabel staging dan
+baru digabung ke tabel live saat dataset selesai.
+
+Setiap kali ada baris baru/berubah, versi dataset model itu dinaikkan
+(view_cache.bump_versions) sehingga context halaman yang di-cache dibangun ulang.
+"""
+import logging
+import threading
+from contextlib import contextmanager, nullcontext
+from decimal import Decimal
+from functools import partial
+
+import pandas as pd
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import connections, models, router, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.services.db_lock import write_lock
+from apps.services.view_cache import bump_versions
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = getattr(settings, 'SYNC_BULK_BATCH_SIZE', 500)
+
+_load_session = threading.local()
+
+
+def current_load_session():
+    """LoadSession (staged_load) yang aktif di thread ini, atau None."""
+    return getattr(_load_session, 'session', None)
+
+
+@contextmanager
+def bind_load_session(session):
+    previous = current_load_session()
+    _load_session.session = session
+    try:
+        yield session
+    finally:
+        _load_session.session = previous
+
+
+def after_load(callback, using):
+    """
+    Menjalankan callback() (tulisan yang harus satu transaksi dengan data dataset,
+    mis. SyncState) dengan write lock. Selama LoadSession aktif, callback ditunda dan
+    dijalankan di transaksi yang sama dengan penggabungan staging ke tabel live.
+    """
+    session = current_load_session()
+    if session is not None:
+        session.defer(callback, using)
+        return
+    with write_lock(using):
+        callback()
+
+
+def natural_key_fields(model):
+    """
+    Field natural key model: unique_together pertama, atau field unique selain primary key.
+    ForeignKey dikembalikan sebagai attname (region -> region_id), sama dengan kolom records.
+    """
+    if model._meta.unique_together:
+        return [model._meta.get_field(name).attname for name in model._meta.unique_together[0]]
+    for field in model._meta.concrete_fields:
+        if field.unique and not field.primary_key:
+            return [field.attname]
+    raise ValueError(f"{model.__name__} tidak punya unique_together/field unique; berikan unique_fields")
+
+
+def has_unique_constraint(model, unique_fields):
+    """True bila kombinasi unique_fields dijamin unik oleh database (syarat ON CONFLICT)."""
+    def attnames(names):
+        return {model._meta.get_field(name).attname for name in names}
+
+    names = attnames(unique_fields)
+    if len(names) == 1 and model._meta.get_field(next(iter(names))).unique:
+        return True
+    if any(attnames(together) == names for together in model._meta.unique_together):
+        return True
+    return any(attnames(constraint.fields) == names for constraint in model._meta.total_unique_constraints)
+
+
+def clean_record(model, record):
+    """
+    Validasi satu baris dengan field model (pengganti serializer.is_valid()).
+    Returns (cleaned, errors); errors kosong bila baris valid.
+    """
+    cleaned = {}
+    errors = {}
+    for name, value in record.items():
+        field = model._meta.get_field(name)
+        if field.is_relation:
+            # ForeignKey diisi id yang sudah di-resolve pemanggil (mis. region_id);
+            # field.clean() akan mengecek keberadaannya dengan satu query per baris
+            cleaned[name] = None if value is None else field.target_field.to_python(value)
+            continue
+        if isinstance(value, str) and isinstance(field, (models.CharField, models.TextField)):
+            # Sama seperti CharField DRF (trim_whitespace=True)
+            value = value.strip()
+        elif isinstance(value, float) and isinstance(field, models.DecimalField):
+            # Sama seperti DecimalField DRF: float dikonversi lewat str, bukan binary float
+            value = Decimal(str(value))
+        try:
+            cleaned[name] = field.clean(value, None)
+        except ValidationError as e:
+            errors[name] = e.messages
+    return cleaned, errors
+
+
+def text_values(series):
+    """Kolom teks yang di-strip; NaN tetap NaN (bukan string 'nan')."""
+    return series.where(series.isna(), series.astype(str).str.strip())
+
+
+def numeric_values(df, column):
+    """Kolom df sebagai float (nilai tak valid -> NaN); semua NaN bila kolomnya tidak ada."""
+    if column not in df.columns:
+        return pd.Series(index=df.index, dtype=float)
+    return pd.to_numeric(df[column], errors='coerce')
+
+
+def drop_blank_rows(frame, fields):
+    """
+    Buang baris yang salah satu `fields`-nya kosong (NaN, '' atau 0), pengganti
+    `if not year or not month: continue` di loop iterrows() lama.
+    """
+    keep = pd.Series(True, index=frame.index)
+    for name in fields:
+        values = frame[name]
+        keep &= values.notna() & (values != '') & (values != 0)
+    return frame[keep]
+
+
+def _batches(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _existing_rows(model, keys, unique_fields, compare_fields, using):
+    """Mengembalikan {key: (pk, {field: nilai})} untuk key yang sudah ada di database (satu SELECT)."""
+    query = Q()
+    for i, name in enumerate(unique_fields):
+        values = {key[i] for key in keys if key[i] is not None}
+        condition = Q(**{f'{name}__in': values}) if values else Q(pk__in=[])
+        if any(key[i] is None for key in keys):
+            # NULL tidak cocok dengan IN (...), sama seperti .get(flag=None) di loop lama
+            condition |= Q(**{f'{name}__isnull': True})
+        query &= condition
+
+    found = {}
+    rows = model.objects.using(using).filter(query).values_list('pk', *unique_fields, *compare_fields)
+    key_len = len(unique_fields)
+    for pk, *values in rows:
+        key = tuple(values[:key_len])
+        found.setdefault(key, (pk, dict(zip(compare_fields, values[key_len:]))))
+    return {key: found[key] for key in keys if key in found}
+
+
+def _is_changed(cleaned, current, compare_fields):
+    # Decimal('14.5') == Decimal('14.50'), jadi nilai hasil quantize DB tidak dianggap berubah
+    return any(cleaned[name] != current[name] for name in compare_fields)
+
+
+def bulk_upsert(model, records, unique_fields=None, update_fields=None, batch_size=BATCH_SIZE, label=None):
+    """
+    Insert/update banyak baris sekaligus berdasarkan natural key model.
+    Baris yang nilainya sama persis dengan isi database tidak ditulis ulang.
+
+    Args:
+        model: class model Django.
+        records: list of dict (nama field -> nilai) atau DataFrame dengan kolom nama field.
+        unique_fields: field natural key; default unique_together model.
+        update_fields: field yang ditimpa bila key sudah ada; default semua field non-key di records.
+        batch_size: jumlah baris per batch SELECT/INSERT.
+        label: nama data untuk pesan log.
+
+    Returns:
+        (created_count, updated_count, unchanged_count). Bila satu key muncul
+        lebih dari sekali, baris terakhir yang dipakai.
+    """
+    if isinstance(records, pd.DataFrame):
+        # NaN -> None supaya kolom nullable disimpan NULL, bukan NaN
+        records = records.astype(object).where(records.notna(), None).to_dict('records')
+    if not records:
+        return 0, 0, 0
+
+    label = label or model._meta.verbose_name
+    unique_fields = list(unique_fields or natural_key_fields(model))
+
+    # 1. Validasi semua baris di memori; key duplikat -> baris terakhir menang
+    valid = {}
+    for record in records:
+        cleaned, errors = clean_record(model, record)
+        if errors:
+            key_desc = ', '.join(f"{name}={record.get(name)}" for name in unique_fields)
+            print(f"[ERROR] Error saat menyimpan {label} untuk {key_desc}: {errors}")
+            continue
+        valid[tuple(cleaned[name] for name in unique_fields)] = cleaned
+
+    if not valid:
+        return 0, 0, 0
+
+    fields = list(next(iter(valid.values())).keys())
+    if update_fields is None:
+        update_fields = [name for name in fields if name not in unique_fields]
+    compare_fields = list(update_fields)
+    auto_now_fields = [
+        field.name for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now', False) and field.name not in compare_fields
+    ]
+    update_fields = compare_fields + auto_now_fields
+
+    using = router.db_for_write(model)
+    features = connections[using].features
+    use_on_conflict = features.supports_update_conflicts and has_unique_constraint(model, unique_fields)
+
+    created_count = 0
+    updated_count = 0
+    unchanged_count = 0
+    items = list(valid.items())
+    session = current_load_session()
+    staged_keys = session.staged_keys(model) if session else {}
+
+    # 2. Per batch: 1 SELECT baris yang ada, diff di memori, lalu tulis hanya baris baru/berubah
+    # (ke tabel staging bila LoadSession aktif; tabel live tidak dikunci sama sekali)
+    with (nullcontext() if session else write_lock(using)), transaction.atomic(using=using):
+        for batch in _batches(items, batch_size):
+            now = timezone.now()
+            if session:
+                # Key yang sudah di-stage oleh chunk sebelumnya ditimpa di staging. Barisnya sudah
+                # dihitung (created atau updated) oleh chunk itu, jadi tidak dihitung dua kali
+                restaged = [(key, cleaned, None) for key, cleaned in batch if key in staged_keys]
+                batch = [(key, cleaned) for key, cleaned in batch if key not in staged_keys]
+            existing = _existing_rows(model, [key for key, _ in batch], unique_fields, compare_fields, using)
+
+            if session:
+                changes = restaged
+                for key, cleaned in batch:
+                    if key not in existing:
+                        created_count += 1
+                        changes.append((key, cleaned, None))
+                    elif _is_changed(cleaned, existing[key][1], compare_fields):
+                        updated_count += 1
+                        changes.append((key, cleaned, existing[key][0]))
+                    else:
+                        unchanged_count += 1
+                if changes:
+                    session.stage(model, using, changes, update_fields, now)
+                continue
+
+            upsert_objs, insert_objs, update_objs = [], [], []
+            for key, cleaned in batch:
+                if key in existing:
+                    pk, current = existing[key]
+                    if not _is_changed(cleaned, current, compare_fields):
+                        unchanged_count += 1
+                        continue
+                    updated_count += 1
+                else:
+                    pk = None
+                    created_count += 1
+
+                if use_on_conflict and None not in key:
+                    upsert_objs.append(model(**cleaned))
+                elif pk is not None:
+                    # Key dengan NULL (atau tanpa unique constraint) tidak bisa memakai ON CONFLICT
+                    obj = model(pk=pk, **cleaned)
+                    for name in auto_now_fields:
+                        setattr(obj, name, now)
+                    update_objs.append(obj)
+                else:
+                    insert_objs.append(model(**cleaned))
+
+            manager = model.objects.using(using)
+            if upsert_objs:
+                if update_fields:
+                    kwargs = {'update_conflicts': True, 'update_fields': update_fields}
+                    if features.supports_update_conflicts_with_target:
+                        kwargs['unique_fields'] = unique_fields
+                else:
+                    kwargs = {'ignore_conflicts': True}
+                manager.bulk_create(upsert_objs, **kwargs)
+            if insert_objs:
+                manager.bulk_create(insert_objs)
+            if update_objs and update_fields:
+                manager.bulk_update(update_objs, update_fields)
+
+    if created_count or updated_count:
+        # Context halaman yang membaca tabel ini di-cache per versi dataset (view_cache)
+        after_load(partial(bump_versions, model), using)
+
+    return created_count, updated_count, unchanged_count
@@ -0,0 +1,335 @@
+"""
+Sumber data sync yang bisa diganti: live, record, atau replay.
+
+Semua ingestion membaca Google Sheets lewat sheets_registry (gspread) dan API
+BPS lewat bps_client, sehingga sync tidak bisa diukur atau di-profile tanpa
+credentials dan jaringan. Modul ini menyisipkan satu lapisan di kedua titik itu:
+
+    live    perilaku biasa (default)
+    record  seperti live, tetapi setiap grid worksheet dan halaman API BPS yang
+            dibaca juga disimpan ke direktori snapshot
+    replay  tidak ada request jaringan; gspread client dan halaman API BPS
+            dilayani dari direktori snapshot (hasil record atau generator
+            sintetis di apps.services.synthetic_data)
+
+Service tidak perlu diubah: mereka tetap memanggil get_worksheet_values(),
+sheets_registry.worksheets() dan bps_client, yang menanyakan current_source().
+
+Layout direktori snapshot:
+
+    <dir>/sheets/<sheet_id>/index.json      {"titles": [...], "files": {title: file}}
+    <dir>/sheets/<sheet_id>/<file>.json     grid (list of list of str)
+    <dir>/bps/<domain>/<model>/page-0001.json   respons JSON endpoint list
+"""
+import contextvars
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+import gspread
+from django.conf import settings
+from gspread.utils import fill_gaps
+
+logger = logging.getLogger(__name__)
+
+LIVE = 'live'
+RECORD = 'record'
+REPLAY = 'replay'
+MODES = (LIVE, RECORD, REPLAY)
+
+DEFAULT_SNAPSHOT_DIR = Path(getattr(settings, 'BASE_DIR', '.')) / 'sync_snapshots'
+
+
+class SnapshotNotFound(LookupError):
+    """Data yang diminta tidak ada di direktori snapshot (mode replay)."""
+
+
+def _write_json(path, payload):
+    """Tulis JSON lewat file sementara supaya pembaca tidak melihat file setengah jadi."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+
+def _read_json(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def grid_file_name(title):
+    """Nama file untuk judul worksheet: aman untuk filesystem dan unik per judul."""
+    slug = re.sub(r'[^A-Za-z0-9_-]+', '_', title).strip('_')[:60] or 'sheet'
+    digest = hashlib.sha1(title.encode('utf-8')).hexdigest()[:8]
+    return f"{slug}-{digest}.json"
+
+
+def sheet_title_from_range(a1_range):
+    """Kebalikan dari sheet_prefetch.a1_sheet_range: "'It''s'!A1:B2" -> "It's"."""
+    quoted = re.match(r"'((?:[^']|'')*)'", a1_range)
+    if quoted:
+        return quoted.group(1).replace("''", "'")
+    return a1_range.split('!', 1)[0]
+
+
+class SnapshotStore:
+    """Membaca dan menulis grid worksheet dan halaman API BPS di satu direktori."""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+
+    # --- Google Sheets ---
+
+    def _sheet_dir(self, sheet_id):
+        return self.directory / 'sheets' / sheet_id
+
+    def _read_index(self, sheet_id):
+        path = self._sheet_dir(sheet_id) / 'index.json'
+        if not path.exists():
+            return {'titles': [], 'files': {}}
+        return _read_json(path)
+
+    def worksheet_titles(self, sheet_id):
+        """Judul worksheet yang grid-nya tersimpan, dalam urutan workbook."""
+        index = self._read_index(sheet_id)
+        return [title for title in index['titles'] if title in index['files']]
+
+    def has_spreadsheet(self, sheet_id):
+        return (self._sheet_dir(sheet_id) / 'index.json').exists()
+
+    def read_grid(self, sheet_id, title):
+        """Grid worksheet; raise gspread.exceptions.WorksheetNotFound seperti live."""
+        file_name = self._read_index(sheet_id)['files'].get(title)
+        if file_name is None:
+            raise gspread.exceptions.WorksheetNotFound(title)
+        return _read_json(self._sheet_dir(sheet_id) / file_name)
+
+    def write_titles(self, sheet_id, titles):
+        """Menyimpan urutan worksheet di workbook (dari Spreadsheet.worksheets())."""
+        with self._lock:
+            index = self._read_index(sheet_id)
+            index['titles'] = list(titles) + [t for t in index['titles'] if t not in titles]
+            _write_json(self._sheet_dir(sheet_id) / 'index.json', index)
+
+    def write_grid(self, sheet_id, title, grid):
+        with self._lock:
+            index = self._read_index(sheet_id)
+            file_name = index['files'].get(title) or grid_file_name(title)
+            _write_json(self._sheet_dir(sheet_id) / file_name, grid)
+            index['files'][title] = file_name
+            if title not in index['titles']:
+                index['titles'].append(title)
+            _write_json(self._sheet_dir(sheet_id) / 'index.json', index)
+
+    def write_workbook(self, sheet_id, grids):
+        """Menyimpan seluruh workbook {title: grid} sekaligus (dipakai generator sintetis)."""
+        for title, grid in grids.items():
+            self.write_grid(sheet_id, title, grid)
+        self.write_titles(sheet_id, list(grids))
+
+    # --- API BPS ---
+
+    def _page_path(self, domain, model, page):
+        return self.directory / 'bps' / domain / model / f"page-{page:04d}.json"
+
+    def read_page(self, domain, model, page):
+        path = self._page_path(domain, model, page)
+        if not path.exists():
+            raise SnapshotNotFound(f"Halaman {page} '{model}' tidak ada di snapshot {self.directory}")
+        return _read_json(path)
+
+    def page_size(self, domain, model, page):
+        return self._page_path(domain, model, page).stat().st_size
+
+    def write_page(self, domain, model, page, payload):
+        _write_json(self._page_path(domain, model, page), payload)
+
+    def summary(self):
+        """Ringkasan isi snapshot untuk output command."""
+        sheets_dir = self.directory / 'sheets'
+        bps_dir = self.directory / 'bps'
+        worksheets = sum(len(self.worksheet_titles(d.name)) for d in sheets_dir.iterdir()) if sheets_dir.exists() else 0
+        pages = len(list(bps_dir.glob('*/*/page-*.json'))) if bps_dir.exists() else 0
+        return f"{worksheets} worksheet, {pages} halaman API BPS"
+
+
+# --- gspread client untuk mode replay ---
+
+class ReplayWorksheet:
+    """Pengganti gspread.Worksheet yang membaca grid dari snapshot."""
+
+    def __init__(self, store, sheet_id, title):
+        self._store = store
+        self._sheet_id = sheet_id
+        self.title = title
+
+    def get_all_values(self):
+        return self._store.read_grid(self._sheet_id, self.title)
+
+
+class ReplaySpreadsheet:
+    """Pengganti gspread.Spreadsheet: worksheets(), worksheet() dan values_batch_get()."""
+
+    def __init__(self, store, sheet_id):
+        self._store = store
+        self.id = sheet_id
+
+    def worksheets(self):
+        return [ReplayWorksheet(self._store, self.id, title) for title in self._store.worksheet_titles(self.id)]
+
+    def worksheet(self, title):
+        if title not in self._store.worksheet_titles(self.id):
+            raise gspread.exceptions.WorksheetNotFound(title)
+        return ReplayWorksheet(self._store, self.id, title)
+
+    def values_batch_get(self, ranges, params=None):
+        value_ranges = []
+        for a1_range in ranges:
+            grid = self._store.read_grid(self.id, sheet_title_from_range(a1_range))
+            value_ranges.append({'range': a1_range, 'majorDimension': 'ROWS', 'values': grid})
+        return {'spreadsheetId': self.id, 'valueRanges': value_ranges}
+
+
+class ReplayClient:
+    """Pengganti client hasil gspread.authorize(); tidak butuh credentials."""
+
+    def __init__(self, store):
+        self._store = store
+
+    def open_by_key(self, key):
+        if not self._store.has_spreadsheet(key):
+            raise gspread.exceptions.SpreadsheetNotFound(key)
+        return ReplaySpreadsheet(self._store, key)
+
+
+# --- gspread client untuk mode record ---
+
+class _RecordingProxy:
+    """Meneruskan semua atribut ke objek gspread asli."""
+
+    def __init__(self, wrapped, store):
+        self._wrapped = wrapped
+        self._store = store
+
+    def __getattr__(self, name):
+        return getattr(self._wrapped, name)
+
+
+class RecordingWorksheet(_RecordingProxy):
+    def __init__(self, wrapped, store, sheet_id):
+        super().__init__(wrapped, store)
+        self._sheet_id = sheet_id
+
+    def get_all_values(self, *args, **kwargs):
+        grid = self._wrapped.get_all_values(*args, **kwargs)
+        if not args and not kwargs:
+            self._store.write_grid(self._sheet_id, self._wrapped.title, grid)
+        return grid
+
+
+class RecordingSpreadsheet(_RecordingProxy):
+    def __init__(self, wrapped, store, sheet_id):
+        super().__init__(wrapped, store)
+        self._sheet_id = sheet_id
+
+    def worksheets(self, *args, **kwargs):
+        worksheets = self._wrapped.worksheets(*args, **kwargs)
+        self._store.write_titles(self._sheet_id, [ws.title for ws in worksheets])
+        return [RecordingWorksheet(ws, self._store, self._sheet_id) for ws in worksheets]
+
+    def worksheet(self, title):
+        return RecordingWorksheet(self._wrapped.worksheet(title), self._store, self._sheet_id)
+
+    def values_batch_get(self, ranges, params=None, **kwargs):
+        response = self._wrapped.values_batch_get(ranges, params=params, **kwargs)
+        for a1_range, value_range in zip(ranges, response.get('valueRanges', [])):
+            # Disimpan dalam bentuk yang sama dengan get_all_values() (baris di-pad dengan '')
+            grid = fill_gaps(value_range.get('values', []))
+            self._store.write_grid(self._sheet_id, sheet_title_from_range(a1_range), [] if grid == [[]] else grid)
+        return response
+
+
+class RecordingClient(_RecordingProxy):
+    def open_by_key(self, key):
+        return RecordingSpreadsheet(self._wrapped.open_by_key(key), self._store, key)
+
+
+class DataSource:
+    """Mode sumber data aktif beserta direktori snapshot-nya."""
+
+    def __init__(self, mode=LIVE, directory=None):
+        if mode not in MODES:
+            raise ValueError(f"Mode sumber data tidak dikenal: {mode}")
+        self.mode = mode
+        self.directory = Path(directory) if directory else DEFAULT_SNAPSHOT_DIR
+        self.store = SnapshotStore(self.directory) if mode != LIVE else None
+
+    @property
+    def offline(self):
+        return self.mode == REPLAY
+
+    def sheets_client(self, authorize):
+        """
+        Client gspread untuk mode ini. authorize() membuat client live
+        (credentials + gspread.authorize) dan tidak dipanggil saat replay.
+        """
+        if self.mode == REPLAY:
+            return ReplayClient(self.store)
+        client = authorize()
+        if self.mode == RECORD:
+            return RecordingClient(client, self.store)
+        return client
+
+    def describe(self):
+        if self.mode == LIVE:
+            return 'live (Google Sheets + API BPS)'
+        action = 'direkam ke' if self.mode == RECORD else 'replay dari'
+        return f"{self.mode}: {action} {self.directory}"
+
+
+_source_lock = threading.Lock()
+_default_source = None
+# Per context (thread / task run_tasks()), bukan per proses: use_source() di satu sync
+# (mis. sync_data --source replay) tidak ikut mengubah sumber sync lain yang berjalan
+# bersamaan di proses yang sama (scheduler, worker job)
+_active_source = contextvars.ContextVar('data_source', default=None)
+
+
+def default_source():
+    """Sumber dari settings DATA_SOURCE_MODE / DATA_SOURCE_DIR (default live)."""
+    global _default_source
+    with _source_lock:
+        if _default_source is None:
+            _default_source = DataSource(
+                getattr(settings, 'DATA_SOURCE_MODE', LIVE),
+                getattr(settings, 'DATA_SOURCE_DIR', None),
+            )
+        return _default_source
+
+
+def current_source():
+    """Sumber data yang aktif di context ini: dari use_source(), atau default_source()."""
+    source = _active_source.get()
+    return source if source is not None else default_source()
+
+
+@contextmanager
+def use_source(mode, directory=None):
+    """
+    Selama context aktif, sheets_registry dan bps_client memakai mode ini di thread
+    ini dan di task yang menyalin context-nya (contextvars.copy_context()).
+    Client gspread yang dibuat untuk sumber lain otomatis dibuat ulang.
+    """
+    source = DataSource(mode, directory)
+    token = _active_source.set(source)
+    try:
+        yield source
+    finally:
+        _active_source.reset(token)
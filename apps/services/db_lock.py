@@ -0,0 +1,22 @@
+"""
+Write lock antar thread untuk database SQLite.
+
+Dipisah dari bulk_writer supaya kode yang hanya perlu lock (view, antrian job,
+snapshot indikator) tidak ikut memuat pandas di proses web.
+"""
+import threading
+from contextlib import contextmanager, nullcontext
+
+from django.db import connections
+
+# SQLite hanya mengizinkan satu writer; sync paralel (sync_data --workers) antre di sini
+# alih-alih gagal dengan "database is locked". Database lain tidak dikunci.
+_sqlite_write_lock = threading.Lock()
+
+
+@contextmanager
+def write_lock(using):
+    """Serialisasi penulisan antar thread bila database-nya SQLite."""
+    lock = _sqlite_write_lock if connections[using].vendor == 'sqlite' else nullcontext()
+    with lock:
+        yield
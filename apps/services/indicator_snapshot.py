@@ -0,0 +1,385 @@
+"""
+Snapshot indikator dashboard (tabel IndicatorSnapshot).
+
+Kartu carousel dashboard membutuhkan nilai terbaru dan sebelumnya dari ±30 seri
+(inflasi, PDRB, IPM, gini, ketenagakerjaan, ...). Sebelumnya dashboard()
+membaca seluruh isi tabel-tabel tersebut, memfilter 'SURABAYA' / 'TOTAL' di
+Python dan menghitung perubahan pada setiap page view. Sekarang perhitungan itu
+dijalankan sekali di akhir setiap sync (rebuild_snapshots(), dipanggil
+track_run) dan hasilnya disimpan satu baris per kartu; dashboard cukup
+membaca IndicatorSnapshot dengan satu query terurut (dashboard_indicators()).
+
+Snapshot menyimpan versi dataset (view_cache.dataset_versions) tabel sumbernya.
+Tulisan di luar sync (admin, ViewSet, endpoint API) menaikkan versi itu lewat
+signal, sehingga dashboard_indicators() yang melihat versi berbeda membangun
+ulang snapshot alih-alih menampilkan angka lama sampai sync berikutnya.
+
+Setiap tabel sumber dibaca satu kali per rebuild (tabel PDRB bahkan hanya baris
+TOTAL periode terbaru dan sebelumnya, disaring di database); aturan pemilihan
+periode dan perhitungan perubahan sama dengan yang dulu ada di dashboard().
+"""
+import logging
+
+from django.db import DatabaseError, router, transaction
+from django.db.models import Case, Q, Value, When
+
+from apps.models import (
+    GiniRatio, HotelOccupancyCombined, HotelOccupancyYearly, HumanDevelopmentIndex, IndicatorSnapshot, Inflasi,
+    IPM_HLS, IPM_IndeksHidupLayak, IPM_IndeksKesehatan, IPM_IndeksPendidikan, IPM_PengeluaranPerKapita, IPM_RLS,
+    IPM_UHH_SP, KemiskinanSurabaya, Kependudukan, KetenagakerjaanTPAK, KetenagakerjaanTPT,
+    PDRBLapanganUsahaADHB, PDRBLapanganUsahaADHBTriwulanan, PDRBLapanganUsahaADHK, PDRBLapanganUsahaADHKTriwulanan,
+    PDRBLapanganUsahaLajuCtoC, PDRBLapanganUsahaLajuPDRB, PDRBLapanganUsahaLajuQtoQ, PDRBLapanganUsahaLajuYtoY,
+    PDRBPengeluaranADHB, PDRBPengeluaranADHBTriwulanan, PDRBPengeluaranADHK, PDRBPengeluaranADHKTriwulanan,
+    PDRBPengeluaranLajuCtoC, PDRBPengeluaranLajuPDRB, PDRBPengeluaranLajuQtoQ, PDRBPengeluaranLajuYtoY,
+)
+from apps.services.db_lock import write_lock
+from apps.services.view_cache import dataset_versions
+
+logger = logging.getLogger(__name__)
+
+MONTH_ORDER = ['JANUARI', 'FEBRUARI', 'MARET', 'APRIL', 'MEI', 'JUNI',
+               'JULI', 'AGUSTUS', 'SEPTEMBER', 'OKTOBER', 'NOPEMBER', 'DESEMBER']
+MONTH_DISPLAY = {'JANUARI': 'Januari', 'FEBRUARI': 'Februari', 'MARET': 'Maret', 'APRIL': 'April',
+                 'MEI': 'Mei', 'JUNI': 'Juni', 'JULI': 'Juli', 'AGUSTUS': 'Agustus',
+                 'SEPTEMBER': 'September', 'OKTOBER': 'Oktober', 'NOPEMBER': 'November', 'DESEMBER': 'Desember'}
+QUARTERS = ['I', 'II', 'III', 'IV']
+QUARTER_ORDER = {'I': 1, 'II': 2, 'III': 3, 'IV': 4, 'TOTAL': 5}
+
+IPM_SUBCATEGORY_PREFIX = 'ipm-sub-'
+
+# (key, nama kartu, model, triwulanan, jenis perubahan, nilai Rupiah) dalam urutan carousel.
+# Nilai Rupiah: perubahan relatif (%); seri laju sudah berupa persen: perubahan dalam poin
+PDRB_INDICATORS = [
+    ('pdrb-peng-adhb', 'PDRB Pengeluaran ADHB (Tahunan)', PDRBPengeluaranADHB, False, 'y-to-y', True),
+    ('pdrb-peng-adhk', 'PDRB Pengeluaran ADHK (Tahunan)', PDRBPengeluaranADHK, False, 'y-to-y', True),
+    ('pdrb-peng-laju', 'PDRB Pengeluaran Laju Pertumbuhan (Tahunan)', PDRBPengeluaranLajuPDRB, False, 'y-to-y', False),
+    ('pdrb-peng-adhb-q', 'PDRB Pengeluaran ADHB (Triwulanan)', PDRBPengeluaranADHBTriwulanan, True, 'q-to-q', True),
+    ('pdrb-peng-adhk-q', 'PDRB Pengeluaran ADHK (Triwulanan)', PDRBPengeluaranADHKTriwulanan, True, 'q-to-q', True),
+    ('pdrb-peng-laju-qtoq', 'PDRB Pengeluaran Laju Q-to-Q (Triwulanan)', PDRBPengeluaranLajuQtoQ, True, 'q-to-q', False),
+    ('pdrb-peng-laju-ytoy', 'PDRB Pengeluaran Laju Y-to-Y (Triwulanan)', PDRBPengeluaranLajuYtoY, True, 'y-to-y', False),
+    ('pdrb-peng-laju-ctoc', 'PDRB Pengeluaran Laju C-to-C (Triwulanan)', PDRBPengeluaranLajuCtoC, True, 'c-to-c', False),
+    ('pdrb-lap-adhb', 'PDRB Lapangan Usaha ADHB (Tahunan)', PDRBLapanganUsahaADHB, False, 'y-to-y', True),
+    ('pdrb-lap-adhk', 'PDRB Lapangan Usaha ADHK (Tahunan)', PDRBLapanganUsahaADHK, False, 'y-to-y', True),
+    ('pdrb-lap-laju', 'PDRB Lapangan Usaha Laju Pertumbuhan (Tahunan)', PDRBLapanganUsahaLajuPDRB, False, 'y-to-y', False),
+    ('pdrb-lap-adhb-q', 'PDRB Lapangan Usaha ADHB (Triwulanan)', PDRBLapanganUsahaADHBTriwulanan, True, 'q-to-q', True),
+    ('pdrb-lap-adhk-q', 'PDRB Lapangan Usaha ADHK (Triwulanan)', PDRBLapanganUsahaADHKTriwulanan, True, 'q-to-q', True),
+    ('pdrb-lap-laju-qtoq', 'PDRB Lapangan Usaha Laju Q-to-Q (Triwulanan)', PDRBLapanganUsahaLajuQtoQ, True, 'q-to-q', False),
+    ('pdrb-lap-laju-ytoy', 'PDRB Lapangan Usaha Laju Y-to-Y (Triwulanan)', PDRBLapanganUsahaLajuYtoY, True, 'y-to-y', False),
+    ('pdrb-lap-laju-ctoc', 'PDRB Lapangan Usaha Laju C-to-C (Triwulanan)', PDRBLapanganUsahaLajuCtoC, True, 'c-to-c', False),
+]
+
+IPM_SUBCATEGORIES = [
+    ('uhh-sp', 'UHH SP', IPM_UHH_SP),
+    ('hls', 'HLS', IPM_HLS),
+    ('rls', 'RLS', IPM_RLS),
+    ('pengeluaran-per-kapita', 'Pengeluaran per Kapita', IPM_PengeluaranPerKapita),
+    ('indeks-kesehatan', 'Indeks Kesehatan', IPM_IndeksKesehatan),
+    ('indeks-hidup-layak', 'Indeks Hidup Layak', IPM_IndeksHidupLayak),
+    ('indeks-pendidikan', 'Indeks Pendidikan', IPM_IndeksPendidikan),
+]
+
+
+# Semua tabel yang dibaca build_indicators(); versinya disimpan bersama snapshot
+SOURCE_MODELS = (
+    Inflasi, HotelOccupancyCombined, HotelOccupancyYearly, GiniRatio, KemiskinanSurabaya,
+    KetenagakerjaanTPT, KetenagakerjaanTPAK, Kependudukan, HumanDevelopmentIndex,
+    *(spec[2] for spec in PDRB_INDICATORS),
+    *(spec[2] for spec in IPM_SUBCATEGORIES),
+)
+
+
+def _indicator(key, name, value, period, change_type, unit='', year=None, previous_value=None,
+               previous_period=None, change=None, change_percent=None, is_currency=False):
+    """Satu kartu carousel dalam bentuk field IndicatorSnapshot."""
+    return {
+        'key': key,
+        'name': name,
+        'value': value,
+        'previous_value': previous_value,
+        'unit': unit,
+        'year': year,
+        'period': period,
+        'previous_period': previous_period or '',
+        'change': change,
+        'change_percent': change_percent,
+        'change_type': change_type,
+        'is_currency': is_currency,
+    }
+
+
+def _change(latest, previous, relative=True):
+    """
+    (change, change_percent) antara dua nilai. relative=False untuk seri yang sudah
+    berupa persen (inflasi, laju, TPK): selisih poin dipakai sebagai change_percent.
+    """
+    change = float(latest) - float(previous)
+    if not relative:
+        return change, change
+    return change, (change / float(previous)) * 100 if float(previous) != 0 else 0
+
+
+def _previous_month(month, year):
+    """(bulan, tahun) sebelum month/year, atau None bila nama bulan tidak dikenal."""
+    if month not in MONTH_ORDER:
+        return None
+    index = MONTH_ORDER.index(month)
+    if index > 0:
+        return MONTH_ORDER[index - 1], year
+    return 'DESEMBER', year - 1
+
+
+def _pdrb_total_rows(model):
+    """Baris kategori TOTAL / JUMLAH, disaring di database (kategori apa pun huruf besar/kecilnya)."""
+    field = 'expenditure_category' if hasattr(model, 'expenditure_category') else 'industry_category'
+    return model.objects.filter(Q(**{f'{field}__icontains': 'TOTAL'}) | Q(**{f'{field}__icontains': 'JUMLAH'}))
+
+
+def _pdrb_latest_previous(model, quarterly):
+    """
+    Periode terbaru kategori TOTAL dan periode sebelumnya (triwulan atau tahun sebelumnya),
+    masing-masing dict year/value(/quarter) dari satu query satu baris. Bila satu periode punya
+    beberapa baris TOTAL, terbaru = baris dengan pk terbesar, sebelumnya = pk terkecil.
+    """
+    rows = _pdrb_total_rows(model)
+    fields = ('year', 'quarter', 'value') if quarterly else ('year', 'value')
+    if quarterly:
+        order = Case(
+            *(When(quarter=quarter, then=Value(rank)) for quarter, rank in QUARTER_ORDER.items()),
+            default=Value(0),
+        )
+        latest = rows.order_by('-year', order.desc(), '-pk').values(*fields).first()
+    else:
+        latest = rows.order_by('-year', '-pk').values(*fields).first()
+    if latest is None:
+        return None, None
+
+    if quarterly and latest['quarter'] in QUARTERS:
+        index = QUARTERS.index(latest['quarter'])
+        if index > 0:
+            target = {'year': latest['year'], 'quarter': QUARTERS[index - 1]}
+        else:
+            target = {'year': latest['year'] - 1, 'quarter': 'IV'}
+    else:
+        target = {'year': latest['year'] - 1}
+    previous = rows.filter(**target).order_by('pk').values(*fields).first()
+    return latest, previous
+
+
+def _pdrb_indicator(key, name, model, quarterly, change_type, is_currency):
+    latest, previous = _pdrb_latest_previous(model, quarterly)
+    if not latest:
+        return None
+    change = change_percent = None
+    if previous and latest['value'] and previous['value']:
+        change, change_percent = _change(latest['value'], previous['value'], relative=is_currency)
+
+    label = (lambda row: f"Q{row['quarter']} {row['year']}") if quarterly else (lambda row: f"{row['year']}")
+    return _indicator(
+        key, name, latest['value'], label(latest), change_type,
+        unit='' if is_currency else '%',
+        year=latest['year'],
+        previous_value=previous['value'] if previous else None,
+        previous_period=label(previous) if previous else None,
+        change=change,
+        change_percent=change_percent,
+        is_currency=is_currency,
+    )
+
+
+def _inflasi_indicators():
+    latest = Inflasi.objects.order_by('-year', '-month').first()
+    if not latest:
+        return []
+    indicators = []
+    period = f"{latest.get_month_display()} {latest.year}"
+
+    if latest.bulanan:
+        target = _previous_month(latest.month, latest.year)
+        previous = Inflasi.objects.filter(year=target[1], month=target[0]).first() if target else None
+        change = change_percent = None
+        if previous and previous.bulanan:
+            change, change_percent = _change(latest.bulanan, previous.bulanan, relative=False)
+        indicators.append(_indicator(
+            'inflasi-mtm', 'Inflasi M-to-M', latest.bulanan, period, 'm-to-m', unit='%', year=latest.year,
+            previous_value=previous.bulanan if previous else None,
+            previous_period=f"{previous.get_month_display()} {previous.year}" if previous else None,
+            change=change, change_percent=change_percent,
+        ))
+
+    if latest.yoy:
+        previous = Inflasi.objects.filter(year=latest.year - 1, month=latest.month).first()
+        change = change_percent = None
+        if previous and previous.yoy:
+            change, change_percent = _change(latest.yoy, previous.yoy, relative=False)
+        indicators.append(_indicator(
+            'inflasi-yty', 'Inflasi Y-to-Y', latest.yoy, period, 'y-to-y', unit='%', year=latest.year,
+            previous_value=previous.yoy if previous else None,
+            previous_period=f"{previous.get_month_display()} {previous.year}" if previous else None,
+            change=change, change_percent=change_percent,
+        ))
+    return indicators
+
+
+def _monthly_hotel_indicator(key, name, field):
+    """Kartu m-to-m dari HotelOccupancyCombined (TPK / RLMT gabungan)."""
+    latest = HotelOccupancyCombined.objects.order_by('-year', '-month').first()
+    if not latest or getattr(latest, field) is None:
+        return None
+    target = _previous_month(latest.month, latest.year)
+    previous = HotelOccupancyCombined.objects.filter(year=target[1], month=target[0]).first() if target else None
+    change = change_percent = previous_period = None
+    if previous and getattr(previous, field) is not None:
+        change, change_percent = _change(getattr(latest, field), getattr(previous, field), relative=False)
+        previous_period = f"{MONTH_DISPLAY.get(previous.month, previous.month)} {previous.year}"
+    return _indicator(
+        key, name, getattr(latest, field), f"{MONTH_DISPLAY.get(latest.month, latest.month)} {latest.year}",
+        'm-to-m', unit='%', year=latest.year,
+        previous_value=getattr(previous, field) if previous else None,
+        previous_period=previous_period, change=change, change_percent=change_percent,
+    )
+
+
+def _yearly_indicator(key, name, queryset, field, unit='%', previous_needs_value=False):
+    """
+    Kartu y-to-y dari tabel dengan satu baris per tahun. previous_needs_value: periode
+    sebelumnya hanya ditampilkan bila nilainya ada (perilaku kartu TPT dan RLMT).
+    """
+    latest = queryset.order_by('-year').first()
+    if not latest or not getattr(latest, field):
+        return None
+    previous = queryset.filter(year=latest.year - 1).first()
+    change = change_percent = None
+    has_value = previous is not None and bool(getattr(previous, field))
+    if has_value:
+        change, change_percent = _change(getattr(latest, field), getattr(previous, field))
+    show_previous = has_value if previous_needs_value else previous is not None
+    return _indicator(
+        key, name, getattr(latest, field), f"{latest.year}", 'y-to-y', unit=unit, year=latest.year,
+        previous_value=getattr(previous, field) if previous else None,
+        previous_period=f"{previous.year}" if show_previous else None,
+        change=change, change_percent=change_percent,
+    )
+
+
+def _kota_surabaya_indicator(key, name, model, field):
+    """Kartu IPM / Gini: dua tahun terakhir Kota Surabaya (bukan harus tahun berurutan)."""
+    rows = list(model.objects.for_region('KOTA SURABAYA').order_by('year', 'pk'))
+    if not rows:
+        return None
+    latest = rows[-1]
+    previous = rows[-2] if len(rows) > 1 else None
+    change = change_percent = None
+    if previous and getattr(latest, field) and getattr(previous, field):
+        change, change_percent = _change(getattr(latest, field), getattr(previous, field))
+    return _indicator(
+        key, name, getattr(latest, field), f"{latest.year}", 'y-to-y', year=latest.year,
+        previous_value=getattr(previous, field) if previous else None,
+        previous_period=f"{previous.year}" if previous else None,
+        change=change, change_percent=change_percent,
+    )
+
+
+def _ipm_subcategory_indicator(key, name, model):
+    rows = list(model.objects.for_region('KOTA SURABAYA').order_by('year', 'pk'))
+    if not rows:
+        return None
+    latest = rows[-1]
+    previous = next((row for row in rows if row.year == latest.year - 1), None)
+    change = change_percent = None
+    if previous and latest.value and previous.value:
+        change, change_percent = _change(latest.value, previous.value)
+    return _indicator(
+        IPM_SUBCATEGORY_PREFIX + key, f'IPM {name}', latest.value, f"{latest.year}", 'y-to-y', year=latest.year,
+        previous_value=previous.value if previous else None,
+        # Kartu sub-kategori IPM selalu menampilkan tahun sebelumnya
+        previous_period=f"{latest.year - 1}",
+        change=change, change_percent=change_percent,
+    )
+
+
+def build_indicators():
+    """Menghitung semua kartu carousel dashboard dari tabel indikator. Returns list dict, urut carousel."""
+    indicators = _inflasi_indicators()
+    indicators.extend(_pdrb_indicator(*spec) for spec in PDRB_INDICATORS)
+    indicators.append(_yearly_indicator(
+        'tpt', 'TPT (Tingkat Pengangguran Terbuka)', KetenagakerjaanTPT.objects.all(), 'total', previous_needs_value=True,
+    ))
+    indicators.append(_monthly_hotel_indicator('tpk-mtm', 'TPK M-to-M', 'tpk'))
+    indicators.append(_yearly_indicator(
+        'rlmt-gabungan', 'RLMT Gabungan', HotelOccupancyYearly.objects.all(), 'rlmtgab', previous_needs_value=True,
+    ))
+    indicators.append(_monthly_hotel_indicator('rlmt-gabungan-mtm', 'RLMT Gabungan M-to-M', 'rlmtgab'))
+    indicators.append(_kota_surabaya_indicator('gini', 'Gini Ratio', GiniRatio, 'gini_ratio_value'))
+    indicators.append(_yearly_indicator(
+        'kemiskinan', 'Kemiskinan (Persentase)', KemiskinanSurabaya.objects.all(), 'persentase_penduduk_miskin',
+    ))
+    indicators.append(_yearly_indicator(
+        'tpak', 'TPAK (Tingkat Partisipasi Angkatan Kerja)', KetenagakerjaanTPAK.objects.all(), 'total',
+    ))
+    indicators.append(_yearly_indicator(
+        'kependudukan', 'Kependudukan (Total Penduduk)', Kependudukan.objects.filter(gender='TOTAL'), 'population',
+        unit='',
+    ))
+    indicators.append(_kota_surabaya_indicator('ipm', 'IPM (Indeks Pembangunan Manusia)', HumanDevelopmentIndex, 'ipm_value'))
+    indicators.extend(_ipm_subcategory_indicator(*spec) for spec in IPM_SUBCATEGORIES)
+    return [indicator for indicator in indicators if indicator]
+
+
+def source_versions():
+    """Versi gabungan tabel sumber snapshot saat ini."""
+    return dataset_versions(*SOURCE_MODELS)
+
+
+def rebuild_snapshots(versions=None):
+    """
+    Menghitung ulang dan mengganti seluruh isi IndicatorSnapshot dalam satu transaksi,
+    sehingga dashboard tidak pernah membaca snapshot setengah jadi. Returns list snapshot.
+
+    versions dibaca sebelum tabel sumber dibaca: tulisan yang masuk selama rebuild
+    membuat versi tersimpan tertinggal, dan snapshot dibangun ulang lagi nanti.
+    """
+    versions = source_versions() if versions is None else versions
+    snapshots = [
+        IndicatorSnapshot(position=position, source_versions=versions, **indicator)
+        for position, indicator in enumerate(build_indicators())
+    ]
+    using = router.db_for_write(IndicatorSnapshot)
+    with write_lock(using), transaction.atomic(using=using):
+        IndicatorSnapshot.objects.using(using).all().delete()
+        IndicatorSnapshot.objects.using(using).bulk_create(snapshots)
+    logger.info(f"Snapshot indikator dashboard diperbarui: {len(snapshots)} indikator")
+    return snapshots
+
+
+def dashboard_indicators():
+    """
+    Snapshot untuk carousel dashboard (satu query). Bila tabel masih kosong (belum ada
+    sync sejak migrasi) atau versi dataset sumbernya sudah berubah (edit di luar sync),
+    snapshot dibangun sekarang.
+    """
+    snapshots = list(IndicatorSnapshot.objects.all())
+    versions = source_versions()
+    if snapshots and snapshots[0].source_versions == versions:
+        return snapshots
+    try:
+        return rebuild_snapshots(versions)
+    except DatabaseError as e:
+        # Mis. request lain sedang mengganti snapshot yang sama; pakai isi tabel saat ini
+        logger.warning(f"Gagal membangun ulang snapshot indikator dashboard: {e}")
+        return list(IndicatorSnapshot.objects.all())
+
+
+def refresh_after_sync(results):
+    """
+    Dipanggil track_run di akhir sync: rebuild bila ada data baru/diperbarui, atau
+    snapshot belum ada / dibuat dari versi dataset lain. Gagal rebuild tidak menggagalkan sync.
+    """
+    changed = any(result.created or result.updated for result in results)
+    try:
+        versions = source_versions()
+        current = IndicatorSnapshot.objects.values_list('source_versions', flat=True).first()
+        if changed or current != versions:
+            rebuild_snapshots(versions)
+    except Exception as e:
+        logger.warning(f"Gagal memperbarui snapshot indikator dashboard: {e}")
+        print(f"[WARNING] Gagal memperbarui snapshot indikator dashboard: {e}")
@@ -0,0 +1,233 @@
+"""
+Leader election untuk proses yang hanya boleh berjalan di satu tempat dalam cluster.
+
+Setiap proses web (atau node) yang menjalankan AppsConfig.ready() mencoba
+mengambil lease yang sama. Hanya pemegang lease yang menjalankan scheduler;
+proses lain terus mencoba secara berkala dan mengambil alih begitu lease
+kedaluwarsa (pemegang mati atau kehilangan koneksi).
+
+Backend lease (settings SCHEDULER_LOCK_BACKEND):
+
+    db      baris SchedulerLease, diambil/diperpanjang dengan UPDATE bersyarat
+            (holder == saya atau expires_at sudah lewat). Default; tidak butuh
+            service tambahan. Mengandalkan jam antar node tersinkron (NTP).
+            Lease ditulis dari koneksi thread elector sendiri, tanpa write lock
+            SQLite yang dipakai sync, sehingga perpanjangan tidak antre di
+            belakang sync yang sedang menulis.
+    redis   key Redis SET NX PX, diperpanjang/dilepas dengan skrip Lua yang
+            memeriksa token pemegang (SCHEDULER_REDIS_URL).
+"""
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, close_old_connections, router, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.models import SchedulerLease
+
+logger = logging.getLogger(__name__)
+
+LEASE_SECONDS = getattr(settings, 'SCHEDULER_LEASE_SECONDS', 60)
+# Lease diperpanjang tiga kali per masa berlaku supaya satu percobaan gagal tidak langsung melepas leader
+RENEW_SECONDS = getattr(settings, 'SCHEDULER_LEASE_RENEW_SECONDS', max(1, LEASE_SECONDS // 3))
+
+
+def holder_id():
+    """Identitas unik proses ini: host, pid dan token acak (pid bisa dipakai ulang setelah restart)."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class DatabaseLease:
+    """
+    Lease di tabel SchedulerLease.
+
+    Tidak memakai db_lock.write_lock: lock itu dipegang sync selama menulis
+    (di SQLite bisa lama, mis. saat staging digabung), dan perpanjangan yang
+    menunggu di belakangnya bisa melewati masa lease. Setiap statement di sini
+    singkat dan autocommit di koneksi thread pemanggil (thread elector), jadi
+    paling lama menunggu busy timeout database.
+    """
+
+    def __init__(self, name, holder, ttl=LEASE_SECONDS):
+        self.name = name
+        self.holder = holder
+        self.ttl = timedelta(seconds=ttl)
+        self.ttl_seconds = ttl
+
+    def acquire(self):
+        """Mengambil atau memperpanjang lease. Returns True bila proses ini pemegangnya."""
+        now = timezone.now()
+        using = router.db_for_write(SchedulerLease)
+        leases = SchedulerLease.objects.filter(name=self.name)
+        if leases.filter(holder=self.holder).update(renewed_at=now, expires_at=now + self.ttl):
+            return True
+        taken = leases.filter(Q(holder='') | Q(expires_at__isnull=True) | Q(expires_at__lt=now)).update(
+            holder=self.holder, acquired_at=now, renewed_at=now, expires_at=now + self.ttl,
+        )
+        if taken:
+            return True
+        if leases.exists():
+            return False
+        try:
+            with transaction.atomic(using=using):
+                SchedulerLease.objects.create(
+                    name=self.name, holder=self.holder,
+                    acquired_at=now, renewed_at=now, expires_at=now + self.ttl,
+                )
+            return True
+        except IntegrityError:
+            # Proses lain membuat baris lease lebih dulu
+            return False
+
+    def holds(self):
+        """True bila lease masih dipegang proses ini dan belum kedaluwarsa (hanya SELECT)."""
+        return SchedulerLease.objects.filter(
+            name=self.name, holder=self.holder, expires_at__gt=timezone.now(),
+        ).exists()
+
+    def release(self):
+        SchedulerLease.objects.filter(name=self.name, holder=self.holder).update(holder='', expires_at=None)
+
+
+class RedisLease:
+    """Lease berupa key Redis berisi token pemegang, kedaluwarsa otomatis setelah ttl."""
+
+    RENEW_SCRIPT = (
+        "if redis.call('get', KEYS[1]) == ARGV[1] then "
+        "return redis.call('pexpire', KEYS[1], ARGV[2]) else return 0 end"
+    )
+    RELEASE_SCRIPT = (
+        "if redis.call('get', KEYS[1]) == ARGV[1] then "
+        "return redis.call('del', KEYS[1]) else return 0 end"
+    )
+
+    def __init__(self, name, holder, ttl=LEASE_SECONDS, url=None):
+        import redis
+
+        self.key = f"aastabaya:lease:{name}"
+        self.holder = holder
+        self.ttl_ms = int(ttl * 1000)
+        self.ttl_seconds = ttl
+        self.client = redis.Redis.from_url(url or getattr(settings, 'SCHEDULER_REDIS_URL', 'redis://localhost:6379/0'))
+
+    def acquire(self):
+        if self.client.set(self.key, self.holder, nx=True, px=self.ttl_ms):
+            return True
+        return bool(self.client.eval(self.RENEW_SCRIPT, 1, self.key, self.holder, self.ttl_ms))
+
+    def holds(self):
+        holder = self.client.get(self.key)
+        return holder is not None and holder.decode() == self.holder
+
+    def release(self):
+        self.client.eval(self.RELEASE_SCRIPT, 1, self.key, self.holder)
+
+
+def get_lease(name, holder=None):
+    """Lease sesuai settings SCHEDULER_LOCK_BACKEND ('db' atau 'redis')."""
+    holder = holder or holder_id()
+    backend = getattr(settings, 'SCHEDULER_LOCK_BACKEND', 'db')
+    if backend == 'redis':
+        return RedisLease(name, holder)
+    if backend != 'db':
+        raise ValueError(f"SCHEDULER_LOCK_BACKEND tidak dikenal: {backend}")
+    return DatabaseLease(name, holder)
+
+
+class LeaderElector:
+    """
+    Thread latar yang memegang lease selama proses hidup.
+
+    on_elected() dipanggil saat proses ini menjadi leader, on_demoted() saat
+    lease hilang (dipegang proses lain) atau saat stop(). Bila backend lease
+    tidak bisa dihubungi, proses ini tetap leader hanya selama lease yang
+    terakhir berhasil diperpanjang masih berlaku (dihitung dengan jam lokal),
+    lalu mundur: lebih baik scheduler sempat tidak berjalan daripada berjalan
+    di dua proses. Job memanggil holds_lease() sebelum setiap dataset.
+    """
+
+    def __init__(self, lease, on_elected, on_demoted, interval=RENEW_SECONDS):
+        self.lease = lease
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.interval = interval
+        self._leader = False
+        # time.monotonic() saat lease yang terakhir berhasil diambil/diperpanjang kedaluwarsa
+        self._valid_until = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def is_leader(self):
+        """Menurut state lokal: leader dan lease terakhir belum kedaluwarsa."""
+        return self._leader and time.monotonic() < self._valid_until
+
+    def holds_lease(self):
+        """is_leader, dan backend lease memastikan lease masih dipegang proses ini."""
+        if not self.is_leader:
+            return False
+        try:
+            return self.lease.holds()
+        except Exception as e:
+            logger.warning(f"Gagal memeriksa lease leader: {e}")
+            return False
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='leader-elector', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Berhenti mencoba, menghentikan job leader dan melepas lease agar proses lain cepat mengambil alih."""
+        self._stop.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.interval + 5)
+        if self._leader:
+            self._step_down()
+        self._release()
+
+    def _release(self):
+        try:
+            self.lease.release()
+        except Exception as e:
+            logger.warning(f"Gagal melepas lease {self.lease.holder}: {e}")
+
+    def _step_down(self):
+        self._leader = False
+        try:
+            self.on_demoted()
+        except Exception as e:
+            logger.error(f"Error saat berhenti menjadi leader: {e}")
+
+    def _run(self):
+        while not self._stop.is_set():
+            close_old_connections()
+            started = time.monotonic()
+            try:
+                holding = self.lease.acquire()
+                if holding:
+                    self._valid_until = started + self.lease.ttl_seconds
+            except Exception as e:
+                # Mis. database sibuk: lease yang sudah dipegang tetap berlaku sampai kedaluwarsa
+                logger.warning(f"Gagal memperbarui lease leader: {e}")
+                holding = self._leader and time.monotonic() + self.interval < self._valid_until
+
+            if holding and not self._leader:
+                self._leader = True
+                try:
+                    self.on_elected()
+                except Exception as e:
+                    logger.error(f"Error saat mulai menjadi leader: {e}")
+                    self._step_down()
+                    self._release()
+            elif not holding and self._leader:
+                self._step_down()
+
+            self._stop.wait(self.interval)
+        close_old_connections()
@@ -0,0 +1,26 @@
+"""
+Fungsi parse angka skalar (per sel) yang digantikan number_parser.parse_numbers().
+
+Dipakai sebagai acuan oleh test parser angka dan oleh command benchmark_parsers
+(benchmark dan --check); tidak dipanggil oleh sync.
+"""
+from apps.services import number_parser
+from apps.services.API_service import convert_kependudukan_value, convert_value, convert_value_to_numeric
+
+
+def legacy_decimal_value(value):
+    """Aturan parse angka lama di parser IPM/Gini, hotel dan Inflasi: koma -> titik, lalu float()."""
+    value_str = str(value).strip().replace(',', '.')
+    try:
+        return float(value_str) if value_str else None
+    except ValueError:
+        return None
+
+
+# Fungsi skalar lama per mode number_parser
+SCALAR_PARSERS = {
+    number_parser.DECIMAL: legacy_decimal_value,
+    number_parser.SPREADSHEET: convert_value,
+    number_parser.INDONESIAN: convert_value_to_numeric,
+    number_parser.POPULATION: convert_kependudukan_value,
+}
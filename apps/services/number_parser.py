@@ -0,0 +1,242 @@
+"""
+Parser angka format Indonesia untuk satu kolom sekaligus.
+
+convert_value, convert_value_to_numeric dan convert_kependudukan_value di
+API_service dipanggil sekali per sel lewat loop Python / Series.apply, dengan
+pengecekan string berulang dan print untuk setiap sel yang gagal. parse_numbers()
+menerapkan aturan yang sama pada seluruh kolom memakai ufunc np.strings, lalu
+mengembalikan array float dan mask sel yang tidak bisa di-parse.
+
+Mode (semantik per sel sama dengan fungsi skalar yang disebutkan):
+    DECIMAL      "12,5" -> 12.5; koma hanya diganti titik, '-' -> kosong (parser IPM/Gini, hotel, Inflasi)
+    SPREADSHEET  convert_value: '-', 'error', 'nan', 'none', 'null' -> kosong;
+                 bila ada >1 titik (setelah koma -> titik), hanya titik terakhir yang desimal
+    INDONESIAN   convert_value_to_numeric: '-' -> 0; titik ribuan, koma desimal
+    POPULATION   convert_kependudukan_value: '-' -> 0; semua '.' dan ',' dibuang, dibulatkan ke bawah
+"""
+import numpy as np
+import pandas as pd
+
+DECIMAL = 'decimal'
+SPREADSHEET = 'spreadsheet'
+INDONESIAN = 'indonesian'
+POPULATION = 'population'
+
+MODES = (DECIMAL, SPREADSHEET, INDONESIAN, POPULATION)
+
+SPREADSHEET_NULL_WORDS = ['-', 'error', '', 'nan', 'none', 'null']
+ZERO_DASHES = ['-', '—']
+
+
+def _as_object_array(values):
+    if isinstance(values, (pd.Series, pd.Index)):
+        return values.to_numpy(dtype=object)
+    array = np.empty(len(values), dtype=object)
+    array[:] = list(values)
+    return array
+
+
+# Sel dengan angka "biasa" dihitung langsung dari digitnya (lihat _parse_plain)
+FAST_MAX_CHARS = 24
+FAST_MAX_DIGITS = 15
+_POW10 = 10.0 ** np.arange(FAST_MAX_DIGITS + 1)
+
+
+def _last_position(mask, positions):
+    """Posisi karakter terakhir yang True per sel (kolom), -1 bila tidak ada."""
+    return np.where(mask, positions, -1).max(axis=0)
+
+
+def _parse_plain(text, mode):
+    """
+    Jalur cepat untuk sel yang setelah aturan pemisah mode berbentuk
+    [+-]digit[.digit] dengan paling banyak 15 digit ASCII.
+
+    String dilihat sebagai matriks codepoint (baris = posisi karakter, kolom =
+    sel), sehingga pemisah ribuan/desimal cukup ditentukan dengan mask, tanpa
+    membuat string baru. Nilainya mantissa integer (< 2**53) dibagi 10**k: satu
+    pembagian IEEE yang dibulatkan dengan benar, jadi hasilnya bit-identik
+    dengan float(string).
+
+    Returns:
+        (plain, numbers): mask sel yang ditangani dan nilainya; sel lain
+        (eksponen, inf, digit non-ASCII, teks) harus lewat jalur string biasa.
+    """
+    count = len(text)
+    width = min(FAST_MAX_CHARS, text.dtype.itemsize // 4)
+    numbers = np.full(count, np.nan)
+    if width == 0:
+        return np.zeros(count, dtype=bool), numbers
+
+    lengths = np.strings.str_len(text)
+    codes = np.ascontiguousarray(text, dtype=f'U{width}').view(np.uint32).reshape(count, width).T.copy()
+    positions = np.arange(width)[:, None]
+
+    digit = (codes >= 48) & (codes <= 57)
+    dot = codes == 46
+    comma = codes == 44
+
+    if mode == DECIMAL:
+        point = dot | comma
+        ignored = np.zeros_like(point)
+    elif mode == SPREADSHEET:
+        # Semua koma jadi titik; bila lebih dari satu, hanya yang terakhir desimal
+        separator = dot | comma
+        point = separator & (positions == _last_position(separator, positions))
+        ignored = separator & ~point
+    elif mode == POPULATION:
+        point = np.zeros_like(dot)
+        ignored = dot | comma
+    else:
+        dot_count = dot.sum(axis=0)
+        dot_pos = _last_position(dot, positions)
+        strip_dots = (dot_count > 0) & (
+            comma.any(axis=0) | (dot_count > 1) | ((dot_pos > 0) & (lengths - dot_pos - 1 > 3))
+        )
+        ignored = dot & strip_dots
+        point = comma | (dot & ~ignored)
+
+    sign = (codes[0] == 45) | (codes[0] == 43)
+    allowed = digit | point | ignored | (codes == 0)
+    allowed[0] |= sign
+    digit_count = digit.sum(axis=0)
+    plain = (
+        (lengths <= width) & allowed.all(axis=0) & (digit_count > 0)
+        & (digit_count <= FAST_MAX_DIGITS) & (point.sum(axis=0) <= 1)
+    )
+    if not plain.any():
+        return plain, numbers
+
+    # Horner per posisi karakter: mantissa = digit-digit sebagai integer, fraction = digit setelah titik
+    mantissa = np.zeros(count, dtype=np.int64)
+    fraction_digits = np.zeros(count, dtype=np.int64)
+    after_point = np.zeros(count, dtype=bool)
+    for position in range(width):
+        is_digit = digit[position]
+        mantissa = np.where(is_digit, mantissa * 10 + (codes[position].astype(np.int64) - 48), mantissa)
+        fraction_digits += is_digit & after_point
+        after_point |= point[position]
+
+    values = mantissa[plain].astype(np.float64) / _POW10[fraction_digits[plain]]
+    values = np.where(codes[0, plain] == 45, -values, values)
+    if mode == POPULATION:
+        # int(float('-0')) == 0
+        values = values + 0.0
+    numbers[plain] = values
+    return plain, numbers
+
+
+def _to_float(text):
+    """
+    float() untuk setiap string di array (semua sudah di-strip dan tidak kosong).
+
+    Cast array object -> float64 memanggil float() per elemen di C, jadi hasilnya
+    sama persis dengan fungsi skalar (termasuk '1_000', 'inf', digit non-ASCII).
+    Bila ada sel yang gagal, cast dibatalkan seluruhnya dan sel dicoba satu per
+    satu. Returns (numbers, failed).
+    """
+    candidates = text.astype(object)
+    try:
+        return candidates.astype(np.float64), np.zeros(len(text), dtype=bool)
+    except ValueError:
+        pass
+
+    numbers = np.full(len(text), np.nan)
+    failed = np.zeros(len(text), dtype=bool)
+    for i, candidate in enumerate(candidates):
+        try:
+            numbers[i] = float(candidate)
+        except ValueError:
+            failed[i] = True
+    return numbers, failed
+
+
+def _remove_all_but_last_dot(text):
+    head, _, tail = np.strings.rpartition(text, '.')
+    return np.strings.add(np.strings.add(np.strings.replace(head, '.', ''), '.'), tail)
+
+
+def _normalize(text, mode):
+    """Aturan pemisah ribuan/desimal mode sebagai operasi string (jalur lambat)."""
+    if mode == SPREADSHEET:
+        text = np.strings.replace(text, ',', '.')
+        multi_dot = np.strings.count(text, '.') > 1
+        if multi_dot.any():
+            text[multi_dot] = _remove_all_but_last_dot(text[multi_dot])
+        return text
+
+    if mode == DECIMAL:
+        return np.strings.replace(text, ',', '.')
+
+    if mode == POPULATION:
+        return np.strings.replace(np.strings.replace(text, '.', ''), ',', '')
+
+    has_comma = np.strings.count(text, ',') > 0
+    dot_count = np.strings.count(text, '.')
+    dot_pos = np.strings.rfind(text, '.')
+    digits_after = np.strings.str_len(text) - dot_pos - 1
+
+    # Titik sebagai pemisah ribuan: ada koma juga, >1 titik, atau >3 karakter setelah titik tunggal
+    strip_dots = (dot_count > 0) & (has_comma | (dot_count > 1) | ((dot_pos > 0) & (digits_after > 3)))
+    text = np.where(strip_dots, np.strings.replace(text, '.', ''), text)
+    return np.strings.replace(text, ',', '.')
+
+
+def parse_numbers(values, mode=DECIMAL):
+    """
+    Mengubah satu kolom (list, array NumPy atau Series) menjadi angka.
+
+    Returns:
+        (numbers, invalid): numbers adalah array float64 dengan NaN untuk sel yang
+        oleh fungsi skalar dikembalikan sebagai None; invalid adalah mask bool sel
+        berisi teks yang gagal di-parse (sel kosong/penanda null tidak termasuk).
+        Urutan mengikuti input, index Series diabaikan.
+    """
+    if mode not in MODES:
+        raise ValueError(f"Mode parser angka tidak dikenal: {mode}")
+
+    array = _as_object_array(values)
+    count = len(array)
+    numbers = np.full(count, np.nan)
+    invalid = np.zeros(count, dtype=bool)
+    if count == 0:
+        return numbers, invalid
+
+    missing = pd.isna(array)
+    text = np.strings.strip(np.where(missing, '', array).astype(str))
+    todo = ~missing & (text != '')
+
+    if mode == SPREADSHEET:
+        todo &= ~np.isin(np.strings.lower(text), SPREADSHEET_NULL_WORDS)
+    elif mode == DECIMAL:
+        # Hasilnya tetap None/NaN seperti parser lama, hanya tidak dilaporkan sebagai invalid
+        todo &= ~np.isin(text, ZERO_DASHES)
+    elif mode in (INDONESIAN, POPULATION):
+        zero = todo & np.isin(text, ZERO_DASHES)
+        numbers[zero] = 0.0
+        todo &= ~zero
+
+    plain, plain_numbers = _parse_plain(text, mode)
+    plain &= todo
+    numbers[plain] = plain_numbers[plain]
+    todo &= ~plain
+
+    if todo.any():
+        parsed, failed = _to_float(_normalize(text[todo], mode))
+        if mode == POPULATION:
+            # int(float(x)): NaN/inf tidak bisa jadi int -> dianggap gagal
+            failed |= ~np.isfinite(parsed)
+            parsed = np.where(failed, np.nan, np.trunc(parsed))
+        numbers[todo] = parsed
+        invalid[todo] = failed
+
+    return numbers, invalid
+
+
+def report_invalid(label, values, invalid, limit=5):
+    """Satu baris warning untuk semua sel gagal (pengganti print per sel)."""
+    count = int(np.count_nonzero(invalid))
+    if not count:
+        return
+    samples = _as_object_array(values)[invalid][:limit].tolist()
+    print(f"[WARNING] {label}: {count} sel tidak bisa dikonversi ke angka, contoh: {samples}")
@@ -0,0 +1,68 @@
+"""
+Resolusi nama lokasi worksheet ke dimensi Region.
+
+Worksheet IPM, Gini Ratio dan sub-indikator IPM menulis nama lokasi dengan
+berbagai ejaan ('KOTA SURABAYA', 'Surabaya', 'Jawa Timur', ...). Setiap baris
+indikator menyimpan FK integer kecil ke Region; resolve_regions() memetakan
+semua nama unik satu worksheet sekaligus. Bila semua ejaan sudah dikenal cukup
+satu SELECT; wilayah baru dan alias baru ditulis dalam satu transaksi.
+"""
+import logging
+
+from django.db import router, transaction
+
+from apps.models import Region, region_key
+from apps.services.db_lock import write_lock
+from apps.services.view_cache import bump_versions
+
+logger = logging.getLogger(__name__)
+
+
+def _regions(codes, using):
+    return {region.code: region for region in Region.objects.using(using).filter(code__in=codes)}
+
+
+def resolve_regions(location_names):
+    """
+    Returns {nama lokasi: id Region} untuk semua nama. Wilayah yang belum ada dibuat
+    (nama dan tipe dari Region.defaults_for), ejaan baru ditambahkan ke alias-nya.
+    Region ditulis langsung ke tabel live, juga pada mode load 'staging'.
+    """
+    codes = {name: region_key(name) for name in set(location_names)}
+    if not codes:
+        return {}
+
+    using = router.db_for_write(Region)
+    all_codes = set(codes.values())
+    aliases = {code: set() for code in all_codes}
+    for name, code in codes.items():
+        aliases[code].add(name)
+
+    regions = _regions(all_codes, using)
+    if all_codes <= set(regions) and all(aliases[code] <= set(region.aliases) for code, region in regions.items()):
+        return {name: regions[code].pk for name, code in codes.items()}
+
+    with write_lock(using), transaction.atomic(using=using):
+        # Dibaca ulang di dalam lock: task lain (sync paralel) bisa sudah membuat wilayah yang sama
+        regions = _regions(all_codes, using)
+        missing = sorted(all_codes - set(regions))
+        if missing:
+            Region.objects.using(using).bulk_create(
+                [Region(code=code, aliases=sorted(aliases[code]), **Region.defaults_for(code)) for code in missing],
+                ignore_conflicts=True,
+            )
+            logger.info(f"{len(missing)} wilayah baru: {', '.join(missing)}")
+            print(f"[INFO] {len(missing)} wilayah baru: {', '.join(missing)}")
+            regions = _regions(all_codes, using)
+        updated = []
+        for code, region in regions.items():
+            if not aliases[code] <= set(region.aliases):
+                region.aliases = sorted(set(region.aliases) | aliases[code])
+                updated.append(region)
+        if updated:
+            Region.objects.using(using).bulk_update(updated, ['aliases'])
+        if missing or updated:
+            # bulk_create/bulk_update tidak mengirim post_save
+            bump_versions(Region)
+
+    return {name: regions[code].pk for name, code in codes.items()}
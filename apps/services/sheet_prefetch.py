@@ -0,0 +1,164 @@
+"""
+Prefetch worksheet secara batch untuk workbook indikator.
+
+Semua service membaca spreadsheet yang sama, tetapi sebelumnya masing-masing
+memanggil worksheet(...).get_all_values() sendiri, sehingga satu sync penuh
+membutuhkan ~30 HTTP round-trip berurutan. Modul ini mengambil semua worksheet
+yang dibutuhkan lewat satu (atau beberapa) panggilan values.batchGet, lalu
+menyimpan grid-nya di memori selama sesi sync berlangsung. Fungsi fetch_* di
+service cukup memanggil get_worksheet_values(), yang memakai grid hasil
+prefetch bila ada dan jatuh kembali ke get_all_values() bila tidak.
+"""
+import logging
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+from gspread.utils import fill_gaps
+
+from apps.services.sheets_client import INDICATOR_SHEET_ID, sheets_registry
+
+logger = logging.getLogger(__name__)
+
+# Jumlah range per request values.batchGet (batas URL Google ~2K karakter per range list)
+BATCH_SIZE = getattr(settings, 'SHEETS_PREFETCH_BATCH_SIZE', 40)
+
+
+def a1_sheet_range(title):
+    """Range A1 untuk seluruh worksheet; API hanya mengembalikan area yang terisi."""
+    return "'" + title.replace("'", "''") + "'"
+
+
+class WorksheetGridCache:
+    """
+    Cache grid worksheet (list of list of str) per (sheet_id, title).
+
+    Grid hanya disimpan selama ada session() yang aktif, supaya data lama tidak
+    terbawa ke sync berikutnya pada proses yang sama (mis. scheduler).
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._grids = {}
+        self._depth = 0
+        self._stats = {'hits': 0, 'misses': 0, 'prefetched': 0, 'batch_calls': 0}
+
+    @contextmanager
+    def session(self):
+        with self._lock:
+            self._depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._grids.clear()
+
+    @property
+    def active(self):
+        return self._depth > 0
+
+    def get(self, sheet_id, title):
+        with self._lock:
+            grid = self._grids.get((sheet_id, title))
+            self._stats['hits' if grid is not None else 'misses'] += 1
+            return grid
+
+    def put(self, sheet_id, title, grid):
+        with self._lock:
+            if self.active:
+                self._grids[(sheet_id, title)] = grid
+
+    def record(self, key, count=1):
+        with self._lock:
+            self._stats[key] += count
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats)
+
+    def report(self):
+        """Ringkasan satu baris untuk output sync_data/log."""
+        stats = self.stats()
+        return (
+            f"prefetch: {stats['prefetched']} worksheet dalam {stats['batch_calls']} batchGet; "
+            f"cache: {stats['hits']} hit, {stats['misses']} miss"
+        )
+
+
+grid_cache = WorksheetGridCache()
+
+
+def prefetch_worksheets(sheet_id=INDICATOR_SHEET_ID, titles=None):
+    """
+    Mengambil beberapa worksheet sekaligus lewat values.batchGet.
+
+    Args:
+        sheet_id: ID spreadsheet.
+        titles: daftar judul worksheet; None berarti seluruh workbook.
+
+    Returns:
+        dict {title: grid}. Grid di-pad dengan '' seperti get_all_values().
+        Judul yang tidak ada di spreadsheet dilewati dengan warning.
+    """
+    available = [ws.title for ws in sheets_registry.worksheets(sheet_id)]
+    if titles is None:
+        wanted = available
+    else:
+        wanted = []
+        for title in dict.fromkeys(titles):
+            if title in available:
+                wanted.append(title)
+            else:
+                print(f"[WARNING] Prefetch: sheet '{title}' tidak ditemukan, dilewati")
+
+    if not wanted:
+        return {}
+
+    spreadsheet = sheets_registry.open(sheet_id)
+    grids = {}
+    for start in range(0, len(wanted), BATCH_SIZE):
+        chunk = wanted[start:start + BATCH_SIZE]
+        response = spreadsheet.values_batch_get(
+            [a1_sheet_range(title) for title in chunk],
+            params={'majorDimension': 'ROWS'},
+        )
+        grid_cache.record('batch_calls')
+        value_ranges = response.get('valueRanges', [])
+        # API mengembalikan valueRanges dengan urutan yang sama seperti ranges
+        for title, value_range in zip(chunk, value_ranges):
+            grid = fill_gaps(value_range.get('values', []))
+            if grid == [[]]:
+                grid = []
+            grids[title] = grid
+            grid_cache.put(sheet_id, title, grid)
+
+    grid_cache.record('prefetched', len(grids))
+    print(f"[INFO] Prefetch: {len(grids)} worksheet dalam {-(-len(wanted) // BATCH_SIZE)} request batchGet")
+    return grids
+
+
+def get_worksheet_values(sheet_id, title):
+    """
+    Mengembalikan grid worksheet, dari cache prefetch bila tersedia.
+    Raise gspread.exceptions.WorksheetNotFound bila worksheet tidak ada.
+    """
+    grid = grid_cache.get(sheet_id, title)
+    if grid is not None:
+        return grid
+
+    grid = sheets_registry.worksheet(sheet_id, title).get_all_values()
+    grid_cache.put(sheet_id, title, grid)
+    return grid
+
+
+def service_worksheets(*services):
+    """Daftar judul worksheet yang dibaca oleh service-service yang diberikan."""
+    titles = []
+    for service in services:
+        if hasattr(service, 'worksheet_names'):
+            titles.extend(service.worksheet_names())
+        else:
+            titles.append(service.WORKSHEET_NAME)
+    return titles
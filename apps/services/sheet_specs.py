@@ -0,0 +1,219 @@
+"""
+Parser deklaratif untuk worksheet indikator "lebar" (satu kolom per tahun).
+
+IPM, Gini Ratio dan tujuh sub-indikator IPM memakai layout yang sama:
+
+    Kabupaten/Kota | 2019 | 2020 | 2021 | ...
+    KOTA SURABAYA  | 82,2 | 82,3 | 82,8 | ...
+
+Sebelumnya setiap service punya salinan ~100 baris kode untuk rename kolom
+lokasi, mencari kolom tahun, melt, parse angka, lalu iterrows() saat menyimpan.
+Di sini perbedaannya cukup ditulis sebagai WideSheetSpec, dan satu parser
+vektor (NumPy/pandas, tanpa loop per sel) dipakai untuk semuanya.
+"""
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+import gspread
+import numpy as np
+import pandas as pd
+
+from apps.models import (
+    HumanDevelopmentIndex, GiniRatio,
+    IPM_UHH_SP, IPM_HLS, IPM_RLS, IPM_PengeluaranPerKapita,
+    IPM_IndeksKesehatan, IPM_IndeksHidupLayak, IPM_IndeksPendidikan,
+)
+from apps.services.bulk_writer import bulk_upsert
+from apps.services.number_parser import DECIMAL, parse_numbers, report_invalid
+from apps.services.regions import resolve_regions
+from apps.services.sheet_prefetch import get_worksheet_values
+from apps.services.sheets_client import INDICATOR_SHEET_ID
+
+logger = logging.getLogger(__name__)
+
+LOCATION_COLUMN = 'Kabupaten/Kota'
+
+# Variasi header kolom lokasi di workbook IPM, dicek berurutan sebelum pencarian keyword
+IPM_LOCATION_ALIASES = ('Kabupaten/Kota\nRegency/Municipality', 'Kabupaten/Kot', 'Provinsi')
+IPM_LOCATION_KEYWORDS = ('kabupaten', 'kota', 'kot', 'provinsi')
+
+
+@dataclass(frozen=True)
+class WideSheetSpec:
+    """Deskripsi satu worksheet lebar dan model tujuannya."""
+    label: str                              # nama data di log, mis. 'IPM HLS'
+    worksheet_name: str
+    model: type
+    value_field: str = 'value'
+    location_aliases: tuple = IPM_LOCATION_ALIASES
+    location_keywords: tuple = IPM_LOCATION_KEYWORDS
+    round_digits: Optional[int] = None      # dibulatkan sebelum disimpan (decimal_places model)
+
+
+IPM_SPEC = WideSheetSpec(
+    'IPM', "Indeks Pembangunan Manusia Menu_Y-to-Y", HumanDevelopmentIndex, value_field='ipm_value',
+)
+GINI_RATIO_SPEC = WideSheetSpec(
+    'Gini Ratio', "Gini Ratio (bu septa)_Y-to-Y", GiniRatio, value_field='gini_ratio_value',
+    location_aliases=('Kabupaten/Kot',), location_keywords=('kabupaten', 'kota', 'kot'),
+)
+IPM_UHH_SP_SPEC = WideSheetSpec('IPM UHH SP', "IPM_UHH SP_Y-to-Y ", IPM_UHH_SP)
+IPM_HLS_SPEC = WideSheetSpec('IPM HLS', "IPM_HLS_Y-to-Y", IPM_HLS)
+IPM_RLS_SPEC = WideSheetSpec('IPM RLS', "IPM_RLS_Y-to-Y", IPM_RLS)
+IPM_PENGELUARAN_PER_KAPITA_SPEC = WideSheetSpec(
+    'IPM Pengeluaran per Kapita', "IPM_Pengeluaran per kapita_Y-to-Y", IPM_PengeluaranPerKapita,
+    round_digits=2,
+)
+IPM_INDEKS_KESEHATAN_SPEC = WideSheetSpec('IPM Indeks Kesehatan', "IPM_Indeks Kesehatan_Y-to-Y", IPM_IndeksKesehatan)
+IPM_INDEKS_HIDUP_LAYAK_SPEC = WideSheetSpec('IPM Indeks Hidup Layak', "IPM_Indeks Hidup Layak_Y-to-Y", IPM_IndeksHidupLayak)
+IPM_INDEKS_PENDIDIKAN_SPEC = WideSheetSpec('IPM Indeks Pendidikan', "IPM_Indeks Pendidikan_Y-to-Y", IPM_IndeksPendidikan)
+
+WIDE_SHEET_SPECS = [
+    IPM_SPEC, GINI_RATIO_SPEC,
+    IPM_UHH_SP_SPEC, IPM_HLS_SPEC, IPM_RLS_SPEC, IPM_PENGELUARAN_PER_KAPITA_SPEC,
+    IPM_INDEKS_KESEHATAN_SPEC, IPM_INDEKS_HIDUP_LAYAK_SPEC, IPM_INDEKS_PENDIDIKAN_SPEC,
+]
+
+
+def find_location_column(headers, spec):
+    """Index kolom lokasi: alias persis, lalu 'Kabupaten/Kota', lalu keyword. None bila tidak ada."""
+    for alias in spec.location_aliases:
+        if alias in headers:
+            return headers.index(alias)
+    if LOCATION_COLUMN in headers:
+        return headers.index(LOCATION_COLUMN)
+    for index, col in enumerate(headers):
+        col_lower = str(col).lower()
+        if any(keyword in col_lower for keyword in spec.location_keywords):
+            return index
+    return None
+
+
+def find_year_columns(headers, location_index):
+    """Index kolom tahun: header 4 digit, atau header numerik apa pun bila tidak ada."""
+    year_columns = [i for i, col in enumerate(headers) if col.isdigit() and len(col) == 4]
+    if not year_columns:
+        year_columns = [
+            i for i, col in enumerate(headers)
+            if i != location_index and col != '' and str(col).strip().isdigit()
+        ]
+    return year_columns
+
+
+def parse_wide_year_sheet(grid, spec):
+    """
+    Mengubah grid worksheet lebar menjadi DataFrame long dengan kolom
+    'Kabupaten/Kota', 'Tahun', 'Value'. Sel kosong/non-numerik dibuang.
+
+    Urutan baris sama dengan pd.melt (per kolom tahun, lalu per baris) supaya
+    baris duplikat diselesaikan dengan cara yang sama seperti sebelumnya.
+    """
+    if not grid or len(grid) < 2:
+        print("[WARNING] No data found in sheet")
+        return pd.DataFrame()
+
+    headers = [str(col) for col in grid[0]]
+    values = pd.DataFrame(grid[1:], columns=range(len(headers))).to_numpy(dtype=object)
+    print(f"[OK] Raw data fetched with shape: {values.shape}")
+
+    location_index = find_location_column(headers, spec)
+    if location_index is None:
+        print(f"[ERROR] Location column not found. Available columns: {headers}")
+        return pd.DataFrame()
+    if headers[location_index] != LOCATION_COLUMN:
+        print(f"[INFO] Found and renamed location column: '{headers[location_index]}' -> '{LOCATION_COLUMN}'")
+
+    year_columns = find_year_columns(headers, location_index)
+    if not year_columns:
+        print("[ERROR] No year columns found")
+        return pd.DataFrame()
+
+    n_rows = values.shape[0]
+    years = np.array([int(headers[i].strip()) for i in year_columns], dtype=np.int64)
+
+    # Melt tanpa loop: blok (baris x tahun) di-flatten per kolom (transpose -> ravel)
+    cells = values[:, year_columns].T.ravel()
+    numbers, invalid = parse_numbers(cells, DECIMAL)
+    report_invalid(spec.label, cells, invalid)
+    valid = ~np.isnan(numbers)
+
+    df_long = pd.DataFrame({
+        LOCATION_COLUMN: np.tile(values[:, location_index], len(year_columns))[valid],
+        'Tahun': np.repeat(years, n_rows)[valid],
+        'Value': numbers[valid],
+    })
+    print(f"[OK] Data processed. Total valid records: {len(df_long)}")
+    return df_long
+
+
+def round_like_python(values, digits):
+    """
+    Pembulatan vektor yang hasilnya sama dengan round(float, digits) bawaan Python.
+
+    np.round mengalikan dengan 10**digits sebelum rint, sehingga nilai yang tepat di
+    tengah (mis. 66.815) bisa dibulatkan ke arah lain. Hanya nilai yang dekat titik
+    tengah itu yang dihitung ulang dengan round() Python.
+    """
+    array = np.asarray(values, dtype=float)
+    rounded = np.round(array, digits)
+    scaled = array * 10 ** digits
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_half.any():
+        rounded[near_half] = [round(value, digits) for value in array[near_half].tolist()]
+    return rounded
+
+
+def wide_sheet_records(df, spec):
+    """
+    DataFrame long -> DataFrame dengan kolom field model (location_name, year,
+    value_field); region_id diisi oleh save_wide_sheet.
+    Baris tanpa nama lokasi dan baris catatan 'Sumber/Source' dibuang.
+    """
+    names = df[LOCATION_COLUMN].astype(str).str.strip()
+    keep = (names != '') & ~names.str.contains('Sumber/Source', regex=False)
+    names = names[keep]
+
+    values = df.loc[keep, 'Value'].to_numpy(dtype=float)
+    if spec.round_digits is not None:
+        values = round_like_python(values, spec.round_digits)
+
+    return pd.DataFrame({
+        'location_name': names.to_numpy(),
+        'year': df.loc[keep, 'Tahun'].to_numpy(),
+        spec.value_field: values,
+    })
+
+
+def fetch_wide_sheet(spec, sheet_id=INDICATOR_SHEET_ID):
+    """Fetch + parse satu worksheet lebar; DataFrame kosong bila gagal."""
+    print(f"[INFO] Fetching {spec.label} data from Google Sheets...")
+    try:
+        grid = get_worksheet_values(sheet_id, spec.worksheet_name)
+        return parse_wide_year_sheet(grid, spec)
+    except gspread.exceptions.SpreadsheetNotFound:
+        logger.error(f"Spreadsheet with ID '{sheet_id}' not found.")
+        print(f"[ERROR] Spreadsheet with ID '{sheet_id}' not found.")
+    except gspread.exceptions.WorksheetNotFound:
+        logger.error(f"Worksheet '{spec.worksheet_name}' not found.")
+        print(f"[ERROR] Worksheet '{spec.worksheet_name}' not found.")
+    except Exception as e:
+        logger.error(f"An error occurred while fetching/processing {spec.label} data: {e}")
+        print(f"[ERROR] Unexpected error: {e}")
+    return pd.DataFrame()
+
+
+def save_wide_sheet(spec, df):
+    """Menyimpan DataFrame hasil parse_wide_year_sheet ke spec.model dengan satu bulk upsert."""
+    if df.empty:
+        print(f"[WARNING] No {spec.label} data to save.")
+        return 0, 0, 0
+
+    records = wide_sheet_records(df, spec)
+    # FK Region di-resolve sekali per nama lokasi unik, bukan per baris
+    records['region_id'] = records['location_name'].map(resolve_regions(records['location_name'].unique()))
+    # Dua ejaan wilayah yang sama pada satu tahun jatuh ke key (region, year) yang sama;
+    # bulk_upsert memakai baris terakhir
+    created_count, updated_count, unchanged_count = bulk_upsert(spec.model, records, label=spec.label)
+    print(f"[INFO] Total {spec.label} records created: {created_count}, updated: {updated_count}, unchanged: {unchanged_count}")
+    return created_count, updated_count, unchanged_count
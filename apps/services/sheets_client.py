@@ -0,0 +1,168 @@
+"""
+Registry client Google Sheets yang dipakai bersama oleh semua service.
+
+Sebelumnya setiap fungsi fetch_* membaca credentials.json, memanggil
+gspread.authorize() dan open_by_key() sendiri-sendiri. Registry ini menyimpan
+satu client per proses (dipakai ulang sampai token kedaluwarsa), satu handle
+spreadsheet per SHEET_ID, dan cache metadata worksheet, lalu mencatat berapa
+banyak panggilan auth/metadata yang berhasil dihemat.
+"""
+import logging
+import threading
+import time
+
+import gspread
+from django.conf import settings
+from oauth2client.service_account import ServiceAccountCredentials
+
+from apps.services.data_source import current_source
+
+logger = logging.getLogger(__name__)
+
+# ID Google Sheet "Indikator Makro Kota Surabaya" yang dibaca oleh semua service
+INDICATOR_SHEET_ID = "1keS9YFYO1qzAawWgLh2U2pY6xX5ppKUnhbdHQYfU5HM"
+
+SCOPE = [
+    'https://www.googleapis.com/auth/spreadsheets',
+    'https://www.googleapis.com/auth/drive'
+]
+
+
+class SheetsClientRegistry:
+    """
+    Thread-safe registry untuk client gspread, handle spreadsheet dan metadata worksheet.
+
+    - Client di-authorize sekali dan dipakai ulang sampai token kedaluwarsa
+      (atau melewati AUTH_TTL sebagai batas aman).
+    - open_by_key() hanya dipanggil sekali per SHEET_ID selama client yang sama masih berlaku.
+    - Daftar worksheet di-cache selama METADATA_TTL detik.
+    - Client dibuat sesuai current_source() (live, record atau replay snapshot);
+      bila sumber data berganti, client dan cache dibuat ulang.
+    """
+
+    # Token service account berlaku 60 menit; authorize ulang sedikit lebih awal
+    AUTH_TTL = 50 * 60
+    METADATA_TTL = getattr(settings, 'SHEETS_METADATA_TTL', 10 * 60)
+
+    def __init__(self, credentials_file='credentials.json'):
+        self.credentials_file = credentials_file
+        self._lock = threading.RLock()
+        self._credentials = None
+        self._client = None
+        self._client_source = None   # DataSource yang dipakai untuk membuat client
+        self._authorized_at = 0.0
+        self._spreadsheets = {}   # sheet_id -> gspread.Spreadsheet
+        self._worksheets = {}     # sheet_id -> (fetched_at, {title: gspread.Worksheet})
+        self._stats = {
+            'auth_calls': 0,
+            'auth_reused': 0,
+            'open_calls': 0,
+            'open_reused': 0,
+            'metadata_calls': 0,
+            'metadata_reused': 0,
+        }
+
+    def _token_expired(self):
+        if self._client is None or self._client_source is not current_source():
+            return True
+        if time.monotonic() - self._authorized_at > self.AUTH_TTL:
+            return True
+        return bool(getattr(self._credentials, 'access_token_expired', False))
+
+    def get_client(self):
+        """Mengembalikan client gspread yang sudah di-authenticate (dipakai ulang bila token masih berlaku)."""
+        with self._lock:
+            if not self._token_expired():
+                self._stats['auth_reused'] += 1
+                return self._client
+
+            # Mode replay tidak membaca credentials; mode record membungkus client live
+            source = current_source()
+            self._credentials = None
+            self._client = source.sheets_client(self._authorize)
+            self._client_source = source
+            self._authorized_at = time.monotonic()
+            self._stats['auth_calls'] += 1
+            # Handle lama terikat ke client lama, jadi harus dibuka ulang
+            self._spreadsheets.clear()
+            self._worksheets.clear()
+            return self._client
+
+    def _authorize(self):
+        self._credentials = ServiceAccountCredentials.from_json_keyfile_name(self.credentials_file, SCOPE)
+        return gspread.authorize(self._credentials)
+
+    def open(self, sheet_id=INDICATOR_SHEET_ID):
+        """Mengembalikan handle gspread.Spreadsheet untuk sheet_id (open_by_key hanya sekali)."""
+        with self._lock:
+            client = self.get_client()
+            spreadsheet = self._spreadsheets.get(sheet_id)
+            if spreadsheet is not None:
+                self._stats['open_reused'] += 1
+                return spreadsheet
+
+            spreadsheet = client.open_by_key(sheet_id)
+            self._spreadsheets[sheet_id] = spreadsheet
+            self._stats['open_calls'] += 1
+            return spreadsheet
+
+    def _worksheet_map(self, sheet_id, refresh=False):
+        with self._lock:
+            spreadsheet = self.open(sheet_id)
+            cached = self._worksheets.get(sheet_id)
+            if cached and not refresh and time.monotonic() - cached[0] < self.METADATA_TTL:
+                self._stats['metadata_reused'] += 1
+                return cached[1]
+
+            worksheets = {ws.title: ws for ws in spreadsheet.worksheets()}
+            self._worksheets[sheet_id] = (time.monotonic(), worksheets)
+            self._stats['metadata_calls'] += 1
+            return worksheets
+
+    def worksheets(self, sheet_id=INDICATOR_SHEET_ID, refresh=False):
+        """Mengembalikan daftar gspread.Worksheet dari cache metadata."""
+        return list(self._worksheet_map(sheet_id, refresh=refresh).values())
+
+    def worksheet(self, sheet_id, title):
+        """
+        Mengembalikan gspread.Worksheet berdasarkan judulnya.
+        Raise gspread.exceptions.WorksheetNotFound seperti Spreadsheet.worksheet().
+        """
+        worksheets = self._worksheet_map(sheet_id)
+        if title not in worksheets:
+            # Worksheet mungkin baru ditambahkan setelah cache dibuat
+            worksheets = self._worksheet_map(sheet_id, refresh=True)
+        if title not in worksheets:
+            raise gspread.exceptions.WorksheetNotFound(title)
+        return worksheets[title]
+
+    def invalidate(self, sheet_id=None):
+        """Menghapus cache handle/metadata (semua atau untuk satu sheet_id)."""
+        with self._lock:
+            if sheet_id is None:
+                self._spreadsheets.clear()
+                self._worksheets.clear()
+            else:
+                self._spreadsheets.pop(sheet_id, None)
+                self._worksheets.pop(sheet_id, None)
+
+    def stats(self):
+        """Statistik pemakaian registry, termasuk jumlah panggilan yang dihemat."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['auth_saved'] = stats['auth_reused']
+        stats['metadata_saved'] = stats['open_reused'] + stats['metadata_reused']
+        return stats
+
+    def report(self):
+        """Ringkasan satu baris untuk output sync_data/log."""
+        stats = self.stats()
+        return (
+            f"auth: {stats['auth_calls']} dipanggil, {stats['auth_saved']} dihemat; "
+            f"metadata: {stats['open_calls'] + stats['metadata_calls']} dipanggil, "
+            f"{stats['metadata_saved']} dihemat"
+        )
+
+
+# Instance tunggal per proses
+sheets_registry = SheetsClientRegistry()
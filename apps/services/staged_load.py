@@ -0,0 +1,312 @@
+"""
+Mode load 'staging': satu dataset ditulis ke tabel staging, lalu digabung ke
+tabel live dalam satu transaksi singkat.
+
+Mode default ('upsert') menulis setiap worksheet / chunk langsung ke tabel live
+dengan transaksinya sendiri, jadi selama sync berjalan halaman seperti PDRB
+atau inflasi bisa menampilkan data yang baru sebagian ter-update. Dengan
+SYNC_LOAD_MODE = 'staging' (atau sync_data --load-mode staging), run_task()
+membuka LoadSession untuk setiap dataset:
+
+1. bulk_upsert() tetap membandingkan baris dengan tabel live (hanya SELECT),
+   tetapi baris baru/berubah ditulis ke TEMP table <tabel>__staging milik
+   koneksi ini, bukan ke tabel live. TEMP table tidak di-fsync dan tidak
+   mengunci database utama.
+2. Setelah task selesai, isi staging divalidasi: jumlah baris sesuai dengan
+   yang di-stage dan baris live yang akan di-update masih ada.
+3. Dalam satu transaksi (satu write lock): INSERT ... SELECT baris baru,
+   UPDATE baris yang berubah, lalu tulisan SyncState yang ditunda
+   (bulk_writer.after_load). Bila satu langkah gagal, semuanya di-rollback dan
+   tabel live tidak tersentuh; SyncState juga tidak berubah sehingga dataset
+   dibaca ulang pada sync berikutnya.
+
+Baris yang tidak ada di sumber tidak dihapus, sama seperti mode upsert.
+"""
+import contextvars
+import itertools
+import logging
+import threading
+from contextlib import contextmanager
+
+from django.apps.registry import Apps
+from django.conf import settings
+from django.db import connections, models, transaction
+
+from apps.services.bulk_writer import bind_load_session, current_load_session
+from apps.services.db_lock import write_lock
+
+logger = logging.getLogger(__name__)
+
+UPSERT = 'upsert'
+STAGING = 'staging'
+LOAD_MODES = (UPSERT, STAGING)
+
+# Per context (thread / task run_tasks()), bukan per proses: sync_data --load-mode tidak
+# ikut mengubah mode load sync lain yang berjalan bersamaan di proses yang sama
+_mode_override = contextvars.ContextVar('load_mode', default=None)
+
+# Registry terpisah: model staging tidak terlihat oleh migrations, admin maupun app registry utama
+_staging_apps = Apps()
+_staging_models = {}
+_staging_models_lock = threading.Lock()
+
+
+class StagingError(Exception):
+    """Isi staging tidak lolos validasi atau tidak bisa digabung ke tabel live."""
+
+
+def current_load_mode():
+    """Mode load aktif: dari use_load_mode(), settings SYNC_LOAD_MODE, atau 'upsert'."""
+    mode = _mode_override.get() or getattr(settings, 'SYNC_LOAD_MODE', UPSERT)
+    if mode not in LOAD_MODES:
+        raise ValueError(f"SYNC_LOAD_MODE tidak dikenal: {mode}")
+    return mode
+
+
+@contextmanager
+def use_load_mode(mode):
+    """
+    Mengganti mode load selama context aktif, di thread ini dan di task yang menyalin
+    context-nya (run_tasks()); dipakai sync_data --load-mode.
+    """
+    if mode not in LOAD_MODES:
+        raise ValueError(f"Mode load tidak dikenal: {mode}")
+    token = _mode_override.set(mode)
+    try:
+        yield
+    finally:
+        _mode_override.reset(token)
+
+
+def _staging_field(field):
+    """Salinan field live tanpa constraint; primary key dan ForeignKey menjadi kolom integer biasa."""
+    if field.is_relation or isinstance(field, models.AutoField):
+        return models.BigIntegerField(null=True, db_column=field.column)
+    name, path, args, kwargs = field.deconstruct()
+    for option in ('primary_key', 'unique', 'db_index', 'auto_now', 'auto_now_add', 'db_column', 'db_comment'):
+        kwargs.pop(option, None)
+    kwargs['null'] = True
+    return field.__class__(*args, db_column=field.column, **kwargs)
+
+
+def staging_model(model):
+    """
+    Model unmanaged untuk <db_table>__staging: semua kolom model live (termasuk primary
+    key, yang terisi bila record menyebutkannya, mis. News.news_id) ditambah live_pk.
+    """
+    with _staging_models_lock:
+        staging = _staging_models.get(model)
+        if staging is not None:
+            return staging
+
+        meta = type('Meta', (), {
+            'app_label': model._meta.app_label,
+            'db_table': f"{model._meta.db_table}__staging",
+            'apps': _staging_apps,
+            'managed': False,
+        })
+        attrs = {
+            '__module__': __name__,
+            'Meta': meta,
+            'staging_id': models.BigIntegerField(primary_key=True),
+            # pk baris live yang di-update; NULL untuk baris baru
+            'live_pk': models.BigIntegerField(null=True),
+        }
+        for field in model._meta.concrete_fields:
+            attrs[field.attname] = _staging_field(field)
+        staging = type(f"{model.__name__}Staging", (models.Model,), attrs)
+        _staging_models[model] = staging
+        return staging
+
+
+class _StagedModel:
+    """Baris staging satu model dalam satu LoadSession."""
+
+    def __init__(self, model, using):
+        self.model = model
+        self.staging = staging_model(model)
+        self.using = using
+        self.keys = {}              # natural key -> (id staging, live pk atau None)
+        self.update_columns = set()
+        self.explicit_pk = False    # record menyebutkan primary key, jadi ikut di-INSERT
+        self._ids = itertools.count(1)
+
+
+class LoadSession:
+    """Staging satu dataset; dibuat oleh dataset_load()."""
+
+    def __init__(self, name):
+        self.name = name
+        self._models = {}
+        self._deferred = []
+
+    def _staged(self, model, using):
+        staged = self._models.get(model)
+        if staged is None:
+            staged = _StagedModel(model, using)
+            self._create_table(staged)
+            self._models[model] = staged
+        return staged
+
+    @staticmethod
+    def _create_table(staged):
+        connection = connections[staged.using]
+        quote = connection.ops.quote_name
+        table = staged.staging._meta.db_table
+        # table_sql() hanya membangun SQL; schema editor tidak dibuka karena bisa jadi
+        # sedang di dalam transaksi (SQLite menolak schema editor di dalam atomic())
+        sql, params = connection.schema_editor().table_sql(staged.staging)
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {quote(table)}")
+            cursor.execute(sql.replace('CREATE TABLE', 'CREATE TEMPORARY TABLE', 1), params)
+            cursor.execute(f"CREATE INDEX {quote(table + '_live_pk')} ON {quote(table)} ({quote('live_pk')})")
+
+    def staged_keys(self, model):
+        staged = self._models.get(model)
+        return staged.keys if staged else {}
+
+    def stage(self, model, using, changes, update_fields, now):
+        """
+        Menulis baris baru/berubah ke staging. changes: list (key, cleaned, pk live atau None).
+        Key yang sudah pernah di-stage menggantikan baris staging sebelumnya.
+        """
+        staged = self._staged(model, using)
+        staged.update_columns.update(model._meta.get_field(name).column for name in update_fields)
+        auto_now_fields = [field for field in model._meta.concrete_fields if getattr(field, 'auto_now', False)]
+        fields = model._meta.concrete_fields
+        pk_name = model._meta.pk.name
+
+        replaced = []
+        rows = []
+        for key, cleaned, pk in changes:
+            if cleaned.get(pk_name) is not None:
+                staged.explicit_pk = True
+            if key in staged.keys:
+                old_id, pk = staged.keys[key]
+                replaced.append(old_id)
+            obj = model(**cleaned)
+            for field in auto_now_fields:
+                setattr(obj, field.attname, now)
+            row_id = next(staged._ids)
+            staged.keys[key] = (row_id, pk)
+            rows.append(staged.staging(
+                staging_id=row_id, live_pk=pk, **{field.attname: getattr(obj, field.attname) for field in fields}
+            ))
+
+        manager = staged.staging.objects.using(using)
+        if replaced:
+            manager.filter(pk__in=replaced).delete()
+        manager.bulk_create(rows, batch_size=500)
+
+    def defer(self, callback, using):
+        self._deferred.append((callback, using))
+
+    def _validate(self, staged):
+        connection = connections[staged.using]
+        quote = connection.ops.quote_name
+        table = quote(staged.staging._meta.db_table)
+        expected_updates = sum(1 for _, pk in staged.keys.values() if pk is not None)
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM {table}")
+            staged_rows = cursor.fetchone()[0]
+            cursor.execute(
+                f"SELECT COUNT(*) FROM {quote(staged.model._meta.db_table)} "
+                f"WHERE {quote(staged.model._meta.pk.column)} IN "
+                f"(SELECT live_pk FROM {table} WHERE live_pk IS NOT NULL)"
+            )
+            live_rows = cursor.fetchone()[0]
+        if staged_rows != len(staged.keys):
+            raise StagingError(
+                f"{staged.model.__name__}: staging berisi {staged_rows} baris, seharusnya {len(staged.keys)}"
+            )
+        if live_rows != expected_updates:
+            raise StagingError(
+                f"{staged.model.__name__}: {expected_updates - live_rows} baris yang akan di-update "
+                f"sudah tidak ada di tabel live"
+            )
+
+    @staticmethod
+    def _merge(staged):
+        """INSERT baris baru dan UPDATE baris berubah dari staging ke tabel live. Returns (inserted, updated)."""
+        model = staged.model
+        connection = connections[staged.using]
+        quote = connection.ops.quote_name
+        live = quote(model._meta.db_table)
+        table = quote(staged.staging._meta.db_table)
+        pk = quote(model._meta.pk.column)
+        columns = ', '.join(
+            quote(field.column) for field in model._meta.concrete_fields
+            if staged.explicit_pk or not field.primary_key
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {live} ({columns}) SELECT {columns} FROM {table} WHERE live_pk IS NULL")
+            inserted = cursor.rowcount
+            updated = 0
+            if staged.update_columns:
+                assignments = ', '.join(
+                    f"{quote(column)} = (SELECT s.{quote(column)} FROM {table} s WHERE s.live_pk = {live}.{pk})"
+                    for column in sorted(staged.update_columns)
+                )
+                cursor.execute(
+                    f"UPDATE {live} SET {assignments} "
+                    f"WHERE {pk} IN (SELECT live_pk FROM {table} WHERE live_pk IS NOT NULL)"
+                )
+                updated = cursor.rowcount
+        return inserted, updated
+
+    def swap(self):
+        """Validasi lalu gabungkan semua staging dan tulisan yang ditunda dalam satu transaksi."""
+        for staged in self._models.values():
+            self._validate(staged)
+
+        usings = {staged.using for staged in self._models.values()} | {using for _, using in self._deferred}
+        if not usings:
+            return
+        if len(usings) > 1:
+            raise StagingError(f"Staging {self.name} menulis ke lebih dari satu database: {sorted(usings)}")
+        using = usings.pop()
+        with write_lock(using), transaction.atomic(using=using):
+            for staged in self._models.values():
+                expected_inserts = sum(1 for _, pk in staged.keys.values() if pk is None)
+                inserted, updated = self._merge(staged)
+                if inserted != expected_inserts or (staged.update_columns and updated != len(staged.keys) - expected_inserts):
+                    raise StagingError(
+                        f"{staged.model.__name__}: {inserted} baris ditambahkan dan {updated} diperbarui, "
+                        f"tidak sesuai staging"
+                    )
+            for callback, _ in self._deferred:
+                callback()
+
+        total = sum(len(staged.keys) for staged in self._models.values())
+        logger.info(f"Staging {self.name}: {total} baris digabung ke tabel live dalam satu transaksi")
+
+    def close(self):
+        """Menghapus semua TEMP table staging session ini."""
+        for staged in self._models.values():
+            connection = connections[staged.using]
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(f"DROP TABLE IF EXISTS {connection.ops.quote_name(staged.staging._meta.db_table)}")
+            except Exception as e:
+                logger.warning(f"Gagal menghapus tabel staging {staged.staging._meta.db_table}: {e}")
+
+
+@contextmanager
+def dataset_load(name):
+    """
+    Context untuk satu dataset (dipakai run_task). Pada mode 'staging' semua
+    bulk_upsert() di thread ini masuk ke staging dan digabung ke tabel live saat
+    context selesai tanpa error; pada mode 'upsert' tidak melakukan apa pun.
+    """
+    if current_load_mode() != STAGING or current_load_session() is not None:
+        yield None
+        return
+
+    session = LoadSession(name)
+    try:
+        with bind_load_session(session):
+            yield session
+        session.swap()
+    finally:
+        session.close()
@@ -0,0 +1,143 @@
+"""
+Jadwal sync per dataset berdasarkan frekuensi rilisnya.
+
+Setiap SyncTask punya cadence (daily/monthly/quarterly/annual). Scheduler
+menjalankan satu job per dataset pada DatasetSchedule.next_run_at, lalu
+menghitung jadwal berikutnya dari hasil sync:
+
+- data berubah (ada baris baru/diperbarui): interval kembali ke interval awal
+  cadence, dan jarak antar perubahan dipelajari (rata-rata bergerak);
+- data tidak berubah: interval diperpanjang (BACKOFF) sampai batas maksimum,
+  sehingga seri tahunan tidak dibaca ulang setiap malam;
+- mendekati perkiraan rilis berikutnya (perubahan terakhir + jarak rata-rata):
+  interval dipersempit ke batas minimum supaya data baru cepat masuk;
+- sync gagal: dicoba lagi setelah interval minimum.
+"""
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import router
+from django.utils import timezone
+
+from apps.models import DatasetSchedule, SyncRun
+from apps.services.db_lock import write_lock
+from apps.services.sheet_prefetch import grid_cache, prefetch_worksheets, service_worksheets
+from apps.services.sheets_client import INDICATOR_SHEET_ID
+from apps.services.sync_orchestrator import ANNUAL, DAILY, MONTHLY, QUARTERLY, SYNC_TASKS
+from apps.services.sync_telemetry import track_run
+
+logger = logging.getLogger(__name__)
+
+# Pengali interval setelah sync yang tidak menemukan perubahan
+BACKOFF = getattr(settings, 'SYNC_CADENCE_BACKOFF', 1.5)
+# Lebar jendela rilis di sekitar perkiraan perubahan berikutnya, relatif terhadap jaraknya
+RELEASE_WINDOW = 0.1
+
+
+@dataclass(frozen=True)
+class CadencePolicy:
+    period: timedelta       # jarak rilis nominal
+    check: timedelta        # interval pemeriksaan awal / setelah data berubah
+    min_check: timedelta    # interval di jendela rilis dan setelah error
+    max_check: timedelta    # batas backoff
+
+
+POLICIES = {
+    DAILY: CadencePolicy(timedelta(days=1), timedelta(hours=6), timedelta(hours=2), timedelta(days=1)),
+    MONTHLY: CadencePolicy(timedelta(days=30), timedelta(days=1), timedelta(hours=6), timedelta(days=7)),
+    QUARTERLY: CadencePolicy(timedelta(days=91), timedelta(days=3), timedelta(hours=12), timedelta(days=14)),
+    ANNUAL: CadencePolicy(timedelta(days=365), timedelta(days=7), timedelta(days=1), timedelta(days=30)),
+}
+
+TASKS_BY_NAME = {task.name: task for task in SYNC_TASKS}
+
+
+def ensure_schedules(now=None):
+    """Membuat DatasetSchedule untuk task yang belum punya (sync pertama: segera). Returns semua jadwal."""
+    now = now or timezone.now()
+    for task in SYNC_TASKS:
+        policy = POLICIES[task.cadence]
+        schedule, created = DatasetSchedule.objects.get_or_create(
+            task_name=task.name,
+            defaults={
+                'cadence': task.cadence,
+                'interval_hours': policy.check / timedelta(hours=1),
+                'next_run_at': now,
+            },
+        )
+        if not created and schedule.cadence != task.cadence:
+            # Cadence di SYNC_TASKS diubah: mulai lagi dari interval awal cadence baru
+            schedule.cadence = task.cadence
+            schedule.interval_hours = policy.check / timedelta(hours=1)
+            schedule.save(update_fields=['cadence', 'interval_hours'])
+    return list(DatasetSchedule.objects.filter(task_name__in=TASKS_BY_NAME))
+
+
+def plan(schedule, changed, failed, now):
+    """Mengisi interval, jarak perubahan dan next_run_at schedule setelah satu kali sync."""
+    policy = POLICIES[schedule.cadence]
+    interval = timedelta(hours=schedule.interval_hours)
+
+    if failed:
+        interval = policy.min_check
+    elif changed:
+        if schedule.last_changed_at:
+            gap = now - schedule.last_changed_at
+            previous = timedelta(hours=schedule.change_period_hours) if schedule.change_period_hours else policy.period
+            period = min(max((previous + gap) / 2, policy.check), policy.period * 2)
+            schedule.change_period_hours = period / timedelta(hours=1)
+        schedule.last_changed_at = now
+        schedule.unchanged_runs = 0
+        interval = policy.check
+    else:
+        schedule.unchanged_runs += 1
+        interval = min(interval * BACKOFF, policy.max_check)
+
+    if not failed and schedule.last_changed_at:
+        period = timedelta(hours=schedule.change_period_hours) if schedule.change_period_hours else policy.period
+        window_start = schedule.last_changed_at + period * (1 - RELEASE_WINDOW)
+        window_end = schedule.last_changed_at + period * (1 + RELEASE_WINDOW)
+        if window_start <= now <= window_end:
+            interval = policy.min_check
+        elif now < window_start:
+            # Jangan melewati awal jendela rilis
+            interval = max(min(interval, window_start - now), policy.min_check)
+
+    schedule.interval_hours = interval / timedelta(hours=1)
+    schedule.next_run_at = now + interval
+    return schedule
+
+
+def run_dataset(task_name):
+    """
+    Sync satu dataset (hanya worksheet miliknya yang di-prefetch) dan menjadwalkan
+    sync berikutnya. Returns DatasetSchedule yang sudah diperbarui.
+    """
+    task = TASKS_BY_NAME[task_name]
+    with grid_cache.session(), track_run(task_name, SyncRun.Trigger.SCHEDULER) as telemetry:
+        if task.services:
+            try:
+                with telemetry.prefetch():
+                    prefetch_worksheets(INDICATOR_SHEET_ID, service_worksheets(*task.services))
+            except Exception as e:
+                print(f"[WARNING] Prefetch gagal, membaca per worksheet: {e}")
+        result = telemetry.run_task(task)
+
+    now = timezone.now()
+    schedule = DatasetSchedule.objects.get(task_name=task_name)
+    changed = result.ok and (result.created + result.updated) > 0
+    plan(schedule, changed=changed, failed=not result.ok, now=now)
+    schedule.last_run_at = now
+    schedule.last_error = result.error or ''
+    with write_lock(router.db_for_write(DatasetSchedule)):
+        schedule.save()
+
+    status = 'berubah' if changed else ('gagal' if not result.ok else 'tidak berubah')
+    logger.info(f"Sync {task_name}: {status}, berikutnya {schedule.next_run_at:%Y-%m-%d %H:%M}")
+    print(
+        f"[SCHEDULER] {task_name}: {result.created} data baru, {result.updated} data diperbarui, "
+        f"{result.unchanged} data tidak berubah ({status}); sync berikutnya {schedule.next_run_at:%Y-%m-%d %H:%M}"
+    )
+    return schedule
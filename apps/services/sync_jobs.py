@@ -0,0 +1,199 @@
+"""
+Antrian job sync berbasis database untuk endpoint /api/sync/*.
+
+Endpoint hanya membuat SyncJob (status queued) dan langsung mengembalikan 202
+dengan job id. Command run_sync_worker mengklaim job satu per satu dan
+menjalankan task yang sama dengan sync_data --type <sync_type>. Selama job
+berjalan, hasil setiap worksheet / daftar API BPS dan setiap task ditulis ke
+SyncJob.progress; total akhir ditulis ke SyncJob.result.
+
+Klaim job memakai UPDATE bersyarat (hanya berhasil bila status masih queued),
+jadi beberapa worker bisa berjalan bersamaan tanpa SELECT ... FOR UPDATE SKIP
+LOCKED yang tidak tersedia di SQLite.
+"""
+import logging
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import router
+from django.utils import timezone
+
+from apps.models import SyncJob, SyncRun
+from apps.services.db_lock import write_lock
+
+# Modul ini di-import oleh views. Service sync (pandas, gspread, bs4) di-import di dalam
+# fungsi, sehingga baru dimuat saat sync diminta atau dijalankan worker, bukan untuk
+# setiap proses web yang hanya menyajikan halaman.
+
+logger = logging.getLogger(__name__)
+
+# Job running tanpa aktivitas selama N menit dianggap ditinggal worker yang mati
+STALE_MINUTES = getattr(settings, 'SYNC_JOB_STALE_MINUTES', 60)
+
+ACTIVE_STATUSES = (SyncJob.Status.QUEUED, SyncJob.Status.RUNNING)
+
+
+def _using():
+    return router.db_for_write(SyncJob)
+
+
+def enqueue(sync_type):
+    """
+    Membuat job untuk sync_type. Bila sudah ada job queued/running untuk sync_type
+    yang sama, job itu yang dikembalikan supaya request berulang tidak menumpuk.
+
+    Returns:
+        (job, created)
+    """
+    from apps.services.sync_orchestrator import SYNC_TYPES
+
+    if sync_type not in SYNC_TYPES:
+        raise ValueError(f"Jenis sync tidak dikenal: {sync_type}")
+    with write_lock(_using()):
+        job = (
+            SyncJob.objects.filter(sync_type=sync_type, status__in=ACTIVE_STATUSES)
+            .order_by('created_at')
+            .first()
+        )
+        if job is not None:
+            return job, False
+        return SyncJob.objects.create(sync_type=sync_type), True
+
+
+def claim_next(worker):
+    """Menandai job queued tertua sebagai running milik `worker`. Returns SyncJob atau None."""
+    while True:
+        job = SyncJob.objects.filter(status=SyncJob.Status.QUEUED).order_by('created_at').first()
+        if job is None:
+            return None
+        now = timezone.now()
+        with write_lock(_using()):
+            claimed = SyncJob.objects.filter(pk=job.pk, status=SyncJob.Status.QUEUED).update(
+                status=SyncJob.Status.RUNNING, worker=worker, started_at=now, heartbeat_at=now,
+            )
+        if claimed:
+            job.refresh_from_db()
+            return job
+        # Sudah diambil worker lain; coba job berikutnya
+
+
+def fail_stale_jobs():
+    """Job running yang tidak ada aktivitas selama STALE_MINUTES ditandai gagal. Returns jumlah job."""
+    now = timezone.now()
+    with write_lock(_using()):
+        return SyncJob.objects.filter(
+            status=SyncJob.Status.RUNNING,
+            heartbeat_at__lt=now - timedelta(minutes=STALE_MINUTES),
+        ).update(
+            status=SyncJob.Status.FAILED,
+            error='Worker berhenti sebelum job selesai',
+            finished_at=now,
+        )
+
+
+class JobProgress:
+    """Mengumpulkan progress satu job dan menuliskannya ke SyncJob.progress."""
+
+    def __init__(self, job):
+        self.job_id = job.pk
+        self.data = {'tasks': {}, 'sheets': {}}
+        self._lock = threading.Lock()
+
+    def _save(self):
+        with write_lock(_using()):
+            SyncJob.objects.filter(pk=self.job_id).update(progress=self.data, heartbeat_at=timezone.now())
+
+    def sheet_done(self, key, created, updated, unchanged, skipped=False):
+        with self._lock:
+            self.data['sheets'][key] = {
+                'created': created, 'updated': updated, 'unchanged': unchanged, 'skipped': skipped,
+            }
+            self._save()
+
+    def task_started(self, task):
+        with self._lock:
+            self.data['tasks'][task.name] = {'status': SyncJob.Status.RUNNING}
+            self._save()
+
+    def task_done(self, result):
+        with self._lock:
+            self.data['tasks'][result.task.name] = {
+                'status': SyncJob.Status.SUCCESS if result.ok else SyncJob.Status.FAILED,
+                'created': result.created,
+                'updated': result.updated,
+                'unchanged': result.unchanged,
+                'duration': round(result.duration, 2),
+                'error': result.error,
+            }
+            self._save()
+
+
+def _prefetch(tasks, telemetry):
+    """Seperti sync_data: semua worksheet job diambil dengan batchGet sebelum task berjalan."""
+    from apps.services.sheet_prefetch import prefetch_worksheets, service_worksheets
+    from apps.services.sheets_client import INDICATOR_SHEET_ID
+
+    services = [service for task in tasks for service in task.services]
+    if not services:
+        return
+    try:
+        with telemetry.prefetch():
+            prefetch_worksheets(INDICATOR_SHEET_ID, service_worksheets(*services))
+    except Exception as e:
+        # Service tetap bisa membaca worksheet satu per satu
+        print(f"[WARNING] Prefetch gagal, membaca per worksheet: {e}")
+
+
+def summarize(results):
+    """Total dan hasil per task, bentuknya sama dengan 'details' respons sync lama."""
+    tasks = {}
+    for result in results:
+        entry = {'created': result.created, 'updated': result.updated, 'unchanged': result.unchanged}
+        if result.sheets:
+            entry['sheets'] = result.sheets
+        if not result.ok:
+            entry['error'] = result.error
+        tasks[result.task.name] = entry
+    return {
+        'total_created': sum(r.created for r in results),
+        'total_updated': sum(r.updated for r in results),
+        'total_unchanged': sum(r.unchanged for r in results),
+        'tasks': tasks,
+    }
+
+
+def execute(job, workers=1):
+    """Menjalankan job yang sudah diklaim sampai selesai dan menyimpan hasilnya."""
+    from apps.services.sheet_prefetch import grid_cache
+    from apps.services.sync_orchestrator import build_tasks
+    from apps.services.sync_state import on_progress
+    from apps.services.sync_telemetry import track_run
+
+    tasks = build_tasks(job.sync_type)
+    progress = JobProgress(job)
+    error = ''
+    results = []
+    try:
+        with grid_cache.session(), on_progress(progress.sheet_done), \
+                track_run(job.sync_type, SyncRun.Trigger.API) as telemetry:
+            _prefetch(tasks, telemetry)
+            results = telemetry.run_tasks(
+                tasks, workers=workers, on_start=progress.task_started, on_result=progress.task_done,
+            )
+    except Exception as e:
+        logger.error(f"Error menjalankan job sync #{job.pk}: {e}")
+        error = str(e)
+
+    failed = [result for result in results if not result.ok]
+    if failed and not error:
+        error = '; '.join(f"{result.task.name}: {result.error}" for result in failed)
+
+    job.status = SyncJob.Status.FAILED if error else SyncJob.Status.SUCCESS
+    job.result = summarize(results)
+    job.progress = progress.data
+    job.error = error
+    job.finished_at = job.heartbeat_at = timezone.now()
+    with write_lock(_using()):
+        job.save(update_fields=['status', 'result', 'progress', 'error', 'finished_at', 'heartbeat_at'])
+    return job
@@ -0,0 +1,206 @@
+"""
+Pengukuran per tahap sync untuk benchmark_sync dan telemetry SyncRun/SyncStep.
+
+run_sheet_sync() dan run_bps_sync() membungkus tiap tahap dengan stage():
+
+    fetch   membaca grid worksheet / halaman API BPS
+    parse   fetch_*() service: grid mentah -> DataFrame
+    save    save_*_to_db(): bulk upsert ke database
+    state   hash konten dan baca/tulis SyncState
+
+Selama StageRecorder aktif (recording()), setiap tahap mencatat durasi, jumlah
+query SQL, jumlah baris, sel dan byte yang dibaca, per task dan per step
+(worksheet / daftar API BPS, lihat step()). Tanpa recorder (recording() atau
+bind()), stage() dan step() hanya yield sehingga sync biasa tidak terpengaruh.
+"""
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+
+from django.db import connections
+
+STAGES = ('fetch', 'parse', 'save', 'state')
+# Nama task untuk batchGet worksheet sebelum task dataset berjalan
+PREFETCH_TASK = '(prefetch worksheet)'
+
+
+class StageMeasure:
+    """Diisi pemanggil stage(): jumlah baris, sel dan byte yang diproses tahap ini."""
+    __slots__ = ('rows', 'cells', 'bytes')
+
+    def __init__(self):
+        self.rows = 0
+        self.cells = 0
+        self.bytes = 0
+
+
+class StageRecorder:
+    """Total per (task, step, tahap): detik, query, baris, sel, byte, jumlah pemanggilan."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._totals = {}
+        self._errors = {}
+
+    @property
+    def current_task(self):
+        return getattr(self._local, 'task', None)
+
+    @property
+    def current_step(self):
+        return getattr(self._local, 'step', None)
+
+    @contextmanager
+    def task(self, name):
+        """Semua tahap di thread ini dicatat atas nama task `name`."""
+        previous = self.current_task
+        self._local.task = name
+        try:
+            yield
+        finally:
+            self._local.task = previous
+
+    def add(self, stage, seconds, queries, measure):
+        key = (self.current_task, self.current_step, stage)
+        with self._lock:
+            totals = self._totals.setdefault(
+                key, {'seconds': 0.0, 'queries': 0, 'rows': 0, 'cells': 0, 'bytes': 0, 'calls': 0},
+            )
+            totals['seconds'] += seconds
+            totals['queries'] += queries
+            totals['rows'] += measure.rows
+            totals['cells'] += measure.cells
+            totals['bytes'] += measure.bytes
+            totals['calls'] += 1
+
+    def add_error(self, error):
+        with self._lock:
+            self._errors[(self.current_task, self.current_step)] = str(error)
+
+    def stages(self, task):
+        """{tahap: totals} untuk satu task (semua step dijumlahkan), dalam urutan STAGES."""
+        found = {}
+        with self._lock:
+            for (name, _, stage), totals in self._totals.items():
+                if name != task:
+                    continue
+                merged = found.setdefault(stage, dict.fromkeys(totals, 0))
+                for field, value in totals.items():
+                    merged[field] += value
+        return {stage: found[stage] for stage in STAGES if stage in found}
+
+    def steps(self):
+        """{(task, step): {'stages': {tahap: totals}, 'error': str atau None}} untuk semua step tercatat."""
+        result = {}
+        with self._lock:
+            for (task, step, stage), totals in self._totals.items():
+                entry = result.setdefault((task, step), {'stages': {}, 'error': None})
+                entry['stages'][stage] = dict(totals)
+            for key, error in self._errors.items():
+                result.setdefault(key, {'stages': {}, 'error': None})['error'] = error
+        return result
+
+
+class QueryCounter:
+    """execute_wrapper Django yang menghitung query di semua koneksi thread ini."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+    @contextmanager
+    def installed(self):
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(self))
+            yield self
+
+
+_active = None
+_active_lock = threading.Lock()
+_nesting = threading.local()
+_bound = threading.local()
+
+
+def current_recorder():
+    """Recorder yang dipakai thread ini: hasil bind(), atau recorder global dari recording()."""
+    return getattr(_bound, 'recorder', None) or _active
+
+
+@contextmanager
+def recording():
+    """Mengaktifkan StageRecorder baru untuk semua thread selama context aktif."""
+    global _active
+    recorder = StageRecorder()
+    with _active_lock:
+        previous, _active = _active, recorder
+    try:
+        yield recorder
+    finally:
+        with _active_lock:
+            _active = previous
+
+
+@contextmanager
+def bind(recorder):
+    """
+    Tahap di thread ini dicatat ke `recorder` selama context aktif, terlepas dari
+    recording() global. Dipakai beberapa sync yang berjalan bersamaan di satu
+    proses (mis. dataset scheduler) agar masing-masing punya recorder sendiri.
+    """
+    previous = getattr(_bound, 'recorder', None)
+    _bound.recorder = recorder
+    try:
+        yield recorder
+    finally:
+        _bound.recorder = previous
+
+
+@contextmanager
+def stage(name):
+    """
+    Mengukur satu tahap bila ada recorder aktif. Tahap di dalam tahap lain
+    tidak dicatat terpisah (waktunya sudah termasuk tahap luar).
+    """
+    measure = StageMeasure()
+    recorder = current_recorder()
+    if recorder is None or getattr(_nesting, 'depth', 0):
+        yield measure
+        return
+
+    _nesting.depth = 1
+    counter = QueryCounter()
+    started = time.perf_counter()
+    try:
+        with counter.installed():
+            yield measure
+    finally:
+        _nesting.depth = 0
+        recorder.add(name, time.perf_counter() - started, counter.count, measure)
+
+
+@contextmanager
+def step(key):
+    """
+    Semua tahap di dalam context ini dicatat atas nama step `key` (judul worksheet
+    atau model API BPS) di task yang sedang aktif. Exception yang lewat dicatat
+    sebagai error step lalu diteruskan.
+    """
+    recorder = current_recorder()
+    if recorder is None:
+        yield
+        return
+
+    previous = recorder.current_step
+    recorder._local.step = key
+    try:
+        yield
+    except Exception as e:
+        recorder.add_error(e)
+        raise
+    finally:
+        recorder._local.step = previous
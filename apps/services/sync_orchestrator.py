@@ -0,0 +1,209 @@
+"""
+Orkestrator sync_data: daftar task per --type dan eksekusi paralel.
+
+Setiap dataset menulis ke tabelnya sendiri dan hampir seluruh waktunya habis
+untuk menunggu jaringan (Google Sheets / API BPS), jadi task-task ini tidak
+saling bergantung dan bisa dijalankan bersamaan di thread pool. Dengan
+workers=1 task dijalankan berurutan di thread pemanggil, persis seperti
+if-chain sync_data sebelumnya.
+"""
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from django.db import connections
+
+from apps.services.API_service import (
+    IPMService,
+    BPSNewsService,
+    BPSPublicationService,
+    BPSInfographicService,
+    HotelOccupancyCombinedService,
+    HotelOccupancyYearlyService,
+    GiniRatioService,
+    IPM_UHH_SPService,
+    IPM_HLSService,
+    IPM_RLSService,
+    IPM_PengeluaranPerKapitaService,
+    IPM_IndeksKesehatanService,
+    IPM_IndeksHidupLayakService,
+    IPM_IndeksPendidikanService,
+    KetenagakerjaanTPTService,
+    KetenagakerjaanTPAKService,
+    KemiskinanSurabayaService,
+    KemiskinanJawaTimurService,
+    KependudukanService,
+    PDRBPengeluaranService,
+    PDRBLapanganUsahaService,
+    InflasiService
+)
+from apps.services.staged_load import dataset_load
+
+logger = logging.getLogger(__name__)
+
+# Seberapa sering sumber data biasanya diperbarui; dipakai scheduler (apps.services.sync_cadence)
+DAILY = 'daily'
+MONTHLY = 'monthly'
+QUARTERLY = 'quarterly'
+ANNUAL = 'annual'
+CADENCES = (DAILY, MONTHLY, QUARTERLY, ANNUAL)
+
+
+@dataclass(frozen=True)
+class SyncTask:
+    """Satu dataset yang di-sync oleh sync_data."""
+    name: str                       # label di output, mis. 'IPM UHH SP'
+    info: str                       # baris [INFO] sebelum task dijalankan
+    run: Callable[[], object]       # sync_* -> (created, updated, unchanged) atau dict per sheet
+    types: tuple                    # nilai --type (selain 'all') yang menyertakan task ini
+    services: tuple = ()            # service spreadsheet, untuk menentukan worksheet yang di-prefetch
+    sheet_details: bool = False     # tampilkan ringkasan per sheet
+    cadence: str = ANNUAL           # frekuensi rilis data, lihat CADENCES
+
+
+@dataclass
+class SyncResult:
+    task: SyncTask
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    sheets: Optional[dict] = None
+    error: Optional[str] = None
+    duration: float = 0.0
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+# Urutan sama dengan if-chain sync_data sebelumnya
+SYNC_TASKS = [
+    SyncTask('IPM', 'Sinkronisasi data IPM dari spreadsheet...',
+             IPMService.sync_ipm, ('ipm',), (IPMService,)),
+    SyncTask('IPM UHH SP', 'Sinkronisasi data IPM UHH SP...',
+             IPM_UHH_SPService.sync_ipm_uhh_sp, ('ipm-all', 'ipm-uhh-sp'), (IPM_UHH_SPService,)),
+    SyncTask('IPM HLS', 'Sinkronisasi data IPM HLS...',
+             IPM_HLSService.sync_ipm_hls, ('ipm-all', 'ipm-hls'), (IPM_HLSService,)),
+    SyncTask('IPM RLS', 'Sinkronisasi data IPM RLS...',
+             IPM_RLSService.sync_ipm_rls, ('ipm-all', 'ipm-rls'), (IPM_RLSService,)),
+    SyncTask('IPM Pengeluaran per Kapita', 'Sinkronisasi data IPM Pengeluaran per Kapita...',
+             IPM_PengeluaranPerKapitaService.sync_ipm_pengeluaran_per_kapita,
+             ('ipm-all', 'ipm-pengeluaran-per-kapita'), (IPM_PengeluaranPerKapitaService,)),
+    SyncTask('IPM Indeks Kesehatan', 'Sinkronisasi data IPM Indeks Kesehatan...',
+             IPM_IndeksKesehatanService.sync_ipm_indeks_kesehatan,
+             ('ipm-all', 'ipm-indeks-kesehatan'), (IPM_IndeksKesehatanService,)),
+    SyncTask('IPM Indeks Hidup Layak', 'Sinkronisasi data IPM Indeks Hidup Layak...',
+             IPM_IndeksHidupLayakService.sync_ipm_indeks_hidup_layak,
+             ('ipm-all', 'ipm-indeks-hidup-layak'), (IPM_IndeksHidupLayakService,)),
+    SyncTask('IPM Indeks Pendidikan', 'Sinkronisasi data IPM Indeks Pendidikan...',
+             IPM_IndeksPendidikanService.sync_ipm_indeks_pendidikan,
+             ('ipm-all', 'ipm-indeks-pendidikan'), (IPM_IndeksPendidikanService,)),
+    SyncTask('Gini Ratio', 'Sinkronisasi data Gini Ratio dari spreadsheet...',
+             GiniRatioService.sync_gini_ratio, ('gini-ratio',), (GiniRatioService,)),
+    SyncTask('News', 'Sinkronisasi data News dari API BPS...',
+             BPSNewsService.sync_news, ('news',), cadence=DAILY),
+    SyncTask('Publications', 'Sinkronisasi data Publications dari API BPS...',
+             BPSPublicationService.sync_publication, ('publications',), cadence=DAILY),
+    SyncTask('Infographics', 'Sinkronisasi data Infographics dari API BPS...',
+             BPSInfographicService.sync_infographic, ('infographics',), cadence=DAILY),
+    SyncTask('Hotel Occupancy (Gabung Semua)', 'Sinkronisasi data Hotel Occupancy (Gabung Semua) dari spreadsheet...',
+             HotelOccupancyCombinedService.sync_hotel_occupancy_combined,
+             ('hotel-occupancy-combined', 'hotel-occupancy'), (HotelOccupancyCombinedService,), cadence=MONTHLY),
+    SyncTask('Hotel Occupancy (Year-to-Year)', 'Sinkronisasi data Hotel Occupancy (Year-to-Year) dari spreadsheet...',
+             HotelOccupancyYearlyService.sync_hotel_occupancy_yearly,
+             ('hotel-occupancy-yearly', 'hotel-occupancy'), (HotelOccupancyYearlyService,), cadence=MONTHLY),
+    SyncTask('Ketenagakerjaan TPT', 'Sinkronisasi data Ketenagakerjaan TPT dari spreadsheet...',
+             KetenagakerjaanTPTService.sync_ketenagakerjaan_tpt,
+             ('ketenagakerjaan-tpt', 'ketenagakerjaan'), (KetenagakerjaanTPTService,)),
+    SyncTask('Ketenagakerjaan TPAK', 'Sinkronisasi data Ketenagakerjaan TPAK dari spreadsheet...',
+             KetenagakerjaanTPAKService.sync_ketenagakerjaan_tpak,
+             ('ketenagakerjaan-tpak', 'ketenagakerjaan'), (KetenagakerjaanTPAKService,)),
+    SyncTask('Kemiskinan Surabaya', 'Sinkronisasi data Kemiskinan Surabaya dari spreadsheet...',
+             KemiskinanSurabayaService.sync_kemiskinan_surabaya,
+             ('kemiskinan-surabaya', 'kemiskinan'), (KemiskinanSurabayaService,)),
+    SyncTask('Kemiskinan Jawa Timur', 'Sinkronisasi data Kemiskinan Jawa Timur dari spreadsheet...',
+             KemiskinanJawaTimurService.sync_kemiskinan_jawa_timur,
+             ('kemiskinan-jawa-timur', 'kemiskinan'), (KemiskinanJawaTimurService,)),
+    SyncTask('Kependudukan', 'Sinkronisasi data Kependudukan dari spreadsheet...',
+             KependudukanService.sync_kependudukan, ('kependudukan',), (KependudukanService,)),
+    SyncTask('PDRB Pengeluaran', 'Sinkronisasi data PDRB Pengeluaran dari spreadsheet...',
+             PDRBPengeluaranService.sync_all_pdrb_pengeluaran,
+             ('pdrb-pengeluaran', 'pdrb'), (PDRBPengeluaranService,), cadence=QUARTERLY),
+    SyncTask('PDRB Lapangan Usaha', 'Sinkronisasi data PDRB Lapangan Usaha dari spreadsheet...',
+             PDRBLapanganUsahaService.sync_all_pdrb_lapangan_usaha,
+             ('pdrb-lapangan-usaha', 'pdrb'), (PDRBLapanganUsahaService,), cadence=QUARTERLY),
+    SyncTask('Inflasi', 'Sinkronisasi data Inflasi dari spreadsheet...',
+             InflasiService.sync_all_inflasi, ('inflasi',), (InflasiService,), sheet_details=True, cadence=MONTHLY),
+]
+
+SYNC_TYPES = ['all'] + list(dict.fromkeys(t for task in SYNC_TASKS for t in task.types))
+
+
+def build_tasks(sync_type):
+    """Daftar task (tanpa dependensi antar task) untuk nilai --type."""
+    return [task for task in SYNC_TASKS if sync_type == 'all' or sync_type in task.types]
+
+
+def run_task(task):
+    """Menjalankan satu task dan mengembalikan SyncResult; exception dicatat, tidak di-raise."""
+    result = SyncResult(task=task)
+    started = time.perf_counter()
+    try:
+        # Mode load 'staging': seluruh dataset digabung ke tabel live setelah task.run() selesai
+        with dataset_load(task.name):
+            output = task.run()
+        if isinstance(output, dict):
+            result.sheets = output
+            result.created = sum(r['created'] for r in output.values())
+            result.updated = sum(r['updated'] for r in output.values())
+            result.unchanged = sum(r['unchanged'] for r in output.values())
+        else:
+            result.created, result.updated, result.unchanged = output
+    except Exception as e:
+        logger.error(f"Error sync {task.name}: {e}")
+        result.error = str(e)
+    finally:
+        result.duration = time.perf_counter() - started
+        if threading.current_thread() is not threading.main_thread():
+            # Koneksi DB bersifat per-thread; tutup agar tidak bocor setelah worker selesai
+            connections.close_all()
+    return result
+
+
+def run_tasks(tasks, workers=1, on_start=None, on_result=None):
+    """
+    Menjalankan task di thread pool berukuran `workers`.
+
+    on_start(task) dan on_result(result) dipanggil saat task mulai/selesai; dengan
+    workers=1 urutannya deterministik mengikuti urutan task. Hasil dikembalikan
+    dalam urutan task, bukan urutan selesai.
+    """
+    if workers <= 1 or len(tasks) <= 1:
+        results = []
+        for task in tasks:
+            if on_start:
+                on_start(task)
+            result = run_task(task)
+            if on_result:
+                on_result(result)
+            results.append(result)
+        return results
+
+    results = [None] * len(tasks)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='sync') as executor:
+        futures = {}
+        for index, task in enumerate(tasks):
+            if on_start:
+                on_start(task)
+            # Task mewarisi context pemanggil (force_resync(), on_progress() dari sync_state)
+            futures[executor.submit(contextvars.copy_context().run, run_task, task)] = index
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            if on_result:
+                on_result(result)
+    return results
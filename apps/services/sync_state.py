@@ -0,0 +1,321 @@
+"""
+Skip parse + save untuk sumber data yang tidak berubah.
+
+Sebagian besar worksheet (IPM tahunan, hotel tahunan, Inflasi_perkom tahun
+lama) hanya berubah beberapa kali setahun. run_sheet_sync() menghitung hash
+grid mentah worksheet, membandingkannya dengan SyncState dari sync terakhir
+yang berhasil, dan melewati parser serta writer bila hash-nya sama.
+Worksheet yang sudah ditutup (mis. Inflasi_perkom tahun lalu) bahkan tidak
+dibaca: hash-nya hanya dicek ulang setiap FROZEN_RECHECK_DAYS hari. Hash yang
+disimpan memuat SHEET_PARSER_VERSION, jadi perbaikan parser berlaku tanpa --force.
+
+Daftar API BPS (news, publication, infographic) diurutkan dari yang terbaru.
+run_bps_sync() menyimpan high-water mark (item terbaru yang sudah disimpan)
+dan hanya mengambil halaman sampai item tersebut; sync penuh tetap dijalankan
+berkala untuk menangkap item lama yang diedit.
+"""
+import contextvars
+import hashlib
+import json
+import logging
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import router
+from django.utils import timezone
+
+from apps.models import SyncState
+from apps.services.bps_client import bps_client
+from apps.services.bulk_writer import after_load
+from apps.services.db_lock import write_lock
+from apps.services.sheet_prefetch import get_worksheet_values, grid_cache
+from apps.services.sync_metrics import stage, step
+
+logger = logging.getLogger(__name__)
+
+BPS_SOURCE = 'bps-api'
+# Sync penuh (semua halaman) paling lambat setiap N hari
+BPS_FULL_RESYNC_DAYS = getattr(settings, 'BPS_FULL_RESYNC_DAYS', 7)
+# Worksheet yang sudah ditutup dibaca ulang (dibandingkan hash-nya) paling lambat setiap N hari
+FROZEN_RECHECK_DAYS = getattr(settings, 'SYNC_FROZEN_RECHECK_DAYS', 30)
+# Versi parser/sheet spec worksheet. Naikkan bila hasil parse grid yang sama berubah: hash
+# yang tersimpan tidak cocok lagi, sehingga semua worksheet (juga yang sudah ditutup)
+# di-parse dan disimpan ulang sekali pada sync berikutnya.
+SHEET_PARSER_VERSION = 2
+
+# Per context (thread / task run_tasks()), bukan per proses: sync lain yang berjalan bersamaan
+# di proses yang sama (scheduler, worker job) tidak ikut dipaksa atau dilaporkan
+_forced = contextvars.ContextVar('sync_forced', default=False)
+_progress_listeners = contextvars.ContextVar('sync_progress_listeners', default=())
+
+
+@contextmanager
+def force_resync():
+    """Selama context aktif, semua worksheet di-parse dan disimpan ulang walaupun hash-nya sama."""
+    token = _forced.set(True)
+    try:
+        yield
+    finally:
+        _forced.reset(token)
+
+
+def is_forced():
+    return _forced.get()
+
+
+@contextmanager
+def on_progress(callback):
+    """
+    Selama context aktif, callback(key, created, updated, unchanged, skipped) dipanggil
+    setiap kali satu worksheet atau daftar API BPS selesai di-sync oleh sync ini
+    (termasuk task yang dijalankan run_tasks() di thread pool).
+    """
+    token = _progress_listeners.set(_progress_listeners.get() + (callback,))
+    try:
+        yield
+    finally:
+        _progress_listeners.reset(token)
+
+
+def _report_progress(key, counts, skipped=False):
+    for callback in _progress_listeners.get():
+        try:
+            callback(key, *counts, skipped=skipped)
+        except Exception as e:
+            logger.warning(f"Gagal melaporkan progress '{key}': {e}")
+
+
+def versioned_hash(digest):
+    """content_hash SyncState: SHEET_PARSER_VERSION + SHA-256 grid."""
+    return f"v{SHEET_PARSER_VERSION}:{digest}"
+
+
+def hash_grid(grid):
+    """
+    (content_hash, byte) grid worksheet (list of list of str). Hash dihitung per baris
+    (JSON UTF-8 satu baris + newline), sehingga grid sebesar apa pun tidak pernah disalin
+    utuh ke satu payload; jumlah byte yang sama dicatat sebagai byte yang dibaca.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    for row in grid:
+        line = json.dumps(row, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+        digest.update(line)
+        size += len(line)
+    return versioned_hash(digest.hexdigest()), size
+
+
+def grid_hash(grid):
+    """content_hash grid worksheet untuk parser versi sekarang."""
+    return hash_grid(grid)[0]
+
+
+def frozen_state(sheet_id, title, closed_at):
+    """
+    SyncState worksheet yang sudah ditutup pada `closed_at` dan tidak perlu dibaca:
+    hash-nya sudah dicek setelah closed_at dan dalam FROZEN_RECHECK_DAYS hari terakhir,
+    dan terakhir disimpan oleh parser versi sekarang. None bila worksheet harus dibaca
+    (belum ditutup, belum pernah dicek, parser sudah berubah, atau force_resync()).
+    """
+    if closed_at is None or is_forced():
+        return None
+    now = timezone.now()
+    if closed_at > now:
+        return None
+    return SyncState.objects.filter(
+        source=sheet_id,
+        key=title,
+        checked_at__gte=max(closed_at, now - timedelta(days=FROZEN_RECHECK_DAYS)),
+        content_hash__startswith=versioned_hash(''),
+    ).first()
+
+
+def _mark_checked(state):
+    with write_lock(router.db_for_write(SyncState)):
+        SyncState.objects.filter(pk=state.pk).update(checked_at=timezone.now())
+
+
+def _measured_chunks(chunks):
+    """Setiap next() pada generator parser dicatat sebagai tahap 'parse'."""
+    iterator = iter(chunks)
+    while True:
+        with stage('parse') as measure:
+            chunk = next(iterator, None)
+            measure.rows = len(chunk) if chunk else 0
+        if chunk is None:
+            return
+        yield chunk
+
+
+def run_sheet_sync(sheet_id, title, queryset, fetch, save, stream=False, closed_at=None):
+    """
+    Menjalankan fetch -> save untuk satu worksheet, kecuali isinya sama dengan sync terakhir.
+
+    Args:
+        sheet_id: ID spreadsheet.
+        title: judul worksheet.
+        queryset: baris tabel tujuan milik worksheet ini; bila kosong (mis. tabel baru
+            di-reset), worksheet tetap disimpan walaupun hash-nya sama.
+        fetch: fungsi tanpa argumen yang mengembalikan DataFrame hasil parse.
+        save: fungsi save_*_to_db(df) yang mengembalikan (created, updated, unchanged).
+        stream: bila True, fetch() mengembalikan iterable chunk (list of dict) dan
+            save(chunk) dipanggil untuk setiap chunk begitu chunk itu selesai di-parse,
+            sehingga hasil parse satu worksheet tidak pernah ada di memori sekaligus.
+            Setiap chunk di-commit sendiri; SyncState baru ditulis setelah chunk
+            terakhir, jadi worksheet yang gagal di tengah jalan diproses ulang penuh
+            pada sync berikutnya.
+        closed_at: waktu worksheet dianggap selesai dan tidak berubah lagi (mis. akhir
+            tahun untuk sheet tahunan), None bila masih aktif. Setelah hash-nya dicek
+            sekali sesudah closed_at, worksheet tidak dibaca sama sekali sampai
+            FROZEN_RECHECK_DAYS hari kemudian; bila saat dicek ulang hash-nya berubah,
+            worksheet di-parse dan disimpan seperti biasa.
+
+    Returns:
+        (created, updated, unchanged). Worksheet yang dilewati dilaporkan sebagai
+        unchanged sebanyak row_count pada sync terakhir.
+    """
+    with step(title):
+        return _run_sheet_sync(sheet_id, title, queryset, fetch, save, stream, closed_at)
+
+
+def _run_sheet_sync(sheet_id, title, queryset, fetch, save, stream, closed_at):
+    with stage('state'):
+        state = frozen_state(sheet_id, title, closed_at)
+        frozen = state is not None and queryset.exists()
+    if frozen:
+        print(f"[SKIP] Sheet '{title}' sudah ditutup dan dicek {state.checked_at:%Y-%m-%d %H:%M}, tidak dibaca ulang")
+        _report_progress(title, (0, 0, state.row_count), skipped=True)
+        return 0, 0, state.row_count
+
+    # Session menjaga grid tetap di cache sehingga fetch() tidak membaca worksheet dua kali
+    with grid_cache.session():
+        content_hash = None
+        try:
+            with stage('fetch') as measure:
+                grid = get_worksheet_values(sheet_id, title)
+                measure.rows = len(grid)
+                measure.cells = sum(len(row) for row in grid)
+            with stage('state') as measure:
+                # Byte grid dihitung sambil di-hash; dijumlahkan dengan tahap lain di SyncStep.bytes_read
+                content_hash, measure.bytes = hash_grid(grid)
+        except Exception as e:
+            # Biarkan fetch() yang menangani dan melaporkan error seperti biasa
+            logger.warning(f"Gagal menghitung hash sheet '{title}': {e}")
+
+        if content_hash and not is_forced():
+            with stage('state'):
+                state = SyncState.objects.filter(source=sheet_id, key=title).first()
+                unchanged = state and state.content_hash == content_hash and queryset.exists()
+            if unchanged:
+                with stage('state'):
+                    _mark_checked(state)
+                print(f"[SKIP] Sheet '{title}' tidak berubah sejak {state.synced_at:%Y-%m-%d %H:%M}, parse dan save dilewati")
+                _report_progress(title, (0, 0, state.row_count), skipped=True)
+                return 0, 0, state.row_count
+
+        if stream:
+            created_count = updated_count = unchanged_count = parsed_rows = 0
+            for chunk in _measured_chunks(fetch()):
+                parsed_rows += len(chunk)
+                with stage('save') as measure:
+                    created, updated, unchanged = save(chunk)
+                    measure.rows = created + updated + unchanged
+                created_count += created
+                updated_count += updated
+                unchanged_count += unchanged
+        else:
+            with stage('parse') as measure:
+                df = fetch()
+                measure.rows = parsed_rows = len(df)
+            with stage('save') as measure:
+                created_count, updated_count, unchanged_count = save(df)
+                measure.rows = created_count + updated_count + unchanged_count
+
+    if content_hash and parsed_rows:
+        row_count = created_count + updated_count + unchanged_count
+        with stage('state'):
+            # Mode load 'staging': ditulis bersama data worksheet saat staging digabung ke tabel live
+            after_load(lambda: SyncState.objects.update_or_create(
+                source=sheet_id,
+                key=title,
+                defaults={'content_hash': content_hash, 'row_count': row_count, 'checked_at': timezone.now()},
+            ), router.db_for_write(SyncState))
+    _report_progress(title, (created_count, updated_count, unchanged_count))
+    return created_count, updated_count, unchanged_count
+
+
+def run_bps_sync(model, queryset, key_field, item_key, save):
+    """
+    Menjalankan fetch -> save untuk satu daftar API BPS secara incremental.
+
+    Args:
+        model: nama model API BPS ('news', 'publication', 'infographic').
+        queryset: tabel tujuan; bila kosong, semua halaman diambil.
+        key_field: field unik di tabel tujuan (mis. 'news_id').
+        item_key: fungsi item API -> nilai key_field (None bila item tidak valid).
+        save: fungsi save_*_to_db(items) yang mengembalikan (created, updated, unchanged).
+
+    Sync penuh dijalankan bila belum pernah ada, sudah lebih dari
+    BPS_FULL_RESYNC_DAYS hari sejak sync penuh terakhir, atau saat force_resync()
+    aktif. Selain itu halaman diambil sampai menemukan high-water mark atau
+    halaman yang seluruh itemnya sudah ada di database.
+
+    Returns:
+        (created, updated, unchanged) dari save().
+    """
+    with step(model):
+        return _run_bps_sync(model, queryset, key_field, item_key, save)
+
+
+def _run_bps_sync(model, queryset, key_field, item_key, save):
+    with stage('state'):
+        state = SyncState.objects.filter(source=BPS_SOURCE, key=model).first()
+        now = timezone.now()
+        full = (
+            is_forced()
+            or state is None
+            or state.full_synced_at is None
+            or now - state.full_synced_at > timedelta(days=BPS_FULL_RESYNC_DAYS)
+            or not queryset.exists()
+        )
+
+    with stage('fetch') as measure:
+        bytes_before = bps_client.bytes_read(model)
+        if full:
+            items = bps_client.fetch_all_pages(model)
+        else:
+            mark = state.high_water_mark
+            known = {str(value) for value in queryset.values_list(key_field, flat=True)}
+
+            def reached_known(page_items):
+                keys = [str(item_key(item)) for item in page_items]
+                return mark in keys or all(key in known for key in keys)
+
+            items, pages = bps_client.fetch_new_pages(model, reached_known)
+            since = f"{state.full_synced_at:%Y-%m-%d}"
+            print(f"[INFO] {model}: sync incremental, {pages} halaman diambil (sync penuh terakhir {since})")
+        measure.rows = len(items)
+        measure.bytes = bps_client.bytes_read(model) - bytes_before
+
+    with stage('save') as measure:
+        created_count, updated_count, unchanged_count = save(items)
+        measure.rows = created_count + updated_count + unchanged_count
+
+    newest = next((item_key(item) for item in items if item_key(item) is not None), None)
+    if newest is not None:
+        full_synced_at = now if full else state.full_synced_at
+
+        def save_state():
+            # row_count dihitung saat ditulis supaya baris dari staging sudah termasuk
+            defaults = {
+                'high_water_mark': str(newest),
+                'row_count': queryset.count(),
+                'full_synced_at': full_synced_at,
+            }
+            SyncState.objects.update_or_create(source=BPS_SOURCE, key=model, defaults=defaults)
+
+        with stage('state'):
+            after_load(save_state, router.db_for_write(SyncState))
+    _report_progress(model, (created_count, updated_count, unchanged_count))
+    return created_count, updated_count, unchanged_count
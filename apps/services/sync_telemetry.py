@@ -0,0 +1,199 @@
+"""
+Telemetry setiap sync ke tabel SyncRun / SyncStep.
+
+track_run() membuat SyncRun, menjalankan task lewat RunTelemetry.run_tasks()
+dengan StageRecorder milik run ini (lihat sync_metrics.bind), lalu menulis:
+
+- satu SyncStep per task (key kosong): status, durasi, error dan total tahap,
+  termasuk batchGet worksheet sebelum task berjalan (PREFETCH_TASK);
+- satu SyncStep per worksheet / daftar API BPS di task itu: durasi fetch,
+  parse, write dan cek perubahan, byte dan sel yang dibaca, jumlah baris
+  created/updated/unchanged, query SQL dan error.
+
+Di akhir run snapshot indikator dashboard diperbarui bila ada data yang
+berubah (indicator_snapshot.refresh_after_sync).
+
+Gagal menulis telemetry hanya dicatat sebagai warning; sync tetap berjalan.
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import replace
+
+from django.db import router
+from django.utils import timezone
+
+from apps.models import SyncRun, SyncStep
+from apps.services.db_lock import write_lock
+from apps.services.indicator_snapshot import refresh_after_sync
+from apps.services.sync_metrics import PREFETCH_TASK, STAGES, StageRecorder, bind, current_recorder, stage
+from apps.services.sync_orchestrator import run_task, run_tasks
+from apps.services.sync_state import on_progress
+
+logger = logging.getLogger(__name__)
+
+
+def _using():
+    return router.db_for_write(SyncRun)
+
+
+def _apply_stages(step, stages):
+    """Mengisi kolom durasi per tahap, byte, sel dan query SyncStep dari recorder.steps()/stages()."""
+    for stage_name in STAGES:
+        totals = stages.get(stage_name)
+        if totals:
+            setattr(step, f'{stage_name}_seconds', totals['seconds'])
+    step.bytes_read = sum(totals['bytes'] for totals in stages.values())
+    step.cells_read = sum(totals['cells'] for totals in stages.values())
+    step.queries = sum(totals['queries'] for totals in stages.values())
+    step.duration_seconds = sum(totals['seconds'] for totals in stages.values())
+    return step
+
+
+class RunTelemetry:
+    """Mengumpulkan pengukuran satu SyncRun; dibuat oleh track_run()."""
+
+    def __init__(self, run):
+        self.run = run
+        self.recorder = StageRecorder()
+        self.results = []
+        self._counts = {}
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+
+    def _bound(self, task):
+        """Task yang sama, tetapi run() mencatat tahapnya ke recorder run ini (di thread mana pun)."""
+        def run():
+            with bind(self.recorder), self.recorder.task(task.name):
+                return task.run()
+        return replace(task, run=run)
+
+    @contextmanager
+    def prefetch(self):
+        """Mengukur prefetch_worksheets() sebagai tahap fetch task PREFETCH_TASK."""
+        with bind(self.recorder), self.recorder.task(PREFETCH_TASK), stage('fetch'):
+            yield
+
+    def run_task(self, task):
+        result = run_task(self._bound(task))
+        self.results.append(result)
+        return result
+
+    def run_tasks(self, tasks, **kwargs):
+        results = run_tasks([self._bound(task) for task in tasks], **kwargs)
+        self.results.extend(results)
+        return results
+
+    def sheet_done(self, key, created, updated, unchanged, skipped=False):
+        """Listener on_progress(); hanya mencatat worksheet yang di-sync oleh task run ini."""
+        if current_recorder() is not self.recorder:
+            return
+        with self._lock:
+            self._counts[(self.recorder.current_task, key)] = (created, updated, unchanged, skipped)
+
+    def _steps(self):
+        measured = self.recorder.steps()
+        steps = []
+        if any(task == PREFETCH_TASK for task, _ in measured):
+            steps.append(_apply_stages(
+                SyncStep(run=self.run, task=PREFETCH_TASK, status=SyncRun.Status.SUCCESS),
+                self.recorder.stages(PREFETCH_TASK),
+            ))
+        for result in self.results:
+            name = result.task.name
+            task_step = SyncStep(
+                run=self.run,
+                task=name,
+                status=SyncRun.Status.SUCCESS if result.ok else SyncRun.Status.FAILED,
+                created=result.created,
+                updated=result.updated,
+                unchanged=result.unchanged,
+                error=result.error or '',
+            )
+            _apply_stages(task_step, self.recorder.stages(name))
+            task_step.duration_seconds = result.duration
+            steps.append(task_step)
+
+            keys = {key for task, key in measured if task == name and key is not None}
+            keys.update(key for task, key in self._counts if task == name)
+            for key in sorted(keys):
+                entry = measured.get((name, key), {'stages': {}, 'error': None})
+                created, updated, unchanged, skipped = self._counts.get((name, key), (0, 0, 0, False))
+                error = entry['error'] or ''
+                steps.append(_apply_stages(SyncStep(
+                    run=self.run,
+                    task=name,
+                    key=key,
+                    status=SyncRun.Status.FAILED if error else SyncRun.Status.SUCCESS,
+                    created=created,
+                    updated=updated,
+                    unchanged=unchanged,
+                    skipped=skipped,
+                    error=error,
+                ), entry['stages']))
+        return steps
+
+    def finish(self, error=''):
+        """Menulis SyncStep dan menutup SyncRun. `error`: exception yang menghentikan seluruh run."""
+        failed = [result for result in self.results if not result.ok]
+        if failed and not error:
+            error = '; '.join(f"{result.task.name}: {result.error}" for result in failed)
+
+        run = self.run
+        steps = self._steps()
+        run.status = SyncRun.Status.FAILED if error else SyncRun.Status.SUCCESS
+        run.finished_at = timezone.now()
+        run.duration_seconds = time.perf_counter() - self._started
+        run.created = sum(result.created for result in self.results)
+        run.updated = sum(result.updated for result in self.results)
+        run.unchanged = sum(result.unchanged for result in self.results)
+        run.queries = sum(step.queries for step in steps if not step.key)
+        run.error = error
+        with write_lock(_using()):
+            SyncStep.objects.bulk_create(steps)
+            run.save(update_fields=[
+                'status', 'finished_at', 'duration_seconds', 'created', 'updated', 'unchanged', 'queries', 'error',
+            ])
+        return run
+
+
+class _Untracked(RunTelemetry):
+    """Dipakai bila SyncRun tidak bisa dibuat: task tetap berjalan, tidak ada yang ditulis."""
+
+    def finish(self, error=''):
+        return None
+
+
+@contextmanager
+def track_run(sync_type, trigger):
+    """
+    Context untuk satu sync. Task dijalankan lewat telemetry.run_task()/run_tasks();
+    saat context selesai snapshot indikator dashboard diperbarui dan SyncRun ditutup
+    (gagal bila ada exception, yang tetap di-raise).
+
+        with track_run('all', SyncRun.Trigger.COMMAND) as telemetry:
+            results = telemetry.run_tasks(tasks, workers=4)
+    """
+    try:
+        with write_lock(_using()):
+            run = SyncRun.objects.create(sync_type=sync_type, trigger=trigger)
+        telemetry = RunTelemetry(run)
+    except Exception as e:
+        logger.warning(f"Gagal membuat SyncRun untuk sync {sync_type}: {e}")
+        telemetry = _Untracked(None)
+
+    error = ''
+    try:
+        with on_progress(telemetry.sheet_done):
+            yield telemetry
+    except Exception as e:
+        error = str(e) or e.__class__.__name__
+        raise
+    finally:
+        # Snapshot dashboard dihitung ulang dari data yang sudah tersimpan, juga bila sebagian task gagal
+        refresh_after_sync(telemetry.results)
+        try:
+            telemetry.finish(error)
+        except Exception as e:
+            logger.warning(f"Gagal menyimpan telemetry sync {sync_type}: {e}")
@@ -0,0 +1,518 @@
+"""
+Generator snapshot sintetis untuk mode replay (lihat apps.services.data_source).
+
+Menghasilkan workbook "Indikator Makro Kota Surabaya" dengan layout yang sama
+seperti worksheet asli yang dibaca service di API_service (judul worksheet,
+baris header, format angka Indonesia, tanda '*'/'**' pada tahun sementara,
+sel kosong dan '-'), plus halaman endpoint list API BPS untuk news,
+publication dan infographic. Ukurannya bisa diperbesar lewat SyntheticScale:
+lebih banyak tahun, wilayah (worksheet IPM/Gini) dan komoditas (Inflasi_perkom),
+sehingga parser dan writer bisa diukur pada data yang lebih besar dari aslinya.
+
+Hasilnya deterministik untuk seed yang sama.
+"""
+import hashlib
+import math
+import random
+from dataclasses import dataclass, field, replace
+from datetime import date, timedelta
+
+from apps.services.API_service import (
+    HotelOccupancyCombinedService, HotelOccupancyYearlyService,
+    KemiskinanSurabayaService, KemiskinanJawaTimurService, KependudukanService,
+    KetenagakerjaanTPTService, KetenagakerjaanTPAKService,
+    PDRBPengeluaranService, PDRBLapanganUsahaService,
+)
+from apps.services.bps_client import BPS_DOMAIN
+from apps.services.data_source import SnapshotStore
+from apps.services.sheet_specs import (
+    WIDE_SHEET_SPECS, IPM_SPEC, GINI_RATIO_SPEC, IPM_UHH_SP_SPEC, IPM_HLS_SPEC, IPM_RLS_SPEC,
+    IPM_PENGELUARAN_PER_KAPITA_SPEC,
+)
+from apps.services.sheets_client import INDICATOR_SHEET_ID
+
+MONTHS = [
+    'JANUARI', 'FEBRUARI', 'MARET', 'APRIL', 'MEI', 'JUNI',
+    'JULI', 'AGUSTUS', 'SEPTEMBER', 'OKTOBER', 'NOVEMBER', 'DESEMBER',
+]
+
+PROVINCE = 'JAWA TIMUR'
+REGIONS = [
+    'PACITAN', 'PONOROGO', 'TRENGGALEK', 'TULUNGAGUNG', 'BLITAR', 'KEDIRI', 'MALANG',
+    'LUMAJANG', 'JEMBER', 'BANYUWANGI', 'BONDOWOSO', 'SITUBONDO', 'PROBOLINGGO', 'PASURUAN',
+    'SIDOARJO', 'MOJOKERTO', 'JOMBANG', 'NGANJUK', 'MADIUN', 'MAGETAN', 'NGAWI', 'BOJONEGORO',
+    'TUBAN', 'LAMONGAN', 'GRESIK', 'BANGKALAN', 'SAMPANG', 'PAMEKASAN', 'SUMENEP',
+    'KOTA KEDIRI', 'KOTA BLITAR', 'KOTA MALANG', 'KOTA PROBOLINGGO', 'KOTA PASURUAN',
+    'KOTA MOJOKERTO', 'KOTA MADIUN', 'KOTA SURABAYA', 'KOTA BATU',
+]
+
+# (min, max, desimal) per worksheet lebar
+WIDE_SHEET_RANGES = {
+    IPM_SPEC.label: (62, 84, 2),
+    GINI_RATIO_SPEC.label: (0.26, 0.44, 3),
+    IPM_UHH_SP_SPEC.label: (66, 74, 2),
+    IPM_HLS_SPEC.label: (11.5, 15.5, 2),
+    IPM_RLS_SPEC.label: (5, 11.5, 2),
+    IPM_PENGELUARAN_PER_KAPITA_SPEC.label: (9000, 19000, 2),
+}
+DEFAULT_WIDE_RANGE = (55, 90, 2)
+
+POVERTY_INDICATORS = [
+    ('Jumlah Penduduk Miskin (Dlm 000)', 100, 200, 2),
+    ('Persentase Penduduk Miskin', 3.5, 6.5, 2),
+    ('Indeks Kedalaman Kemiskinan (P1)', 0.4, 0.9, 2),
+    ('Indeks Keparahan Kemiskinan (P2)', 0.08, 0.2, 2),
+    ('Garis Kemiskinan (Rp/Kapita/Bulan)', 550000, 800000, 0),
+]
+
+AGE_GROUPS = [
+    '0-4', '5-9', '10-14', '15-19', '20-24', '25-29', '30-34', '35-39',
+    '40-44', '45-49', '50-54', '55-59', '60-64', '65-69', '70-74', '75+',
+]
+
+EXPENDITURE_CATEGORIES = [
+    'Pengeluaran Konsumsi Rumah Tangga',
+    'Pengeluaran Konsumsi LNPRT',
+    'Pengeluaran Konsumsi Pemerintah',
+    'Pembentukan Modal Tetap Bruto',
+    'Perubahan Inventori',
+    'Net Ekspor Barang dan Jasa Antar Daerah',
+    'Produk Domestik Regional Bruto',
+]
+
+INDUSTRY_CATEGORIES = [
+    ('A', 'Pertanian, Kehutanan, dan Perikanan'),
+    ('B', 'Pertambangan dan Penggalian'),
+    ('C', 'Industri Pengolahan'),
+    ('D', 'Pengadaan Listrik dan Gas'),
+    ('E', 'Pengadaan Air, Pengelolaan Sampah, Limbah dan Daur Ulang'),
+    ('F', 'Konstruksi'),
+    ('G', 'Perdagangan Besar dan Eceran; Reparasi Mobil dan Sepeda Motor'),
+    ('H', 'Transportasi dan Pergudangan'),
+    ('I', 'Penyediaan Akomodasi dan Makan Minum'),
+    ('J', 'Informasi dan Komunikasi'),
+    ('K', 'Jasa Keuangan dan Asuransi'),
+    ('L', 'Real Estate'),
+    ('M,N', 'Jasa Perusahaan'),
+    ('O', 'Administrasi Pemerintahan, Pertahanan dan Jaminan Sosial Wajib'),
+    ('P', 'Jasa Pendidikan'),
+    ('Q', 'Jasa Kesehatan dan Kegiatan Sosial'),
+    ('R,S,T,U', 'Jasa lainnya'),
+]
+
+COMMODITY_GROUPS = [
+    'Makanan, Minuman dan Tembakau', 'Pakaian dan Alas Kaki', 'Perumahan, Air, Listrik dan Bahan Bakar',
+    'Perlengkapan, Peralatan dan Pemeliharaan Rutin Rumah Tangga', 'Kesehatan', 'Transportasi',
+    'Informasi, Komunikasi dan Jasa Keuangan', 'Rekreasi, Olahraga dan Budaya', 'Pendidikan',
+    'Penyediaan Makanan dan Minuman/Restoran', 'Perawatan Pribadi dan Jasa Lainnya',
+]
+COMMODITIES = [
+    'Beras', 'Daging Ayam Ras', 'Telur Ayam Ras', 'Cabai Merah', 'Cabai Rawit', 'Bawang Merah',
+    'Bawang Putih', 'Minyak Goreng', 'Gula Pasir', 'Tomat', 'Kangkung', 'Bayam', 'Tempe', 'Tahu Mentah',
+    'Ikan Bandeng', 'Ikan Tongkol', 'Udang Basah', 'Daging Sapi', 'Susu Bubuk', 'Kopi Bubuk',
+    'Teh Celup', 'Rokok Kretek Filter', 'Air Kemasan', 'Mie Kering Instan', 'Roti Manis', 'Kemeja Pendek',
+    'Celana Panjang', 'Sepatu', 'Sewa Rumah', 'Tarif Listrik', 'Bensin', 'Tarif Air Minum PAM',
+    'Sabun Detergen', 'Obat dengan Resep', 'Tarif Angkutan Udara', 'Tarif Kereta Api', 'Pulsa Ponsel',
+    'Biaya Sekolah Dasar', 'Nasi dengan Lauk', 'Es Krim', 'Sabun Mandi', 'Emas Perhiasan',
+]
+
+NEWS_CATEGORIES = [('1', 'Kegiatan Statistik'), ('2', 'Berita Resmi Statistik'), ('3', 'Kegiatan Lainnya')]
+NEWS_SENTENCES = [
+    'Badan Pusat Statistik Kota Surabaya merilis data terbaru mengenai perkembangan indikator makro.',
+    'Inflasi tahunan Kota Surabaya tercatat terkendali sesuai sasaran yang ditetapkan pemerintah.',
+    'Tingkat penghunian kamar hotel berbintang mengalami kenaikan dibandingkan bulan sebelumnya.',
+    'Kegiatan pendataan lapangan dilaksanakan oleh petugas mitra statistik di seluruh kecamatan.',
+    'Pertumbuhan ekonomi didorong oleh lapangan usaha perdagangan besar dan eceran.',
+    'Data ini dapat diakses melalui website resmi BPS Kota Surabaya &amp; aplikasi Allstats.',
+]
+
+
+@dataclass(frozen=True)
+class SyntheticScale:
+    """Ukuran data sintetis; default kira-kira seukuran workbook dan API asli."""
+    years: int = 10                 # jumlah tahun di setiap worksheet
+    regions: int = 38               # kabupaten/kota di worksheet IPM/Gini (di luar baris provinsi)
+    commodities: int = 200          # komoditas per worksheet Inflasi_perkom_YYYY
+    perkom_years: int = 4           # jumlah worksheet Inflasi_perkom_YYYY
+    news: int = 300
+    publications: int = 200
+    infographics: int = 150
+    per_page: int = 10              # item per halaman API BPS
+    end_year: int = field(default_factory=lambda: date.today().year)
+    missing_rate: float = 0.02      # peluang sel kosong / '-'
+    seed: int = 0
+
+    @property
+    def year_range(self):
+        return list(range(self.end_year - self.years + 1, self.end_year + 1))
+
+    def scaled(self, factor):
+        """
+        Ukuran total grid kira-kira x factor: tahun dan wilayah x sqrt(factor)
+        (sel worksheet lebar x factor), komoditas dan item API x factor.
+        Jumlah worksheet tidak berubah.
+        """
+        root = math.sqrt(factor)
+
+        def times(value, multiplier):
+            return max(1, round(value * multiplier))
+
+        return replace(
+            self,
+            years=times(self.years, root),
+            regions=times(self.regions, root),
+            commodities=times(self.commodities, factor),
+            news=times(self.news, factor),
+            publications=times(self.publications, factor),
+            infographics=times(self.infographics, factor),
+        )
+
+
+def format_number(value, decimals, thousands=False):
+    """Angka format Indonesia: koma desimal, titik ribuan (opsional)."""
+    text = f"{value:,.{decimals}f}" if thousands else f"{value:.{decimals}f}"
+    return text.replace(',', '_').replace('.', ',').replace('_', '.')
+
+
+def year_label(year, scale):
+    """Tahun dengan tanda angka sementara (*) dan sangat sementara (**) untuk 2 tahun terakhir."""
+    if year == scale.end_year:
+        return f"{year}**"
+    if year == scale.end_year - 1:
+        return f"{year}*"
+    return str(year)
+
+
+class _Cells:
+    """Pembuat nilai sel: tren per baris + noise, kadang kosong atau '-'."""
+
+    def __init__(self, scale):
+        self.rng = random.Random(scale.seed)
+        self.missing_rate = scale.missing_rate
+
+    def missing(self):
+        if self.rng.random() < self.missing_rate:
+            return self.rng.choice(['', '-'])
+        return None
+
+    def series(self, low, high, count):
+        """Deret `count` nilai yang naik/turun pelan di antara low dan high."""
+        value = self.rng.uniform(low, high)
+        step = (high - low) * 0.02
+        values = []
+        for _ in range(count):
+            value = min(high, max(low, value + self.rng.uniform(-step, step * 1.5)))
+            values.append(value)
+        return values
+
+    def cell(self, value, decimals, thousands=False):
+        missing = self.missing()
+        if missing is not None:
+            return missing
+        return format_number(value, decimals, thousands)
+
+
+def region_names(count):
+    names = REGIONS[:count]
+    for index in range(len(names), count):
+        names.append(f"KABUPATEN SINTETIS {index + 1:03d}")
+    return names
+
+
+def wide_year_sheet(spec, scale, cells):
+    """Worksheet IPM/Gini: Kabupaten/Kota | tahun... ; satu baris per wilayah."""
+    low, high, decimals = WIDE_SHEET_RANGES.get(spec.label, DEFAULT_WIDE_RANGE)
+    years = scale.year_range
+    grid = [[spec.location_aliases[0]] + [str(year) for year in years]]
+    for name in [PROVINCE] + region_names(scale.regions):
+        grid.append([name] + [cells.cell(v, decimals) for v in cells.series(low, high, len(years))])
+    grid.append(['Sumber/Source: BPS Provinsi Jawa Timur'] + [''] * len(years))
+    return grid
+
+
+def hotel_combined_sheet(scale, cells):
+    grid = [['Tahun', 'Bulan', 'MKTJ', 'TPK', 'RLMTA', 'RLMTNUS', 'RLMTGAB', 'GPR']]
+    for year in scale.year_range:
+        for month in MONTHS:
+            grid.append([
+                str(year), month.title(),
+                str(cells.rng.randint(150000, 450000)),
+                cells.cell(cells.rng.uniform(40, 75), 2),
+                cells.cell(cells.rng.uniform(2, 4), 2),
+                cells.cell(cells.rng.uniform(1.5, 2.5), 2),
+                cells.cell(cells.rng.uniform(1.5, 2.5), 2),
+                cells.cell(cells.rng.uniform(1, 2.5), 2),
+            ])
+    return grid
+
+
+def hotel_yearly_sheet(scale, cells):
+    grid = [['Tahun', 'MKTJ', 'TPK', 'RLMTA', 'RLMTNUS', 'RLMTGAB', 'GPR']]
+    for year in scale.year_range:
+        grid.append([
+            str(year), str(cells.rng.randint(2000000, 5000000)),
+            cells.cell(cells.rng.uniform(40, 75), 2), cells.cell(cells.rng.uniform(2, 4), 2),
+            cells.cell(cells.rng.uniform(1.5, 2.5), 2), cells.cell(cells.rng.uniform(1.5, 2.5), 2),
+            cells.cell(cells.rng.uniform(1, 2.5), 2),
+        ])
+    return grid
+
+
+def poverty_sheet(scale, cells):
+    """Kemiskinan: indikator per baris, tahun per kolom (format convert_value_to_numeric)."""
+    years = scale.year_range
+    grid = [['Indikator'] + [str(year) for year in years]]
+    for name, low, high, decimals in POVERTY_INDICATORS:
+        grid.append([name] + [cells.cell(v, decimals) for v in cells.series(low, high, len(years))])
+    return grid
+
+
+def population_sheet(scale, cells):
+    """Kependudukan: tahun (span 3 kolom) / LK-PR-Total / kelompok umur."""
+    years = scale.year_range
+    year_row, gender_row = ['Kelompok Umur'], ['']
+    for year in years:
+        year_row += [str(year), '', '']
+        gender_row += ['LK', 'PR', 'Total']
+    grid = [year_row, gender_row]
+    totals = [0] * (3 * len(years))
+    for age_group in AGE_GROUPS:
+        row = [age_group]
+        for index in range(len(years)):
+            male, female = cells.rng.randint(60000, 120000), cells.rng.randint(60000, 120000)
+            for offset, value in enumerate((male, female, male + female)):
+                totals[3 * index + offset] += value
+                row.append(format_number(value, 0, thousands=True))
+        grid.append(row)
+    grid.append(['Jumlah'] + [format_number(value, 0, thousands=True) for value in totals])
+    return grid
+
+
+def labour_sheet(scale, cells, low, high):
+    """Ketenagakerjaan TPT/TPAK: Tahun | Laki-Laki | Perempuan | Total."""
+    grid = [['Tahun', 'Laki-Laki', 'Perempuan', 'Total']]
+    for year in scale.year_range:
+        grid.append([str(year)] + [cells.cell(cells.rng.uniform(low, high), 2) for _ in range(3)])
+    return grid
+
+
+def _pdrb_value_range(title):
+    if 'ADHB' in title or 'ADHK' in title:
+        return 1e6, 2e8, True          # juta rupiah, dengan titik ribuan
+    if 'Distribusi' in title:
+        return 0.1, 60, False
+    return -8, 12, False               # laju pertumbuhan/implisit, bisa negatif
+
+
+def pdrb_annual_sheet(title, categories, scale, cells):
+    """PDRB tahunan: kategori | tahun (dengan * / **)."""
+    low, high, thousands = _pdrb_value_range(title)
+    years = scale.year_range
+    if isinstance(categories[0], tuple):
+        grid = [['Kode', 'Lapangan Usaha'] + [year_label(year, scale) for year in years]]
+        labels = [[code, name] for code, name in categories]
+    else:
+        grid = [['Jenis Pengeluaran'] + [year_label(year, scale) for year in years]]
+        labels = [[name] for name in categories]
+    for label in labels:
+        grid.append(label + [cells.cell(v, 2, thousands) for v in cells.series(low, high, len(years))])
+    return grid
+
+
+def pdrb_quarterly_sheet(title, categories, scale, cells):
+    """PDRB triwulanan: tahun (span 5 kolom) / I, II, III, IV, Jumlah / kode | kategori | nilai."""
+    low, high, thousands = _pdrb_value_range(title)
+    years = scale.year_range
+    year_row, quarter_row = ['', ''], ['', '']
+    for year in years:
+        year_row += [year_label(year, scale), '', '', '', '']
+        quarter_row += ['I', 'II', 'III', 'IV', 'Jumlah']
+    grid = [year_row, quarter_row]
+    for index, category in enumerate(categories, start=1):
+        code, name = category if isinstance(category, tuple) else (str(index), category)
+        row = [code, name]
+        for quarters in zip(*[iter(cells.series(low / 4, high / 4, 4 * len(years)))] * 4):
+            total = sum(quarters) if thousands else sum(quarters) / 4
+            row += [cells.cell(v, 2, thousands) for v in quarters] + [format_number(total, 2, thousands)]
+        grid.append(row)
+    return grid
+
+
+def inflation_sheet(scale, cells):
+    """Inflasi: tahun (span 3 kolom) / Bulanan-Kumulatif-YoY / bulan."""
+    years = scale.year_range
+    year_row, type_row = ['Bulan'], ['']
+    for year in years:
+        year_row += [str(year), '', '']
+        type_row += ['Bulanan', 'Kumulatif', 'YoY']
+    grid = [year_row, type_row]
+    monthly = {year: [cells.rng.uniform(-0.5, 1.0) for _ in MONTHS] for year in years}
+    for month_index, month in enumerate(MONTHS):
+        row = [month]
+        for year in years:
+            cumulative = sum(monthly[year][:month_index + 1])
+            row += [
+                cells.cell(monthly[year][month_index], 2),
+                cells.cell(cumulative, 2),
+                cells.cell(cumulative + cells.rng.uniform(0.5, 2.5), 2),
+            ]
+        grid.append(row)
+    return grid
+
+
+def commodity_rows(count):
+    """(kode, nama, flag): kelompok pengeluaran (flag 1) diikuti komoditasnya (flag 2)."""
+    rows = []
+    per_group = max(1, math.ceil(count / len(COMMODITY_GROUPS)))
+    for group_index, group in enumerate(COMMODITY_GROUPS, start=1):
+        if len(rows) >= count:
+            break
+        rows.append((f"{group_index:02d}", group, '1'))
+        for item_index in range(1, per_group + 1):
+            if len(rows) >= count:
+                break
+            serial = (group_index - 1) * per_group + item_index - 1
+            name = COMMODITIES[serial % len(COMMODITIES)]
+            if serial >= len(COMMODITIES):
+                name = f"{name} {serial // len(COMMODITIES) + 1}"
+            rows.append((f"{group_index:02d}{item_index:05d}", name, '2'))
+    return rows
+
+
+def perkom_sheet(scale, cells):
+    """Inflasi_perkom_YYYY: Kode Komoditas | Nama Komoditas | Flag | JANUARI..DESEMBER."""
+    grid = [['Kode Komoditas', 'Nama Komoditas', 'Flag'] + MONTHS]
+    for code, name, flag in commodity_rows(scale.commodities):
+        grid.append([code, name, flag] + [cells.cell(cells.rng.uniform(-3, 4), 2) for _ in MONTHS])
+    return grid
+
+
+def build_workbook(scale=None):
+    """
+    Workbook indikator sintetis {judul worksheet: grid}, dengan judul yang sama
+    seperti yang dibaca service (WORKSHEET_NAME, sheet_plan(), Inflasi_perkom_YYYY).
+    """
+    scale = scale or SyntheticScale()
+    cells = _Cells(scale)
+    workbook = {}
+    for spec in WIDE_SHEET_SPECS:
+        workbook[spec.worksheet_name] = wide_year_sheet(spec, scale, cells)
+    workbook[HotelOccupancyCombinedService.WORKSHEET_NAME] = hotel_combined_sheet(scale, cells)
+    workbook[HotelOccupancyYearlyService.WORKSHEET_NAME] = hotel_yearly_sheet(scale, cells)
+    workbook[KemiskinanSurabayaService.WORKSHEET_NAME] = poverty_sheet(scale, cells)
+    workbook[KemiskinanJawaTimurService.WORKSHEET_NAME] = poverty_sheet(scale, cells)
+    workbook[KependudukanService.WORKSHEET_NAME] = population_sheet(scale, cells)
+    workbook[KetenagakerjaanTPTService.WORKSHEET_NAME] = labour_sheet(scale, cells, 4, 10)
+    workbook[KetenagakerjaanTPAKService.WORKSHEET_NAME] = labour_sheet(scale, cells, 55, 80)
+
+    for service, categories in (
+        (PDRBPengeluaranService, EXPENDITURE_CATEGORIES),
+        (PDRBLapanganUsahaService, INDUSTRY_CATEGORIES),
+    ):
+        for title, _model, _save, is_quarterly in service.sheet_plan():
+            build = pdrb_quarterly_sheet if is_quarterly else pdrb_annual_sheet
+            workbook[title] = build(title, categories, scale, cells)
+
+    workbook["Inflasi"] = inflation_sheet(scale, cells)
+    for year in range(scale.end_year - scale.perkom_years + 1, scale.end_year + 1):
+        workbook[f"Inflasi_perkom_{year}"] = perkom_sheet(scale, cells)
+    return workbook
+
+
+def _release_dates(count, end, rng):
+    """Tanggal rilis dari yang terbaru, seperti urutan endpoint list BPS."""
+    current = end
+    for _ in range(count):
+        yield current.isoformat()
+        current -= timedelta(days=rng.randint(0, 3))
+
+
+def news_items(scale, rng):
+    items = []
+    dates = _release_dates(scale.news, date(scale.end_year, 12, 31), rng)
+    for index in range(scale.news):
+        news_id = 10000 + scale.news - index
+        category_id, category_name = rng.choice(NEWS_CATEGORIES)
+        paragraphs = ''.join(
+            f'<p style="text-align: justify;">{" ".join(rng.sample(NEWS_SENTENCES, 3))}</p>\\r\\n'
+            for _ in range(rng.randint(2, 6))
+        )
+        items.append({
+            'news_id': news_id,
+            'newscat_id': category_id,
+            'newscat_name': category_name,
+            'title': f"Berita Statistik Kota Surabaya No. {news_id}",
+            'news': paragraphs,
+            'rl_date': next(dates),
+            'picture': f"https://web-api.bps.go.id/cover.php?f=news-{news_id}.jpg",
+        })
+    return items
+
+
+def publication_items(scale, rng):
+    items = []
+    dates = _release_dates(scale.publications, date(scale.end_year, 12, 31), rng)
+    for index in range(scale.publications):
+        pub_id = hashlib.md5(f"publication-{scale.publications - index}".encode()).hexdigest()[:24]
+        items.append({
+            'pub_id': pub_id,
+            'title': f"Kota Surabaya Dalam Angka {scale.end_year - index % scale.years} Volume {index + 1}",
+            'abstract': '\\u000D\\u000A'.join(rng.sample(NEWS_SENTENCES, 3)),
+            'cover': f"https://web-api.bps.go.id/cover.php?f={pub_id}.jpg",
+            'pdf': f"https://web-api.bps.go.id/download.php?f={pub_id}.pdf",
+            'rl_date': next(dates),
+            'size': f"{rng.uniform(1, 25):.2f} MB",
+        })
+    return items
+
+
+def infographic_items(scale, rng):
+    items = []
+    for index in range(scale.infographics):
+        number = scale.infographics - index
+        items.append({
+            'inf_id': number,
+            'title': f"Infografis Indikator Strategis Kota Surabaya Edisi {number}",
+            'img': f"https://web-api.bps.go.id/cover.php?f=infographic-{number}.png",
+            'dl': f"https://web-api.bps.go.id/download.php?f=infographic-{number}.png",
+        })
+    return items
+
+
+def paginate(items, per_page):
+    """Item -> daftar respons endpoint list BPS (data[0] = info halaman, data[1] = item)."""
+    pages = max(1, math.ceil(len(items) / per_page))
+    payloads = []
+    for page in range(1, pages + 1):
+        chunk = items[(page - 1) * per_page:page * per_page]
+        payloads.append({
+            'status': 'OK',
+            'data-availability': 'available' if items else 'list-not-available',
+            'data': [
+                {'page': page, 'pages': pages, 'per_page': per_page, 'count': len(chunk), 'total': len(items)},
+                chunk,
+            ],
+        })
+    return payloads
+
+
+def build_bps_pages(scale=None):
+    """Halaman API BPS sintetis {model: [payload halaman 1, 2, ...]}."""
+    scale = scale or SyntheticScale()
+    rng = random.Random(scale.seed)
+    return {
+        'news': paginate(news_items(scale, rng), scale.per_page),
+        'publication': paginate(publication_items(scale, rng), scale.per_page),
+        'infographic': paginate(infographic_items(scale, rng), scale.per_page),
+    }
+
+
+def write_snapshot(directory, scale=None, sheet_id=INDICATOR_SHEET_ID, domain=BPS_DOMAIN):
+    """Menulis workbook dan halaman API BPS sintetis ke direktori snapshot. Returns SnapshotStore."""
+    scale = scale or SyntheticScale()
+    store = SnapshotStore(directory)
+    store.write_workbook(sheet_id, build_workbook(scale))
+    for model, payloads in build_bps_pages(scale).items():
+        for page, payload in enumerate(payloads, start=1):
+            store.write_page(domain, model, page, payload)
+    return store
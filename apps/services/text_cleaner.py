@@ -0,0 +1,164 @@
+"""
+Normalisasi teks/HTML untuk data News dan Publication dari API BPS.
+
+BPSNewsService.clean_html_content dulu menjalankan ~20 re.sub tanpa compile,
+html.unescape, lalu parse BeautifulSoup untuk setiap berita; abstrak publikasi
+melewati rantai regex serupa. Modul ini menghasilkan teks yang sama dengan:
+
+- pola yang di-compile sekali di level modul,
+- satu regex pass untuk semua escape literal (\\r, \\n, \\t, \\uXXXX),
+- tag stripper regex untuk markup sederhana; BeautifulSoup hanya dipakai bila
+  ada markup yang perlu DOM parser (komentar, script/style, '<' yang bukan tag,
+  entity yang belum ter-decode).
+
+clean_many() membersihkan banyak teks sekaligus, dengan process pool untuk
+backfill besar.
+"""
+import html
+import logging
+import multiprocessing
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from bs4 import BeautifulSoup
+
+logger = logging.getLogger(__name__)
+
+# Escape literal yang dihapus (bukan di-decode) oleh cleaner lama, diproses paling awal
+_DROPPED_ESCAPES = (('\\u003C', ''), ('\\u003E', ''), ('\\u0022', ''), ('\\u0027', ''), ('\\u0020', ' '))
+
+# Urutan alternatif = urutan re.sub di cleaner lama; kontrol ber-hex huruf besar jadi spasi,
+# \uXXXX lainnya di-decode jadi karakter
+_HTML_ESCAPE_RE = re.compile(
+    r'\\u000D\\u000A|\\u000[DA9BC]|\\r\\n|\\[nrt]|\\u([0-9a-fA-F]{4})'
+)
+# Abstrak publikasi: kontrol dan \r\n\t tidak peka huruf besar/kecil, \uXXXX lainnya peka
+_ABSTRACT_ESCAPE_RE = re.compile(
+    r'(?i:\\u000D\\u000A|\\u000[DA9BC]|\\r\\n|\\[nrt])|\\u([0-9a-fA-F]{4})'
+)
+
+# Sama dengan pola IGNORECASE lama ('ſ' ikut karena case folding Unicode), tetapi
+# kelas karakter eksplisit jauh lebih cepat di-scan daripada IGNORECASE
+_STYLE_ATTR_RE = re.compile(r'[Ssſ][Tt][Yy][Ll][Ee]\s*=')
+_STYLE_QUOTED_RE = re.compile(r'[Ssſ][Tt][Yy][Ll][Ee]\s*=\s*["\'][^"\']*["\']')
+_STYLE_BARE_RE = re.compile(r'[Ssſ][Tt][Yy][Ll][Ee]\s*=\s*[^\s>]*')
+
+_ANY_TAG_RE = re.compile(r'<[^>]+>')
+_CONTROL_OR_SPACE_RE = re.compile(r'[\s\x00-\x1f\x7f-\x9f]+')
+
+# Tag yang hasil get_text()-nya cukup diganti spasi: nama tag + atribut (nilai boleh di-quote)
+_SIMPLE_TAG_RE = re.compile(
+    r'</?([A-Za-z][A-Za-z0-9:-]*)(?:\s+[^\s<>"\'=/]+(?:\s*=\s*(?:"[^"]*"|\'[^\']*\'|[^\s<>"\']+))?)*\s*/?>'
+)
+# Isi tag ini diperlakukan khusus oleh html.parser/BeautifulSoup
+_RAW_TEXT_TAGS = frozenset(['script', 'style', 'textarea', 'title', 'xmp', 'iframe', 'noembed', 'noframes', 'noscript', 'plaintext'])
+_ENTITY_START_RE = re.compile(r'&[#A-Za-z]')
+
+
+def _decode_escape(match):
+    code = match.group(1)
+    return chr(int(code, 16)) if code else ' '
+
+
+def decode_literal_escapes(text):
+    """Escape literal (\\u003C, \\r\\n, \\uXXXX, ...) -> karakter, sama seperti cleaner lama."""
+    if '\\' not in text:
+        return text
+    for escape, replacement in _DROPPED_ESCAPES:
+        text = text.replace(escape, replacement)
+    return _HTML_ESCAPE_RE.sub(_decode_escape, text)
+
+
+def _strip_simple_markup(text):
+    """
+    Teks dengan semua tag diganti spasi, atau None bila markup-nya butuh DOM parser.
+    Spasi tambahan tidak masalah karena whitespace dinormalisasi setelahnya.
+    """
+    if '<' in text:
+        tags = _SIMPLE_TAG_RE.findall(text)
+        if len(tags) != text.count('<') or any(tag.lower() in _RAW_TEXT_TAGS for tag in tags):
+            return None
+        text = _SIMPLE_TAG_RE.sub(' ', text)
+    if '&' in text and _ENTITY_START_RE.search(text):
+        return None
+    return text
+
+
+def _soup_text(text):
+    try:
+        return BeautifulSoup(text, 'html.parser').get_text(separator=' ', strip=False)
+    except Exception as e:
+        logger.warning(f"Error menggunakan BeautifulSoup: {e}. Menggunakan fallback method.")
+        text = re.sub(r'<script[^>]*>.*?</script>', '', text, flags=re.DOTALL | re.IGNORECASE)
+        text = re.sub(r'<style[^>]*>.*?</style>', '', text, flags=re.DOTALL | re.IGNORECASE)
+        return _ANY_TAG_RE.sub('', text)
+
+
+def _decode_and_unstyle(text):
+    text = html.unescape(decode_literal_escapes(text))
+    # Dua pass seperti cleaner lama; pass kedua jarang menemukan sisa atribut style
+    if _STYLE_ATTR_RE.search(text):
+        text = _STYLE_QUOTED_RE.sub('', text)
+        if _STYLE_ATTR_RE.search(text):
+            text = _STYLE_BARE_RE.sub('', text)
+    return text
+
+
+def uses_dom_parser(text):
+    """True bila clean_html(text) perlu BeautifulSoup (dipakai untuk statistik benchmark)."""
+    if not text or not isinstance(text, str):
+        return False
+    return _strip_simple_markup(_decode_and_unstyle(text)) is None
+
+
+def clean_html(text):
+    """
+    Membersihkan HTML tags, entities dan escape Unicode literal dari isi berita.
+    Hasilnya sama dengan BPSNewsService.clean_html_content versi lama.
+    """
+    if not text or not isinstance(text, str):
+        return ""
+
+    text = _decode_and_unstyle(text)
+    stripped = _strip_simple_markup(text)
+    if stripped is None:
+        stripped = _soup_text(text)
+    # str.split() memakai definisi whitespace yang sama dengan \s, tanpa regex
+    return ' '.join(stripped.split())
+
+
+def clean_text(text, max_length=None):
+    """Field teks pendek (title, category): unescape, hapus tag, normalisasi spasi, potong."""
+    if not text or not isinstance(text, str):
+        return ""
+
+    cleaned = ' '.join(_ANY_TAG_RE.sub('', html.unescape(text)).split())
+    if max_length and len(cleaned) > max_length:
+        cleaned = cleaned[:max_length]
+    return cleaned
+
+
+def clean_abstract(text):
+    """Abstrak publikasi: escape literal -> karakter, karakter kontrol -> spasi, spasi dinormalisasi."""
+    if not text:
+        return ''
+    if '\\' in text:
+        text = _ABSTRACT_ESCAPE_RE.sub(_decode_escape, text)
+    return _CONTROL_OR_SPACE_RE.sub(' ', text).strip()
+
+
+def clean_many(texts, cleaner=clean_html, processes=1, min_items=1000, chunksize=64):
+    """
+    cleaner() untuk setiap teks, urutan hasil sama dengan input.
+
+    Dengan processes > 1 dan paling sedikit min_items teks (mis. backfill
+    seluruh arsip berita), pekerjaan dibagi ke process pool. Proses dibuat
+    dengan 'spawn' karena pemanggilnya bisa berjalan di thread pool sync_data;
+    modul ini tidak bergantung pada Django sehingga murah di-import ulang.
+    """
+    texts = list(texts)
+    if processes <= 1 or len(texts) < max(min_items, 1):
+        return [cleaner(text) for text in texts]
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=processes, mp_context=context) as executor:
+        return list(executor.map(cleaner, texts, chunksize=chunksize))
@@ -0,0 +1,337 @@
+"""
+Cache context halaman indikator (dan nilai lain yang hanya bergantung pada data sync).
+
+Halaman seperti IPM, PDRB atau inflasi membangun context-nya dari nol pada
+setiap request, padahal datanya paling sering berubah sekali sehari. Modul ini
+menyimpan hasil builder di cache Django (settings CACHES: locmem per proses,
+atau Redis bila REDIS_CACHE_URL di-set) dengan aturan:
+
+- Versi dataset: setiap tabel yang dibaca builder punya DatasetVersion yang
+  dinaikkan bulk_upsert() saat sync menambah/mengubah baris, dan oleh signal
+  post_save/post_delete untuk tulisan lain (admin, ViewSet dan endpoint API,
+  lihat track_model_changes()). Versi itu bagian dari key cache, jadi data baru
+  tidak pernah tertutup cache lama; versi dibaca dengan satu query per request.
+- Single-flight: saat key belum ada, hanya satu request (per key, lintas proses
+  bila cache-nya Redis) yang menjalankan builder; request lain menunggu hasilnya
+  alih-alih ikut membangun context yang sama.
+- Stale-while-revalidate: entry versi dataset yang sama tetapi sudah
+  kedaluwarsa (VIEW_CACHE_TIMEOUT) masih dipakai selama VIEW_CACHE_STALE_SECONDS
+  sementara satu thread latar membangun ulang, sehingga cache yang habis di jam
+  sibuk tidak berubah menjadi N rebuild yang identik. Entry dari versi dataset
+  sebelumnya tidak pernah dipakai lagi: setelah data berubah, satu request
+  membangun ulang dan yang lain menunggu hasilnya.
+
+Context dibungkus dengan @cached_context; fragmen template yang mahal dirender
+(mis. data chart PDRB) dibungkus dengan {% cached_fragment %} dari
+apps/templatetags/view_cache_tags.py dan memakai versi data context-nya.
+Endpoint JSON dibungkus dengan @conditional_api: ETag dari versi dataset dan
+parameter query, sehingga If-None-Match dijawab 304 tanpa query data.
+
+Versi semua dataset sendiri di-cache VIEW_CACHE_VERSION_SECONDS detik dan
+dihapus saat bump_versions() commit, jadi cache hit maupun 304 tidak memerlukan
+query sama sekali. Dengan locmem dan sync di proses lain (sync_data,
+scheduler), proses web melihat versi baru paling lambat setelah batas itu.
+
+Nilai harus bisa di-pickle (dict context berisi model instance/list, string HTML).
+"""
+import hashlib
+import logging
+import threading
+import time
+import uuid
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import IntegrityError, close_old_connections, router, transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+from apps.models import (
+    Bookmark, DatasetSchedule, DatasetVersion, IndicatorSnapshot, SchedulerLease, SyncJob, SyncRun, SyncState,
+    SyncStep, User,
+)
+
+logger = logging.getLogger(__name__)
+
+CACHE_ALIAS = getattr(settings, 'VIEW_CACHE_ALIAS', 'default')
+# Entry dianggap segar selama TIMEOUT, lalu masih boleh dipakai (sambil di-rebuild) selama STALE_SECONDS
+TIMEOUT = getattr(settings, 'VIEW_CACHE_TIMEOUT', 60 * 60)
+STALE_SECONDS = getattr(settings, 'VIEW_CACHE_STALE_SECONDS', 24 * 60 * 60)
+# Lock single-flight kedaluwarsa sendiri bila pemegangnya mati di tengah rebuild
+LOCK_SECONDS = getattr(settings, 'VIEW_CACHE_LOCK_SECONDS', 60)
+# Batas tunggu request lain sebelum membangun sendiri
+WAIT_SECONDS = getattr(settings, 'VIEW_CACHE_WAIT_SECONDS', 10)
+# Lama versi dataset di-cache; batas keterlambatan melihat hasil sync dari proses lain
+VERSION_SECONDS = getattr(settings, 'VIEW_CACHE_VERSION_SECONDS', 5)
+# max-age respons API: browser / reverse proxy memakai ulang tanpa bertanya, lalu revalidasi dengan ETag
+API_MAX_AGE = getattr(settings, 'VIEW_CACHE_API_MAX_AGE', 60)
+POLL_SECONDS = 0.05
+KEY_PREFIX = 'aastabaya:view'
+VERSIONS_KEY = f"{KEY_PREFIX}:versions"
+
+
+def dataset_name(model):
+    return model._meta.label_lower
+
+
+# Tabel milik aplikasi/sync sendiri, bukan data indikator: tulisannya tidak menaikkan versi
+UNTRACKED_MODELS = (
+    User, Bookmark, SyncState, SyncJob, SchedulerLease, DatasetSchedule, SyncRun, SyncStep, IndicatorSnapshot,
+    DatasetVersion,
+)
+
+
+def bump_versions(*models):
+    """
+    Menaikkan versi dataset model-model yang baru ditulis, di transaksi yang sama
+    dengan tulisannya. Dari sync dipanggil lewat bulk_writer.after_load() (write lock
+    SQLite sudah dipegang pemanggil); dari tulisan lain lewat signal, lihat
+    track_model_changes().
+    """
+    now = timezone.now()
+    using = router.db_for_write(DatasetVersion)
+    for name in sorted({dataset_name(model) for model in models}):
+        versions = DatasetVersion.objects.using(using).filter(dataset=name)
+        if versions.update(version=F('version') + 1, changed_at=now):
+            continue
+        try:
+            with transaction.atomic(using=using):
+                DatasetVersion.objects.using(using).create(dataset=name, version=1, changed_at=now)
+        except IntegrityError:
+            # Proses lain membuat barisnya lebih dulu
+            versions.update(version=F('version') + 1, changed_at=now)
+    # Setelah commit (di staging: setelah swap), bukan sebelumnya, agar versi lama tidak di-cache ulang
+    transaction.on_commit(lambda: caches[CACHE_ALIAS].delete(VERSIONS_KEY), using=using)
+
+
+def _bump_on_write(sender, raw=False, **kwargs):
+    # raw: fixture loaddata, bukan perubahan data
+    if not raw:
+        bump_versions(sender)
+
+
+def track_model_changes(app_config):
+    """
+    Menghubungkan post_save/post_delete semua model data `app_config` (selain
+    UNTRACKED_MODELS) ke bump_versions(), sehingga edit lewat admin, ViewSet atau
+    endpoint add/update/delete juga membuat cache context dan ETag API dibangun ulang.
+    Tulisan bulk (bulk_create/update) tidak mengirim signal; pemanggilnya menaikkan
+    versi sendiri (bulk_upsert, resolve_regions). Dipanggil dari AppsConfig.ready().
+    """
+    for model in app_config.get_models():
+        if model in UNTRACKED_MODELS:
+            continue
+        uid = f"view_cache:{dataset_name(model)}"
+        post_save.connect(_bump_on_write, sender=model, dispatch_uid=f"{uid}:save")
+        post_delete.connect(_bump_on_write, sender=model, dispatch_uid=f"{uid}:delete")
+
+
+def _all_versions():
+    """{dataset: (versi, changed_at)} semua dataset, dari cache atau satu query."""
+    cache = caches[CACHE_ALIAS]
+    versions = cache.get(VERSIONS_KEY)
+    if versions is None:
+        versions = {
+            dataset: (version, changed_at)
+            for dataset, version, changed_at in DatasetVersion.objects.values_list('dataset', 'version', 'changed_at')
+        }
+        cache.set(VERSIONS_KEY, versions, VERSION_SECONDS)
+    return versions
+
+
+def dataset_state(*models):
+    """
+    Returns (versi gabungan, waktu perubahan terakhir) model-model. Dataset yang belum
+    pernah di-sync berversi 0; waktu None bila tidak satu pun pernah berubah.
+    """
+    versions = _all_versions()
+    states = [versions.get(name, (0, None)) for name in sorted({dataset_name(model) for model in models})]
+    changed = [changed_at for _, changed_at in states if changed_at]
+    return '-'.join(str(version) for version, _ in states), max(changed, default=None)
+
+
+def dataset_versions(*models):
+    """Versi gabungan model-model; lihat dataset_state()."""
+    return dataset_state(*models)[0]
+
+
+def _digest(params):
+    return hashlib.sha1(repr(params).encode()).hexdigest()[:16]
+
+
+class ViewCache:
+    """Cache hasil builder per (nama, parameter, versi dataset); lihat docstring modul."""
+
+    def __init__(self, alias=CACHE_ALIAS):
+        self.alias = alias
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'stale': 0, 'misses': 0, 'waits': 0, 'builds': 0, 'refreshes': 0}
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def _record(self, key, count=1):
+        with self._lock:
+            self._stats[key] += count
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats)
+
+    def report(self):
+        stats = self.stats()
+        return (
+            f"{stats['hits']} hit, {stats['stale']} stale, {stats['misses']} miss "
+            f"({stats['waits']} menunggu), {stats['builds']} build, {stats['refreshes']} refresh"
+        )
+
+    def _acquire(self, key):
+        """Lock single-flight untuk key. Returns token bila berhasil, None bila dipegang pihak lain."""
+        token = uuid.uuid4().hex
+        return token if self.cache.add(f"{key}:lock", token, LOCK_SECONDS) else None
+
+    def _release(self, key, token):
+        lock_key = f"{key}:lock"
+        if self.cache.get(lock_key) == token:
+            self.cache.delete(lock_key)
+
+    def _build(self, key, version, builder):
+        value = builder()
+        entry = {'version': version, 'value': value, 'fresh_until': time.time() + TIMEOUT}
+        self.cache.set(key, entry, TIMEOUT + STALE_SECONDS)
+        self._record('builds')
+        return entry
+
+    def _refresh_in_background(self, key, version, builder, token):
+        def run():
+            try:
+                self._build(key, version, builder)
+                self._record('refreshes')
+            except Exception as e:
+                logger.warning(f"Gagal memperbarui cache {key}: {e}")
+            finally:
+                self._release(key, token)
+                close_old_connections()
+
+        threading.Thread(target=run, name='view-cache-refresh', daemon=True).start()
+
+    def lookup(self, name, builder, version, params=(), background=True):
+        """
+        Returns (nilai, versi nilai) untuk `name` + `params` pada versi dataset `version`.
+
+        Entry versi ini yang sudah kedaluwarsa dikembalikan apa adanya sementara satu
+        pemanggil membangun ulang: di thread latar, atau langsung di pemanggil itu bila
+        background=False (builder yang tidak boleh berjalan di thread lain, mis. render
+        fragmen template). Bila belum ada entry untuk versi ini (data baru atau belum
+        pernah dibangun), hanya satu pemanggil yang menjalankan builder dan yang lain
+        menunggu hasilnya.
+        """
+        key = f"{KEY_PREFIX}:{name}:{_digest(params)}:{version}"
+
+        entry = self.cache.get(key)
+        if entry is not None:
+            if entry['fresh_until'] > time.time():
+                self._record('hits')
+                return entry['value'], entry['version']
+            token = self._acquire(key)
+            if token and not background:
+                try:
+                    entry = self._build(key, version, builder)
+                finally:
+                    self._release(key, token)
+                self._record('refreshes')
+                return entry['value'], entry['version']
+            self._record('stale')
+            if token:
+                self._refresh_in_background(key, version, builder, token)
+            return entry['value'], entry['version']
+
+        self._record('misses')
+        token = self._acquire(key)
+        if token:
+            try:
+                entry = self._build(key, version, builder)
+            finally:
+                self._release(key, token)
+            return entry['value'], entry['version']
+
+        # Pemanggil lain sedang membangun key yang sama: tunggu hasilnya
+        self._record('waits')
+        deadline = time.monotonic() + WAIT_SECONDS
+        while time.monotonic() < deadline:
+            time.sleep(POLL_SECONDS)
+            entry = self.cache.get(key)
+            if entry is not None:
+                return entry['value'], entry['version']
+        logger.warning(f"Menunggu cache {key} lebih dari {WAIT_SECONDS} detik, membangun sendiri")
+        entry = self._build(key, version, builder)
+        return entry['value'], entry['version']
+
+    def get_or_build(self, name, builder, models, params=()):
+        """Nilai builder() untuk `name` + `params`, di-cache per versi dataset `models`."""
+        value, _ = self.lookup(name, builder, dataset_versions(*models), params)
+        return value
+
+
+view_cache = ViewCache()
+
+
+def cached_context(name, *models):
+    """
+    Decorator untuk builder context halaman. Argumen builder (mis. tahun yang dipilih)
+    ikut menjadi bagian key; `models` adalah tabel yang dibaca builder. Context yang
+    dikembalikan berisi `dataset_version` (versi data di context itu) untuk tag
+    {% cached_fragment %}.
+
+        @cached_context('gini_ratio', GiniRatio)
+        def gini_ratio_context():
+            ...
+    """
+    def decorator(builder):
+        @wraps(builder)
+        def wrapper(*args):
+            context, version = view_cache.lookup(name, lambda: builder(*args), dataset_versions(*models), params=args)
+            return {**context, 'dataset_version': version}
+        return wrapper
+    return decorator
+
+
+def conditional_api(*models):
+    """
+    Decorator untuk endpoint API GET (dipasang di bawah @api_view) yang hanya membaca
+    `models`. Respons 200 diberi ETag kuat dari versi dataset, path, parameter query dan
+    media type, Last-Modified dari DatasetVersion, serta Cache-Control public dengan
+    max-age VIEW_CACHE_API_MAX_AGE. If-None-Match / If-Modified-Since yang masih cocok
+    dijawab 304 sebelum view berjalan.
+
+        @api_view(['GET'])
+        @conditional_api(GiniRatio)
+        def get_gini_ratio_data(request):
+            ...
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            version, changed_at = dataset_state(*models)
+            etag = quote_etag(_digest((
+                version, request.path, sorted(request.GET.lists()), request.accepted_media_type,
+            )))
+            last_modified = int(changed_at.timestamp()) if changed_at else None
+
+            response = get_conditional_response(request._request, etag=etag, last_modified=last_modified)
+            if response is None:
+                response = view(request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+            response['ETag'] = etag
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(last_modified)
+            patch_cache_control(response, public=True, max_age=API_MAX_AGE)
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,47 @@
+"""
+{% cached_fragment %}: cache hasil render satu bagian template per versi data.
+
+    {% load view_cache_tags %}
+    {% cached_fragment 'pdrb_pengeluaran:data' dataset_version %}
+      ... bagian yang hanya bergantung pada data indikator ...
+    {% endcached_fragment %}
+
+`dataset_version` diisi oleh @cached_context (apps.services.view_cache). Bila
+kosong, bagian itu dirender biasa tanpa cache. Jangan membungkus bagian yang
+bergantung pada user atau request (nama user, token CSRF, bookmark).
+"""
+from django import template
+
+from apps.services.view_cache import view_cache
+
+register = template.Library()
+
+
+class CachedFragmentNode(template.Node):
+    def __init__(self, nodelist, name, version):
+        self.nodelist = nodelist
+        self.name = name
+        self.version = version
+
+    def render(self, context):
+        version = self.version.resolve(context)
+        if not version:
+            return self.nodelist.render(context)
+        # Render memakai context request yang sedang berjalan, jadi rebuild tidak boleh di thread lain
+        fragment, _ = view_cache.lookup(
+            f"fragment:{self.name.resolve(context)}",
+            lambda: self.nodelist.render(context),
+            version,
+            background=False,
+        )
+        return fragment
+
+
+@register.tag
+def cached_fragment(parser, token):
+    bits = token.split_contents()
+    if len(bits) != 3:
+        raise template.TemplateSyntaxError(f"'{bits[0]}' membutuhkan nama fragmen dan versi data")
+    nodelist = parser.parse(('endcached_fragment',))
+    parser.delete_first_token()
+    return CachedFragmentNode(nodelist, parser.compile_filter(bits[1]), parser.compile_filter(bits[2]))
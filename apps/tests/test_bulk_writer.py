@@ -0,0 +1,93 @@
+from decimal import Decimal
+
+from django.test import TestCase
+
+from apps.models import HotelOccupancyYearly, Infographic, InflasiPerKomoditas
+from apps.services.bulk_writer import bulk_upsert
+from apps.services.staged_load import STAGING, dataset_load, use_load_mode
+
+
+def hotel(year, tpk):
+    return {'year': year, 'tpk': tpk}
+
+
+def komoditas(code, flag, value):
+    return {
+        'commodity_code': code, 'commodity_name': f'Komoditas {code}', 'flag': flag,
+        'year': 2024, 'month': 'JANUARI', 'value': value,
+    }
+
+
+class BulkUpsertTests(TestCase):
+    def test_counts_created_updated_unchanged(self):
+        self.assertEqual(bulk_upsert(HotelOccupancyYearly, [hotel(2020, 50.1), hotel(2021, 55.2)]), (2, 0, 0))
+        self.assertEqual(
+            bulk_upsert(HotelOccupancyYearly, [hotel(2020, 50.1), hotel(2021, 60), hotel(2022, 61)]),
+            (1, 1, 1),
+        )
+        self.assertEqual(HotelOccupancyYearly.objects.get(year=2021).tpk, Decimal('60.00'))
+        self.assertEqual(HotelOccupancyYearly.objects.count(), 3)
+
+    def test_decimal_scale_is_not_a_change(self):
+        bulk_upsert(HotelOccupancyYearly, [hotel(2020, 14.5)])
+        self.assertEqual(bulk_upsert(HotelOccupancyYearly, [hotel(2020, '14.50')]), (0, 0, 1))
+
+    def test_last_duplicate_wins(self):
+        counts = bulk_upsert(HotelOccupancyYearly, [hotel(2020, 1), hotel(2020, 2), hotel(2020, 3)])
+        self.assertEqual(counts, (1, 0, 0))
+        self.assertEqual(HotelOccupancyYearly.objects.get(year=2020).tpk, Decimal('3.00'))
+
+    def test_invalid_rows_are_skipped(self):
+        counts = bulk_upsert(HotelOccupancyYearly, [hotel(2020, 1), hotel('bukan tahun', 2)])
+        self.assertEqual(counts, (1, 0, 0))
+
+    def test_null_flag_keys_are_matched_without_on_conflict(self):
+        records = [komoditas('1', None, 1.5), komoditas('1', '1', 2.5)]
+        self.assertEqual(bulk_upsert(InflasiPerKomoditas, records), (2, 0, 0))
+
+        records = [komoditas('1', None, 9), komoditas('1', '1', 2.5)]
+        self.assertEqual(bulk_upsert(InflasiPerKomoditas, records), (0, 1, 1))
+        self.assertEqual(InflasiPerKomoditas.objects.count(), 2)
+        self.assertEqual(InflasiPerKomoditas.objects.get(flag__isnull=True).value, Decimal('9.00'))
+        self.assertEqual(InflasiPerKomoditas.objects.get(flag='1').value, Decimal('2.50'))
+
+    def test_key_without_unique_constraint(self):
+        records = [{'title': 'A', 'image': 'https://example.com/a.png'}, {'title': 'B', 'image': None}]
+        self.assertEqual(bulk_upsert(Infographic, records, unique_fields=['title']), (2, 0, 0))
+
+        records = [{'title': 'A', 'image': 'https://example.com/a2.png'}, {'title': 'B', 'image': None}]
+        self.assertEqual(bulk_upsert(Infographic, records, unique_fields=['title']), (0, 1, 1))
+        self.assertEqual(Infographic.objects.count(), 2)
+        self.assertEqual(Infographic.objects.get(title='A').image, 'https://example.com/a2.png')
+
+    def test_small_batches(self):
+        records = [hotel(2000 + i, i) for i in range(7)]
+        self.assertEqual(bulk_upsert(HotelOccupancyYearly, records, batch_size=3), (7, 0, 0))
+        records[4] = hotel(2004, 99)
+        self.assertEqual(bulk_upsert(HotelOccupancyYearly, records, batch_size=3), (0, 1, 6))
+
+
+class StagedBulkUpsertTests(TestCase):
+    def test_rows_reach_live_table_only_after_dataset(self):
+        HotelOccupancyYearly.objects.create(year=2019, tpk=1)
+        with use_load_mode(STAGING), dataset_load('hotel'):
+            self.assertEqual(bulk_upsert(HotelOccupancyYearly, [hotel(2019, 2), hotel(2020, 3)]), (1, 1, 0))
+            self.assertFalse(HotelOccupancyYearly.objects.filter(year=2020).exists())
+            self.assertEqual(HotelOccupancyYearly.objects.get(year=2019).tpk, Decimal('1.00'))
+
+        self.assertEqual(HotelOccupancyYearly.objects.get(year=2019).tpk, Decimal('2.00'))
+        self.assertEqual(HotelOccupancyYearly.objects.get(year=2020).tpk, Decimal('3.00'))
+
+    def test_restaged_keys_are_counted_once(self):
+        HotelOccupancyYearly.objects.create(year=2019, tpk=1)
+        with use_load_mode(STAGING), dataset_load('hotel'):
+            first = bulk_upsert(HotelOccupancyYearly, [hotel(2019, 2), hotel(2020, 3)])
+            # Chunk berikutnya menimpa kedua key yang sudah di-stage dan menambah satu key baru
+            second = bulk_upsert(HotelOccupancyYearly, [hotel(2019, 4), hotel(2020, 5), hotel(2021, 6)])
+
+        self.assertEqual(first, (1, 1, 0))
+        self.assertEqual(second, (1, 0, 0))
+        self.assertEqual(
+            list(HotelOccupancyYearly.objects.order_by('year').values_list('year', 'tpk')),
+            [(2019, Decimal('4.00')), (2020, Decimal('5.00')), (2021, Decimal('6.00'))],
+        )
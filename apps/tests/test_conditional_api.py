@@ -0,0 +1,78 @@
+from decimal import Decimal
+
+from django.core.cache import caches
+from django.test import TestCase
+
+from apps.models import GiniRatio, Region
+from apps.services import view_cache
+from apps.services.bulk_writer import bulk_upsert
+from apps.services.regions import resolve_regions
+from apps.services.view_cache import dataset_versions
+
+URL = '/api/gini-ratio/'
+
+
+def gini(year, value):
+    return {'location_name': 'KOTA SURABAYA', 'year': year, 'gini_ratio_value': value}
+
+
+class ConditionalApiTests(TestCase):
+    def setUp(self):
+        caches[view_cache.CACHE_ALIAS].clear()
+        self.row = GiniRatio.objects.create(**gini(2023, Decimal('0.400')))
+
+    def write(self, func, *args, **kwargs):
+        with self.captureOnCommitCallbacks(execute=True):
+            return func(*args, **kwargs)
+
+    def etag(self, url=URL):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response['ETag']
+
+    def assertNotModified(self, etag, url=URL):
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_validators_and_not_modified(self):
+        response = self.client.get(URL)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Last-Modified', response)
+        self.assertIn('max-age', response['Cache-Control'])
+        self.assertNotModified(response['ETag'])
+        self.assertNotEqual(self.etag(URL + '?year=2023'), response['ETag'])
+
+    def test_save_outside_sync_changes_etag(self):
+        etag = self.etag()
+        self.row.gini_ratio_value = Decimal('0.410')
+        self.write(self.row.save)
+
+        response = self.client.get(URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.json()['data'][0]['gini_ratio_value'], '0.410')
+        self.assertNotModified(response['ETag'])
+
+    def test_delete_outside_sync_changes_etag(self):
+        etag = self.etag()
+        self.write(self.row.delete)
+        response = self.client.get(URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['count'], 0)
+
+    def test_bulk_upsert_changes_etag(self):
+        etag = self.etag()
+        self.write(bulk_upsert, GiniRatio, [dict(gini(2024, 0.42), region_id=self.row.region_id)])
+        self.assertEqual(self.client.get(URL, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_unchanged_bulk_upsert_keeps_etag(self):
+        etag = self.etag()
+        self.write(bulk_upsert, GiniRatio, [dict(gini(2023, 0.4), region_id=self.row.region_id)])
+        self.assertNotModified(etag)
+
+    def test_region_bulk_writes_bump(self):
+        version = dataset_versions(Region)
+        self.write(resolve_regions, ['Jawa Timur'])
+        self.assertNotEqual(dataset_versions(Region), version)
+        version = dataset_versions(Region)
+        self.write(resolve_regions, ['Jawa Timur'])
+        self.assertEqual(dataset_versions(Region), version)
@@ -0,0 +1,84 @@
+from decimal import Decimal
+from unittest import mock
+
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.models import IndicatorSnapshot, KetenagakerjaanTPT, PDRBLapanganUsahaADHBTriwulanan, PDRBPengeluaranADHK
+from apps.services import indicator_snapshot, view_cache
+from apps.services.indicator_snapshot import _pdrb_indicator, dashboard_indicators, rebuild_snapshots
+
+
+class PDRBIndicatorTests(TestCase):
+    def test_annual_total_latest_and_previous_year(self):
+        for category, year, value in [
+            ('Pengeluaran Konsumsi Rumah Tangga', 2024, '900'),
+            ('Produk Domestik Regional Bruto (Total)', 2022, '80'),
+            ('Produk Domestik Regional Bruto (Total)', 2023, '100'),
+            ('Produk Domestik Regional Bruto (Total)', 2024, '110'),
+        ]:
+            PDRBPengeluaranADHK.objects.create(expenditure_category=category, year=year, value=Decimal(value))
+
+        with CaptureQueriesContext(connection) as queries:
+            indicator = _pdrb_indicator('adhk', 'ADHK', PDRBPengeluaranADHK, False, 'y-to-y', True)
+        self.assertEqual(len(queries), 2)
+        self.assertEqual(indicator['period'], '2024')
+        self.assertEqual(indicator['value'], Decimal('110'))
+        self.assertEqual(indicator['previous_period'], '2023')
+        self.assertAlmostEqual(indicator['change'], 10.0)
+
+    def test_quarterly_total_uses_previous_quarter(self):
+        for year, quarter, value in [(2023, 'IV', '50'), (2024, 'I', '60'), (2024, 'II', '66')]:
+            PDRBLapanganUsahaADHBTriwulanan.objects.create(
+                industry_category='jumlah', year=year, quarter=quarter, value=Decimal(value),
+            )
+        PDRBLapanganUsahaADHBTriwulanan.objects.create(
+            industry_category='Industri Pengolahan', year=2025, quarter='I', value=Decimal('1'),
+        )
+
+        indicator = _pdrb_indicator('adhb-q', 'ADHB', PDRBLapanganUsahaADHBTriwulanan, True, 'q-to-q', True)
+        self.assertEqual(indicator['period'], 'QII 2024')
+        self.assertEqual(indicator['previous_period'], 'QI 2024')
+        self.assertAlmostEqual(indicator['change'], 6.0)
+
+        PDRBLapanganUsahaADHBTriwulanan.objects.filter(quarter='II').delete()
+        indicator = _pdrb_indicator('adhb-q', 'ADHB', PDRBLapanganUsahaADHBTriwulanan, True, 'q-to-q', True)
+        self.assertEqual(indicator['previous_period'], 'QIV 2023')
+
+    def test_no_total_rows(self):
+        PDRBPengeluaranADHK.objects.create(expenditure_category='Ekspor', year=2024, value=Decimal('1'))
+        self.assertIsNone(_pdrb_indicator('adhk', 'ADHK', PDRBPengeluaranADHK, False, 'y-to-y', True))
+
+
+class DashboardSnapshotTests(TestCase):
+    def setUp(self):
+        caches[view_cache.CACHE_ALIAS].clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            KetenagakerjaanTPT.objects.create(year=2023, total=Decimal('5.00'))
+            self.row = KetenagakerjaanTPT.objects.create(year=2024, total=Decimal('4.00'))
+
+    def tpt(self):
+        return {snapshot.key: snapshot for snapshot in dashboard_indicators()}['tpt']
+
+    def test_snapshot_is_reused_while_sources_are_unchanged(self):
+        rebuild_snapshots()
+        with mock.patch.object(indicator_snapshot, 'build_indicators') as build:
+            self.assertEqual(self.tpt().value, Decimal('4.000'))
+        build.assert_not_called()
+
+    def test_edit_outside_sync_rebuilds_snapshot(self):
+        rebuild_snapshots()
+        self.row.total = Decimal('3.50')
+        # Seperti edit lewat admin: signal post_save menaikkan versi dataset, tanpa refresh_after_sync
+        with self.captureOnCommitCallbacks(execute=True):
+            self.row.save()
+
+        snapshot = self.tpt()
+        self.assertEqual(snapshot.value, Decimal('3.500'))
+        self.assertEqual(snapshot.previous_value, Decimal('5.000'))
+        self.assertEqual(
+            set(IndicatorSnapshot.objects.values_list('source_versions', flat=True)),
+            {indicator_snapshot.source_versions()},
+        )
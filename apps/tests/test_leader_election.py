@@ -0,0 +1,117 @@
+import threading
+import time
+from datetime import timedelta
+
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
+from django.utils import timezone
+
+from apps.models import SchedulerLease
+from apps.services.db_lock import write_lock
+from apps.services.leader_election import DatabaseLease, LeaderElector
+
+
+class DatabaseLeaseTests(TestCase):
+    def test_acquire_renew_and_release(self):
+        lease = DatabaseLease('test', 'a', ttl=60)
+        other = DatabaseLease('test', 'b', ttl=60)
+        self.assertTrue(lease.acquire())
+        self.assertTrue(lease.holds())
+        self.assertFalse(other.acquire())
+        self.assertFalse(other.holds())
+        self.assertTrue(lease.acquire())
+
+        lease.release()
+        self.assertFalse(lease.holds())
+        self.assertTrue(other.acquire())
+
+    def test_expired_lease_is_taken_over(self):
+        lease = DatabaseLease('test', 'a', ttl=60)
+        lease.acquire()
+        SchedulerLease.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+        self.assertFalse(lease.holds())
+        self.assertTrue(DatabaseLease('test', 'b', ttl=60).acquire())
+        self.assertFalse(lease.acquire())
+
+
+class LeaseRenewalWhileSyncWritesTests(TransactionTestCase):
+    def test_renewal_does_not_wait_for_sync_write_lock(self):
+        lease = DatabaseLease('test', 'a', ttl=60)
+        lease.acquire()
+        results = []
+
+        def renew():
+            try:
+                results.append(lease.acquire())
+            finally:
+                connection.close()
+
+        # Sync yang sedang menulis memegang write lock (di SQLite dipakai bersama semua writer)
+        with write_lock('default'):
+            thread = threading.Thread(target=renew)
+            thread.start()
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+        self.assertEqual(results, [True])
+
+
+class FakeLease:
+    holder = 'fake'
+    ttl_seconds = 60
+
+    def __init__(self, held=True):
+        self.held = held
+
+    def acquire(self):
+        return self.held
+
+    def holds(self):
+        return self.held
+
+    def release(self):
+        self.held = False
+
+
+class LeaderElectorTests(SimpleTestCase):
+    def elector(self, lease):
+        elector = LeaderElector(lease, lambda: None, lambda: None, interval=0.01)
+        elector._leader = True
+        elector._valid_until = time.monotonic() + lease.ttl_seconds
+        return elector
+
+    def test_holds_lease_checks_the_backend(self):
+        lease = FakeLease()
+        elector = self.elector(lease)
+        self.assertTrue(elector.holds_lease())
+        lease.held = False
+        self.assertTrue(elector.is_leader)
+        self.assertFalse(elector.holds_lease())
+
+    def test_not_leader_after_local_expiry(self):
+        elector = self.elector(FakeLease())
+        elector._valid_until = time.monotonic() - 1
+        self.assertFalse(elector.is_leader)
+        self.assertFalse(elector.holds_lease())
+
+    def test_failed_renewal_keeps_leader_until_expiry(self):
+        demoted = threading.Event()
+        calls = []
+
+        class BusyLease(FakeLease):
+            ttl_seconds = 0.2
+
+            def acquire(self):
+                calls.append(time.monotonic())
+                if len(calls) == 1:
+                    return True
+                raise RuntimeError('database is locked')
+
+        elector = LeaderElector(BusyLease(), lambda: None, demoted.set, interval=0.02)
+        elector.start()
+        try:
+            time.sleep(0.1)
+            self.assertTrue(elector.is_leader)
+            self.assertTrue(demoted.wait(2))
+            self.assertFalse(elector.is_leader)
+        finally:
+            elector.stop()
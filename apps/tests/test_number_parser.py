@@ -0,0 +1,96 @@
+import contextlib
+import io
+import math
+import random
+
+import numpy as np
+import pandas as pd
+from django.test import SimpleTestCase
+
+from apps.services import number_parser
+from apps.services.legacy_number_parsers import SCALAR_PARSERS
+
+FIXED_CASES = [
+    '', ' ', '-', ' - ', '—', 'error', 'ERROR', 'Error', 'nan', 'None', 'null', None,
+    '0', '-0', '12', ' 12 ', '12,5', '-12,5', '12.5', '-12.5', '1.234', '-1.234', '1.234.567',
+    '-1.234.567', '1.234,5', '1.234.567,89', '-1.234.567,89', '1,234,567', '1,2.3', '12..3',
+    ',5', '.5', '5,', '--5', '(3,5)', '3,5%', '12a', 'n.a', '1e3', 'inf', '-inf', '1e400',
+]
+
+
+def thousands(number, decimals):
+    """Format Indonesia: titik ribuan, koma desimal."""
+    text = f"{number:,.{decimals}f}"
+    return text.replace(',', '_').replace('.', ',').replace('_', '.')
+
+
+def generated_cases(count, seed):
+    rng = random.Random(seed)
+    cases = []
+    for _ in range(count):
+        roll = rng.random()
+        number = rng.uniform(-5e6, 5e6)
+        if roll < 0.1:
+            cases.append(rng.choice(['', ' ', '-', 'error', 'ERROR', ' - ']))
+        elif roll < 0.3:
+            # Ribuan bertitik, tanpa desimal
+            cases.append(thousands(round(number), 0))
+        elif roll < 0.5:
+            # Ribuan bertitik dan koma desimal
+            cases.append(thousands(number, rng.randint(1, 3)))
+        elif roll < 0.65:
+            # Koma desimal tanpa pemisah ribuan
+            cases.append(f"{number:.{rng.randint(1, 4)}f}".replace('.', ','))
+        elif roll < 0.8:
+            cases.append(f"{number:.{rng.randint(0, 4)}f}")
+        else:
+            cases.append(''.join(rng.choice('0123456789.,-e ') for _ in range(rng.randint(1, 9))))
+    return cases
+
+
+def scalar_number(func, value):
+    """Hasil fungsi skalar lama sebagai float (None -> NaN); print per sel dibuang."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            result = func(value)
+        except OverflowError:
+            # int(float('inf')) di convert_kependudukan_value
+            result = None
+    return math.nan if result is None else float(result)
+
+
+class ParseNumbersMatchesScalarParsersTests(SimpleTestCase):
+    def assertSameAsScalar(self, values):
+        for mode, func in SCALAR_PARSERS.items():
+            with self.subTest(mode=mode):
+                numbers, invalid = number_parser.parse_numbers(values, mode)
+                expected = [scalar_number(func, value) for value in values]
+                mismatches = [
+                    (value, want, got)
+                    for value, want, got in zip(values, expected, numbers.tolist())
+                    if not (math.isnan(want) and math.isnan(got)) and want != got
+                ]
+                self.assertEqual(mismatches, [], f"(input, skalar, vektor) berbeda pada mode {mode}")
+                # Sel yang ditandai invalid selalu NaN, sama seperti None pada fungsi skalar
+                self.assertFalse(np.any(invalid & ~np.isnan(numbers)))
+
+    def test_fixed_cases(self):
+        self.assertSameAsScalar(FIXED_CASES)
+
+    def test_generated_cases(self):
+        for seed in range(5):
+            self.assertSameAsScalar(generated_cases(2000, seed))
+
+    def test_pandas_series_input(self):
+        series = pd.Series(generated_cases(500, 99), index=range(1000, 1500), dtype=object)
+        self.assertSameAsScalar(series.tolist())
+        numbers, _ = number_parser.parse_numbers(series, number_parser.INDONESIAN)
+        expected, _ = number_parser.parse_numbers(series.tolist(), number_parser.INDONESIAN)
+        np.testing.assert_array_equal(numbers, expected)
+
+    def test_null_markers(self):
+        numbers, invalid = number_parser.parse_numbers(['-', '', 'error'], number_parser.SPREADSHEET)
+        self.assertTrue(np.isnan(numbers).all())
+        self.assertFalse(invalid.any())
+        numbers, _ = number_parser.parse_numbers(['-', '1.234.567'], number_parser.POPULATION)
+        self.assertEqual(numbers.tolist(), [0.0, 1234567.0])
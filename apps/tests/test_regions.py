@@ -0,0 +1,52 @@
+from decimal import Decimal
+from unittest import mock
+
+import pandas as pd
+from django.test import TestCase
+
+from apps.models import GiniRatio, Region
+from apps.services import regions
+from apps.services.sheet_specs import GINI_RATIO_SPEC, LOCATION_COLUMN, save_wide_sheet
+
+
+class RegionalIndicatorTests(TestCase):
+    def test_save_resolves_region_only_when_location_name_changes(self):
+        with mock.patch.object(regions, 'resolve_regions', wraps=regions.resolve_regions) as resolve:
+            row = GiniRatio.objects.create(location_name='Surabaya', year=2023, gini_ratio_value=Decimal('0.400'))
+            self.assertEqual(resolve.call_count, 1)
+
+            row = GiniRatio.objects.get(pk=row.pk)
+            row.gini_ratio_value = Decimal('0.410')
+            row.save()
+            self.assertEqual(resolve.call_count, 1)
+
+            # Ejaan lain wilayah yang sama: di-resolve ulang ke Region yang sama
+            row.location_name = 'KOTA SURABAYA'
+            row.save(update_fields=['location_name'])
+            self.assertEqual(resolve.call_count, 2)
+
+        self.assertEqual(row.region.code, 'KOTA SURABAYA')
+        self.assertEqual(Region.objects.count(), 1)
+
+    def test_location_type_follows_region_type(self):
+        rows = [
+            GiniRatio.objects.create(location_name=name, year=2023, gini_ratio_value=Decimal('0.400'))
+            for name in ('Surabaya', 'BANGKALAN', 'Jawa Timur')
+        ]
+        loaded = GiniRatio.objects.select_related('region').filter(pk__in=[row.pk for row in rows]).order_by('pk')
+        self.assertEqual(
+            [row.location_type for row in loaded],
+            [GiniRatio.LocationType.MUNICIPALITY, GiniRatio.LocationType.REGENCY, GiniRatio.LocationType.REGENCY],
+        )
+
+    def test_two_spellings_in_one_year_are_one_row(self):
+        df = pd.DataFrame({
+            LOCATION_COLUMN: ['Surabaya', 'KOTA SURABAYA', 'KOTA SURABAYA'],
+            'Tahun': [2023, 2023, 2024],
+            'Value': [0.39, 0.4, 0.41],
+        })
+        self.assertEqual(save_wide_sheet(GINI_RATIO_SPEC, df), (2, 0, 0))
+
+        row = GiniRatio.objects.get(region__code='KOTA SURABAYA', year=2023)
+        self.assertEqual((row.location_name, row.gini_ratio_value), ('KOTA SURABAYA', Decimal('0.400')))
+        self.assertEqual(Region.objects.get().aliases, ['KOTA SURABAYA', 'Surabaya'])
@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.test import SimpleTestCase
+
+from apps.models import DatasetSchedule
+from apps.services.sync_cadence import POLICIES, plan
+from apps.services.sync_orchestrator import MONTHLY
+
+NOW = datetime(2026, 1, 1, tzinfo=dt_timezone.utc)
+POLICY = POLICIES[MONTHLY]    # period 30 hari, check 1 hari, min 6 jam, max 7 hari
+
+
+def hours(delta):
+    return delta / timedelta(hours=1)
+
+
+def schedule(interval=POLICY.check, last_changed_at=None, change_period=None, unchanged_runs=0):
+    return DatasetSchedule(
+        task_name='Inflasi', cadence=MONTHLY, interval_hours=hours(interval),
+        last_changed_at=last_changed_at, unchanged_runs=unchanged_runs,
+        change_period_hours=hours(change_period) if change_period else None,
+    )
+
+
+class PlanTests(SimpleTestCase):
+    def assertInterval(self, result, expected):
+        self.assertAlmostEqual(result.interval_hours, hours(expected))
+        self.assertEqual(result.next_run_at, NOW + expected)
+
+    def test_failure_retries_after_min_check(self):
+        # Walaupun di luar jendela rilis dan interval sudah panjang; statistik perubahan tidak disentuh
+        last_changed = NOW - timedelta(days=5)
+        result = plan(schedule(timedelta(days=5), last_changed, unchanged_runs=3), changed=False, failed=True, now=NOW)
+        self.assertInterval(result, POLICY.min_check)
+        self.assertEqual(result.unchanged_runs, 3)
+        self.assertEqual(result.last_changed_at, last_changed)
+        self.assertIsNone(result.change_period_hours)
+
+    def test_first_change_resets_interval_without_learning_period(self):
+        result = plan(schedule(timedelta(days=7), unchanged_runs=4), changed=True, failed=False, now=NOW)
+        self.assertInterval(result, POLICY.check)
+        self.assertEqual(result.last_changed_at, NOW)
+        self.assertEqual(result.unchanged_runs, 0)
+        self.assertIsNone(result.change_period_hours)
+
+    def test_change_learns_moving_average_of_gaps(self):
+        # Belum ada rata-rata: mulai dari periode nominal 30 hari; (30 + 20) / 2 = 25 hari
+        result = plan(schedule(last_changed_at=NOW - timedelta(days=20)), changed=True, failed=False, now=NOW)
+        self.assertAlmostEqual(result.change_period_hours, hours(timedelta(days=25)))
+        self.assertInterval(result, POLICY.check)
+
+        # Rata-rata yang sudah ada dipakai: (25 + 35) / 2 = 30 hari
+        result = plan(
+            schedule(last_changed_at=NOW - timedelta(days=35), change_period=timedelta(days=25)),
+            changed=True, failed=False, now=NOW,
+        )
+        self.assertAlmostEqual(result.change_period_hours, hours(timedelta(days=30)))
+
+    def test_learned_period_is_clamped(self):
+        result = plan(schedule(last_changed_at=NOW - timedelta(days=400)), changed=True, failed=False, now=NOW)
+        self.assertAlmostEqual(result.change_period_hours, hours(POLICY.period * 2))
+
+        result = plan(
+            schedule(last_changed_at=NOW - timedelta(hours=1), change_period=POLICY.check),
+            changed=True, failed=False, now=NOW,
+        )
+        self.assertAlmostEqual(result.change_period_hours, hours(POLICY.check))
+
+    def test_unchanged_backs_off_up_to_max_check(self):
+        current = schedule()
+        intervals = []
+        for _ in range(7):
+            current = plan(current, changed=False, failed=False, now=NOW)
+            intervals.append(round(current.interval_hours, 3))
+        self.assertEqual(intervals, [36.0, 54.0, 81.0, 121.5, 168.0, 168.0, 168.0])
+        self.assertEqual(current.unchanged_runs, 7)
+        self.assertIsNone(current.last_changed_at)
+
+    def test_inside_release_window_checks_at_min_check(self):
+        # Perubahan terakhir 30 hari lalu, periode 30 hari: sekarang di tengah jendela [27, 33] hari
+        result = plan(
+            schedule(timedelta(days=5), NOW - timedelta(days=30)), changed=False, failed=False, now=NOW,
+        )
+        self.assertInterval(result, POLICY.min_check)
+        self.assertEqual(result.unchanged_runs, 1)
+
+    def test_interval_is_clamped_to_release_window_start(self):
+        # Jendela mulai 1 hari lagi; backoff (5 hari -> 7 hari) tidak boleh melewatinya
+        result = plan(
+            schedule(timedelta(days=5), NOW - timedelta(days=26)), changed=False, failed=False, now=NOW,
+        )
+        self.assertInterval(result, timedelta(days=1))
+
+        # Jendela mulai 2 jam lagi: tidak lebih cepat dari min_check
+        result = plan(
+            schedule(timedelta(days=5), NOW - timedelta(days=27) + timedelta(hours=2)),
+            changed=False, failed=False, now=NOW,
+        )
+        self.assertInterval(result, POLICY.min_check)
+
+    def test_far_from_release_window_keeps_backoff(self):
+        result = plan(
+            schedule(timedelta(days=2), NOW - timedelta(days=3)), changed=False, failed=False, now=NOW,
+        )
+        self.assertInterval(result, timedelta(days=3))
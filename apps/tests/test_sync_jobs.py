@@ -0,0 +1,105 @@
+import threading
+from datetime import timedelta
+from unittest import mock
+
+from django.db import connection
+from django.test import TransactionTestCase
+from django.utils import timezone
+
+from apps.models import SyncJob
+from apps.services import sync_jobs
+
+
+def run_together(count, target):
+    """Menjalankan target(i) di `count` thread yang dimulai bersamaan; hasilnya per thread."""
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def run(i):
+        try:
+            barrier.wait(5)
+            results[i] = target(i)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    return results
+
+
+class ClaimNextTests(TransactionTestCase):
+    def test_two_claimers_take_different_jobs(self):
+        first = SyncJob.objects.create(sync_type='news')
+        second = SyncJob.objects.create(sync_type='inflasi')
+        real_now = timezone.now
+        other = []
+
+        def now():
+            # claim_next memanggil timezone.now() setelah SELECT job queued tertua, tepat
+            # sebelum UPDATE bersyarat. Di titik ini worker 'b' mengklaim job yang sama.
+            if not other:
+                other.append(None)
+                other[0] = sync_jobs.claim_next('b')
+            return real_now()
+
+        with mock.patch.object(sync_jobs.timezone, 'now', side_effect=now):
+            job = sync_jobs.claim_next('a')
+
+        self.assertEqual((other[0].pk, other[0].worker), (first.pk, 'b'))
+        self.assertEqual((job.pk, job.worker), (second.pk, 'a'))
+        first.refresh_from_db()
+        self.assertEqual((first.status, first.worker), (SyncJob.Status.RUNNING, 'b'))
+        self.assertIsNone(sync_jobs.claim_next('c'))
+
+
+class EnqueueTests(TransactionTestCase):
+    def test_duplicate_enqueue_returns_active_job(self):
+        job, created = sync_jobs.enqueue('news')
+        again, created_again = sync_jobs.enqueue('news')
+        self.assertTrue(created)
+        self.assertFalse(created_again)
+        self.assertEqual(again.pk, job.pk)
+
+        # Job yang sedang berjalan juga dipakai ulang; job yang sudah selesai tidak
+        sync_jobs.claim_next('a')
+        self.assertEqual(sync_jobs.enqueue('news'), (SyncJob.objects.get(pk=job.pk), False))
+        SyncJob.objects.filter(pk=job.pk).update(status=SyncJob.Status.SUCCESS)
+        new_job, created = sync_jobs.enqueue('news')
+        self.assertTrue(created)
+        self.assertNotEqual(new_job.pk, job.pk)
+
+    def test_concurrent_enqueue_creates_one_job(self):
+        results = run_together(4, lambda i: sync_jobs.enqueue('inflasi'))
+
+        self.assertEqual(SyncJob.objects.filter(sync_type='inflasi').count(), 1)
+        self.assertEqual(sum(created for _, created in results), 1)
+        self.assertEqual(len({job.pk for job, _ in results}), 1)
+
+    def test_unknown_type_is_rejected(self):
+        with self.assertRaises(ValueError):
+            sync_jobs.enqueue('bukan-jenis-sync')
+        self.assertFalse(SyncJob.objects.exists())
+
+
+class FailStaleJobsTests(TransactionTestCase):
+    def test_only_running_jobs_with_old_heartbeat_fail(self):
+        now = timezone.now()
+        old = now - timedelta(minutes=sync_jobs.STALE_MINUTES + 1)
+        stale = SyncJob.objects.create(sync_type='news', status=SyncJob.Status.RUNNING, heartbeat_at=old)
+        alive = SyncJob.objects.create(sync_type='inflasi', status=SyncJob.Status.RUNNING, heartbeat_at=now)
+        queued = SyncJob.objects.create(sync_type='pdrb')
+
+        self.assertEqual(sync_jobs.fail_stale_jobs(), 1)
+
+        stale.refresh_from_db()
+        self.assertEqual(stale.status, SyncJob.Status.FAILED)
+        self.assertTrue(stale.error)
+        self.assertIsNotNone(stale.finished_at)
+        self.assertEqual(SyncJob.objects.get(pk=alive.pk).status, SyncJob.Status.RUNNING)
+        self.assertEqual(SyncJob.objects.get(pk=queued.pk).status, SyncJob.Status.QUEUED)
+        # Stale job yang sudah gagal tidak dihitung lagi, dan antrian bisa menerima job baru
+        self.assertEqual(sync_jobs.fail_stale_jobs(), 0)
+        self.assertTrue(sync_jobs.enqueue('news')[1])
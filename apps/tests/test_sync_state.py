@@ -0,0 +1,268 @@
+import hashlib
+import json
+import threading
+from datetime import timedelta
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from apps.models import HotelOccupancyYearly, Publication, SyncState
+from apps.services import sync_state
+from apps.services.bps_client import bps_client
+from apps.services.data_source import REPLAY, current_source, default_source, use_source
+from apps.services.staged_load import STAGING, UPSERT, current_load_mode, use_load_mode
+from apps.services.sync_orchestrator import SyncTask, run_tasks
+from apps.services.sync_state import (
+    force_resync, grid_hash, is_forced, on_progress, run_bps_sync, run_sheet_sync,
+)
+
+SHEET_ID = 'sheet-test'
+TITLE = 'Hotel Tahunan'
+GRID = [['Tahun', 'TPK'], ['2020', '50,1'], ['2021', '55,2']]
+
+
+class SheetSyncTests(TestCase):
+    def setUp(self):
+        self.grid = [list(row) for row in GRID]
+        patcher = mock.patch.object(sync_state, 'get_worksheet_values', side_effect=lambda *args: self.grid)
+        self.get_worksheet_values = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.saved = []
+
+    def fetch(self):
+        return [{'year': int(row[0]), 'tpk': row[1].replace(',', '.')} for row in self.grid[1:]]
+
+    def save(self, records):
+        self.saved.append(records)
+        for record in records:
+            HotelOccupancyYearly.objects.update_or_create(year=record['year'], defaults={'tpk': record['tpk']})
+        return len(records), 0, 0
+
+    def sync(self, closed_at=None):
+        return run_sheet_sync(
+            SHEET_ID, TITLE, HotelOccupancyYearly.objects.all(), self.fetch, self.save, closed_at=closed_at,
+        )
+
+    def state(self):
+        return SyncState.objects.get(source=SHEET_ID, key=TITLE)
+
+    def test_unchanged_sheet_is_skipped(self):
+        self.assertEqual(self.sync(), (2, 0, 0))
+        self.assertEqual(self.state().content_hash, grid_hash(self.grid))
+        self.assertEqual(self.sync(), (0, 0, 2))
+        self.assertEqual(len(self.saved), 1)
+
+    def test_changed_sheet_is_saved(self):
+        self.sync()
+        self.grid.append(['2022', '60'])
+        self.assertEqual(self.sync(), (3, 0, 0))
+        self.assertEqual(self.state().row_count, 3)
+
+    def test_force_resync_saves_unchanged_sheet(self):
+        self.sync()
+        with force_resync():
+            self.assertEqual(self.sync(), (2, 0, 0))
+        self.assertEqual(len(self.saved), 2)
+
+    def test_empty_table_is_saved_again(self):
+        self.sync()
+        HotelOccupancyYearly.objects.all().delete()
+        self.assertEqual(self.sync(), (2, 0, 0))
+
+    def test_parser_version_change_saves_unchanged_sheet(self):
+        self.sync()
+        with mock.patch.object(sync_state, 'SHEET_PARSER_VERSION', sync_state.SHEET_PARSER_VERSION + 1):
+            self.assertEqual(self.sync(), (2, 0, 0))
+            self.assertEqual(self.sync(), (0, 0, 2))
+        self.assertEqual(len(self.saved), 2)
+
+    def test_closed_sheet_is_not_read(self):
+        closed_at = timezone.now() - timedelta(days=1)
+        self.sync(closed_at=closed_at)
+        self.assertEqual(self.sync(closed_at=closed_at), (0, 0, 2))
+        self.get_worksheet_values.reset_mock()
+        self.assertEqual(self.sync(closed_at=closed_at), (0, 0, 2))
+        self.get_worksheet_values.assert_not_called()
+
+    def test_closed_sheet_is_rechecked(self):
+        closed_at = timezone.now() - timedelta(days=1)
+        self.sync(closed_at=closed_at)
+        SyncState.objects.update(checked_at=timezone.now() - timedelta(days=sync_state.FROZEN_RECHECK_DAYS + 1))
+        self.grid.append(['2022', '60'])
+        self.assertEqual(self.sync(closed_at=closed_at), (3, 0, 0))
+
+    def test_closed_sheet_is_read_after_parser_change(self):
+        closed_at = timezone.now() - timedelta(days=1)
+        self.sync(closed_at=closed_at)
+        self.get_worksheet_values.reset_mock()
+        with mock.patch.object(sync_state, 'SHEET_PARSER_VERSION', sync_state.SHEET_PARSER_VERSION + 1):
+            self.assertEqual(self.sync(closed_at=closed_at), (2, 0, 0))
+        self.get_worksheet_values.assert_called_once()
+
+    def test_sheet_still_open_is_read(self):
+        closed_at = timezone.now() + timedelta(days=1)
+        self.sync(closed_at=closed_at)
+        self.get_worksheet_values.reset_mock()
+        self.assertEqual(self.sync(closed_at=closed_at), (0, 0, 2))
+        self.get_worksheet_values.assert_called_once()
+
+
+def publication(pub_id):
+    return {'pub_id': str(pub_id), 'title': f'Publikasi {pub_id}'}
+
+
+class BPSSyncTests(TestCase):
+    def setUp(self):
+        self.items = [publication(3), publication(2), publication(1)]
+        self.pages = []
+        for name, patched in (
+            ('fetch_all_pages', self.fetch_all_pages),
+            ('fetch_new_pages', self.fetch_new_pages),
+            ('bytes_read', lambda model: 0),
+        ):
+            patcher = mock.patch.object(bps_client, name, side_effect=patched)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def fetch_all_pages(self, model):
+        self.pages.append('all')
+        return list(self.items)
+
+    def fetch_new_pages(self, model, reached_known):
+        # Satu item per halaman, terbaru dulu
+        items = []
+        for item in self.items:
+            self.pages.append(item['pub_id'])
+            items.append(item)
+            if reached_known([item]):
+                break
+        return items, len(items)
+
+    def save(self, items):
+        created = 0
+        for item in items:
+            _, was_created = Publication.objects.update_or_create(
+                pub_id=item['pub_id'], defaults={'title': item['title']},
+            )
+            created += was_created
+        return created, len(items) - created, 0
+
+    def sync(self):
+        return run_bps_sync('publication', Publication.objects.all(), 'pub_id', lambda item: item['pub_id'], self.save)
+
+    def state(self):
+        return SyncState.objects.get(source=sync_state.BPS_SOURCE, key='publication')
+
+    def test_first_sync_is_full_and_stores_high_water_mark(self):
+        self.assertEqual(self.sync(), (3, 0, 0))
+        self.assertEqual(self.pages, ['all'])
+        self.assertEqual(self.state().high_water_mark, '3')
+        self.assertEqual(self.state().row_count, 3)
+
+    def test_incremental_sync_stops_at_high_water_mark(self):
+        self.sync()
+        self.items = [publication(5), publication(4)] + self.items
+        self.pages.clear()
+        self.assertEqual(self.sync(), (2, 1, 0))
+        self.assertEqual(self.pages, ['5', '4', '3'])
+        self.assertEqual(self.state().high_water_mark, '5')
+        self.assertEqual(Publication.objects.count(), 5)
+
+    def test_full_sync_after_resync_interval(self):
+        self.sync()
+        SyncState.objects.update(full_synced_at=timezone.now() - timedelta(days=sync_state.BPS_FULL_RESYNC_DAYS + 1))
+        self.pages.clear()
+        self.sync()
+        self.assertEqual(self.pages, ['all'])
+
+    def test_force_resync_is_full(self):
+        self.sync()
+        self.pages.clear()
+        with force_resync():
+            self.sync()
+        self.assertEqual(self.pages, ['all'])
+
+
+class SyncContextTests(SimpleTestCase):
+    def task(self, name):
+        def run():
+            sync_state._report_progress(name, (1, 0, 0))
+            return (1, 0, 0) if is_forced() else (0, 0, 1)
+        return SyncTask(name=name, info='', run=run, types=())
+
+    def test_worker_tasks_inherit_force_and_progress(self):
+        done = []
+        with force_resync(), on_progress(lambda key, *counts, skipped: done.append(key)):
+            results = run_tasks([self.task('a'), self.task('b'), self.task('c')], workers=3)
+        self.assertEqual([(r.created, r.unchanged) for r in results], [(1, 0)] * 3)
+        self.assertEqual(sorted(done), ['a', 'b', 'c'])
+
+    def test_other_threads_are_not_affected(self):
+        seen = {}
+        other_done = []
+        ready, release = threading.Event(), threading.Event()
+
+        def other_sync():
+            with on_progress(lambda key, *counts, skipped: other_done.append(key)):
+                ready.set()
+                release.wait(5)
+                seen['forced'] = is_forced()
+                run_tasks([self.task('lain')], workers=1)
+
+        thread = threading.Thread(target=other_sync)
+        thread.start()
+        ready.wait(5)
+        done = []
+        with force_resync(), on_progress(lambda key, *counts, skipped: done.append(key)):
+            release.set()
+            thread.join(5)
+            run_tasks([self.task('ini')], workers=1)
+
+        self.assertFalse(seen['forced'])
+        self.assertEqual(other_done, ['lain'])
+        self.assertEqual(done, ['ini'])
+
+    def test_data_source_is_per_context(self):
+        seen = {}
+
+        def task(name):
+            def run():
+                seen[name] = current_source()
+                return (0, 0, 1)
+            return SyncTask(name=name, info='', run=run, types=())
+
+        other = threading.Thread(target=lambda: seen.update(other=current_source()))
+        with use_source(REPLAY, 'snapshot') as source:
+            other.start()
+            other.join(5)
+            run_tasks([task('a'), task('b')], workers=2)
+
+        self.assertIs(seen['a'], source)
+        self.assertIs(seen['b'], source)
+        self.assertIs(seen['other'], default_source())
+        self.assertIs(current_source(), default_source())
+
+    def test_load_mode_is_per_context(self):
+        seen = {}
+        other = threading.Thread(target=lambda: seen.update(other=current_load_mode()))
+        with self.settings(SYNC_LOAD_MODE=UPSERT), use_load_mode(STAGING):
+            other.start()
+            other.join(5)
+            seen['self'] = current_load_mode()
+        self.assertEqual(seen, {'other': UPSERT, 'self': STAGING})
+
+
+class GridHashTests(SimpleTestCase):
+    def test_hash_and_size_match_row_payloads(self):
+        grid = [['Kode', 'Nama'], ['01', 'Beras "premium"'], ['02', 'Cabai ñ']]
+        content_hash, size = sync_state.hash_grid(grid)
+        payload = b''.join(
+            json.dumps(row, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n' for row in grid
+        )
+        self.assertEqual(content_hash, sync_state.versioned_hash(hashlib.sha256(payload).hexdigest()))
+        self.assertEqual(size, len(payload))
+
+    def test_row_boundaries_change_the_hash(self):
+        self.assertNotEqual(grid_hash([['a', 'b'], ['c']]), grid_hash([['a'], ['b', 'c']]))
+        self.assertNotEqual(grid_hash([['a']]), grid_hash([['a'], []]))
@@ -0,0 +1,88 @@
+from decimal import Decimal
+from unittest import mock
+
+from django.core.cache import caches
+from django.test import TestCase
+
+from apps.models import DatasetVersion, HotelOccupancyYearly
+from apps.services import view_cache
+from apps.services.bulk_writer import bulk_upsert
+from apps.services.view_cache import cached_context, dataset_versions
+
+builds = []
+
+
+@cached_context('test_hotel_yearly', HotelOccupancyYearly)
+def hotel_context(year_from):
+    builds.append(year_from)
+    rows = HotelOccupancyYearly.objects.filter(year__gte=year_from).order_by('year')
+    return {'tpk': [(row.year, row.tpk) for row in rows]}
+
+
+class CachedContextTests(TestCase):
+    def setUp(self):
+        caches[view_cache.CACHE_ALIAS].clear()
+        builds.clear()
+        self.row = HotelOccupancyYearly.objects.create(year=2020, tpk=Decimal('50'))
+
+    def write(self, func, *args, **kwargs):
+        # Versi dataset di cache baru dihapus saat transaksi tulisan commit
+        with self.captureOnCommitCallbacks(execute=True):
+            return func(*args, **kwargs)
+
+    def test_context_is_cached_per_version(self):
+        first = hotel_context(2000)
+        self.assertEqual(hotel_context(2000), first)
+        self.assertEqual(builds, [2000])
+        self.assertEqual(first['dataset_version'], dataset_versions(HotelOccupancyYearly))
+
+        hotel_context(2021)
+        self.assertEqual(builds, [2000, 2021])
+
+    def test_save_outside_sync_invalidates_context(self):
+        hotel_context(2000)
+        self.row.tpk = Decimal('60')
+        self.write(self.row.save)
+
+        context = hotel_context(2000)
+        self.assertEqual(context['tpk'], [(2020, Decimal('60.00'))])
+        self.assertEqual(builds, [2000, 2000])
+
+    def test_create_and_delete_outside_sync_invalidate_context(self):
+        hotel_context(2000)
+        self.write(HotelOccupancyYearly.objects.create, year=2021, tpk=Decimal('70'))
+        self.assertEqual(len(hotel_context(2000)['tpk']), 2)
+
+        self.write(HotelOccupancyYearly.objects.filter(year=2021).delete)
+        self.assertEqual(hotel_context(2000)['tpk'], [(2020, Decimal('50.00'))])
+        self.assertEqual(len(builds), 3)
+
+    def test_bulk_upsert_invalidates_context(self):
+        hotel_context(2000)
+        self.write(bulk_upsert, HotelOccupancyYearly, [{'year': 2020, 'tpk': 55}])
+        self.assertEqual(hotel_context(2000)['tpk'], [(2020, Decimal('55.00'))])
+
+    def test_previous_version_is_not_served_while_rebuilding(self):
+        hotel_context(2000)
+        self.write(HotelOccupancyYearly.objects.create, year=2021, tpk=Decimal('70'))
+        # Request lain sedang membangun versi baru: yang ini menunggu, bukan memakai context lama
+        with mock.patch.object(view_cache.ViewCache, '_acquire', return_value=None), \
+                mock.patch.object(view_cache, 'WAIT_SECONDS', 0.1):
+            context = hotel_context(2000)
+        self.assertEqual(len(context['tpk']), 2)
+
+    def test_expired_entry_of_same_version_is_refreshed(self):
+        with mock.patch.object(view_cache, 'TIMEOUT', -1):
+            hotel_context(2000)
+        value, _ = view_cache.view_cache.lookup(
+            'test_hotel_yearly', lambda: {'tpk': 'baru'}, dataset_versions(HotelOccupancyYearly), params=(2000,),
+            background=False,
+        )
+        self.assertEqual(value, {'tpk': 'baru'})
+        self.assertEqual(hotel_context(2000)['tpk'], 'baru')
+
+    def test_untracked_models_do_not_bump(self):
+        before = DatasetVersion.objects.count()
+        self.write(DatasetVersion.objects.create, dataset='test.model', version=1)
+        self.assertEqual(DatasetVersion.objects.count(), before + 1)
+        self.assertFalse(DatasetVersion.objects.filter(dataset='apps.datasetversion').exists())
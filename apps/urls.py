@@ -55,6 +55,9 @@ urlpatterns = [
     path('api/login/', views.user_login, name='api-login'),
     path('api/logout/', views.user_logout, name='api-logout'),
 
+    # Status job sinkronisasi (endpoint /api/sync/* di bawah hanya menjadwalkan job)
+    path('api/sync/jobs/<int:job_id>/', views.sync_job_status, name='sync-job-status'),
+
     # API endpoints for BPS data synchronization
     path('api/sync/news/', views.sync_bps_news, name='sync-bps-news'),
     path('api/sync/infographics/', views.sync_bps_infographic, name='sync-bps-infographics'),
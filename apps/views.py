@@ -7,15 +7,6 @@ import requests
 from urllib.parse import urlparse
 import os
 import re
-from .services.API_service import (
-    BPSInfographicService, BPSNewsService, BPSPublicationService, 
-    IPMService, HotelOccupancyCombinedService, HotelOccupancyYearlyService, GiniRatioService,
-    IPM_UHH_SPService, IPM_HLSService, IPM_RLSService, IPM_PengeluaranPerKapitaService,
-    IPM_IndeksKesehatanService, IPM_IndeksHidupLayakService, IPM_IndeksPendidikanService,
-    KetenagakerjaanTPTService, KetenagakerjaanTPAKService, KemiskinanSurabayaService,
-    KemiskinanJawaTimurService, KependudukanService, PDRBPengeluaranService,
-    PDRBLapanganUsahaService, InflasiService
-)
 from rest_framework.authtoken.models import Token
 from django.contrib.auth import authenticate, logout, login as auth_login
 from rest_framework.response import Response
@@ -30,6 +21,9 @@ from django.contrib.auth.decorators import login_required
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 from django.db.models import Q, Max, Case, When, IntegerField, CharField
 from django.db.models.functions import ExtractYear, Length
+from .services import sync_jobs
+from .services.indicator_snapshot import IPM_SUBCATEGORY_PREFIX, dashboard_indicators
+from .services.view_cache import cached_context, conditional_api
 
 class NewsViewSet(viewsets.ModelViewSet):
     queryset = News.objects.all()
@@ -45,7 +39,7 @@ class PublicationViewSet(viewsets.ModelViewSet):
     serializer_class = PublicationSerializer
 
 class HumanDevelopmentIndexViewSet(viewsets.ModelViewSet):
-    queryset = HumanDevelopmentIndex.objects.all()
+    queryset = HumanDevelopmentIndex.objects.select_related('region')
     serializer_class = HumanDevelopmentIndexSerializer
 
 @api_view(['POST'])
@@ -85,362 +79,123 @@ def delete_bookmark(request, pk):
     bookmark.delete()
     return Response(status=status.HTTP_204_NO_CONTENT)
 
-@api_view(['GET'])
-def sync_bps_news(request):
+def _enqueue_sync(request, sync_type, label):
+    """
+    Menjadwalkan sync di antrian job (dijalankan oleh command run_sync_worker) dan
+    langsung mengembalikan 202 beserta job id dan URL status.
+    """
     try:
-        created_count, updated_count = BPSNewsService.sync_news()
-        return Response({
-            "status": "success",
-            "message": f"Sinkronisasi berita selesai. Data baru: {created_count}, data diperbarui: {updated_count}.",
-            "details": {"created": created_count, "updated": updated_count}
-        })
+        job, created = sync_jobs.enqueue(sync_type)
     except Exception as e:
         return Response({
             "status": "error",
             "message": str(e)
         }, status=500)
-        
+
+    if created:
+        message = f"Sinkronisasi {label} dijadwalkan."
+    else:
+        message = f"Sinkronisasi {label} sudah ada di antrian (status: {job.status})."
+    return Response({
+        "status": job.status,
+        "message": f"{message} Cek progress di status_url.",
+        "job_id": job.pk,
+        "status_url": request.build_absolute_uri(reverse('sync-job-status', args=[job.pk])),
+    }, status=status.HTTP_202_ACCEPTED)
+
 @api_view(['GET'])
+def sync_job_status(request, job_id):
+    """Status job sync: progress per worksheet/task selama berjalan dan total akhir setelah selesai."""
+    job = get_object_or_404(SyncJob, pk=job_id)
+    return Response(SyncJobSerializer(job).data)
+
+@api_view(['GET', 'POST'])
+def sync_bps_news(request):
+    return _enqueue_sync(request, 'news', 'berita')
+
+@api_view(['GET', 'POST'])
 def sync_bps_infographic(request):
-    try:
-        created_count, updated_count = BPSInfographicService.sync_infographic()
-        return Response({
-            "status": "success",
-            "message": f"Sinkronisasi infografis selesai. Data baru: {created_count}, data diperbarui: {updated_count}.",
-            "details": {"created": created_count, "updated": updated_count}
-        })
-    except Exception as e:
-        return Response({
-            "status": "error",
-            "message": str(e)
-        }, status=500)
-        
-@api_view(['GET'])
+    return _enqueue_sync(request, 'infographics', 'infografis')
+
+@api_view(['GET', 'POST'])
 def sync_bps_publication(request):
-    try:
-        created_count, updated_count = BPSPublicationService.sync_publication()
-        return Response({
-            "status": "success",
-            "message": f"Sinkronisasi publikasi selesai. Data baru: {created_count}, data diperbarui: {updated_count}.",
-            "details": {"created": created_count, "updated": updated_count}
-        })
-    except Exception as e:
-        return Response({
-            "status": "error",
-            "message": str(e)
-        }, status=500)
+    return _enqueue_sync(request, 'publications', 'publikasi')
 
-@api_view(['GET'])
+@api_view(['GET', 'POST'])
 def sync_human_development_index(request):
-    try:
-        created_count, updated_count = IPMService.sync_ipm()
-        return Response({
-            "status": "success",
-            "message": f"Sinkronisasi IPM selesai. Data baru: {created_count}, data diperbarui: {updated_count}.",
-            "details": {"created": created_count, "updated": updated_count}
-        })
-    except Exception as e:
-        return Response({
-            "status": "error",
-            "message": str(e)
-        }, status=500)
+    return _enqueue_sync(request, 'ipm', 'IPM')
 
-@api_view(['GET'])
+@api_view(['GET', 'POST'])
 def sync_hotel_occupancy_combined(request):
-    try:
-        created_count, updated_count = HotelOccupancyCombinedService.sync_hotel_occupancy_combined()
-        return Response({
-            "status": "success",
-            "message": f"Sinkronisasi Tingkat Hunian Hotel (Gabung Semua) selesai. Data baru: {created_count}, data diperbarui: {updated_count}.",
-            "details": {"created": created_count, "updated": updated_count}
-        })
-    except Exception as e:
-        return Response({
-            "status": "error",
-            "message": str(e)
-        }, status=500)
+    return _enqueue_sync(request, 'hotel-occupancy-combined', 'Tingkat Hunian Hotel (Gabung Semua)')
 
-@api_view(['GET'])
+@api_view(['GET', 'POST'])
 def sync_hotel_occupancy_yearly(request):
-    try:
-        created_count, updated_count = HotelOccupancyYearlyService.sync_hotel_occupancy_yearly()
-        return Response({
-            "status": "success",
-            "message": f"Sinkronisasi Tingkat Hunian Hotel (Year-to-Year) selesai. Data baru: {created_count}, data diperbarui: {updated_count}.",
-            "details": {"created": created_count, "updated": updated_count}
-        })
-    except Exception as e:
-        return Response({
-            "status": "error",
-            "message": str(e)
-        }, status=500)
+    return _enqueue_sync(request, 'hotel-occupancy-yearly', 'Tingkat Hunian Hotel (Year-to-Year)')
 
-@api_view(['GET'])
+@api_view(['GET', 'POST'])
 def sync_gini_ratio(request):
-    try:
-        created_count, updated_count = GiniRatioService.sync_gini_ratio()
-        return Response({
-            "status": "success",
-            "message": f"Sinkronisasi Gini Ratio selesai. Data baru: {created_count}, data diperbarui: {updated_count}.",
-            "details": {"created": created_count, "updated": updated_count}
-        })
-    except Exception as e:
-        return Response({
-            "status": "error",
-            "message": str(e)
-        }, status=500)
+    return _enqueue_sync(request, 'gini-ratio', 'Gini Ratio')
 
-@api_view(['GET'])
+@api_view(['GET', 'POST'])
 def sync_ipm_uhh_sp(request):
-    try:
-        created_count, updated_count = IPM_UHH_SPService.sync_ipm_uhh_sp()
-        return Response({
-            "status": "success",
-            "message": f"Sinkronisasi IPM UHH SP selesai. Data baru: {created_count}, data diperbarui: {updated_count}.",
-            "details": {"created": created_count, "updated": updated_count}
-        })
-    except Exception as e:
-        return Response({
-            "status": "error",
-            "message": str(e)
-        }, status=500)
+    return _enqueue_sync(request, 'ipm-uhh-sp', 'IPM UHH SP')
 
-@api_view(['GET'])
+@api_view(['GET', 'POST'])
 def sync_ipm_hls(request):
-    try:
-        created_count, updated_count = IPM_HLSService.sync_ipm_hls()
-        return Response({
-            "status": "success",
-            "message": f"Sinkronisasi IPM HLS selesai. Data baru: {created_count}, data diperbarui: {updated_count}.",
-            "details": {"created": created_count, "updated": updated_count}
-        })
-    except Exception as e:
-        return Response({
-            "status": "error",
-            "message": str(e)
-        }, status=500)
+    return _enqueue_sync(request, 'ipm-hls', 'IPM HLS')
 
-@api_view(['GET'])
+@api_view(['GET', 'POST'])
 def sync_ipm_rls(request):
-    try:
-        created_count, updated_count = IPM_RLSService.sync_ipm_rls()
-        return Response({
-            "status": "success",
-            "message": f"Sinkronisasi IPM RLS selesai. Data baru: {created_count}, data diperbarui: {updated_count}.",
-            "details": {"created": created_count, "updated": updated_count}
-        })
-    except Exception as e:
-        return Response({
-            "status": "error",
-            "message": str(e)
-        }, status=500)
+    return _enqueue_sync(request, 'ipm-rls', 'IPM RLS')
 
-@api_view(['GET'])
+@api_view(['GET', 'POST'])
 def sync_ipm_pengeluaran_per_kapita(request):
-    try:
-        created_count, updated_count = IPM_PengeluaranPerKapitaService.sync_ipm_pengeluaran_per_kapita()
-        return Response({
-            "status": "success",
-            "message": f"Sinkronisasi IPM Pengeluaran per Kapita selesai. Data baru: {created_count}, data diperbarui: {updated_count}.",
-            "details": {"created": created_count, "updated": updated_count}
-        })
-    except Exception as e:
-        return Response({
-            "status": "error",
-            "message": str(e)
-        }, status=500)
+    return _enqueue_sync(request, 'ipm-pengeluaran-per-kapita', 'IPM Pengeluaran per Kapita')
 
-@api_view(['GET'])
+@api_view(['GET', 'POST'])
 def sync_ipm_indeks_kesehatan(request):
-    try:
-        created_count, updated_count = IPM_IndeksKesehatanService.sync_ipm_indeks_kesehatan()
-        return Response({
-            "status": "success",
-            "message": f"Sinkronisasi IPM Indeks Kesehatan selesai. Data baru: {created_count}, data diperbarui: {updated_count}.",
-            "details": {"created": created_count, "updated": updated_count}
-        })
-    except Exception as e:
-        return Response({
-            "status": "error",
-            "message": str(e)
-        }, status=500)
+    return _enqueue_sync(request, 'ipm-indeks-kesehatan', 'IPM Indeks Kesehatan')
 
-@api_view(['GET'])
+@api_view(['GET', 'POST'])
 def sync_ipm_indeks_hidup_layak(request):
-    try:
-        created_count, updated_count = IPM_IndeksHidupLayakService.sync_ipm_indeks_hidup_layak()
-        return Response({
-            "status": "success",
-            "message": f"Sinkronisasi IPM Indeks Hidup Layak selesai. Data baru: {created_count}, data diperbarui: {updated_count}.",
-            "details": {"created": created_count, "updated": updated_count}
-        })
-    except Exception as e:
-        return Response({
-            "status": "error",
-            "message": str(e)
-        }, status=500)
+    return _enqueue_sync(request, 'ipm-indeks-hidup-layak', 'IPM Indeks Hidup Layak')
 
-@api_view(['GET'])
+@api_view(['GET', 'POST'])
 def sync_ipm_indeks_pendidikan(request):
-    try:
-        created_count, updated_count = IPM_IndeksPendidikanService.sync_ipm_indeks_pendidikan()
-        return Response({
-            "status": "success",
-            "message": f"Sinkronisasi IPM Indeks Pendidikan selesai. Data baru: {created_count}, data diperbarui: {updated_count}.",
-            "details": {"created": created_count, "updated": updated_count}
-        })
-    except Exception as e:
-        return Response({
-            "status": "error",
-            "message": str(e)
-        }, status=500)     
+    return _enqueue_sync(request, 'ipm-indeks-pendidikan', 'IPM Indeks Pendidikan')
 
-@api_view(['GET'])
+@api_view(['GET', 'POST'])
 def sync_kemiskinan_surabaya(request):
-    try:
-        created_count, updated_count = KemiskinanSurabayaService.sync_kemiskinan_surabaya()
-        return Response({
-            "status": "success",
-            "message": f"Sinkronisasi Kemiskinan Surabaya selesai. Data baru: {created_count}, data diperbarui: {updated_count}.",
-            "details": {"created": created_count, "updated": updated_count}
-        })
-    except Exception as e:
-        return Response({
-            "status": "error",
-            "message": str(e)
-        }, status=500)
+    return _enqueue_sync(request, 'kemiskinan-surabaya', 'Kemiskinan Surabaya')
 
-@api_view(['GET'])
+@api_view(['GET', 'POST'])
 def sync_kemiskinan_jawa_timur(request):
-    try:
-        created_count, updated_count = KemiskinanJawaTimurService.sync_kemiskinan_jawa_timur()
-        return Response({
-            "status": "success",
-            "message": f"Sinkronisasi Kemiskinan Jawa Timur selesai. Data baru: {created_count}, data diperbarui: {updated_count}.",
-            "details": {"created": created_count, "updated": updated_count}
-        })
-    except Exception as e:
-        return Response({
-            "status": "error",
-            "message": str(e)
-        }, status=500)
-        
-@api_view(['GET'])
+    return _enqueue_sync(request, 'kemiskinan-jawa-timur', 'Kemiskinan Jawa Timur')
+
+@api_view(['GET', 'POST'])
 def sync_kependudukan(request):
-    try:
-        created_count, updated_count = KependudukanService.sync_kependudukan()
-        return Response({
-            "status": "success",
-            "message": f"Sinkronisasi Kependudukan selesai. Data baru: {created_count}, data diperbarui: {updated_count}.",
-            "details": {"created": created_count, "updated": updated_count}
-        })
-    except Exception as e:
-        return Response({
-            "status": "error",
-            "message": str(e)
-        }, status=500)   
+    return _enqueue_sync(request, 'kependudukan', 'Kependudukan')
 
-@api_view(['GET'])
+@api_view(['GET', 'POST'])
 def sync_ketenagakerjaan_tpt(request):
-    try:
-        created_count, updated_count = KetenagakerjaanTPTService.sync_ketenagakerjaan_tpt()
-        return Response({
-            "status": "success",
-            "message": f"Sinkronisasi Ketenagakerjaan TPT selesai. Data baru: {created_count}, data diperbarui: {updated_count}.",
-            "details": {"created": created_count, "updated": updated_count}
-        })
-    except Exception as e:
-        return Response({
-            "status": "error",
-            "message": str(e)
-        }, status=500)
+    return _enqueue_sync(request, 'ketenagakerjaan-tpt', 'Ketenagakerjaan TPT')
 
-@api_view(['GET'])
+@api_view(['GET', 'POST'])
 def sync_ketenagakerjaan_tpak(request):
-    try:
-        created_count, updated_count = KetenagakerjaanTPAKService.sync_ketenagakerjaan_tpak()
-        return Response({
-            "status": "success",
-            "message": f"Sinkronisasi Ketenagakerjaan TPAK selesai. Data baru: {created_count}, data diperbarui: {updated_count}.",
-            "details": {"created": created_count, "updated": updated_count}
-        })
-    except Exception as e:
-        return Response({
-            "status": "error",
-            "message": str(e)
-        }, status=500)
-        
-@api_view(['GET'])
+    return _enqueue_sync(request, 'ketenagakerjaan-tpak', 'Ketenagakerjaan TPAK')
+
+@api_view(['GET', 'POST'])
 def sync_pdrb_pengeluaran(request):
-    try:
-        results = PDRBPengeluaranService.sync_all_pdrb_pengeluaran()
-        
-        # Calculate totals
-        total_created = sum(sheet_result['created'] for sheet_result in results.values())
-        total_updated = sum(sheet_result['updated'] for sheet_result in results.values())
-        
-        return Response({
-            "status": "success",
-            "message": f"Sinkronisasi PDRB Pengeluaran selesai. Total data baru: {total_created}, total data diperbarui: {total_updated}.",
-            "details": {
-                "total_created": total_created,
-                "total_updated": total_updated,
-                "sheets": results
-            }
-        })
-    except Exception as e:
-        return Response({
-            "status": "error",
-            "message": str(e)
-        }, status=500)
+    return _enqueue_sync(request, 'pdrb-pengeluaran', 'PDRB Pengeluaran')
 
-@api_view(['GET'])
+@api_view(['GET', 'POST'])
 def sync_pdrb_lapangan_usaha(request):
-    try:
-        results = PDRBLapanganUsahaService.sync_all_pdrb_lapangan_usaha()
-        
-        # Calculate totals
-        total_created = sum(sheet_result['created'] for sheet_result in results.values())
-        total_updated = sum(sheet_result['updated'] for sheet_result in results.values())
-        
-        return Response({
-            "status": "success",
-            "message": f"Sinkronisasi PDRB Lapangan Usaha selesai. Total data baru: {total_created}, total data diperbarui: {total_updated}.",
-            "details": {
-                "total_created": total_created,
-                "total_updated": total_updated,
-                "sheets": results
-            }
-        })
-    except Exception as e:
-        return Response({
-            "status": "error",
-            "message": str(e)
-        }, status=500)     
+    return _enqueue_sync(request, 'pdrb-lapangan-usaha', 'PDRB Lapangan Usaha')
 
-@api_view(['GET'])
+@api_view(['GET', 'POST'])
 def sync_inflasi(request):
-    try:
-        results = InflasiService.sync_all_inflasi()
-        
-        # Calculate totals
-        total_created = sum(sheet_result['created'] for sheet_result in results.values())
-        total_updated = sum(sheet_result['updated'] for sheet_result in results.values())
-        
-        return Response({
-            "status": "success",
-            "message": f"Sinkronisasi Inflasi selesai. Total data baru: {total_created}, total data diperbarui: {total_updated}.",
-            "details": {
-                "total_created": total_created,
-                "total_updated": total_updated,
-                "sheets": results
-            }
-        })
-    except Exception as e:
-        return Response({
-            "status": "error",
-            "message": str(e)
-        }, status=500)
+    return _enqueue_sync(request, 'inflasi', 'Inflasi')
 
 def get_month_order():
     """Helper function untuk mendapatkan urutan bulan secara kronologis."""
@@ -462,6 +217,7 @@ def get_month_order():
     )
 
 @api_view(['GET'])
+@conditional_api(Inflasi)
 def get_inflasi_data(request):
     """API endpoint untuk mendapatkan data inflasi umum."""
     try:
@@ -503,6 +259,7 @@ def get_inflasi_data(request):
         }, status=500)
 
 @api_view(['GET'])
+@conditional_api(InflasiPerKomoditas)
 def get_inflasi_perkomoditas_data(request):
     """API endpoint untuk mendapatkan data inflasi per komoditas."""
     try:
@@ -561,6 +318,7 @@ def get_inflasi_perkomoditas_data(request):
         }, status=500)
 
 @api_view(['GET'])
+@conditional_api(InflasiPerKomoditas)
 def get_komoditas_by_flag(request):
     """API endpoint untuk mendapatkan komoditas berdasarkan flag dan parent."""
     try:
@@ -1230,931 +988,35 @@ def dashboard(request):
                     'icon_class': icon_class,
                 })
 
-    # Helper function to get latest sub-category IPM data for carousel
-    def get_latest_subcategory_data(model_class, location_name_keywords):
-        """Helper function to get latest data for a sub-category"""
-        all_data = list(model_class.objects.all())
-        filtered_data = []
-        for data in all_data:
-            location_upper = data.location_name.upper().strip()
-            if any(keyword in location_upper for keyword in location_name_keywords):
-                filtered_data.append(data)
-        if filtered_data:
-            filtered_data.sort(key=lambda x: x.year)
-            return filtered_data[-1] if filtered_data else None
-        return None
-    
-    def get_previous_subcategory_data(model_class, location_name_keywords, current_year):
-        """Helper function to get previous year data for calculating change"""
-        all_data = list(model_class.objects.all())
-        filtered_data = []
-        for data in all_data:
-            location_upper = data.location_name.upper().strip()
-            if any(keyword in location_upper for keyword in location_name_keywords):
-                filtered_data.append(data)
-        if filtered_data:
-            previous_data = [d for d in filtered_data if d.year == current_year - 1]
-            return previous_data[0] if previous_data else None
-        return None
-    
-    # Helper function to get latest data for PDRB models (looking for "TOTAL" or "JUMLAH" category)
-    def get_latest_pdrb_data(model_class, category_keywords=['TOTAL', 'JUMLAH']):
-        """Helper function to get latest data for PDRB models by category"""
-        all_data = list(model_class.objects.all())
-        filtered_data = []
-        for data in all_data:
-            category_upper = data.expenditure_category.upper().strip() if hasattr(data, 'expenditure_category') else data.industry_category.upper().strip()
-            if any(keyword in category_upper for keyword in category_keywords):
-                filtered_data.append(data)
-        if filtered_data:
-            # Sort by year, then by quarter (if exists) - quarters: I, II, III, IV
-            quarter_order = {'I': 1, 'II': 2, 'III': 3, 'IV': 4, 'TOTAL': 5}
-            if hasattr(filtered_data[0], 'quarter'):
-                filtered_data.sort(key=lambda x: (x.year, quarter_order.get(getattr(x, 'quarter', ''), 0)))
-            else:
-                filtered_data.sort(key=lambda x: x.year)
-            return filtered_data[-1] if filtered_data else None
-        return None
-    
-    def get_previous_pdrb_data(model_class, current_year, current_quarter=None, category_keywords=['TOTAL', 'JUMLAH']):
-        """Helper function to get previous period data for PDRB models"""
-        all_data = list(model_class.objects.all())
-        filtered_data = []
-        for data in all_data:
-            category_upper = data.expenditure_category.upper().strip() if hasattr(data, 'expenditure_category') else data.industry_category.upper().strip()
-            if any(keyword in category_upper for keyword in category_keywords):
-                filtered_data.append(data)
-        if filtered_data:
-            if current_quarter:
-                # For quarterly data, get previous quarter
-                quarters = ['I', 'II', 'III', 'IV']
-                if current_quarter in quarters:
-                    prev_idx = quarters.index(current_quarter) - 1
-                    if prev_idx >= 0:
-                        prev_quarter = quarters[prev_idx]
-                        prev_year = current_year
-                    else:
-                        prev_quarter = 'IV'
-                        prev_year = current_year - 1
-                    previous_data = [d for d in filtered_data if d.year == prev_year and d.quarter == prev_quarter]
-                else:
-                    # For annual comparison
-                    previous_data = [d for d in filtered_data if d.year == current_year - 1]
-            else:
-                # Annual data
-                previous_data = [d for d in filtered_data if d.year == current_year - 1]
-            return previous_data[0] if previous_data else None
-        return None
-    
-    # Get IPM sub-category data for carousel (Kota Surabaya)
-    ipm_subcategories = []
-    subcategory_models = [
-        ('UHH SP', IPM_UHH_SP),
-        ('HLS', IPM_HLS),
-        ('RLS', IPM_RLS),
-        ('Pengeluaran per Kapita', IPM_PengeluaranPerKapita),
-        ('Indeks Kesehatan', IPM_IndeksKesehatan),
-        ('Indeks Hidup Layak', IPM_IndeksHidupLayak),
-        ('Indeks Pendidikan', IPM_IndeksPendidikan),
+    # Kartu carousel indikator: snapshot yang dihitung di akhir setiap sync (satu query)
+    indicator_carousel_data = dashboard_indicators()
+    snapshots = {snapshot.key: snapshot for snapshot in indicator_carousel_data}
+
+    # IPM sub-categories (Kota Surabaya)
+    ipm_subcategories = [
+        {
+            'name': snapshot.name.removeprefix('IPM '),
+            'value': snapshot.value,
+            'year': snapshot.year,
+            'change': snapshot.change,
+            'change_percent': snapshot.change_percent,
+        }
+        for snapshot in indicator_carousel_data if snapshot.key.startswith(IPM_SUBCATEGORY_PREFIX)
     ]
-    
-    for name, model_class in subcategory_models:
-        latest = get_latest_subcategory_data(model_class, ['SURABAYA'])
-        if latest:
-            previous = get_previous_subcategory_data(model_class, ['SURABAYA'], latest.year)
-            change = None
-            change_percent = None
-            if previous and latest.value and previous.value:
-                change = float(latest.value) - float(previous.value)
-                change_percent = (change / float(previous.value)) * 100 if float(previous.value) != 0 else 0
-            
-            ipm_subcategories.append({
-                'name': name,
-                'value': latest.value,
-                'year': latest.year,
-                'change': change,
-                'change_percent': change_percent,
-            })
-    
-    # Get latest IPM main data (Kota Surabaya)
-    surabaya_keywords = ['KOTA SURABAYA', 'SURABAYA']
-    all_ipm_data = list(HumanDevelopmentIndex.objects.all())
-    surabaya_ipm_data = []
-    for data in all_ipm_data:
-        location_upper = data.location_name.upper().strip()
-        if 'SURABAYA' in location_upper:
-            if 'KOTA' in location_upper or location_upper.startswith('SURABAYA'):
-                surabaya_ipm_data.append(data)
-    
-    latest_ipm = None
-    previous_ipm = None
-    ipm_change = None
-    ipm_change_percent = None
-    if surabaya_ipm_data:
-        surabaya_ipm_data.sort(key=lambda x: x.year)
-        latest_ipm = surabaya_ipm_data[-1]
-        if len(surabaya_ipm_data) > 1:
-            previous_ipm = surabaya_ipm_data[-2]
-            if latest_ipm.ipm_value and previous_ipm.ipm_value:
-                ipm_change = float(latest_ipm.ipm_value) - float(previous_ipm.ipm_value)
-                ipm_change_percent = (ipm_change / float(previous_ipm.ipm_value)) * 100 if float(previous_ipm.ipm_value) != 0 else 0
-    
-    # Get latest Gini Ratio (Kota Surabaya)
-    all_gini_data = list(GiniRatio.objects.all())
-    surabaya_gini_data = []
-    for data in all_gini_data:
-        location_upper = data.location_name.upper().strip()
-        if 'SURABAYA' in location_upper:
-            if 'KOTA' in location_upper or location_upper.startswith('SURABAYA'):
-                surabaya_gini_data.append(data)
-    
-    latest_gini = None
-    previous_gini = None
-    gini_change = None
-    gini_change_percent = None
-    if surabaya_gini_data:
-        surabaya_gini_data.sort(key=lambda x: x.year)
-        latest_gini = surabaya_gini_data[-1]
-        if len(surabaya_gini_data) > 1:
-            previous_gini = surabaya_gini_data[-2]
-            if latest_gini.gini_ratio_value and previous_gini.gini_ratio_value:
-                gini_change = float(latest_gini.gini_ratio_value) - float(previous_gini.gini_ratio_value)
-                gini_change_percent = (gini_change / float(previous_gini.gini_ratio_value)) * 100 if float(previous_gini.gini_ratio_value) != 0 else 0
-    
+
+    # IPM dan Gini Ratio (Kota Surabaya) untuk summary card
+    ipm_snapshot = snapshots.get('ipm')
+    latest_ipm = {'ipm_value': ipm_snapshot.value, 'year': ipm_snapshot.year} if ipm_snapshot else None
+    ipm_change = ipm_snapshot.change if ipm_snapshot else None
+    ipm_change_percent = ipm_snapshot.change_percent if ipm_snapshot else None
+
+    gini_snapshot = snapshots.get('gini')
+    latest_gini = {'gini_ratio_value': gini_snapshot.value, 'year': gini_snapshot.year} if gini_snapshot else None
+    gini_change = gini_snapshot.change if gini_snapshot else None
+    gini_change_percent = gini_snapshot.change_percent if gini_snapshot else None
+
     # Get latest Hotel Occupancy Yearly data
-    all_hotel_yearly = list(HotelOccupancyYearly.objects.all().order_by('-year'))
-    latest_hotel_yearly = all_hotel_yearly[0] if all_hotel_yearly else None
-    
-    # Helper function to get latest data for PDRB models (looking for "TOTAL" or "JUMLAH" category)
-    def get_latest_pdrb_data(model_class, category_keywords=['TOTAL', 'JUMLAH']):
-        """Helper function to get latest data for PDRB models by category"""
-        all_data = list(model_class.objects.all())
-        filtered_data = []
-        for data in all_data:
-            category_upper = data.expenditure_category.upper().strip() if hasattr(data, 'expenditure_category') else data.industry_category.upper().strip()
-            if any(keyword in category_upper for keyword in category_keywords):
-                filtered_data.append(data)
-        if filtered_data:
-            # Sort by year, then by quarter (if exists) - quarters: I, II, III, IV
-            quarter_order = {'I': 1, 'II': 2, 'III': 3, 'IV': 4, 'TOTAL': 5}
-            if hasattr(filtered_data[0], 'quarter'):
-                filtered_data.sort(key=lambda x: (x.year, quarter_order.get(getattr(x, 'quarter', ''), 0)))
-            else:
-                filtered_data.sort(key=lambda x: x.year)
-            return filtered_data[-1] if filtered_data else None
-        return None
-    
-    def get_previous_pdrb_data(model_class, current_year, current_quarter=None, category_keywords=['TOTAL', 'JUMLAH']):
-        """Helper function to get previous period data for PDRB models"""
-        all_data = list(model_class.objects.all())
-        filtered_data = []
-        for data in all_data:
-            category_upper = data.expenditure_category.upper().strip() if hasattr(data, 'expenditure_category') else data.industry_category.upper().strip()
-            if any(keyword in category_upper for keyword in category_keywords):
-                filtered_data.append(data)
-        if filtered_data:
-            if current_quarter:
-                # For quarterly data, get previous quarter
-                quarters = ['I', 'II', 'III', 'IV']
-                if current_quarter in quarters:
-                    prev_idx = quarters.index(current_quarter) - 1
-                    if prev_idx >= 0:
-                        prev_quarter = quarters[prev_idx]
-                        prev_year = current_year
-                    else:
-                        prev_quarter = 'IV'
-                        prev_year = current_year - 1
-                    previous_data = [d for d in filtered_data if d.year == prev_year and d.quarter == prev_quarter]
-                else:
-                    # For annual comparison
-                    previous_data = [d for d in filtered_data if d.year == current_year - 1]
-            else:
-                # Annual data
-                previous_data = [d for d in filtered_data if d.year == current_year - 1]
-            return previous_data[0] if previous_data else None
-        return None
-    
-    # Collect all indicator data for carousel
-    indicator_carousel_data = []
-    
-    # Month order mapping for Inflasi
-    month_order = ['JANUARI', 'FEBRUARI', 'MARET', 'APRIL', 'MEI', 'JUNI', 
-                   'JULI', 'AGUSTUS', 'SEPTEMBER', 'OKTOBER', 'NOPEMBER', 'DESEMBER']
-    
-    # 1. Inflasi M-to-M (Month to Month)
-    latest_inflasi_mtm = Inflasi.objects.order_by('-year', '-month').first()
-    if latest_inflasi_mtm and latest_inflasi_mtm.bulanan:
-        # Get previous month data
-        if latest_inflasi_mtm.month in month_order:
-            current_month_idx = month_order.index(latest_inflasi_mtm.month)
-            if current_month_idx > 0:
-                # Previous month in same year
-                prev_month = month_order[current_month_idx - 1]
-                previous_inflasi_mtm = Inflasi.objects.filter(year=latest_inflasi_mtm.year, month=prev_month).first()
-            else:
-                # Previous month is December of previous year (current month is January)
-                previous_inflasi_mtm = Inflasi.objects.filter(year=latest_inflasi_mtm.year - 1, month='DESEMBER').first()
-        else:
-            previous_inflasi_mtm = None
-        
-        change_mtm = None
-        change_mtm_percent = None
-        if previous_inflasi_mtm and previous_inflasi_mtm.bulanan:
-            change_mtm = float(latest_inflasi_mtm.bulanan) - float(previous_inflasi_mtm.bulanan)
-            change_mtm_percent = change_mtm  # For m-to-m, change is already a percentage difference
-        
-        previous_period = None
-        if previous_inflasi_mtm:
-            previous_period = f"{previous_inflasi_mtm.get_month_display()} {previous_inflasi_mtm.year}"
-        
-        indicator_carousel_data.append({
-            'name': 'Inflasi M-to-M',
-            'value': latest_inflasi_mtm.bulanan,
-            'unit': '%',
-            'period': f"{latest_inflasi_mtm.get_month_display()} {latest_inflasi_mtm.year}",
-            'previous_period': previous_period,
-            'change': change_mtm,
-            'change_percent': change_mtm_percent,
-            'change_type': 'm-to-m'
-        })
-    
-    # 2. Inflasi Y-to-Y (Year to Year)
-    if latest_inflasi_mtm and latest_inflasi_mtm.yoy:
-        previous_inflasi_yty = Inflasi.objects.filter(
-            year=latest_inflasi_mtm.year - 1,
-            month=latest_inflasi_mtm.month
-        ).first()
-        
-        change_yty = None
-        change_yty_percent = None
-        if previous_inflasi_yty and previous_inflasi_yty.yoy:
-            change_yty = float(latest_inflasi_mtm.yoy) - float(previous_inflasi_yty.yoy)
-            change_yty_percent = change_yty
-        
-        previous_period = None
-        if previous_inflasi_yty:
-            previous_period = f"{previous_inflasi_yty.get_month_display()} {previous_inflasi_yty.year}"
-        
-        indicator_carousel_data.append({
-            'name': 'Inflasi Y-to-Y',
-            'value': latest_inflasi_mtm.yoy,
-            'unit': '%',
-            'period': f"{latest_inflasi_mtm.get_month_display()} {latest_inflasi_mtm.year}",
-            'previous_period': previous_period,
-            'change': change_yty,
-            'change_percent': change_yty_percent,
-            'change_type': 'y-to-y'
-        })
-    
-    # 3. PDRB Pengeluaran ADHB Tahunan
-    latest_pdrb_peng_adhb = get_latest_pdrb_data(PDRBPengeluaranADHB)
-    if latest_pdrb_peng_adhb:
-        previous_pdrb_peng_adhb = get_previous_pdrb_data(PDRBPengeluaranADHB, latest_pdrb_peng_adhb.year)
-        change = None
-        change_percent = None
-        if previous_pdrb_peng_adhb and latest_pdrb_peng_adhb.value and previous_pdrb_peng_adhb.value:
-            change = float(latest_pdrb_peng_adhb.value) - float(previous_pdrb_peng_adhb.value)
-            change_percent = (change / float(previous_pdrb_peng_adhb.value)) * 100 if float(previous_pdrb_peng_adhb.value) != 0 else 0
-        
-        previous_period = None
-        if previous_pdrb_peng_adhb:
-            previous_period = f"{previous_pdrb_peng_adhb.year}"
-        
-        indicator_carousel_data.append({
-            'name': 'PDRB Pengeluaran ADHB (Tahunan)',
-            'value': latest_pdrb_peng_adhb.value,
-            'unit': '',
-            'period': f"{latest_pdrb_peng_adhb.year}",
-            'previous_period': previous_period,
-            'change': change,
-            'change_percent': change_percent,
-            'change_type': 'y-to-y',
-            'is_currency': True
-        })
-    
-    # 4. PDRB Pengeluaran ADHK Tahunan
-    latest_pdrb_peng_adhk = get_latest_pdrb_data(PDRBPengeluaranADHK)
-    if latest_pdrb_peng_adhk:
-        previous_pdrb_peng_adhk = get_previous_pdrb_data(PDRBPengeluaranADHK, latest_pdrb_peng_adhk.year)
-        change = None
-        change_percent = None
-        if previous_pdrb_peng_adhk and latest_pdrb_peng_adhk.value and previous_pdrb_peng_adhk.value:
-            change = float(latest_pdrb_peng_adhk.value) - float(previous_pdrb_peng_adhk.value)
-            change_percent = (change / float(previous_pdrb_peng_adhk.value)) * 100 if float(previous_pdrb_peng_adhk.value) != 0 else 0
-        
-        previous_period = None
-        if previous_pdrb_peng_adhk:
-            previous_period = f"{previous_pdrb_peng_adhk.year}"
-        
-        indicator_carousel_data.append({
-            'name': 'PDRB Pengeluaran ADHK (Tahunan)',
-            'value': latest_pdrb_peng_adhk.value,
-            'unit': '',
-            'period': f"{latest_pdrb_peng_adhk.year}",
-            'previous_period': previous_period,
-            'change': change,
-            'change_percent': change_percent,
-            'change_type': 'y-to-y',
-            'is_currency': True
-        })
-    
-    # 5. PDRB Pengeluaran Laju Pertumbuhan Tahunan
-    latest_pdrb_peng_laju = get_latest_pdrb_data(PDRBPengeluaranLajuPDRB)
-    if latest_pdrb_peng_laju:
-        previous_pdrb_peng_laju = get_previous_pdrb_data(PDRBPengeluaranLajuPDRB, latest_pdrb_peng_laju.year)
-        change = None
-        if previous_pdrb_peng_laju and latest_pdrb_peng_laju.value and previous_pdrb_peng_laju.value:
-            change = float(latest_pdrb_peng_laju.value) - float(previous_pdrb_peng_laju.value)
-        
-        previous_period = None
-        if previous_pdrb_peng_laju:
-            previous_period = f"{previous_pdrb_peng_laju.year}"
-        
-        indicator_carousel_data.append({
-            'name': 'PDRB Pengeluaran Laju Pertumbuhan (Tahunan)',
-            'value': latest_pdrb_peng_laju.value,
-            'unit': '%',
-            'period': f"{latest_pdrb_peng_laju.year}",
-            'previous_period': previous_period,
-            'change': change,
-            'change_percent': change,
-            'change_type': 'y-to-y'
-        })
-    
-    # 6. PDRB Pengeluaran ADHB Triwulanan
-    latest_pdrb_peng_adhb_q = get_latest_pdrb_data(PDRBPengeluaranADHBTriwulanan)
-    if latest_pdrb_peng_adhb_q:
-        previous_pdrb_peng_adhb_q = get_previous_pdrb_data(PDRBPengeluaranADHBTriwulanan, latest_pdrb_peng_adhb_q.year, latest_pdrb_peng_adhb_q.quarter)
-        change = None
-        change_percent = None
-        if previous_pdrb_peng_adhb_q and latest_pdrb_peng_adhb_q.value and previous_pdrb_peng_adhb_q.value:
-            change = float(latest_pdrb_peng_adhb_q.value) - float(previous_pdrb_peng_adhb_q.value)
-            change_percent = (change / float(previous_pdrb_peng_adhb_q.value)) * 100 if float(previous_pdrb_peng_adhb_q.value) != 0 else 0
-        
-        previous_period = None
-        if previous_pdrb_peng_adhb_q:
-            previous_period = f"Q{previous_pdrb_peng_adhb_q.quarter} {previous_pdrb_peng_adhb_q.year}"
-        
-        indicator_carousel_data.append({
-            'name': 'PDRB Pengeluaran ADHB (Triwulanan)',
-            'value': latest_pdrb_peng_adhb_q.value,
-            'unit': '',
-            'period': f"Q{latest_pdrb_peng_adhb_q.quarter} {latest_pdrb_peng_adhb_q.year}",
-            'previous_period': previous_period,
-            'change': change,
-            'change_percent': change_percent,
-            'change_type': 'q-to-q',
-            'is_currency': True
-        })
-    
-    # 7. PDRB Pengeluaran ADHK Triwulanan
-    latest_pdrb_peng_adhk_q = get_latest_pdrb_data(PDRBPengeluaranADHKTriwulanan)
-    if latest_pdrb_peng_adhk_q:
-        previous_pdrb_peng_adhk_q = get_previous_pdrb_data(PDRBPengeluaranADHKTriwulanan, latest_pdrb_peng_adhk_q.year, latest_pdrb_peng_adhk_q.quarter)
-        change = None
-        change_percent = None
-        if previous_pdrb_peng_adhk_q and latest_pdrb_peng_adhk_q.value and previous_pdrb_peng_adhk_q.value:
-            change = float(latest_pdrb_peng_adhk_q.value) - float(previous_pdrb_peng_adhk_q.value)
-            change_percent = (change / float(previous_pdrb_peng_adhk_q.value)) * 100 if float(previous_pdrb_peng_adhk_q.value) != 0 else 0
-        
-        previous_period = None
-        if previous_pdrb_peng_adhk_q:
-            previous_period = f"Q{previous_pdrb_peng_adhk_q.quarter} {previous_pdrb_peng_adhk_q.year}"
-        
-        indicator_carousel_data.append({
-            'name': 'PDRB Pengeluaran ADHK (Triwulanan)',
-            'value': latest_pdrb_peng_adhk_q.value,
-            'unit': '',
-            'period': f"Q{latest_pdrb_peng_adhk_q.quarter} {latest_pdrb_peng_adhk_q.year}",
-            'previous_period': previous_period,
-            'change': change,
-            'change_percent': change_percent,
-            'change_type': 'q-to-q',
-            'is_currency': True
-        })
-    
-    # 8. PDRB Pengeluaran Laju Q-to-Q Triwulanan
-    latest_pdrb_peng_laju_qtoq = get_latest_pdrb_data(PDRBPengeluaranLajuQtoQ)
-    if latest_pdrb_peng_laju_qtoq:
-        previous_pdrb_peng_laju_qtoq = get_previous_pdrb_data(PDRBPengeluaranLajuQtoQ, latest_pdrb_peng_laju_qtoq.year, latest_pdrb_peng_laju_qtoq.quarter)
-        change = None
-        if previous_pdrb_peng_laju_qtoq and latest_pdrb_peng_laju_qtoq.value and previous_pdrb_peng_laju_qtoq.value:
-            change = float(latest_pdrb_peng_laju_qtoq.value) - float(previous_pdrb_peng_laju_qtoq.value)
-        
-        previous_period = None
-        if previous_pdrb_peng_laju_qtoq:
-            previous_period = f"Q{previous_pdrb_peng_laju_qtoq.quarter} {previous_pdrb_peng_laju_qtoq.year}"
-        
-        indicator_carousel_data.append({
-            'name': 'PDRB Pengeluaran Laju Q-to-Q (Triwulanan)',
-            'value': latest_pdrb_peng_laju_qtoq.value,
-            'unit': '%',
-            'period': f"Q{latest_pdrb_peng_laju_qtoq.quarter} {latest_pdrb_peng_laju_qtoq.year}",
-            'previous_period': previous_period,
-            'change': change,
-            'change_percent': change,
-            'change_type': 'q-to-q'
-        })
-    
-    # 8b. PDRB Pengeluaran Laju Y-to-Y Triwulanan
-    latest_pdrb_peng_laju_yty_q = get_latest_pdrb_data(PDRBPengeluaranLajuYtoY)
-    if latest_pdrb_peng_laju_yty_q:
-        previous_pdrb_peng_laju_yty_q = get_previous_pdrb_data(PDRBPengeluaranLajuYtoY, latest_pdrb_peng_laju_yty_q.year, latest_pdrb_peng_laju_yty_q.quarter)
-        change = None
-        if previous_pdrb_peng_laju_yty_q and latest_pdrb_peng_laju_yty_q.value and previous_pdrb_peng_laju_yty_q.value:
-            change = float(latest_pdrb_peng_laju_yty_q.value) - float(previous_pdrb_peng_laju_yty_q.value)
-        
-        previous_period = None
-        if previous_pdrb_peng_laju_yty_q:
-            previous_period = f"Q{previous_pdrb_peng_laju_yty_q.quarter} {previous_pdrb_peng_laju_yty_q.year}"
-        
-        indicator_carousel_data.append({
-            'name': 'PDRB Pengeluaran Laju Y-to-Y (Triwulanan)',
-            'value': latest_pdrb_peng_laju_yty_q.value,
-            'unit': '%',
-            'period': f"Q{latest_pdrb_peng_laju_yty_q.quarter} {latest_pdrb_peng_laju_yty_q.year}",
-            'previous_period': previous_period,
-            'change': change,
-            'change_percent': change,
-            'change_type': 'y-to-y'
-        })
-    
-    # 8c. PDRB Pengeluaran Laju C-to-C Triwulanan
-    latest_pdrb_peng_laju_ctoc = get_latest_pdrb_data(PDRBPengeluaranLajuCtoC)
-    if latest_pdrb_peng_laju_ctoc:
-        previous_pdrb_peng_laju_ctoc = get_previous_pdrb_data(PDRBPengeluaranLajuCtoC, latest_pdrb_peng_laju_ctoc.year, latest_pdrb_peng_laju_ctoc.quarter)
-        change = None
-        if previous_pdrb_peng_laju_ctoc and latest_pdrb_peng_laju_ctoc.value and previous_pdrb_peng_laju_ctoc.value:
-            change = float(latest_pdrb_peng_laju_ctoc.value) - float(previous_pdrb_peng_laju_ctoc.value)
-        
-        previous_period = None
-        if previous_pdrb_peng_laju_ctoc:
-            previous_period = f"Q{previous_pdrb_peng_laju_ctoc.quarter} {previous_pdrb_peng_laju_ctoc.year}"
-        
-        indicator_carousel_data.append({
-            'name': 'PDRB Pengeluaran Laju C-to-C (Triwulanan)',
-            'value': latest_pdrb_peng_laju_ctoc.value,
-            'unit': '%',
-            'period': f"Q{latest_pdrb_peng_laju_ctoc.quarter} {latest_pdrb_peng_laju_ctoc.year}",
-            'previous_period': previous_period,
-            'change': change,
-            'change_percent': change,
-            'change_type': 'c-to-c'
-        })
-    
-    # 9. PDRB Lapangan Usaha ADHB Tahunan
-    latest_pdrb_lap_adhb = get_latest_pdrb_data(PDRBLapanganUsahaADHB)
-    if latest_pdrb_lap_adhb:
-        previous_pdrb_lap_adhb = get_previous_pdrb_data(PDRBLapanganUsahaADHB, latest_pdrb_lap_adhb.year)
-        change = None
-        change_percent = None
-        if previous_pdrb_lap_adhb and latest_pdrb_lap_adhb.value and previous_pdrb_lap_adhb.value:
-            change = float(latest_pdrb_lap_adhb.value) - float(previous_pdrb_lap_adhb.value)
-            change_percent = (change / float(previous_pdrb_lap_adhb.value)) * 100 if float(previous_pdrb_lap_adhb.value) != 0 else 0
-        
-        previous_period = None
-        if previous_pdrb_lap_adhb:
-            previous_period = f"{previous_pdrb_lap_adhb.year}"
-        
-        indicator_carousel_data.append({
-            'name': 'PDRB Lapangan Usaha ADHB (Tahunan)',
-            'value': latest_pdrb_lap_adhb.value,
-            'unit': '',
-            'period': f"{latest_pdrb_lap_adhb.year}",
-            'previous_period': previous_period,
-            'change': change,
-            'change_percent': change_percent,
-            'change_type': 'y-to-y',
-            'is_currency': True
-        })
-    
-    # 10. PDRB Lapangan Usaha ADHK Tahunan
-    latest_pdrb_lap_adhk = get_latest_pdrb_data(PDRBLapanganUsahaADHK)
-    if latest_pdrb_lap_adhk:
-        previous_pdrb_lap_adhk = get_previous_pdrb_data(PDRBLapanganUsahaADHK, latest_pdrb_lap_adhk.year)
-        change = None
-        change_percent = None
-        if previous_pdrb_lap_adhk and latest_pdrb_lap_adhk.value and previous_pdrb_lap_adhk.value:
-            change = float(latest_pdrb_lap_adhk.value) - float(previous_pdrb_lap_adhk.value)
-            change_percent = (change / float(previous_pdrb_lap_adhk.value)) * 100 if float(previous_pdrb_lap_adhk.value) != 0 else 0
-        
-        previous_period = None
-        if previous_pdrb_lap_adhk:
-            previous_period = f"{previous_pdrb_lap_adhk.year}"
-        
-        indicator_carousel_data.append({
-            'name': 'PDRB Lapangan Usaha ADHK (Tahunan)',
-            'value': latest_pdrb_lap_adhk.value,
-            'unit': '',
-            'period': f"{latest_pdrb_lap_adhk.year}",
-            'previous_period': previous_period,
-            'change': change,
-            'change_percent': change_percent,
-            'change_type': 'y-to-y',
-            'is_currency': True
-        })
-    
-    # 11. PDRB Lapangan Usaha Laju Pertumbuhan Tahunan
-    latest_pdrb_lap_laju = get_latest_pdrb_data(PDRBLapanganUsahaLajuPDRB)
-    if latest_pdrb_lap_laju:
-        previous_pdrb_lap_laju = get_previous_pdrb_data(PDRBLapanganUsahaLajuPDRB, latest_pdrb_lap_laju.year)
-        change = None
-        if previous_pdrb_lap_laju and latest_pdrb_lap_laju.value and previous_pdrb_lap_laju.value:
-            change = float(latest_pdrb_lap_laju.value) - float(previous_pdrb_lap_laju.value)
-        
-        previous_period = None
-        if previous_pdrb_lap_laju:
-            previous_period = f"{previous_pdrb_lap_laju.year}"
-        
-        indicator_carousel_data.append({
-            'name': 'PDRB Lapangan Usaha Laju Pertumbuhan (Tahunan)',
-            'value': latest_pdrb_lap_laju.value,
-            'unit': '%',
-            'period': f"{latest_pdrb_lap_laju.year}",
-            'previous_period': previous_period,
-            'change': change,
-            'change_percent': change,
-            'change_type': 'y-to-y'
-        })
-    
-    # 12. PDRB Lapangan Usaha ADHB Triwulanan
-    latest_pdrb_lap_adhb_q = get_latest_pdrb_data(PDRBLapanganUsahaADHBTriwulanan)
-    if latest_pdrb_lap_adhb_q:
-        previous_pdrb_lap_adhb_q = get_previous_pdrb_data(PDRBLapanganUsahaADHBTriwulanan, latest_pdrb_lap_adhb_q.year, latest_pdrb_lap_adhb_q.quarter)
-        change = None
-        change_percent = None
-        if previous_pdrb_lap_adhb_q and latest_pdrb_lap_adhb_q.value and previous_pdrb_lap_adhb_q.value:
-            change = float(latest_pdrb_lap_adhb_q.value) - float(previous_pdrb_lap_adhb_q.value)
-            change_percent = (change / float(previous_pdrb_lap_adhb_q.value)) * 100 if float(previous_pdrb_lap_adhb_q.value) != 0 else 0
-        
-        previous_period = None
-        if previous_pdrb_lap_adhb_q:
-            previous_period = f"Q{previous_pdrb_lap_adhb_q.quarter} {previous_pdrb_lap_adhb_q.year}"
-        
-        indicator_carousel_data.append({
-            'name': 'PDRB Lapangan Usaha ADHB (Triwulanan)',
-            'value': latest_pdrb_lap_adhb_q.value,
-            'unit': '',
-            'period': f"Q{latest_pdrb_lap_adhb_q.quarter} {latest_pdrb_lap_adhb_q.year}",
-            'previous_period': previous_period,
-            'change': change,
-            'change_percent': change_percent,
-            'change_type': 'q-to-q',
-            'is_currency': True
-        })
-    
-    # 13. PDRB Lapangan Usaha ADHK Triwulanan
-    latest_pdrb_lap_adhk_q = get_latest_pdrb_data(PDRBLapanganUsahaADHKTriwulanan)
-    if latest_pdrb_lap_adhk_q:
-        previous_pdrb_lap_adhk_q = get_previous_pdrb_data(PDRBLapanganUsahaADHKTriwulanan, latest_pdrb_lap_adhk_q.year, latest_pdrb_lap_adhk_q.quarter)
-        change = None
-        change_percent = None
-        if previous_pdrb_lap_adhk_q and latest_pdrb_lap_adhk_q.value and previous_pdrb_lap_adhk_q.value:
-            change = float(latest_pdrb_lap_adhk_q.value) - float(previous_pdrb_lap_adhk_q.value)
-            change_percent = (change / float(previous_pdrb_lap_adhk_q.value)) * 100 if float(previous_pdrb_lap_adhk_q.value) != 0 else 0
-        
-        previous_period = None
-        if previous_pdrb_lap_adhk_q:
-            previous_period = f"Q{previous_pdrb_lap_adhk_q.quarter} {previous_pdrb_lap_adhk_q.year}"
-        
-        indicator_carousel_data.append({
-            'name': 'PDRB Lapangan Usaha ADHK (Triwulanan)',
-            'value': latest_pdrb_lap_adhk_q.value,
-            'unit': '',
-            'period': f"Q{latest_pdrb_lap_adhk_q.quarter} {latest_pdrb_lap_adhk_q.year}",
-            'previous_period': previous_period,
-            'change': change,
-            'change_percent': change_percent,
-            'change_type': 'q-to-q',
-            'is_currency': True
-        })
-    
-    # 14a. PDRB Lapangan Usaha Laju Q-to-Q Triwulanan
-    latest_pdrb_lap_laju_qtoq = get_latest_pdrb_data(PDRBLapanganUsahaLajuQtoQ)
-    if latest_pdrb_lap_laju_qtoq:
-        previous_pdrb_lap_laju_qtoq = get_previous_pdrb_data(PDRBLapanganUsahaLajuQtoQ, latest_pdrb_lap_laju_qtoq.year, latest_pdrb_lap_laju_qtoq.quarter)
-        change = None
-        if previous_pdrb_lap_laju_qtoq and latest_pdrb_lap_laju_qtoq.value and previous_pdrb_lap_laju_qtoq.value:
-            change = float(latest_pdrb_lap_laju_qtoq.value) - float(previous_pdrb_lap_laju_qtoq.value)
-        
-        previous_period = None
-        if previous_pdrb_lap_laju_qtoq:
-            previous_period = f"Q{previous_pdrb_lap_laju_qtoq.quarter} {previous_pdrb_lap_laju_qtoq.year}"
-        
-        indicator_carousel_data.append({
-            'name': 'PDRB Lapangan Usaha Laju Q-to-Q (Triwulanan)',
-            'value': latest_pdrb_lap_laju_qtoq.value,
-            'unit': '%',
-            'period': f"Q{latest_pdrb_lap_laju_qtoq.quarter} {latest_pdrb_lap_laju_qtoq.year}",
-            'previous_period': previous_period,
-            'change': change,
-            'change_percent': change,
-            'change_type': 'q-to-q'
-        })
-    
-    # 14b. PDRB Lapangan Usaha Laju Y-to-Y Triwulanan
-    latest_pdrb_lap_laju_yty_q = get_latest_pdrb_data(PDRBLapanganUsahaLajuYtoY)
-    if latest_pdrb_lap_laju_yty_q:
-        previous_pdrb_lap_laju_yty_q = get_previous_pdrb_data(PDRBLapanganUsahaLajuYtoY, latest_pdrb_lap_laju_yty_q.year, latest_pdrb_lap_laju_yty_q.quarter)
-        change = None
-        if previous_pdrb_lap_laju_yty_q and latest_pdrb_lap_laju_yty_q.value and previous_pdrb_lap_laju_yty_q.value:
-            change = float(latest_pdrb_lap_laju_yty_q.value) - float(previous_pdrb_lap_laju_yty_q.value)
-        
-        previous_period = None
-        if previous_pdrb_lap_laju_yty_q:
-            previous_period = f"Q{previous_pdrb_lap_laju_yty_q.quarter} {previous_pdrb_lap_laju_yty_q.year}"
-        
-        indicator_carousel_data.append({
-            'name': 'PDRB Lapangan Usaha Laju Y-to-Y (Triwulanan)',
-            'value': latest_pdrb_lap_laju_yty_q.value,
-            'unit': '%',
-            'period': f"Q{latest_pdrb_lap_laju_yty_q.quarter} {latest_pdrb_lap_laju_yty_q.year}",
-            'previous_period': previous_period,
-            'change': change,
-            'change_percent': change,
-            'change_type': 'y-to-y'
-        })
-    
-    # 14c. PDRB Lapangan Usaha Laju C-to-C Triwulanan
-    latest_pdrb_lap_laju_ctoc = get_latest_pdrb_data(PDRBLapanganUsahaLajuCtoC)
-    if latest_pdrb_lap_laju_ctoc:
-        previous_pdrb_lap_laju_ctoc = get_previous_pdrb_data(PDRBLapanganUsahaLajuCtoC, latest_pdrb_lap_laju_ctoc.year, latest_pdrb_lap_laju_ctoc.quarter)
-        change = None
-        if previous_pdrb_lap_laju_ctoc and latest_pdrb_lap_laju_ctoc.value and previous_pdrb_lap_laju_ctoc.value:
-            change = float(latest_pdrb_lap_laju_ctoc.value) - float(previous_pdrb_lap_laju_ctoc.value)
-        
-        previous_period = None
-        if previous_pdrb_lap_laju_ctoc:
-            previous_period = f"Q{previous_pdrb_lap_laju_ctoc.quarter} {previous_pdrb_lap_laju_ctoc.year}"
-        
-        indicator_carousel_data.append({
-            'name': 'PDRB Lapangan Usaha Laju C-to-C (Triwulanan)',
-            'value': latest_pdrb_lap_laju_ctoc.value,
-            'unit': '%',
-            'period': f"Q{latest_pdrb_lap_laju_ctoc.quarter} {latest_pdrb_lap_laju_ctoc.year}",
-            'previous_period': previous_period,
-            'change': change,
-            'change_percent': change,
-            'change_type': 'c-to-c'
-        })
-    
-    # 15. TPK (Tingkat Pengangguran Terbuka) - Tahunan
-    latest_tpk = KetenagakerjaanTPT.objects.order_by('-year').first()
-    if latest_tpk and latest_tpk.total:
-        previous_tpk = KetenagakerjaanTPT.objects.filter(year=latest_tpk.year - 1).first()
-        change = None
-        change_percent = None
-        previous_period = None
-        if previous_tpk and previous_tpk.total:
-            change = float(latest_tpk.total) - float(previous_tpk.total)
-            change_percent = (change / float(previous_tpk.total)) * 100 if float(previous_tpk.total) != 0 else 0
-            previous_period = f"{previous_tpk.year}"
-        
-        indicator_carousel_data.append({
-            'name': 'TPT (Tingkat Pengangguran Terbuka)',
-            'value': latest_tpk.total,
-            'unit': '%',
-            'period': f"{latest_tpk.year}",
-            'previous_period': previous_period,
-            'change': change,
-            'change_percent': change_percent,
-            'change_type': 'y-to-y'
-        })
-    
-    # 15b. TPK (Tingkat Pengangguran Terbuka) - Bulanan (M-to-M)
-    latest_tpk_monthly = HotelOccupancyCombined.objects.order_by('-year', '-month').first()
-    if latest_tpk_monthly and latest_tpk_monthly.tpk is not None:
-        # Get previous month data
-        if latest_tpk_monthly.month in month_order:
-            current_month_idx = month_order.index(latest_tpk_monthly.month)
-            if current_month_idx > 0:
-                prev_month = month_order[current_month_idx - 1]
-                previous_tpk_monthly = HotelOccupancyCombined.objects.filter(year=latest_tpk_monthly.year, month=prev_month).first()
-            else:
-                previous_tpk_monthly = HotelOccupancyCombined.objects.filter(year=latest_tpk_monthly.year - 1, month='DESEMBER').first()
-        else:
-            previous_tpk_monthly = None
-        
-        change = None
-        change_percent = None
-        previous_period = None
-        if previous_tpk_monthly and previous_tpk_monthly.tpk is not None:
-            change = float(latest_tpk_monthly.tpk) - float(previous_tpk_monthly.tpk)
-            change_percent = change  # For m-to-m, change is already a percentage difference
-            # Format previous period - need to get month display name
-            month_map = {'JANUARI': 'Januari', 'FEBRUARI': 'Februari', 'MARET': 'Maret', 'APRIL': 'April',
-                        'MEI': 'Mei', 'JUNI': 'Juni', 'JULI': 'Juli', 'AGUSTUS': 'Agustus',
-                        'SEPTEMBER': 'September', 'OKTOBER': 'Oktober', 'NOPEMBER': 'November', 'DESEMBER': 'Desember'}
-            prev_month_display = month_map.get(previous_tpk_monthly.month, previous_tpk_monthly.month)
-            previous_period = f"{prev_month_display} {previous_tpk_monthly.year}"
-        
-        month_map = {'JANUARI': 'Januari', 'FEBRUARI': 'Februari', 'MARET': 'Maret', 'APRIL': 'April',
-                    'MEI': 'Mei', 'JUNI': 'Juni', 'JULI': 'Juli', 'AGUSTUS': 'Agustus',
-                    'SEPTEMBER': 'September', 'OKTOBER': 'Oktober', 'NOPEMBER': 'November', 'DESEMBER': 'Desember'}
-        current_month_display = month_map.get(latest_tpk_monthly.month, latest_tpk_monthly.month)
-        
-        indicator_carousel_data.append({
-            'name': 'TPK M-to-M',
-            'value': latest_tpk_monthly.tpk,
-            'unit': '%',
-            'period': f"{current_month_display} {latest_tpk_monthly.year}",
-            'previous_period': previous_period,
-            'change': change,
-            'change_percent': change_percent,
-            'change_type': 'm-to-m'
-        })
-    
-    # 16. RLMT Gabungan - Tahunan
-    if latest_hotel_yearly and latest_hotel_yearly.rlmtgab:
-        previous_rlmtgab = HotelOccupancyYearly.objects.filter(year=latest_hotel_yearly.year - 1).first()
-        change = None
-        change_percent = None
-        previous_period = None
-        if previous_rlmtgab and previous_rlmtgab.rlmtgab:
-            change = float(latest_hotel_yearly.rlmtgab) - float(previous_rlmtgab.rlmtgab)
-            change_percent = (change / float(previous_rlmtgab.rlmtgab)) * 100 if float(previous_rlmtgab.rlmtgab) != 0 else 0
-            previous_period = f"{previous_rlmtgab.year}"
-        
-        indicator_carousel_data.append({
-            'name': 'RLMT Gabungan',
-            'value': latest_hotel_yearly.rlmtgab,
-            'unit': '%',
-            'period': f"{latest_hotel_yearly.year}",
-            'previous_period': previous_period,
-            'change': change,
-            'change_percent': change_percent,
-            'change_type': 'y-to-y'
-        })
-    
-    # 16b. RLMT Gabungan - Bulanan (M-to-M)
-    latest_rlmt_monthly = HotelOccupancyCombined.objects.order_by('-year', '-month').first()
-    if latest_rlmt_monthly and latest_rlmt_monthly.rlmtgab is not None:
-        # Get previous month data
-        if latest_rlmt_monthly.month in month_order:
-            current_month_idx = month_order.index(latest_rlmt_monthly.month)
-            if current_month_idx > 0:
-                prev_month = month_order[current_month_idx - 1]
-                previous_rlmt_monthly = HotelOccupancyCombined.objects.filter(year=latest_rlmt_monthly.year, month=prev_month).first()
-            else:
-                previous_rlmt_monthly = HotelOccupancyCombined.objects.filter(year=latest_rlmt_monthly.year - 1, month='DESEMBER').first()
-        else:
-            previous_rlmt_monthly = None
-        
-        change = None
-        change_percent = None
-        previous_period = None
-        if previous_rlmt_monthly and previous_rlmt_monthly.rlmtgab is not None:
-            change = float(latest_rlmt_monthly.rlmtgab) - float(previous_rlmt_monthly.rlmtgab)
-            change_percent = change  # For m-to-m, change is already a percentage difference
-            # Format previous period
-            month_map = {'JANUARI': 'Januari', 'FEBRUARI': 'Februari', 'MARET': 'Maret', 'APRIL': 'April',
-                        'MEI': 'Mei', 'JUNI': 'Juni', 'JULI': 'Juli', 'AGUSTUS': 'Agustus',
-                        'SEPTEMBER': 'September', 'OKTOBER': 'Oktober', 'NOPEMBER': 'November', 'DESEMBER': 'Desember'}
-            prev_month_display = month_map.get(previous_rlmt_monthly.month, previous_rlmt_monthly.month)
-            previous_period = f"{prev_month_display} {previous_rlmt_monthly.year}"
-        
-        month_map = {'JANUARI': 'Januari', 'FEBRUARI': 'Februari', 'MARET': 'Maret', 'APRIL': 'April',
-                    'MEI': 'Mei', 'JUNI': 'Juni', 'JULI': 'Juli', 'AGUSTUS': 'Agustus',
-                    'SEPTEMBER': 'September', 'OKTOBER': 'Oktober', 'NOPEMBER': 'November', 'DESEMBER': 'Desember'}
-        current_month_display = month_map.get(latest_rlmt_monthly.month, latest_rlmt_monthly.month)
-        
-        indicator_carousel_data.append({
-            'name': 'RLMT Gabungan M-to-M',
-            'value': latest_rlmt_monthly.rlmtgab,
-            'unit': '%',
-            'period': f"{current_month_display} {latest_rlmt_monthly.year}",
-            'previous_period': previous_period,
-            'change': change,
-            'change_percent': change_percent,
-            'change_type': 'm-to-m'
-        })
-    
-    # 17. Gini Ratio
-    if latest_gini:
-        previous_period = None
-        if previous_gini:
-            previous_period = f"{previous_gini.year}"
-        
-        indicator_carousel_data.append({
-            'name': 'Gini Ratio',
-            'value': latest_gini.gini_ratio_value,
-            'unit': '',
-            'period': f"{latest_gini.year}",
-            'previous_period': previous_period,
-            'change': gini_change,
-            'change_percent': gini_change_percent,
-            'change_type': 'y-to-y'
-        })
-    
-    # 18. Kemiskinan (Persentase Penduduk Miskin)
-    latest_kemiskinan = KemiskinanSurabaya.objects.order_by('-year').first()
-    if latest_kemiskinan and latest_kemiskinan.persentase_penduduk_miskin:
-        previous_kemiskinan = KemiskinanSurabaya.objects.filter(year=latest_kemiskinan.year - 1).first()
-        change = None
-        change_percent = None
-        if previous_kemiskinan and previous_kemiskinan.persentase_penduduk_miskin:
-            change = float(latest_kemiskinan.persentase_penduduk_miskin) - float(previous_kemiskinan.persentase_penduduk_miskin)
-            change_percent = (change / float(previous_kemiskinan.persentase_penduduk_miskin)) * 100 if float(previous_kemiskinan.persentase_penduduk_miskin) != 0 else 0
-        
-        previous_period = None
-        if previous_kemiskinan:
-            previous_period = f"{previous_kemiskinan.year}"
-        
-        indicator_carousel_data.append({
-            'name': 'Kemiskinan (Persentase)',
-            'value': latest_kemiskinan.persentase_penduduk_miskin,
-            'unit': '%',
-            'period': f"{latest_kemiskinan.year}",
-            'previous_period': previous_period,
-            'change': change,
-            'change_percent': change_percent,
-            'change_type': 'y-to-y'
-        })
-    
-    # 19. Ketenagakerjaan TPAK
-    latest_tpak = KetenagakerjaanTPAK.objects.order_by('-year').first()
-    if latest_tpak and latest_tpak.total:
-        previous_tpak = KetenagakerjaanTPAK.objects.filter(year=latest_tpak.year - 1).first()
-        change = None
-        change_percent = None
-        if previous_tpak and previous_tpak.total:
-            change = float(latest_tpak.total) - float(previous_tpak.total)
-            change_percent = (change / float(previous_tpak.total)) * 100 if float(previous_tpak.total) != 0 else 0
-        
-        previous_period = None
-        if previous_tpak:
-            previous_period = f"{previous_tpak.year}"
-        
-        indicator_carousel_data.append({
-            'name': 'TPAK (Tingkat Partisipasi Angkatan Kerja)',
-            'value': latest_tpak.total,
-            'unit': '%',
-            'period': f"{latest_tpak.year}",
-            'previous_period': previous_period,
-            'change': change,
-            'change_percent': change_percent,
-            'change_type': 'y-to-y'
-        })
-    
-    # 20. Kependudukan (Total Penduduk)
-    latest_kependudukan = Kependudukan.objects.filter(gender='TOTAL').order_by('-year').first()
-    if latest_kependudukan and latest_kependudukan.population:
-        previous_kependudukan = Kependudukan.objects.filter(gender='TOTAL', year=latest_kependudukan.year - 1).first()
-        change = None
-        change_percent = None
-        if previous_kependudukan and previous_kependudukan.population:
-            change = float(latest_kependudukan.population) - float(previous_kependudukan.population)
-            change_percent = (change / float(previous_kependudukan.population)) * 100 if float(previous_kependudukan.population) != 0 else 0
-        
-        previous_period = None
-        if previous_kependudukan:
-            previous_period = f"{previous_kependudukan.year}"
-        
-        indicator_carousel_data.append({
-            'name': 'Kependudukan (Total Penduduk)',
-            'value': latest_kependudukan.population,
-            'unit': '',
-            'period': f"{latest_kependudukan.year}",
-            'previous_period': previous_period,
-            'change': change,
-            'change_percent': change_percent,
-            'change_type': 'y-to-y',
-            'is_currency': False
-        })
-    
-    # 21. IPM
-    if latest_ipm:
-        previous_period = None
-        if previous_ipm:
-            previous_period = f"{previous_ipm.year}"
-        
-        indicator_carousel_data.append({
-            'name': 'IPM (Indeks Pembangunan Manusia)',
-            'value': latest_ipm.ipm_value,
-            'unit': '',
-            'period': f"{latest_ipm.year}",
-            'previous_period': previous_period,
-            'change': ipm_change,
-            'change_percent': ipm_change_percent,
-            'change_type': 'y-to-y'
-        })
-    
-    # 22. All IPM Indicators (already collected in ipm_subcategories)
-    for subcat in ipm_subcategories:
-        previous_period = None
-        if subcat.get('year'):
-            previous_period = f"{subcat['year'] - 1}"
-        
-        indicator_carousel_data.append({
-            'name': f'IPM {subcat["name"]}',
-            'value': subcat['value'],
-            'unit': '',
-            'period': f"{subcat['year']}",
-            'previous_period': previous_period,
-            'change': subcat.get('change'),
-            'change_percent': subcat.get('change_percent'),
-            'change_type': 'y-to-y'
-        })
+    latest_hotel_yearly = HotelOccupancyYearly.objects.order_by('-year').first()
 
     context = {
         'countNews':countNews,
@@ -2548,36 +1410,19 @@ def news(request):
     return render(request, 'dashboard/news.html', context)
 
 # ======= Tampilan Indikator Strategis Kota Surabaya =======
-def ipm(request):
-    """Merender halaman IPM dengan visualisasi data untuk Kota Surabaya dan Jawa Timur."""
-    # Filter data untuk Kota Surabaya dan Jawa Timur
-    surabaya_keywords = ['KOTA SURABAYA', 'SURABAYA']
-    jatim_keywords = ['JAWA TIMUR', 'JATIM']
-    
-    # Get all IPM data
-    all_ipm_data = list(HumanDevelopmentIndex.objects.all())
-    
-    # Filter untuk Kota Surabaya
-    surabaya_data = []
-    for data in all_ipm_data:
-        location_upper = data.location_name.upper().strip()
-        if 'SURABAYA' in location_upper:
-            if 'KOTA' in location_upper or location_upper.startswith('SURABAYA'):
-                surabaya_data.append(data)
-    
-    # Filter untuk Jawa Timur
-    jatim_data = []
-    for data in all_ipm_data:
-        location_upper = data.location_name.upper().strip()
-        if 'JAWA TIMUR' in location_upper or location_upper == 'JATIM':
-            jatim_data.append(data)
-    
-    # Sort by year
-    surabaya_data.sort(key=lambda x: x.year)
-    jatim_data.sort(key=lambda x: x.year)
+@cached_context(
+    'ipm',
+    HumanDevelopmentIndex, IPM_UHH_SP, IPM_HLS, IPM_RLS, IPM_PengeluaranPerKapita,
+    IPM_IndeksKesehatan, IPM_IndeksHidupLayak, IPM_IndeksPendidikan,
+)
+def _ipm_context():
+    """Context halaman IPM dengan visualisasi data untuk Kota Surabaya dan Jawa Timur."""
+    # Data Kota Surabaya dan Jawa Timur, urut tahun
+    surabaya_data = list(HumanDevelopmentIndex.objects.for_region('KOTA SURABAYA').order_by('year', 'pk'))
+    jatim_data = list(HumanDevelopmentIndex.objects.for_region('JAWA TIMUR').order_by('year', 'pk'))
     
     # Get distinct years
-    all_years = sorted(set([d.year for d in all_ipm_data]))
+    all_years = sorted(HumanDevelopmentIndex.objects.values_list('year', flat=True).distinct())
     latest_year = max(all_years) if all_years else None
     
     # Get latest data for summary cards
@@ -2604,43 +1449,31 @@ def ipm(request):
         jatim_change = float(latest_jatim.ipm_value) - float(previous_jatim.ipm_value)
     
     # Get sub-category data - both latest and historical data
-    def get_subcategory_data(model_class, location_name_keywords):
+    def get_subcategory_data(model_class, region):
         """Helper function to get all historical data for a sub-category"""
-        all_data = list(model_class.objects.all())
-        filtered_data = []
-        for data in all_data:
-            location_upper = data.location_name.upper().strip()
-            if any(keyword in location_upper for keyword in location_name_keywords):
-                filtered_data.append(data)
-        if filtered_data:
-            filtered_data.sort(key=lambda x: x.year)
-            return filtered_data
-        return []
-    
-    def get_latest_subcategory_data(model_class, location_name_keywords):
+        return list(model_class.objects.for_region(region).order_by('year', 'pk'))
+    
+    def get_latest_subcategory_data(model_class, region):
         """Helper function to get latest data for a sub-category"""
-        all_data = get_subcategory_data(model_class, location_name_keywords)
-        if all_data:
-            return all_data[-1] if all_data else None
-        return None
+        return model_class.objects.for_region(region).order_by('year', 'pk').last()
     
     # Get all historical data for each sub-category (Kota Surabaya)
-    uhh_sp_surabaya_data = get_subcategory_data(IPM_UHH_SP, ['SURABAYA'])
-    hls_surabaya_data = get_subcategory_data(IPM_HLS, ['SURABAYA'])
-    rls_surabaya_data = get_subcategory_data(IPM_RLS, ['SURABAYA'])
-    pengeluaran_surabaya_data = get_subcategory_data(IPM_PengeluaranPerKapita, ['SURABAYA'])
-    indeks_kesehatan_surabaya_data = get_subcategory_data(IPM_IndeksKesehatan, ['SURABAYA'])
-    indeks_hidup_layak_surabaya_data = get_subcategory_data(IPM_IndeksHidupLayak, ['SURABAYA'])
-    indeks_pendidikan_surabaya_data = get_subcategory_data(IPM_IndeksPendidikan, ['SURABAYA'])
+    uhh_sp_surabaya_data = get_subcategory_data(IPM_UHH_SP, 'KOTA SURABAYA')
+    hls_surabaya_data = get_subcategory_data(IPM_HLS, 'KOTA SURABAYA')
+    rls_surabaya_data = get_subcategory_data(IPM_RLS, 'KOTA SURABAYA')
+    pengeluaran_surabaya_data = get_subcategory_data(IPM_PengeluaranPerKapita, 'KOTA SURABAYA')
+    indeks_kesehatan_surabaya_data = get_subcategory_data(IPM_IndeksKesehatan, 'KOTA SURABAYA')
+    indeks_hidup_layak_surabaya_data = get_subcategory_data(IPM_IndeksHidupLayak, 'KOTA SURABAYA')
+    indeks_pendidikan_surabaya_data = get_subcategory_data(IPM_IndeksPendidikan, 'KOTA SURABAYA')
     
     # Get latest data for summary cards
-    latest_uhh_sp_surabaya = get_latest_subcategory_data(IPM_UHH_SP, ['SURABAYA'])
-    latest_hls_surabaya = get_latest_subcategory_data(IPM_HLS, ['SURABAYA'])
-    latest_rls_surabaya = get_latest_subcategory_data(IPM_RLS, ['SURABAYA'])
-    latest_pengeluaran_surabaya = get_latest_subcategory_data(IPM_PengeluaranPerKapita, ['SURABAYA'])
-    latest_indeks_kesehatan_surabaya = get_latest_subcategory_data(IPM_IndeksKesehatan, ['SURABAYA'])
-    latest_indeks_hidup_layak_surabaya = get_latest_subcategory_data(IPM_IndeksHidupLayak, ['SURABAYA'])
-    latest_indeks_pendidikan_surabaya = get_latest_subcategory_data(IPM_IndeksPendidikan, ['SURABAYA'])
+    latest_uhh_sp_surabaya = get_latest_subcategory_data(IPM_UHH_SP, 'KOTA SURABAYA')
+    latest_hls_surabaya = get_latest_subcategory_data(IPM_HLS, 'KOTA SURABAYA')
+    latest_rls_surabaya = get_latest_subcategory_data(IPM_RLS, 'KOTA SURABAYA')
+    latest_pengeluaran_surabaya = get_latest_subcategory_data(IPM_PengeluaranPerKapita, 'KOTA SURABAYA')
+    latest_indeks_kesehatan_surabaya = get_latest_subcategory_data(IPM_IndeksKesehatan, 'KOTA SURABAYA')
+    latest_indeks_hidup_layak_surabaya = get_latest_subcategory_data(IPM_IndeksHidupLayak, 'KOTA SURABAYA')
+    latest_indeks_pendidikan_surabaya = get_latest_subcategory_data(IPM_IndeksPendidikan, 'KOTA SURABAYA')
     
     context = {
         'surabaya_data': surabaya_data,
@@ -2672,38 +1505,20 @@ def ipm(request):
         'page_title': 'Indeks Pembangunan Manusia',
     }
     
-    return render(request, 'dashboard/indikator/IPM.html', context)
+    return context
+
+def ipm(request):
+    """Merender halaman IPM dengan visualisasi data untuk Kota Surabaya dan Jawa Timur."""
+    return render(request, 'dashboard/indikator/IPM.html', _ipm_context())
 
 def indeks_pembangunan_manusia(request):
     """Merender halaman Indeks Pembangunan Manusia dengan visualisasi alternatif."""
-    # Filter data untuk Kota Surabaya dan Jawa Timur
-    surabaya_keywords = ['KOTA SURABAYA', 'SURABAYA']
-    jatim_keywords = ['JAWA TIMUR', 'JATIM']
-    
-    # Get all IPM data
-    all_ipm_data = list(HumanDevelopmentIndex.objects.all())
-    
-    # Filter untuk Kota Surabaya
-    surabaya_data = []
-    for data in all_ipm_data:
-        location_upper = data.location_name.upper().strip()
-        if 'SURABAYA' in location_upper:
-            if 'KOTA' in location_upper or location_upper.startswith('SURABAYA'):
-                surabaya_data.append(data)
-    
-    # Filter untuk Jawa Timur
-    jatim_data = []
-    for data in all_ipm_data:
-        location_upper = data.location_name.upper().strip()
-        if 'JAWA TIMUR' in location_upper or location_upper == 'JATIM':
-            jatim_data.append(data)
-    
-    # Sort by year
-    surabaya_data.sort(key=lambda x: x.year)
-    jatim_data.sort(key=lambda x: x.year)
+    # Data Kota Surabaya dan Jawa Timur, urut tahun
+    surabaya_data = list(HumanDevelopmentIndex.objects.for_region('KOTA SURABAYA').order_by('year', 'pk'))
+    jatim_data = list(HumanDevelopmentIndex.objects.for_region('JAWA TIMUR').order_by('year', 'pk'))
     
     # Get distinct years
-    all_years = sorted(set([d.year for d in all_ipm_data]))
+    all_years = sorted(HumanDevelopmentIndex.objects.values_list('year', flat=True).distinct())
     latest_year = max(all_years) if all_years else None
     
     # Get latest data for summary cards
@@ -2730,43 +1545,31 @@ def indeks_pembangunan_manusia(request):
         jatim_change = float(latest_jatim.ipm_value) - float(previous_jatim.ipm_value)
     
     # Get sub-category data - both latest and historical data
-    def get_subcategory_data(model_class, location_name_keywords):
+    def get_subcategory_data(model_class, region):
         """Helper function to get all historical data for a sub-category"""
-        all_data = list(model_class.objects.all())
-        filtered_data = []
-        for data in all_data:
-            location_upper = data.location_name.upper().strip()
-            if any(keyword in location_upper for keyword in location_name_keywords):
-                filtered_data.append(data)
-        if filtered_data:
-            filtered_data.sort(key=lambda x: x.year)
-            return filtered_data
-        return []
-    
-    def get_latest_subcategory_data(model_class, location_name_keywords):
+        return list(model_class.objects.for_region(region).order_by('year', 'pk'))
+    
+    def get_latest_subcategory_data(model_class, region):
         """Helper function to get latest data for a sub-category"""
-        all_data = get_subcategory_data(model_class, location_name_keywords)
-        if all_data:
-            return all_data[-1] if all_data else None
-        return None
+        return model_class.objects.for_region(region).order_by('year', 'pk').last()
     
     # Get all historical data for each sub-category (Kota Surabaya)
-    uhh_sp_surabaya_data = get_subcategory_data(IPM_UHH_SP, ['SURABAYA'])
-    hls_surabaya_data = get_subcategory_data(IPM_HLS, ['SURABAYA'])
-    rls_surabaya_data = get_subcategory_data(IPM_RLS, ['SURABAYA'])
-    pengeluaran_surabaya_data = get_subcategory_data(IPM_PengeluaranPerKapita, ['SURABAYA'])
-    indeks_kesehatan_surabaya_data = get_subcategory_data(IPM_IndeksKesehatan, ['SURABAYA'])
-    indeks_hidup_layak_surabaya_data = get_subcategory_data(IPM_IndeksHidupLayak, ['SURABAYA'])
-    indeks_pendidikan_surabaya_data = get_subcategory_data(IPM_IndeksPendidikan, ['SURABAYA'])
+    uhh_sp_surabaya_data = get_subcategory_data(IPM_UHH_SP, 'KOTA SURABAYA')
+    hls_surabaya_data = get_subcategory_data(IPM_HLS, 'KOTA SURABAYA')
+    rls_surabaya_data = get_subcategory_data(IPM_RLS, 'KOTA SURABAYA')
+    pengeluaran_surabaya_data = get_subcategory_data(IPM_PengeluaranPerKapita, 'KOTA SURABAYA')
+    indeks_kesehatan_surabaya_data = get_subcategory_data(IPM_IndeksKesehatan, 'KOTA SURABAYA')
+    indeks_hidup_layak_surabaya_data = get_subcategory_data(IPM_IndeksHidupLayak, 'KOTA SURABAYA')
+    indeks_pendidikan_surabaya_data = get_subcategory_data(IPM_IndeksPendidikan, 'KOTA SURABAYA')
     
     # Get latest data for summary cards
-    latest_uhh_sp_surabaya = get_latest_subcategory_data(IPM_UHH_SP, ['SURABAYA'])
-    latest_hls_surabaya = get_latest_subcategory_data(IPM_HLS, ['SURABAYA'])
-    latest_rls_surabaya = get_latest_subcategory_data(IPM_RLS, ['SURABAYA'])
-    latest_pengeluaran_surabaya = get_latest_subcategory_data(IPM_PengeluaranPerKapita, ['SURABAYA'])
-    latest_indeks_kesehatan_surabaya = get_latest_subcategory_data(IPM_IndeksKesehatan, ['SURABAYA'])
-    latest_indeks_hidup_layak_surabaya = get_latest_subcategory_data(IPM_IndeksHidupLayak, ['SURABAYA'])
-    latest_indeks_pendidikan_surabaya = get_latest_subcategory_data(IPM_IndeksPendidikan, ['SURABAYA'])
+    latest_uhh_sp_surabaya = get_latest_subcategory_data(IPM_UHH_SP, 'KOTA SURABAYA')
+    latest_hls_surabaya = get_latest_subcategory_data(IPM_HLS, 'KOTA SURABAYA')
+    latest_rls_surabaya = get_latest_subcategory_data(IPM_RLS, 'KOTA SURABAYA')
+    latest_pengeluaran_surabaya = get_latest_subcategory_data(IPM_PengeluaranPerKapita, 'KOTA SURABAYA')
+    latest_indeks_kesehatan_surabaya = get_latest_subcategory_data(IPM_IndeksKesehatan, 'KOTA SURABAYA')
+    latest_indeks_hidup_layak_surabaya = get_latest_subcategory_data(IPM_IndeksHidupLayak, 'KOTA SURABAYA')
+    latest_indeks_pendidikan_surabaya = get_latest_subcategory_data(IPM_IndeksPendidikan, 'KOTA SURABAYA')
     
     context = {
         'surabaya_data': surabaya_data,
@@ -2800,8 +1603,9 @@ def indeks_pembangunan_manusia(request):
     
     return render(request, 'dashboard/indikator/indeks pembangunan manusia.html', context)
 
-def hotel_occupancy(request):
-    """Merender halaman Tingkat Hunian Hotel dengan visualisasi data TPK."""
+@cached_context('hotel_occupancy', HotelOccupancyCombined, HotelOccupancyYearly)
+def _hotel_occupancy_context():
+    """Context halaman Tingkat Hunian Hotel dengan visualisasi data TPK."""
     # Fetch hotel occupancy data from database
     
     # Month order for proper sorting
@@ -2915,9 +1719,14 @@ def hotel_occupancy(request):
         'page_title': 'Tingkat Hunian Hotel',
     }
     
-    return render(request, 'dashboard/indikator/hotel_occupancy.html', context)
+    return context
+
+def hotel_occupancy(request):
+    """Merender halaman Tingkat Hunian Hotel dengan visualisasi data TPK."""
+    return render(request, 'dashboard/indikator/hotel_occupancy.html', _hotel_occupancy_context())
 
 @api_view(['GET'])
+@conditional_api(HotelOccupancyCombined)
 def get_hotel_occupancy_data(request):
     """API endpoint untuk mendapatkan data tingkat hunian hotel."""
     try:
@@ -2940,40 +1749,15 @@ def get_hotel_occupancy_data(request):
             "message": str(e)
         }, status=500)
 
-def gini_ratio(request):
-    """Merender halaman Gini Ratio dengan visualisasi data untuk Kota Surabaya dan Jawa Timur."""
-    # Filter data untuk Kota Surabaya dan Jawa Timur
-    # Mencari dengan berbagai variasi nama yang mungkin ada di database
-    surabaya_keywords = ['KOTA SURABAYA', 'SURABAYA']
-    jatim_keywords = ['JAWA TIMUR', 'JATIM']
-    
-    # Get all Gini Ratio data
-    all_gini_data = list(GiniRatio.objects.all())
-    
-    # Filter untuk Kota Surabaya - lebih spesifik untuk menghindari duplikasi
-    surabaya_data = []
-    for data in all_gini_data:
-        location_upper = data.location_name.upper().strip()
-        # Cek apakah mengandung kata kunci Surabaya dan bukan hanya bagian dari kata lain
-        if 'SURABAYA' in location_upper:
-            # Pastikan ini adalah Kota Surabaya, bukan kabupaten lain yang mengandung kata Surabaya
-            if 'KOTA' in location_upper or location_upper.startswith('SURABAYA'):
-                surabaya_data.append(data)
-    
-    # Filter untuk Jawa Timur
-    jatim_data = []
-    for data in all_gini_data:
-        location_upper = data.location_name.upper().strip()
-        # Cek untuk Jawa Timur
-        if 'JAWA TIMUR' in location_upper or location_upper == 'JATIM':
-            jatim_data.append(data)
-    
-    # Sort by year
-    surabaya_data.sort(key=lambda x: x.year)
-    jatim_data.sort(key=lambda x: x.year)
+@cached_context('gini_ratio', GiniRatio)
+def _gini_ratio_context():
+    """Context halaman Gini Ratio dengan visualisasi data untuk Kota Surabaya dan Jawa Timur."""
+    # Data Kota Surabaya dan Jawa Timur (semua variasi penulisan nama lewat Region), urut tahun
+    surabaya_data = list(GiniRatio.objects.for_region('KOTA SURABAYA').order_by('year', 'pk'))
+    jatim_data = list(GiniRatio.objects.for_region('JAWA TIMUR').order_by('year', 'pk'))
     
     # Get distinct years
-    all_years = sorted(set([d.year for d in all_gini_data]))
+    all_years = sorted(GiniRatio.objects.values_list('year', flat=True).distinct())
     latest_year = max(all_years) if all_years else None
     
     # Get latest data for summary cards
@@ -3013,16 +1797,21 @@ def gini_ratio(request):
         'page_title': 'Gini Ratio',
     }
     
-    return render(request, 'dashboard/indikator/gini_ratio.html', context)
+    return context
+
+def gini_ratio(request):
+    """Merender halaman Gini Ratio dengan visualisasi data untuk Kota Surabaya dan Jawa Timur."""
+    return render(request, 'dashboard/indikator/gini_ratio.html', _gini_ratio_context())
 
 @api_view(['GET'])
+@conditional_api(GiniRatio)
 def get_gini_ratio_data(request):
     """API endpoint untuk mendapatkan data Gini Ratio."""
     try:
         location = request.query_params.get('location', None)
         year = request.query_params.get('year', None)
         
-        queryset = GiniRatio.objects.all()
+        queryset = GiniRatio.objects.select_related('region')
         
         if location:
             # Filter by location (case-insensitive)
@@ -3045,8 +1834,9 @@ def get_gini_ratio_data(request):
             "message": str(e)
         }, status=500)
 
-def kemiskinan(request):
-    """Merender halaman Kemiskinan dengan visualisasi data untuk Kota Surabaya dan Jawa Timur."""
+@cached_context('kemiskinan', KemiskinanSurabaya, KemiskinanJawaTimur)
+def _kemiskinan_context():
+    """Context halaman Kemiskinan dengan visualisasi data untuk Kota Surabaya dan Jawa Timur."""
     # Get all Kemiskinan data
     surabaya_data = list(KemiskinanSurabaya.objects.all().order_by('year'))
     jatim_data = list(KemiskinanJawaTimur.objects.all().order_by('year'))
@@ -3120,10 +1910,15 @@ def kemiskinan(request):
         'page_title': 'Kemiskinan',
     }
     
-    return render(request, 'dashboard/indikator/kemiskinan.html', context)
+    return context
 
-def kependudukan(request):
-    """Merender halaman Kependudukan dengan visualisasi data populasi."""
+def kemiskinan(request):
+    """Merender halaman Kemiskinan dengan visualisasi data untuk Kota Surabaya dan Jawa Timur."""
+    return render(request, 'dashboard/indikator/kemiskinan.html', _kemiskinan_context())
+
+@cached_context('kependudukan', Kependudukan)
+def _kependudukan_context(selected_year):
+    """Context halaman Kependudukan dengan visualisasi data populasi."""
     from django.db.models import Sum, Q
     from collections import defaultdict
     
@@ -3134,8 +1929,7 @@ def kependudukan(request):
     all_years = sorted(set([d.year for d in all_data if d.year])) if all_data.exists() else []
     latest_year = max(all_years) if all_years else None
     
-    # Get selected year from request (default to latest year)
-    selected_year = request.GET.get('year', None)
+    # selected_year: parameter ?year= dari request (default ke tahun terbaru)
     if selected_year:
         try:
             selected_year = int(selected_year)
@@ -3353,10 +2147,15 @@ def kependudukan(request):
         'page_title': 'Kependudukan',
     }
     
-    return render(request, 'dashboard/indikator/kependudukan.html', context)
+    return context
 
-def ketenagakerjaan(request):
-    """Merender halaman Ketenagakerjaan dengan 2 tab: TPT dan TPAK."""
+def kependudukan(request):
+    """Merender halaman Kependudukan dengan visualisasi data populasi."""
+    return render(request, 'dashboard/indikator/kependudukan.html', _kependudukan_context(request.GET.get('year')))
+
+@cached_context('ketenagakerjaan', KetenagakerjaanTPT, KetenagakerjaanTPAK)
+def _ketenagakerjaan_context():
+    """Context halaman Ketenagakerjaan dengan 2 tab: TPT dan TPAK."""
     # Get all TPT data sorted by year
     all_tpt_data = list(KetenagakerjaanTPT.objects.all().order_by('year'))
     
@@ -3415,7 +2214,11 @@ def ketenagakerjaan(request):
         'page_title': 'Ketenagakerjaan',
     }
     
-    return render(request, 'dashboard/indikator/ketenagakerjaan.html', context)
+    return context
+
+def ketenagakerjaan(request):
+    """Merender halaman Ketenagakerjaan dengan 2 tab: TPT dan TPAK."""
+    return render(request, 'dashboard/indikator/ketenagakerjaan.html', _ketenagakerjaan_context())
 
 def ketenagakerjaan_tpt(request):
     """Merender halaman Tingkat Pengangguran Terbuka (TPT) dengan visualisasi data."""
@@ -3500,22 +2303,9 @@ def ketenagakerjaan_tpak(request):
 # ======= Views untuk Indikator IPM Individual =======
 def ipm_uhh_sp(request):
     """Merender halaman IPM Usia Harapan Hidup saat Lahir (UHH SP) dengan visualisasi data."""
-    # Helper function to get all historical data for a sub-category
-    def get_subcategory_data(model_class, location_name_keywords):
-        all_data = list(model_class.objects.all())
-        filtered_data = []
-        for data in all_data:
-            location_upper = data.location_name.upper().strip()
-            if any(keyword in location_upper for keyword in location_name_keywords):
-                filtered_data.append(data)
-        if filtered_data:
-            filtered_data.sort(key=lambda x: x.year)
-            return filtered_data
-        return []
-    
     # Get all historical data for UHH SP (Kota Surabaya dan Jawa Timur)
-    surabaya_data = get_subcategory_data(IPM_UHH_SP, ['SURABAYA'])
-    jatim_data = get_subcategory_data(IPM_UHH_SP, ['JAWA TIMUR', 'JATIM'])
+    surabaya_data = list(IPM_UHH_SP.objects.for_region('KOTA SURABAYA').order_by('year', 'pk'))
+    jatim_data = list(IPM_UHH_SP.objects.for_region('JAWA TIMUR').order_by('year', 'pk'))
     
     # Get latest and previous data for summary cards (Surabaya)
     latest_data = surabaya_data[-1] if surabaya_data else None
@@ -3552,20 +2342,8 @@ def ipm_uhh_sp(request):
 
 def ipm_hls(request):
     """Merender halaman IPM Harapan Lama Sekolah (HLS) dengan visualisasi data."""
-    def get_subcategory_data(model_class, location_name_keywords):
-        all_data = list(model_class.objects.all())
-        filtered_data = []
-        for data in all_data:
-            location_upper = data.location_name.upper().strip()
-            if any(keyword in location_upper for keyword in location_name_keywords):
-                filtered_data.append(data)
-        if filtered_data:
-            filtered_data.sort(key=lambda x: x.year)
-            return filtered_data
-        return []
-    
-    surabaya_data = get_subcategory_data(IPM_HLS, ['SURABAYA'])
-    jatim_data = get_subcategory_data(IPM_HLS, ['JAWA TIMUR', 'JATIM'])
+    surabaya_data = list(IPM_HLS.objects.for_region('KOTA SURABAYA').order_by('year', 'pk'))
+    jatim_data = list(IPM_HLS.objects.for_region('JAWA TIMUR').order_by('year', 'pk'))
     
     latest_data = surabaya_data[-1] if surabaya_data else None
     previous_data = surabaya_data[-2] if len(surabaya_data) >= 2 else None
@@ -3599,20 +2377,8 @@ def ipm_hls(request):
 
 def ipm_rls(request):
     """Merender halaman IPM Rata-rata Lama Sekolah (RLS) dengan visualisasi data."""
-    def get_subcategory_data(model_class, location_name_keywords):
-        all_data = list(model_class.objects.all())
-        filtered_data = []
-        for data in all_data:
-            location_upper = data.location_name.upper().strip()
-            if any(keyword in location_upper for keyword in location_name_keywords):
-                filtered_data.append(data)
-        if filtered_data:
-            filtered_data.sort(key=lambda x: x.year)
-            return filtered_data
-        return []
-    
-    surabaya_data = get_subcategory_data(IPM_RLS, ['SURABAYA'])
-    jatim_data = get_subcategory_data(IPM_RLS, ['JAWA TIMUR', 'JATIM'])
+    surabaya_data = list(IPM_RLS.objects.for_region('KOTA SURABAYA').order_by('year', 'pk'))
+    jatim_data = list(IPM_RLS.objects.for_region('JAWA TIMUR').order_by('year', 'pk'))
     
     latest_data = surabaya_data[-1] if surabaya_data else None
     previous_data = surabaya_data[-2] if len(surabaya_data) >= 2 else None
@@ -3646,20 +2412,8 @@ def ipm_rls(request):
 
 def ipm_pengeluaran_per_kapita(request):
     """Merender halaman IPM Pengeluaran per Kapita dengan visualisasi data."""
-    def get_subcategory_data(model_class, location_name_keywords):
-        all_data = list(model_class.objects.all())
-        filtered_data = []
-        for data in all_data:
-            location_upper = data.location_name.upper().strip()
-            if any(keyword in location_upper for keyword in location_name_keywords):
-                filtered_data.append(data)
-        if filtered_data:
-            filtered_data.sort(key=lambda x: x.year)
-            return filtered_data
-        return []
-    
-    surabaya_data = get_subcategory_data(IPM_PengeluaranPerKapita, ['SURABAYA'])
-    jatim_data = get_subcategory_data(IPM_PengeluaranPerKapita, ['JAWA TIMUR', 'JATIM'])
+    surabaya_data = list(IPM_PengeluaranPerKapita.objects.for_region('KOTA SURABAYA').order_by('year', 'pk'))
+    jatim_data = list(IPM_PengeluaranPerKapita.objects.for_region('JAWA TIMUR').order_by('year', 'pk'))
     
     latest_data = surabaya_data[-1] if surabaya_data else None
     previous_data = surabaya_data[-2] if len(surabaya_data) >= 2 else None
@@ -3693,20 +2447,8 @@ def ipm_pengeluaran_per_kapita(request):
 
 def ipm_indeks_kesehatan(request):
     """Merender halaman IPM Indeks Kesehatan dengan visualisasi data."""
-    def get_subcategory_data(model_class, location_name_keywords):
-        all_data = list(model_class.objects.all())
-        filtered_data = []
-        for data in all_data:
-            location_upper = data.location_name.upper().strip()
-            if any(keyword in location_upper for keyword in location_name_keywords):
-                filtered_data.append(data)
-        if filtered_data:
-            filtered_data.sort(key=lambda x: x.year)
-            return filtered_data
-        return []
-    
-    surabaya_data = get_subcategory_data(IPM_IndeksKesehatan, ['SURABAYA'])
-    jatim_data = get_subcategory_data(IPM_IndeksKesehatan, ['JAWA TIMUR', 'JATIM'])
+    surabaya_data = list(IPM_IndeksKesehatan.objects.for_region('KOTA SURABAYA').order_by('year', 'pk'))
+    jatim_data = list(IPM_IndeksKesehatan.objects.for_region('JAWA TIMUR').order_by('year', 'pk'))
     
     latest_data = surabaya_data[-1] if surabaya_data else None
     previous_data = surabaya_data[-2] if len(surabaya_data) >= 2 else None
@@ -3740,20 +2482,8 @@ def ipm_indeks_kesehatan(request):
 
 def ipm_indeks_hidup_layak(request):
     """Merender halaman IPM Indeks Hidup Layak dengan visualisasi data."""
-    def get_subcategory_data(model_class, location_name_keywords):
-        all_data = list(model_class.objects.all())
-        filtered_data = []
-        for data in all_data:
-            location_upper = data.location_name.upper().strip()
-            if any(keyword in location_upper for keyword in location_name_keywords):
-                filtered_data.append(data)
-        if filtered_data:
-            filtered_data.sort(key=lambda x: x.year)
-            return filtered_data
-        return []
-    
-    surabaya_data = get_subcategory_data(IPM_IndeksHidupLayak, ['SURABAYA'])
-    jatim_data = get_subcategory_data(IPM_IndeksHidupLayak, ['JAWA TIMUR', 'JATIM'])
+    surabaya_data = list(IPM_IndeksHidupLayak.objects.for_region('KOTA SURABAYA').order_by('year', 'pk'))
+    jatim_data = list(IPM_IndeksHidupLayak.objects.for_region('JAWA TIMUR').order_by('year', 'pk'))
     
     latest_data = surabaya_data[-1] if surabaya_data else None
     previous_data = surabaya_data[-2] if len(surabaya_data) >= 2 else None
@@ -3787,20 +2517,8 @@ def ipm_indeks_hidup_layak(request):
 
 def ipm_indeks_pendidikan(request):
     """Merender halaman IPM Indeks Pendidikan dengan visualisasi data."""
-    def get_subcategory_data(model_class, location_name_keywords):
-        all_data = list(model_class.objects.all())
-        filtered_data = []
-        for data in all_data:
-            location_upper = data.location_name.upper().strip()
-            if any(keyword in location_upper for keyword in location_name_keywords):
-                filtered_data.append(data)
-        if filtered_data:
-            filtered_data.sort(key=lambda x: x.year)
-            return filtered_data
-        return []
-    
-    surabaya_data = get_subcategory_data(IPM_IndeksPendidikan, ['SURABAYA'])
-    jatim_data = get_subcategory_data(IPM_IndeksPendidikan, ['JAWA TIMUR', 'JATIM'])
+    surabaya_data = list(IPM_IndeksPendidikan.objects.for_region('KOTA SURABAYA').order_by('year', 'pk'))
+    jatim_data = list(IPM_IndeksPendidikan.objects.for_region('JAWA TIMUR').order_by('year', 'pk'))
     
     latest_data = surabaya_data[-1] if surabaya_data else None
     previous_data = surabaya_data[-2] if len(surabaya_data) >= 2 else None
@@ -3832,8 +2550,15 @@ def ipm_indeks_pendidikan(request):
     
     return render(request, 'dashboard/indikator/ipm_indeks_pendidikan.html', context)
 
-def pdrb_pengeluaran(request):
-    """Merender halaman PDRB Pengeluaran dengan visualisasi data."""
+@cached_context(
+    'pdrb_pengeluaran',
+    PDRBPengeluaranADHB, PDRBPengeluaranADHK, PDRBPengeluaranDistribusi, PDRBPengeluaranLajuPDRB,
+    PDRBPengeluaranADHBTriwulanan, PDRBPengeluaranADHKTriwulanan,
+    PDRBPengeluaranDistribusiTriwulanan, PDRBPengeluaranLajuQtoQ, PDRBPengeluaranLajuYtoY,
+    PDRBPengeluaranLajuCtoC,
+)
+def _pdrb_pengeluaran_context():
+    """Context halaman PDRB Pengeluaran dengan visualisasi data."""
     # ========== TAHUNAN DATA ==========
     # ADHB (Annual) - TAMPILKAN SEMUA KATEGORI (tidak hanya yang mengandung PDRB)
     all_adhb_data = list(PDRBPengeluaranADHB.objects.all())
@@ -4094,10 +2819,21 @@ def pdrb_pengeluaran(request):
         'page_title': 'PDRB Pengeluaran',
     }
     
-    return render(request, 'dashboard/indikator/pdrb_pengeluaran.html', context)
+    return context
 
-def pdrb_lapangan_usaha(request):
-    """Merender halaman PDRB Lapangan Usaha dengan visualisasi data."""
+def pdrb_pengeluaran(request):
+    """Merender halaman PDRB Pengeluaran dengan visualisasi data."""
+    return render(request, 'dashboard/indikator/pdrb_pengeluaran.html', _pdrb_pengeluaran_context())
+
+@cached_context(
+    'pdrb_lapangan_usaha',
+    PDRBLapanganUsahaADHB, PDRBLapanganUsahaADHK, PDRBLapanganUsahaDistribusi,
+    PDRBLapanganUsahaLajuPDRB, PDRBLapanganUsahaLajuImplisit, PDRBLapanganUsahaADHBTriwulanan,
+    PDRBLapanganUsahaADHKTriwulanan, PDRBLapanganUsahaDistribusiTriwulanan,
+    PDRBLapanganUsahaLajuQtoQ, PDRBLapanganUsahaLajuYtoY, PDRBLapanganUsahaLajuCtoC,
+)
+def _pdrb_lapangan_usaha_context():
+    """Context halaman PDRB Lapangan Usaha dengan visualisasi data."""
     # ========== TAHUNAN DATA ==========
     # ADHB (Annual) - TAMPILKAN SEMUA KATEGORI
     all_adhb_data = list(PDRBLapanganUsahaADHB.objects.all())
@@ -4379,10 +3115,15 @@ def pdrb_lapangan_usaha(request):
         'page_title': 'PDRB Lapangan Usaha',
     }
     
-    return render(request, 'dashboard/indikator/pdrb_lapangan_usaha.html', context)
+    return context
 
-def inflasi(request):
-    """Merender halaman Inflasi dengan visualisasi data."""
+def pdrb_lapangan_usaha(request):
+    """Merender halaman PDRB Lapangan Usaha dengan visualisasi data."""
+    return render(request, 'dashboard/indikator/pdrb_lapangan_usaha.html', _pdrb_lapangan_usaha_context())
+
+@cached_context('inflasi', Inflasi, InflasiPerKomoditas)
+def _inflasi_context():
+    """Context halaman Inflasi dengan visualisasi data."""
     from django.db.models import Max, Min
     
     # Get all inflasi data (general inflation) - sorted chronologically
@@ -4470,4 +3211,8 @@ def inflasi(request):
         'page_title': 'Inflasi',
     }
     
-    return render(request, 'dashboard/indikator/inflasi.html', context)
\ No newline at end of file
+    return context
+
+def inflasi(request):
+    """Merender halaman Inflasi dengan visualisasi data."""
+    return render(request, 'dashboard/indikator/inflasi.html', _inflasi_context())